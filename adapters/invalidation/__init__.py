@@ -0,0 +1,9 @@
+from .bus import InvalidationBus
+from .local import LocalInvalidationBus
+from .postgres import PostgresInvalidationBus
+
+__all__ = [
+    "InvalidationBus",
+    "LocalInvalidationBus",
+    "PostgresInvalidationBus",
+]
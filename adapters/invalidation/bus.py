@@ -0,0 +1,40 @@
+import logging
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+__all__ = ["InvalidationBus"]
+
+logger = logging.getLogger("dnd_guide.invalidation")
+
+
+class InvalidationBus(ABC):
+    # сигналы о зафиксированных записях в справочник; каждый процесс
+    # подписывает на шину свои кеши, чтобы не отдавать устаревшие данные.
+    # что именно изменилось, не передаётся: подписчики сбрасывают всё
+    def __init__(self) -> None:
+        self._subscribers: list[Callable[[], None]] = []
+
+    def subscribe(self, callback: Callable[[], None]) -> None:
+        self._subscribers.append(callback)
+
+    @abstractmethod
+    async def publish(self, session: "AsyncSession") -> None:
+        # вызывается внутри пишущей транзакции: сигнал уходит при её
+        # коммите и пропадает при откате
+        raise NotImplemented
+
+    async def start(self) -> None:
+        return None
+
+    async def stop(self) -> None:
+        return None
+
+    def _deliver(self) -> None:
+        for callback in self._subscribers:
+            try:
+                callback()
+            except Exception:
+                logger.exception("invalidation subscriber failed")
@@ -0,0 +1,18 @@
+from typing import TYPE_CHECKING, Any
+
+from adapters.invalidation.bus import InvalidationBus
+from sqlalchemy import event
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+__all__ = ["LocalInvalidationBus"]
+
+
+class LocalInvalidationBus(InvalidationBus):
+    # один процесс: подписчики узнают о записи сразу после коммита
+    async def publish(self, session: "AsyncSession") -> None:
+        event.listen(session.sync_session, "after_commit", self._committed, once=True)
+
+    def _committed(self, session: Any) -> None:
+        self._deliver()
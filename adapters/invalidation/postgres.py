@@ -0,0 +1,64 @@
+import asyncio
+import contextvars
+import logging
+
+import psycopg
+from adapters.invalidation.bus import InvalidationBus
+from psycopg import sql
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+__all__ = ["PostgresInvalidationBus"]
+
+logger = logging.getLogger("dnd_guide.invalidation")
+
+
+class PostgresInvalidationBus(InvalidationBus):
+    # NOTIFY идёт в транзакции записи, LISTEN держит отдельное соединение:
+    # в пуле оно вернулось бы другому запросу вместе с подпиской
+    def __init__(self, dsn: str, channel: str, reconnect_delay: float = 1.0) -> None:
+        super().__init__()
+        self._dsn = dsn
+        self._channel = channel
+        self._reconnect_delay = reconnect_delay
+        self._task: asyncio.Task[None] | None = None
+
+    async def publish(self, session: AsyncSession) -> None:
+        # postgres доставит сигнал только при коммите транзакции
+        await session.execute(
+            text("SELECT pg_notify(:channel, '')"), {"channel": self._channel}
+        )
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(
+                self._listen(), context=contextvars.Context()
+            )
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    self._dsn, autocommit=True
+                ) as conn:
+                    await conn.execute(
+                        sql.SQL("LISTEN {}").format(sql.Identifier(self._channel))
+                    )
+                    # пока соединения не было, сообщения могли потеряться
+                    self._deliver()
+                    async for _ in conn.notifies():
+                        self._deliver()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("invalidation listener lost connection")
+                await asyncio.sleep(self._reconnect_delay)
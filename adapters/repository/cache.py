@@ -0,0 +1,142 @@
+from collections import OrderedDict
+from copy import deepcopy
+from time import monotonic
+from typing import Any, Callable, Hashable, TypeVar, cast
+from uuid import UUID
+
+from adapters.repository.sql import DBHelper
+from application.dto.model.version import AppVersion
+from application.repository import VersionRepository
+
+__all__ = ["TTLCache", "CachedRepository", "CachedVersionRepository", "cached"]
+
+R = TypeVar("R")
+
+_MISSING = object()
+
+
+class TTLCache:
+    def __init__(
+        self, maxsize: int, ttl: float, clock: Callable[[], float] = monotonic
+    ) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._store: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        # растёт при каждом сбросе: значение, загруженное до сброса, устарело
+        self.generation = 0
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def get(self, key: Hashable) -> Any:
+        entry = self._store.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._store[key]
+            return _MISSING
+        self._store.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._store[key] = (self._clock() + self._ttl, value)
+        self._store.move_to_end(key)
+        while len(self._store) > self._maxsize:
+            self._store.popitem(last=False)
+
+    def clear(self) -> None:
+        self._store.clear()
+        self.generation += 1
+
+
+class CachedRepository:
+    # сущности ссылаются друг на друга (заклинание хранит id классов и т.д.),
+    # поэтому любая запись сбрасывает кеш целиком, а не только свою запись
+    write_methods = frozenset(["save", "create", "create_many", "update", "delete"])
+
+    def __init__(
+        self, repository: Any, cache: TTLCache, db_helper: DBHelper | None = None
+    ) -> None:
+        self._repository = repository
+        self._cache = cache
+        self._db_helper = db_helper
+
+    async def id_exists(self, *args: Any, **kwargs: Any) -> bool:
+        if self._bypass():
+            return await self._repository.id_exists(*args, **kwargs)
+        if self._cache.get(self._key(args, kwargs)) is not _MISSING:
+            return True
+        return await self._repository.id_exists(*args, **kwargs)
+
+    async def get_by_id(self, *args: Any, **kwargs: Any) -> Any:
+        if self._bypass():
+            return await self._repository.get_by_id(*args, **kwargs)
+        key = self._key(args, kwargs)
+        value = self._cache.get(key)
+        if value is _MISSING:
+            generation = self._cache.generation
+            value = await self._repository.get_by_id(*args, **kwargs)
+            # запись, прошедшая во время загрузки, сбросила кеш: значение
+            # могло быть прочитано до неё
+            if generation == self._cache.generation:
+                self._cache.set(key, value)
+        # доменные сущности изменяют списки, полученные из dto, на месте
+        return deepcopy(value)
+
+    def _bypass(self) -> bool:
+        # внутри единицы работы видны незафиксированные строки; после отката
+        # их никто не сбросит, поэтому такие чтения идут мимо кеша
+        return self._db_helper is not None and self._db_helper.in_unit_of_work
+
+    def _key(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+        return (type(self._repository).__name__, args, tuple(sorted(kwargs.items())))
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._repository, name)
+        if name not in self.write_methods:
+            return attr
+
+        async def write(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await attr(*args, **kwargs)
+            finally:
+                self._cache.clear()
+
+        return write
+
+
+class CachedVersionRepository(VersionRepository):
+    # версии для ETag: условный GET без запроса в БД, пока кеш не сброшен
+    # записью в справочник (локальной или пришедшей по шине) или по TTL
+    def __init__(
+        self,
+        repository: VersionRepository,
+        cache: TTLCache,
+        db_helper: DBHelper | None = None,
+    ) -> None:
+        self._repository = repository
+        self._cache = cache
+        self._db_helper = db_helper
+
+    async def version(
+        self, entity_type: str, entity_id: UUID | None = None
+    ) -> AppVersion:
+        if self._db_helper is not None and self._db_helper.in_unit_of_work:
+            return await self._repository.version(entity_type, entity_id)
+        key = ("version", entity_type, entity_id)
+        value = self._cache.get(key)
+        if value is _MISSING:
+            generation = self._cache.generation
+            value = await self._repository.version(entity_type, entity_id)
+            if generation == self._cache.generation:
+                self._cache.set(key, value)
+        return value
+
+    async def catalogue_version(self) -> AppVersion:
+        return await self._repository.catalogue_version()
+
+
+def cached(repository: R, cache: TTLCache, db_helper: DBHelper | None = None) -> R:
+    return cast(R, CachedRepository(repository, cache, db_helper))
@@ -7,6 +7,7 @@ from .feat import InMemoryFeatRepository
 from .material import InMemoryMaterialRepository
 from .material_component import InMemoryMaterialComponentRepository
 from .race import InMemoryRaceRepository
+from .search import InMemorySearchRepository
 from .source import InMemorySourceRepository
 from .spell import InMemorySpellRepository
 from .subclass_feature import InMemorySubclassFeatureRepository
@@ -27,6 +28,7 @@ __all__ = [
     "InMemoryMaterialRepository",
     "InMemoryMaterialComponentRepository",
     "InMemoryRaceRepository",
+    "InMemorySearchRepository",
     "InMemorySourceRepository",
     "InMemorySpellRepository",
     "InMemorySubclassFeatureRepository",
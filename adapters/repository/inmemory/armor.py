@@ -1,8 +1,13 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
+from adapters.repository.inmemory.page import paginate
 from application.dto.model.armor import AppArmor
+from application.dto.model.page import AppCursor
+from application.dto.model.reference import AppReferences
 from application.repository import ArmorRepository as AppArmorRepository
 from domain.armor import ArmorRepository as DomainArmorRepository
+from domain.error import DomainError
 
 
 class InMemoryArmorRepository(DomainArmorRepository, AppArmorRepository):
@@ -18,7 +23,12 @@ class InMemoryArmorRepository(DomainArmorRepository, AppArmorRepository):
     async def id_exists(self, armor_id: UUID) -> bool:
         return armor_id in self._store
 
+    async def missing_ids(self, armor_ids: Sequence[UUID]) -> set[UUID]:
+        return {i for i in armor_ids if i not in self._store}
+
     async def get_by_id(self, armor_id: UUID) -> AppArmor:
+        if armor_id not in self._store:
+            raise DomainError.not_found(f"доспехи с id {armor_id} не существует")
         return self._store[armor_id]
 
     async def get_all(self) -> list[AppArmor]:
@@ -29,6 +39,8 @@ class InMemoryArmorRepository(DomainArmorRepository, AppArmorRepository):
         search_by_name: str | None = None,
         filter_by_armor_types: list[str] | None = None,
         filter_by_material_ids: list[UUID] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppArmor]:
         result: list[AppArmor] = list()
         for armor in self._store.values():
@@ -44,7 +56,21 @@ class InMemoryArmorRepository(DomainArmorRepository, AppArmorRepository):
                 )
             ):
                 result.append(armor)
-        return result
+        return paginate(
+            result, lambda armor: (armor.name, armor.armor_id), limit, cursor
+        )
+
+    async def references(
+        self,
+        filter_by_material_ids: list[UUID] | None = None,
+        limit: int = 5,
+    ) -> AppReferences:
+        result = await self.filter(
+            filter_by_material_ids=filter_by_material_ids,
+        )
+        return AppReferences(
+            count=len(result), names=[item.name for item in result[:limit]]
+        )
 
     async def save(self, armor: AppArmor) -> None:
         self._store[armor.armor_id] = armor
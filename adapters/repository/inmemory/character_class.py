@@ -1,8 +1,13 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
-from application.dto.model.character_class import AppClass
+from adapters.repository.inmemory.page import paginate
+from application.dto.model.character_class import AppClass, AppClassSummary
+from application.dto.model.page import AppCursor
+from application.dto.model.reference import AppReferences
 from application.repository import ClassRepository as AppClassRepository
 from domain.character_class import ClassRepository as DomainClassRepository
+from domain.error import DomainError
 
 
 class InMemoryClassRepository(DomainClassRepository, AppClassRepository):
@@ -20,7 +25,12 @@ class InMemoryClassRepository(DomainClassRepository, AppClassRepository):
     async def id_exists(self, class_id: UUID) -> bool:
         return class_id in self._store
 
+    async def missing_ids(self, class_ids: Sequence[UUID]) -> set[UUID]:
+        return {i for i in class_ids if i not in self._store}
+
     async def get_by_id(self, class_id: UUID) -> AppClass:
+        if class_id not in self._store:
+            raise DomainError.not_found(f"класса с id {class_id} не существует")
         return self._store[class_id]
 
     async def get_all(self) -> list[AppClass]:
@@ -32,6 +42,8 @@ class InMemoryClassRepository(DomainClassRepository, AppClassRepository):
         filter_by_source_ids: list[UUID] | None = None,
         filter_by_tool_ids: list[UUID] | None = None,
         filter_by_weapon_ids: list[UUID] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppClass]:
         result: list[AppClass] = list()
         for c in self._store.values():
@@ -50,7 +62,42 @@ class InMemoryClassRepository(DomainClassRepository, AppClassRepository):
                 )
             ):
                 result.append(c)
-        return result
+        return paginate(result, lambda c: (c.name, c.class_id), limit, cursor)
+
+    async def filter_summaries(
+        self,
+        search_by_name: str | None = None,
+        filter_by_source_ids: list[UUID] | None = None,
+        filter_by_tool_ids: list[UUID] | None = None,
+        filter_by_weapon_ids: list[UUID] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
+    ) -> list[AppClassSummary]:
+        items = await self.filter(
+            search_by_name=search_by_name,
+            filter_by_source_ids=filter_by_source_ids,
+            filter_by_tool_ids=filter_by_tool_ids,
+            filter_by_weapon_ids=filter_by_weapon_ids,
+            limit=limit,
+            cursor=cursor,
+        )
+        return [AppClassSummary.from_app(item) for item in items]
+
+    async def references(
+        self,
+        filter_by_source_ids: list[UUID] | None = None,
+        filter_by_tool_ids: list[UUID] | None = None,
+        filter_by_weapon_ids: list[UUID] | None = None,
+        limit: int = 5,
+    ) -> AppReferences:
+        result = await self.filter(
+            filter_by_source_ids=filter_by_source_ids,
+            filter_by_tool_ids=filter_by_tool_ids,
+            filter_by_weapon_ids=filter_by_weapon_ids,
+        )
+        return AppReferences(
+            count=len(result), names=[item.name for item in result[:limit]]
+        )
 
     async def save(self, character_class: AppClass) -> None:
         self._store[character_class.class_id] = character_class
@@ -1,9 +1,12 @@
-from typing import Dict
+from typing import Dict, Sequence
 from uuid import UUID, uuid4
 
+from adapters.repository.inmemory.page import paginate
 from application.dto.model.character_subclass import AppSubclass
+from application.dto.model.page import AppCursor
 from application.repository import SubclassRepository as AppSubclassRepository
 from domain.character_subclass import SubclassRepository as DomainSubclassRepository
+from domain.error import DomainError
 
 
 class InMemorySubclassRepository(DomainSubclassRepository, AppSubclassRepository):
@@ -19,21 +22,36 @@ class InMemorySubclassRepository(DomainSubclassRepository, AppSubclassRepository
     async def id_exists(self, subclass_id: UUID) -> bool:
         return subclass_id in self._store
 
+    async def missing_ids(self, subclass_ids: Sequence[UUID]) -> set[UUID]:
+        return {i for i in subclass_ids if i not in self._store}
+
     async def get_by_id(self, subclass_id: UUID) -> AppSubclass:
+        if subclass_id not in self._store:
+            raise DomainError.not_found(f"подкласс с id {subclass_id} не существует")
         return self._store[subclass_id]
 
     async def get_all(self) -> list[AppSubclass]:
         return list(self._store.values())
 
-    async def filter(self, filter_by_class_id: UUID | None = None) -> list[AppSubclass]:
+    async def filter(
+        self,
+        filter_by_class_id: UUID | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
+    ) -> list[AppSubclass]:
+        result = list(self._store.values())
         if filter_by_class_id is not None:
-            return [
+            result = [
                 subclass
-                for subclass in self._store.values()
+                for subclass in result
                 if subclass.class_id == filter_by_class_id
             ]
-        else:
-            return list(self._store.values())
+        return paginate(
+            result,
+            lambda subclass: (subclass.name, subclass.subclass_id),
+            limit,
+            cursor,
+        )
 
     async def save(self, subclass: AppSubclass) -> None:
         self._store[subclass.subclass_id] = subclass
@@ -1,8 +1,12 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
+from adapters.repository.inmemory.page import paginate
 from application.dto.model.class_feature import AppClassFeature
+from application.dto.model.page import AppCursor
 from application.repository import ClassFeatureRepository as AppClassFeatureRepository
 from domain.class_feature import ClassFeatureRepository as DomainClassFeatureRepository
+from domain.error import DomainError
 
 
 class InMemoryClassFeatureRepository(
@@ -23,18 +27,27 @@ class InMemoryClassFeatureRepository(
     async def id_exists(self, feature_id: UUID) -> bool:
         return feature_id in self._store
 
+    async def missing_ids(self, feature_ids: Sequence[UUID]) -> set[UUID]:
+        return {i for i in feature_ids if i not in self._store}
+
     async def get_by_id(self, feature_id: UUID) -> AppClassFeature:
+        if feature_id not in self._store:
+            raise DomainError.not_found(f"умения с id {feature_id} не существует")
         return self._store[feature_id]
 
     async def get_all(self) -> list[AppClassFeature]:
         return list(self._store.values())
 
     async def filter(
-        self, filter_by_class_id: UUID | None = None
+        self,
+        filter_by_class_id: UUID | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppClassFeature]:
+        result = list(self._store.values())
         if filter_by_class_id is not None:
-            return [f for f in self._store.values() if f.class_id == filter_by_class_id]
-        return list(self._store.values())
+            result = [f for f in result if f.class_id == filter_by_class_id]
+        return paginate(result, lambda f: (f.level, f.feature_id), limit, cursor)
 
     async def save(self, feature: AppClassFeature) -> None:
         self._store[feature.feature_id] = feature
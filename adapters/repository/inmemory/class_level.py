@@ -1,8 +1,12 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
+from adapters.repository.inmemory.page import paginate
 from application.dto.model.class_level import AppClassLevel
+from application.dto.model.page import AppCursor
 from application.repository import ClassLevelRepository as AppClassLevelRepository
 from domain.class_level import ClassLevelRepository as DomainClassLevelRepository
+from domain.error import DomainError
 
 
 class InMemoryClassLevelRepository(DomainClassLevelRepository, AppClassLevelRepository):
@@ -22,22 +26,29 @@ class InMemoryClassLevelRepository(DomainClassLevelRepository, AppClassLevelRepo
     async def id_exists(self, level_id: UUID) -> bool:
         return level_id in self._store
 
+    async def missing_ids(self, level_ids: Sequence[UUID]) -> set[UUID]:
+        return {i for i in level_ids if i not in self._store}
+
     async def get_by_id(self, level_id: UUID) -> AppClassLevel:
+        if level_id not in self._store:
+            raise DomainError.not_found(f"уровень с id {level_id} не существует")
         return self._store[level_id]
 
     async def get_all(self) -> list[AppClassLevel]:
         return list(self._store.values())
 
     async def filter(
-        self, filter_by_class_id: UUID | None = None
+        self,
+        filter_by_class_id: UUID | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppClassLevel]:
+        result = list(self._store.values())
         if filter_by_class_id is not None:
-            return [
-                lvl
-                for lvl in self._store.values()
-                if lvl.class_id == filter_by_class_id
-            ]
-        return list(self._store.values())
+            result = [lvl for lvl in result if lvl.class_id == filter_by_class_id]
+        return paginate(
+            result, lambda lvl: (lvl.level, lvl.class_level_id), limit, cursor
+        )
 
     async def save(self, level: AppClassLevel) -> None:
         self._store[level.class_level_id] = level
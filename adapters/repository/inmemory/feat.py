@@ -1,7 +1,11 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
+from adapters.repository.inmemory.page import paginate
 from application.dto.model.feat import AppFeat
+from application.dto.model.page import AppCursor
 from application.repository import FeatRepository as AppFeatRepository
+from domain.error import DomainError
 from domain.feat import FeatRepository as DomainFeatRepository
 
 
@@ -18,7 +22,12 @@ class InMemoryFeatRepository(DomainFeatRepository, AppFeatRepository):
     async def id_exists(self, feat_id: UUID) -> bool:
         return feat_id in self._store
 
+    async def missing_ids(self, feat_ids: Sequence[UUID]) -> set[UUID]:
+        return {i for i in feat_ids if i not in self._store}
+
     async def get_by_id(self, feat_id: UUID) -> AppFeat:
+        if feat_id not in self._store:
+            raise DomainError.not_found(f"черты с id {feat_id} не существует")
         return self._store[feat_id]
 
     async def get_all(self) -> list[AppFeat]:
@@ -31,6 +40,8 @@ class InMemoryFeatRepository(DomainFeatRepository, AppFeatRepository):
         filter_by_required_armor_types: list[str] | None = None,
         filter_by_required_modifiers: list[str] | None = None,
         filter_by_increase_modifiers: list[str] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppFeat]:
         result: list[AppFeat] = list()
         for f in self._store.values():
@@ -58,7 +69,7 @@ class InMemoryFeatRepository(DomainFeatRepository, AppFeatRepository):
                 )
             ):
                 result.append(f)
-        return result
+        return paginate(result, lambda f: (f.name, f.feat_id), limit, cursor)
 
     async def save(self, feat: AppFeat) -> None:
         self._store[feat.feat_id] = feat
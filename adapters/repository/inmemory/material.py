@@ -1,7 +1,11 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
+from adapters.repository.inmemory.page import paginate
 from application.dto.model.material import AppMaterial
+from application.dto.model.page import AppCursor
 from application.repository import MaterialRepository as AppMaterialRepository
+from domain.error import DomainError
 from domain.material import MaterialRepository as DomainMaterialRepository
 
 
@@ -18,16 +22,27 @@ class InMemoryMaterialRepository(DomainMaterialRepository, AppMaterialRepository
     async def id_exists(self, material_id: UUID) -> bool:
         return material_id in self._store
 
+    async def missing_ids(self, material_ids: Sequence[UUID]) -> set[UUID]:
+        return {i for i in material_ids if i not in self._store}
+
     async def get_by_id(self, material_id: UUID) -> AppMaterial:
+        if material_id not in self._store:
+            raise DomainError.not_found(f"материала с id {material_id} не существует")
         return self._store[material_id]
 
     async def get_all(self) -> list[AppMaterial]:
         return list(self._store.values())
 
-    async def filter(self, search_by_name: str | None = None) -> list[AppMaterial]:
+    async def filter(
+        self,
+        search_by_name: str | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
+    ) -> list[AppMaterial]:
+        result = list(self._store.values())
         if search_by_name is not None:
-            return [m for m in self._store.values() if search_by_name in m.name]
-        return list(self._store.values())
+            result = [m for m in result if search_by_name in m.name]
+        return paginate(result, lambda m: (m.name, m.material_id), limit, cursor)
 
     async def save(self, material: AppMaterial) -> None:
         self._store[material.material_id] = material
@@ -0,0 +1,19 @@
+from typing import Any, Callable, Iterable, TypeVar
+from uuid import UUID
+
+from application.dto.model.page import AppCursor
+
+T = TypeVar("T")
+
+
+def paginate(
+    items: Iterable[T],
+    key: Callable[[T], tuple[Any, UUID]],
+    limit: int | None = None,
+    cursor: AppCursor | None = None,
+) -> list[T]:
+    result = sorted(items, key=key)
+    if cursor is not None:
+        after = (cursor.key, cursor.entity_id)
+        result = [item for item in result if key(item) > after]
+    return result if limit is None else result[:limit]
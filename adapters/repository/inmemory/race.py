@@ -1,7 +1,12 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
+from adapters.repository.inmemory.page import paginate
+from application.dto.model.page import AppCursor
 from application.dto.model.race import AppRace
+from application.dto.model.reference import AppReferences
 from application.repository import RaceRepository as AppRaceRepository
+from domain.error import DomainError
 from domain.race import RaceRepository as DomainRaceRepository
 
 
@@ -18,7 +23,12 @@ class InMemoryRaceRepository(DomainRaceRepository, AppRaceRepository):
     async def id_exists(self, race_id: UUID) -> bool:
         return race_id in self._store
 
+    async def missing_ids(self, race_ids: Sequence[UUID]) -> set[UUID]:
+        return {i for i in race_ids if i not in self._store}
+
     async def get_by_id(self, race_id: UUID) -> AppRace:
+        if race_id not in self._store:
+            raise DomainError.not_found(f"раса с id {race_id} не существует")
         return self._store[race_id]
 
     async def get_all(self) -> list[AppRace]:
@@ -28,6 +38,8 @@ class InMemoryRaceRepository(DomainRaceRepository, AppRaceRepository):
         self,
         search_by_name: str | None = None,
         filter_by_source_ids: list[UUID] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppRace]:
         result: list[AppRace] = list()
         for r in self._store.values():
@@ -35,7 +47,19 @@ class InMemoryRaceRepository(DomainRaceRepository, AppRaceRepository):
                 filter_by_source_ids is None or r.source_id in filter_by_source_ids
             ):
                 result.append(r)
-        return result
+        return paginate(result, lambda r: (r.name, r.race_id), limit, cursor)
+
+    async def references(
+        self,
+        filter_by_source_ids: list[UUID] | None = None,
+        limit: int = 5,
+    ) -> AppReferences:
+        result = await self.filter(
+            filter_by_source_ids=filter_by_source_ids,
+        )
+        return AppReferences(
+            count=len(result), names=[item.name for item in result[:limit]]
+        )
 
     async def save(self, race: AppRace) -> None:
         self._store[race.race_id] = race
@@ -0,0 +1,109 @@
+from adapters.repository.inmemory.armor import InMemoryArmorRepository
+from adapters.repository.inmemory.character_class import InMemoryClassRepository
+from adapters.repository.inmemory.character_subclass import InMemorySubclassRepository
+from adapters.repository.inmemory.feat import InMemoryFeatRepository
+from adapters.repository.inmemory.material import InMemoryMaterialRepository
+from adapters.repository.inmemory.race import InMemoryRaceRepository
+from adapters.repository.inmemory.spell import InMemorySpellRepository
+from adapters.repository.inmemory.subrace import InMemorySubraceRepository
+from adapters.repository.inmemory.tool import InMemoryToolRepository
+from adapters.repository.inmemory.weapon import InMemoryWeaponRepository
+from application.dto.model.search import AppSearchHit
+from application.repository import SearchRepository as AppSearchRepository
+
+
+class InMemorySearchRepository(AppSearchRepository):
+    def __init__(
+        self,
+        spell_repository: InMemorySpellRepository,
+        class_repository: InMemoryClassRepository,
+        subclass_repository: InMemorySubclassRepository,
+        race_repository: InMemoryRaceRepository,
+        subrace_repository: InMemorySubraceRepository,
+        feat_repository: InMemoryFeatRepository,
+        armor_repository: InMemoryArmorRepository,
+        weapon_repository: InMemoryWeaponRepository,
+        tool_repository: InMemoryToolRepository,
+        material_repository: InMemoryMaterialRepository,
+    ) -> None:
+        self._spells = spell_repository
+        self._classes = class_repository
+        self._subclasses = subclass_repository
+        self._races = race_repository
+        self._subraces = subrace_repository
+        self._feats = feat_repository
+        self._armors = armor_repository
+        self._weapons = weapon_repository
+        self._tools = tool_repository
+        self._materials = material_repository
+
+    async def search(self, term: str, limit: int) -> list[AppSearchHit]:
+        candidates = [
+            *[
+                ("spell", s.spell_id, s.name, s.name_in_english, s.description)
+                for s in self._spells._store.values()
+            ],
+            *[
+                ("class", c.class_id, c.name, c.name_in_english, c.description)
+                for c in self._classes._store.values()
+            ],
+            *[
+                ("subclass", s.subclass_id, s.name, s.name_in_english, s.description)
+                for s in self._subclasses._store.values()
+            ],
+            *[
+                ("race", r.race_id, r.name, r.name_in_english, r.description)
+                for r in self._races._store.values()
+            ],
+            *[
+                ("subrace", s.subrace_id, s.name, s.name_in_english, s.description)
+                for s in self._subraces._store.values()
+            ],
+            *[
+                ("feat", f.feat_id, f.name, None, f.description)
+                for f in self._feats._store.values()
+            ],
+            *[
+                ("armor", a.armor_id, a.name, None, a.description)
+                for a in self._armors._store.values()
+            ],
+            *[
+                ("weapon", w.weapon_id, w.name, None, w.description)
+                for w in self._weapons._store.values()
+            ],
+            *[
+                ("tool", t.tool_id, t.name, None, t.description)
+                for t in self._tools._store.values()
+            ],
+            *[
+                ("material", m.material_id, m.name, None, m.description)
+                for m in self._materials._store.values()
+            ],
+        ]
+        term = term.lower()
+        hits = list()
+        for entity_type, entity_id, name, name_in_english, description in candidates:
+            names = [name] if name_in_english is None else [name, name_in_english]
+            if not any(term in n.lower() for n in [*names, description]):
+                continue
+            hits.append(
+                AppSearchHit(
+                    entity_type=entity_type,
+                    entity_id=entity_id,
+                    name=name,
+                    name_in_english=name_in_english,
+                    rank=max(self._rank(term, n.lower()) for n in names),
+                )
+            )
+        hits.sort(key=lambda h: (-h.rank, h.name, h.entity_id))
+        return hits[:limit]
+
+    @staticmethod
+    def _rank(term: str, name: str) -> float:
+        if name == term:
+            return 1.0
+        if name.startswith(term):
+            return 0.75
+        if term in name:
+            return 0.5
+        return 0.0
@@ -1,7 +1,11 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
+from adapters.repository.inmemory.page import paginate
+from application.dto.model.page import AppCursor
 from application.dto.model.source import AppSource
 from application.repository import SourceRepository as AppSourceRepository
+from domain.error import DomainError
 from domain.source import SourceRepository as DomainSourceRepository
 
 
@@ -18,16 +22,27 @@ class InMemorySourceRepository(DomainSourceRepository, AppSourceRepository):
     async def id_exists(self, source_id: UUID) -> bool:
         return source_id in self._store
 
+    async def missing_ids(self, source_ids: Sequence[UUID]) -> set[UUID]:
+        return {i for i in source_ids if i not in self._store}
+
     async def get_by_id(self, source_id: UUID) -> AppSource:
+        if source_id not in self._store:
+            raise DomainError.not_found(f"источника с id {source_id} не существует")
         return self._store[source_id]
 
     async def get_all(self) -> list[AppSource]:
         return list(self._store.values())
 
-    async def filter(self, search_by_name: str | None = None) -> list[AppSource]:
+    async def filter(
+        self,
+        search_by_name: str | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
+    ) -> list[AppSource]:
+        result = list(self._store.values())
         if search_by_name is not None:
-            return [s for s in self._store.values() if search_by_name in s.name]
-        return list(self._store.values())
+            result = [s for s in result if search_by_name in s.name]
+        return paginate(result, lambda s: (s.name, s.source_id), limit, cursor)
 
     async def save(self, source: AppSource) -> None:
         self._store[source.source_id] = source
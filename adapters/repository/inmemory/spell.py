@@ -1,7 +1,12 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
-from application.dto.model.spell import AppSpell
+from adapters.repository.inmemory.page import paginate
+from application.dto.model.page import AppCursor
+from application.dto.model.reference import AppReferences
+from application.dto.model.spell import AppSpell, AppSpellSummary
 from application.repository import SpellRepository as AppSpellRepository
+from domain.error import DomainError
 from domain.spell import SpellRepository as DomainSpellRepository
 
 
@@ -12,13 +17,21 @@ class InMemorySpellRepository(DomainSpellRepository, AppSpellRepository):
     async def name_exists(self, name: str) -> bool:
         return any(spell.name == name for spell in self._store.values())
 
+    async def existing_names(self, names: Sequence[str]) -> set[str]:
+        return {spell.name for spell in self._store.values() if spell.name in names}
+
     async def next_id(self) -> UUID:
         return uuid4()
 
     async def id_exists(self, spell_id: UUID) -> bool:
         return spell_id in self._store
 
+    async def missing_ids(self, spell_ids: Sequence[UUID]) -> set[UUID]:
+        return {i for i in spell_ids if i not in self._store}
+
     async def get_by_id(self, spell_id: UUID) -> AppSpell:
+        if spell_id not in self._store:
+            raise DomainError.not_found(f"заклинание с id {spell_id} не существует")
         return self._store[spell_id]
 
     async def get_all(self) -> list[AppSpell]:
@@ -40,6 +53,8 @@ class InMemorySpellRepository(DomainSpellRepository, AppSpellRepository):
         filter_by_concentration: bool | None = None,
         filter_by_ritual: bool | None = None,
         filter_by_source_ids: list[UUID] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppSpell]:
         result: list[AppSpell] = list()
         for s in self._store.values():
@@ -98,10 +113,67 @@ class InMemorySpellRepository(DomainSpellRepository, AppSpellRepository):
                 )
             ):
                 result.append(s)
-        return result
+        return paginate(result, lambda s: (s.name, s.spell_id), limit, cursor)
+
+    async def filter_summaries(
+        self,
+        search_by_name: str | None = None,
+        filter_by_class_ids: list[UUID] | None = None,
+        filter_by_subclass_ids: list[UUID] | None = None,
+        filter_by_schools: list[str] | None = None,
+        filter_by_damage_types: list[str] | None = None,
+        filter_by_durations: list[str] | None = None,
+        filter_by_casting_times: list[str] | None = None,
+        filter_by_verbal_component: bool | None = None,
+        filter_by_symbolic_component: bool | None = None,
+        filter_by_material_component: bool | None = None,
+        filter_by_material_ids: list[UUID] | None = None,
+        filter_by_concentration: bool | None = None,
+        filter_by_ritual: bool | None = None,
+        filter_by_source_ids: list[UUID] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
+    ) -> list[AppSpellSummary]:
+        items = await self.filter(
+            search_by_name=search_by_name,
+            filter_by_class_ids=filter_by_class_ids,
+            filter_by_subclass_ids=filter_by_subclass_ids,
+            filter_by_schools=filter_by_schools,
+            filter_by_damage_types=filter_by_damage_types,
+            filter_by_durations=filter_by_durations,
+            filter_by_casting_times=filter_by_casting_times,
+            filter_by_verbal_component=filter_by_verbal_component,
+            filter_by_symbolic_component=filter_by_symbolic_component,
+            filter_by_material_component=filter_by_material_component,
+            filter_by_material_ids=filter_by_material_ids,
+            filter_by_concentration=filter_by_concentration,
+            filter_by_ritual=filter_by_ritual,
+            filter_by_source_ids=filter_by_source_ids,
+            limit=limit,
+            cursor=cursor,
+        )
+        return [AppSpellSummary.from_app(item) for item in items]
+
+    async def references(
+        self,
+        filter_by_source_ids: list[UUID] | None = None,
+        filter_by_material_ids: list[UUID] | None = None,
+        limit: int = 5,
+    ) -> AppReferences:
+        result = await self.filter(
+            filter_by_source_ids=filter_by_source_ids,
+            filter_by_material_ids=filter_by_material_ids,
+        )
+        return AppReferences(
+            count=len(result), names=[item.name for item in result[:limit]]
+        )
 
     async def save(self, spell: AppSpell) -> None:
         self._store[spell.spell_id] = spell
 
+    async def create_many(self, spells: Sequence[AppSpell]) -> None:
+        for spell in spells:
+            self._store[spell.spell_id] = spell
+
     async def delete(self, spell_id: UUID) -> None:
         del self._store[spell_id]
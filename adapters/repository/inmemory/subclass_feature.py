@@ -1,9 +1,13 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
+from adapters.repository.inmemory.page import paginate
+from application.dto.model.page import AppCursor
 from application.dto.model.subclass_feature import AppSubclassFeature
 from application.repository import (
     SubclassFeatureRepository as AppSubclassFeatureRepository,
 )
+from domain.error import DomainError
 from domain.subclass_feature import (
     SubclassFeatureRepository as DomainSubclassFeatureRepository,
 )
@@ -27,22 +31,27 @@ class InMemorySubclassFeatureRepository(
     async def id_exists(self, feature_id: UUID) -> bool:
         return feature_id in self._store
 
+    async def missing_ids(self, feature_ids: Sequence[UUID]) -> set[UUID]:
+        return {i for i in feature_ids if i not in self._store}
+
     async def get_by_id(self, feature_id: UUID) -> AppSubclassFeature:
+        if feature_id not in self._store:
+            raise DomainError.not_found(f"умения с id {feature_id} не существует")
         return self._store[feature_id]
 
     async def get_all(self) -> list[AppSubclassFeature]:
         return list(self._store.values())
 
     async def filter(
-        self, filter_by_subclass_id: UUID | None = None
+        self,
+        filter_by_subclass_id: UUID | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppSubclassFeature]:
+        result = list(self._store.values())
         if filter_by_subclass_id is not None:
-            return [
-                f
-                for f in self._store.values()
-                if f.subclass_id == filter_by_subclass_id
-            ]
-        return list(self._store.values())
+            result = [f for f in result if f.subclass_id == filter_by_subclass_id]
+        return paginate(result, lambda f: (f.level, f.feature_id), limit, cursor)
 
     async def save(self, feature: AppSubclassFeature) -> None:
         self._store[feature.feature_id] = feature
@@ -1,7 +1,11 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
+from adapters.repository.inmemory.page import paginate
+from application.dto.model.page import AppCursor
 from application.dto.model.subrace import AppSubrace
 from application.repository import SubraceRepository as AppSubraceRepository
+from domain.error import DomainError
 from domain.subrace import SubraceRepository as DomainSubraceRepository
 
 
@@ -18,16 +22,27 @@ class InMemorySubraceRepository(DomainSubraceRepository, AppSubraceRepository):
     async def id_exists(self, subrace_id: UUID) -> bool:
         return subrace_id in self._store
 
+    async def missing_ids(self, subrace_ids: Sequence[UUID]) -> set[UUID]:
+        return {i for i in subrace_ids if i not in self._store}
+
     async def get_by_id(self, subrace_id: UUID) -> AppSubrace:
+        if subrace_id not in self._store:
+            raise DomainError.not_found(f"подраса с id {subrace_id} не существует")
         return self._store[subrace_id]
 
     async def get_all(self) -> list[AppSubrace]:
         return list(self._store.values())
 
-    async def filter(self, search_by_name: str | None = None) -> list[AppSubrace]:
+    async def filter(
+        self,
+        search_by_name: str | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
+    ) -> list[AppSubrace]:
+        result = list(self._store.values())
         if search_by_name is not None:
-            return [s for s in self._store.values() if search_by_name in s.name]
-        return list(self._store.values())
+            result = [s for s in result if search_by_name in s.name]
+        return paginate(result, lambda s: (s.name, s.subrace_id), limit, cursor)
 
     async def save(self, subrace: AppSubrace) -> None:
         self._store[subrace.subrace_id] = subrace
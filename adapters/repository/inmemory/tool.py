@@ -1,7 +1,11 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
+from adapters.repository.inmemory.page import paginate
+from application.dto.model.page import AppCursor
 from application.dto.model.tool import AppTool
 from application.repository import ToolRepository as AppToolRepository
+from domain.error import DomainError
 from domain.tool import ToolRepository as DomainToolRepository
 
 
@@ -18,16 +22,27 @@ class InMemoryToolRepository(DomainToolRepository, AppToolRepository):
     async def id_exists(self, tool_id: UUID) -> bool:
         return tool_id in self._store
 
+    async def missing_ids(self, tool_ids: Sequence[UUID]) -> set[UUID]:
+        return {i for i in tool_ids if i not in self._store}
+
     async def get_by_id(self, tool_id: UUID) -> AppTool:
+        if tool_id not in self._store:
+            raise DomainError.not_found(f"инструмента с id {tool_id} не существует")
         return self._store[tool_id]
 
     async def get_all(self) -> list[AppTool]:
         return list(self._store.values())
 
-    async def filter(self, search_by_name: str | None = None) -> list[AppTool]:
+    async def filter(
+        self,
+        search_by_name: str | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
+    ) -> list[AppTool]:
+        result = list(self._store.values())
         if search_by_name is not None:
-            return [t for t in self._store.values() if search_by_name in t.name]
-        return list(self._store.values())
+            result = [t for t in result if search_by_name in t.name]
+        return paginate(result, lambda t: (t.name, t.tool_id), limit, cursor)
 
     async def save(self, tool: AppTool) -> None:
         self._store[tool.tool_id] = tool
@@ -1,3 +1,4 @@
+from typing import Sequence
 from uuid import UUID
 
 from application.dto.model.user import AppUser
@@ -11,6 +12,9 @@ class InMemoryUserRepository(UserRepository):
     async def id_exists(self, user_id: UUID) -> bool:
         return user_id in self._store
 
+    async def missing_ids(self, user_ids: Sequence[UUID]) -> set[UUID]:
+        return {i for i in user_ids if i not in self._store}
+
     async def get_all(self) -> list[AppUser]:
         return list(self._store.values())
 
@@ -1,7 +1,12 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
+from adapters.repository.inmemory.page import paginate
+from application.dto.model.page import AppCursor
+from application.dto.model.reference import AppReferences
 from application.dto.model.weapon import AppWeapon
 from application.repository import WeaponRepository as AppWeaponRepository
+from domain.error import DomainError
 from domain.weapon import WeaponRepository as DomainWeaponRepository
 
 
@@ -18,7 +23,12 @@ class InMemoryWeaponRepository(DomainWeaponRepository, AppWeaponRepository):
     async def id_exists(self, weapon_id: UUID) -> bool:
         return weapon_id in self._store
 
+    async def missing_ids(self, weapon_ids: Sequence[UUID]) -> set[UUID]:
+        return {i for i in weapon_ids if i not in self._store}
+
     async def get_by_id(self, weapon_id: UUID) -> AppWeapon:
+        if weapon_id not in self._store:
+            raise DomainError.not_found(f"оружия с id {weapon_id} не существует")
         return self._store[weapon_id]
 
     async def get_all(self) -> list[AppWeapon]:
@@ -31,6 +41,8 @@ class InMemoryWeaponRepository(DomainWeaponRepository, AppWeaponRepository):
         filter_by_damage_types: list[str] | None = None,
         filter_by_property_ids: list[UUID] | None = None,
         filter_by_material_ids: list[UUID] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppWeapon]:
         result: list[AppWeapon] = list()
         for w in self._store.values():
@@ -53,7 +65,23 @@ class InMemoryWeaponRepository(DomainWeaponRepository, AppWeaponRepository):
                 )
             ):
                 result.append(w)
-        return result
+        return paginate(result, lambda w: (w.name, w.weapon_id), limit, cursor)
+
+    async def references(
+        self,
+        filter_by_kind_ids: list[UUID] | None = None,
+        filter_by_property_ids: list[UUID] | None = None,
+        filter_by_material_ids: list[UUID] | None = None,
+        limit: int = 5,
+    ) -> AppReferences:
+        result = await self.filter(
+            filter_by_kind_ids=filter_by_kind_ids,
+            filter_by_property_ids=filter_by_property_ids,
+            filter_by_material_ids=filter_by_material_ids,
+        )
+        return AppReferences(
+            count=len(result), names=[item.name for item in result[:limit]]
+        )
 
     async def save(self, weapon: AppWeapon) -> None:
         self._store[weapon.weapon_id] = weapon
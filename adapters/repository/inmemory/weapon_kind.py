@@ -1,7 +1,11 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
+from adapters.repository.inmemory.page import paginate
+from application.dto.model.page import AppCursor
 from application.dto.model.weapon_kind import AppWeaponKind
 from application.repository import WeaponKindRepository as AppWeaponKindRepository
+from domain.error import DomainError
 from domain.weapon_kind import WeaponKindRepository as DomainWeaponKindRepository
 
 
@@ -18,7 +22,14 @@ class InMemoryWeaponKindRepository(DomainWeaponKindRepository, AppWeaponKindRepo
     async def id_exists(self, weapon_kind_id: UUID) -> bool:
         return weapon_kind_id in self._store
 
+    async def missing_ids(self, weapon_kind_ids: Sequence[UUID]) -> set[UUID]:
+        return {i for i in weapon_kind_ids if i not in self._store}
+
     async def get_by_id(self, weapon_kind_id: UUID) -> AppWeaponKind:
+        if weapon_kind_id not in self._store:
+            raise DomainError.not_found(
+                f"вид оружия с id {weapon_kind_id} не существует"
+            )
         return self._store[weapon_kind_id]
 
     async def get_all(self) -> list[AppWeaponKind]:
@@ -28,6 +39,8 @@ class InMemoryWeaponKindRepository(DomainWeaponKindRepository, AppWeaponKindRepo
         self,
         search_by_name: str | None = None,
         filter_by_types: list[str] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppWeaponKind]:
         result: list[AppWeaponKind] = list()
         for k in self._store.values():
@@ -35,7 +48,7 @@ class InMemoryWeaponKindRepository(DomainWeaponKindRepository, AppWeaponKindRepo
                 filter_by_types is None or k.weapon_type in filter_by_types
             ):
                 result.append(k)
-        return result
+        return paginate(result, lambda k: (k.name, k.weapon_kind_id), limit, cursor)
 
     async def save(self, weapon_kind: AppWeaponKind) -> None:
         self._store[weapon_kind.weapon_kind_id] = weapon_kind
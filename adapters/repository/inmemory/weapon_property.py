@@ -1,9 +1,13 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
+from adapters.repository.inmemory.page import paginate
+from application.dto.model.page import AppCursor
 from application.dto.model.weapon_property import AppWeaponProperty
 from application.repository import (
     WeaponPropertyRepository as AppWeaponPropertyRepository,
 )
+from domain.error import DomainError
 from domain.weapon_property import (
     WeaponPropertyRepository as DomainWeaponPropertyRepository,
 )
@@ -26,18 +30,29 @@ class InMemoryWeaponPropertyRepository(
     async def id_exists(self, weapon_property_id: UUID) -> bool:
         return weapon_property_id in self._store
 
+    async def missing_ids(self, weapon_property_ids: Sequence[UUID]) -> set[UUID]:
+        return {i for i in weapon_property_ids if i not in self._store}
+
     async def get_by_id(self, weapon_property_id: UUID) -> AppWeaponProperty:
+        if weapon_property_id not in self._store:
+            raise DomainError.not_found(
+                f"свойства оружия с id {weapon_property_id} не существует"
+            )
         return self._store[weapon_property_id]
 
     async def get_all(self) -> list[AppWeaponProperty]:
         return list(self._store.values())
 
     async def filter(
-        self, search_by_name: str | None = None
+        self,
+        search_by_name: str | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppWeaponProperty]:
+        result = list(self._store.values())
         if search_by_name is not None:
-            return [w for w in self._store.values() if search_by_name in w.name]
-        return list(self._store.values())
+            result = [w for w in result if search_by_name in w.name]
+        return paginate(result, lambda w: (w.name, w.weapon_property_id), limit, cursor)
 
     async def save(self, weapon_property: AppWeaponProperty) -> None:
         self._store[weapon_property.weapon_property_id] = weapon_property
@@ -0,0 +1,242 @@
+import asyncio
+import contextvars
+import logging
+from copy import deepcopy
+from dataclasses import dataclass
+from time import monotonic
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, TypeVar, cast
+from uuid import UUID
+
+from adapters.repository.sql import DBHelper, SQLVersionRepository
+from adapters.repository.sql.models import Base, UserModel
+from application.dto.model.version import AppVersion
+from application.repository import VersionRepository
+
+__all__ = [
+    "SnapshotStore",
+    "SnapshotRepository",
+    "SnapshotVersionRepository",
+    "snapshot",
+]
+
+R = TypeVar("R")
+
+logger = logging.getLogger("dnd_guide.snapshot")
+
+# поле с id сущности каждого справочника
+ID_FIELDS: dict[str, str] = {
+    "armor": "armor_id",
+    "class": "class_id",
+    "subclass": "subclass_id",
+    "class_feature": "feature_id",
+    "class_level": "class_level_id",
+    "feat": "feat_id",
+    "material": "material_id",
+    "material_component": "material_id",
+    "race": "race_id",
+    "source": "source_id",
+    "spell": "spell_id",
+    "subclass_feature": "feature_id",
+    "subrace": "subrace_id",
+    "tool": "tool_id",
+    "weapon": "weapon_id",
+    "weapon_kind": "weapon_kind_id",
+    "weapon_property": "weapon_property_id",
+}
+
+# коммиты в остальные таблицы (пользователи) снимок не сбрасывают
+CATALOGUE_TABLES = frozenset(
+    name for name in Base.metadata.tables if name != UserModel.__tablename__
+)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    entities: Mapping[str, Mapping[UUID, Any]]
+    generation: int
+    version: AppVersion
+
+
+class SnapshotStore:
+    # весь справочник в памяти процесса; снимок собирается целиком и
+    # подменяется одной ссылкой, поэтому читатели не видят его наполовину
+    def __init__(
+        self,
+        db_helper: DBHelper,
+        poll_interval: float,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._db_helper = db_helper
+        self._version_repository = SQLVersionRepository(db_helper)
+        self._sources: dict[str, Any] = {}
+        self._poll_interval = poll_interval
+        self._clock = clock
+        self._snapshot: Snapshot | None = None
+        self._generation = 0
+        self._polled_at = float("-inf")
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        db_helper.on_commit(self.invalidate, CATALOGUE_TABLES)
+
+    def register(self, name: str, repository: Any) -> None:
+        self._sources[name] = repository
+
+    def invalidate(self) -> None:
+        # счётчик растёт и при записи, и после коммита: снимок, собранный
+        # между ними, не успеет стать текущим
+        self._generation += 1
+
+    def current(self) -> Mapping[str, Mapping[UUID, Any]] | None:
+        # внутри единицы работы читаем из БД, чтобы видеть свои же записи
+        if self._db_helper.in_unit_of_work:
+            return None
+        snapshot = self._snapshot
+        fresh = snapshot is not None and snapshot.generation == self._generation
+        if not fresh or self._clock() - self._polled_at >= self._poll_interval:
+            self._schedule_refresh()
+        return snapshot.entities if fresh and snapshot is not None else None
+
+    def catalogue_version(self) -> AppVersion | None:
+        # версия справочника, из которой собран текущий снимок
+        if self.current() is None or self._snapshot is None:
+            return None
+        return self._snapshot.version
+
+    async def refresh(self) -> None:
+        async with self._lock:
+            generation = self._generation
+            version = await self._version()
+            self._polled_at = self._clock()
+            snapshot = self._snapshot
+            if (
+                snapshot is not None
+                and snapshot.generation == generation
+                and snapshot.version == version
+            ):
+                return
+            entities = await self._load()
+            if generation != self._generation:
+                return
+            self._snapshot = Snapshot(entities, generation, version)
+            logger.info("catalogue snapshot rebuilt, version %s", version)
+
+    async def wait(self) -> None:
+        if self._task is not None:
+            await asyncio.shield(self._task)
+
+    def _schedule_refresh(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        # пустой контекст: перестройка не должна попасть в сессию единицы
+        # работы или в статистику запросов того HTTP запроса, что её запустил
+        self._task = asyncio.create_task(
+            self._refresh_logged(), context=contextvars.Context()
+        )
+
+    async def _refresh_logged(self) -> None:
+        try:
+            await self.refresh()
+        except Exception:
+            logger.exception("catalogue snapshot rebuild failed")
+
+    async def _version(self) -> AppVersion:
+        return await self._version_repository.catalogue_version()
+
+    async def _load(self) -> Mapping[str, Mapping[UUID, Any]]:
+        # только для чтения: снимок делят все запросы процесса
+        entities = {}
+        for name, source in self._sources.items():
+            field = ID_FIELDS[name]
+            entities[name] = MappingProxyType(
+                {getattr(entity, field): entity for entity in await source.get_all()}
+            )
+        return MappingProxyType(entities)
+
+
+class SnapshotRepository:
+    # из снимка - выборки по id, запись и остальные чтения - в исходный
+    # репозиторий: фильтры, поиск и порядок страниц задаёт только БД, иначе
+    # курсор из снимка разошёлся бы со страницей из БД
+    write_methods = frozenset(["save", "create", "create_many", "update", "delete"])
+
+    def __init__(self, repository: Any, store: SnapshotStore, name: str) -> None:
+        self._repository = repository
+        self._store = store
+        self._name = name
+        store.register(name, repository)
+
+    async def get_by_id(self, *args: Any, **kwargs: Any) -> Any:
+        entities = self._entities()
+        entity = None if entities is None else entities.get(_entity_id(args, kwargs))
+        if entity is None:
+            # снимок не готов или ещё не видит запись: БД вернёт её или not_found
+            return await self._repository.get_by_id(*args, **kwargs)
+        # доменные сущности изменяют списки, полученные из dto, на месте
+        return deepcopy(entity)
+
+    async def id_exists(self, *args: Any, **kwargs: Any) -> bool:
+        entities = self._entities()
+        if entities is not None and _entity_id(args, kwargs) in entities:
+            return True
+        return await self._repository.id_exists(*args, **kwargs)
+
+    async def get_all(self) -> list[Any]:
+        entities = self._entities()
+        if entities is None:
+            return await self._repository.get_all()
+        return deepcopy(list(entities.values()))
+
+    def _entities(self) -> Mapping[UUID, Any] | None:
+        current = self._store.current()
+        return None if current is None else current[self._name]
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._repository, name)
+        if name not in self.write_methods:
+            return attr
+
+        async def write(*args: Any, **kwargs: Any) -> Any:
+            self._store.invalidate()
+            return await attr(*args, **kwargs)
+
+        return write
+
+
+class SnapshotVersionRepository(VersionRepository):
+    # версия для ETag без запроса в БД: одна на весь справочник, поэтому
+    # меняется при любой записи в него и отстаёт от БД не больше самого снимка
+    def __init__(self, repository: VersionRepository, store: SnapshotStore) -> None:
+        self._repository = repository
+        self._store = store
+
+    async def version(
+        self, entity_type: str, entity_id: UUID | None = None
+    ) -> AppVersion:
+        entities = self._store.current()
+        version = self._store.catalogue_version()
+        if (
+            entities is None
+            or version is None
+            or entity_type not in entities
+            or (entity_id is not None and entity_id not in entities[entity_type])
+        ):
+            # снимок не готов, тип неизвестен или сущности в нём нет (новая
+            # или удалённая): ответ даст БД
+            return await self._repository.version(entity_type, entity_id)
+        return version
+
+    async def catalogue_version(self) -> AppVersion:
+        version = self._store.catalogue_version()
+        if version is None:
+            return await self._repository.catalogue_version()
+        return version
+
+
+def _entity_id(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+    (entity_id,) = (*args, *kwargs.values())
+    return entity_id
+
+
+def snapshot(repository: R, store: SnapshotStore, name: str) -> R:
+    return cast(R, SnapshotRepository(repository, store, name))
@@ -4,16 +4,22 @@ from .character_subclass import SQLSubclassRepository
 from .class_feature import SQLClassFeatureRepository
 from .class_level import SQLClassLevelRepository
 from .database import DBHelper
+from .export import SQLExportRepository
 from .feat import SQLFeatRepository
+from .instrumentation import QueryStats, track_queries
 from .material import SQLMaterialRepository
 from .material_component import SQLMaterialComponentRepository
+from .pool import PoolMetrics, PoolSettings
 from .race import SQLRaceRepository
+from .search import SQLSearchRepository
 from .source import SQLSourceRepository
 from .spell import SQLSpellRepository
 from .subclass_feature import SQLSubclassFeatureRepository
 from .subrace import SQLSubraceRepository
 from .tool import SQLToolRepository
+from .unit_of_work import UnitOfWork
 from .user import SQLUserRepository
+from .version import SQLVersionRepository
 from .weapon import SQLWeaponRepository
 from .weapon_kind import SQLWeaponKindRepository
 from .weapon_property import SQLWeaponPropertyRepository
@@ -25,16 +31,24 @@ __all__ = [
     "SQLClassFeatureRepository",
     "SQLClassLevelRepository",
     "DBHelper",
+    "SQLExportRepository",
     "SQLFeatRepository",
     "SQLMaterialRepository",
     "SQLMaterialComponentRepository",
+    "PoolMetrics",
+    "PoolSettings",
+    "QueryStats",
+    "track_queries",
     "SQLRaceRepository",
+    "SQLSearchRepository",
     "SQLSourceRepository",
     "SQLSpellRepository",
     "SQLSubclassFeatureRepository",
     "SQLSubraceRepository",
     "SQLToolRepository",
+    "UnitOfWork",
     "SQLUserRepository",
+    "SQLVersionRepository",
     "SQLWeaponRepository",
     "SQLWeaponKindRepository",
     "SQLWeaponPropertyRepository",
@@ -1,8 +1,14 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
 from adapters.repository.sql.database import DBHelper
 from adapters.repository.sql.models import ArmorModel, MaterialModel
+from adapters.repository.sql.page import paginate
+from adapters.repository.sql.reference import fetch_references, select_references
+from adapters.repository.sql.search import name_matches, search_rank
 from application.dto.model.armor import AppArmor
+from application.dto.model.page import AppCursor
+from application.dto.model.reference import AppReferences
 from application.repository import ArmorRepository as AppArmorRepository
 from domain.armor import ArmorRepository as DomainArmorRepository
 from domain.error import DomainError
@@ -30,6 +36,14 @@ class SQLArmorRepository(DomainArmorRepository, AppArmorRepository):
             result = result.scalar()
             return result if result is not None else False
 
+    async def missing_ids(self, armor_ids: Sequence[UUID]) -> set[UUID]:
+        if len(armor_ids) == 0:
+            return set()
+        async with self.__helper.session as session:
+            query = select(ArmorModel.id).where(ArmorModel.id.in_(armor_ids))
+            result = await session.execute(query)
+            return set(armor_ids) - set(result.scalars().all())
+
     async def get_by_id(self, armor_id: UUID) -> AppArmor:
         async with self.__helper.session as session:
             query = select(ArmorModel).where(ArmorModel.id == armor_id)
@@ -51,21 +65,42 @@ class SQLArmorRepository(DomainArmorRepository, AppArmorRepository):
         search_by_name: str | None = None,
         filter_by_armor_types: list[str] | None = None,
         filter_by_material_ids: list[UUID] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppArmor]:
         async with self.__helper.session as session:
             query = select(ArmorModel)
             conditions = list()
             if search_by_name is not None:
-                conditions.append(ArmorModel.name.ilike(f"%{search_by_name}%"))
+                conditions.append(name_matches(search_by_name, ArmorModel.name))
             if filter_by_armor_types is not None:
                 conditions.append(ArmorModel.armor_type.in_(filter_by_armor_types))
             if filter_by_material_ids is not None:
                 conditions.append(ArmorModel.material_id.in_(filter_by_material_ids))
             if len(conditions) > 0:
                 query = query.where(*conditions)
+            query = paginate(
+                query,
+                ArmorModel.name,
+                ArmorModel.id,
+                limit,
+                cursor,
+                rank=search_rank(search_by_name, ArmorModel.name),
+            )
             result = await session.execute(query)
             return [armor.to_app() for armor in result.scalars().all()]
 
+    async def references(
+        self,
+        filter_by_material_ids: list[UUID] | None = None,
+        limit: int = 5,
+    ) -> AppReferences:
+        async with self.__helper.session as session:
+            query = select_references(ArmorModel.name, limit)
+            if filter_by_material_ids is not None:
+                query = query.where(ArmorModel.material_id.in_(filter_by_material_ids))
+            return await fetch_references(session, query, limit)
+
     async def save(self, armor: AppArmor) -> None:
         if await self.id_exists(armor.armor_id):
             await self.update(armor)
@@ -1,3 +1,4 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
 from adapters.repository.sql.database import DBHelper
@@ -8,18 +9,33 @@ from adapters.repository.sql.models import (
     ClassSavingThrowModel,
     ClassSkillModel,
     SourceModel,
+    SpellReadModel,
     ToolModel,
     WeaponModel,
 )
-from application.dto.model.character_class import AppClass
+from adapters.repository.sql.page import paginate
+from adapters.repository.sql.reference import fetch_references, select_references
+from adapters.repository.sql.search import name_matches, search_rank
+from adapters.repository.sql.spell_read import remove_from_spell_read
+from application.dto.model.character_class import AppClass, AppClassSummary
+from application.dto.model.page import AppCursor
+from application.dto.model.reference import AppReferences
 from application.repository import ClassRepository as AppClassRepository
 from domain.character_class import ClassRepository as DomainClassRepository
 from domain.error import DomainError
-from sqlalchemy import Select, delete, exists, or_, select
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy import ColumnElement, Select, delete, exists, select
+from sqlalchemy.orm import joinedload, load_only, selectinload
 
 
 class SQLClassRepository(DomainClassRepository, AppClassRepository):
+    summary_columns = [
+        CharacterClassModel.name,
+        CharacterClassModel.hit_dice_name,
+        CharacterClassModel.hit_dice_count,
+        CharacterClassModel.name_in_english,
+        CharacterClassModel.source_id,
+    ]
+
     def __init__(self, db_helper: DBHelper) -> None:
         self.__helper = db_helper
 
@@ -40,6 +56,16 @@ class SQLClassRepository(DomainClassRepository, AppClassRepository):
             result = result.scalar()
             return result if result is not None else False
 
+    async def missing_ids(self, class_ids: Sequence[UUID]) -> set[UUID]:
+        if len(class_ids) == 0:
+            return set()
+        async with self.__helper.session as session:
+            query = select(CharacterClassModel.id).where(
+                CharacterClassModel.id.in_(class_ids)
+            )
+            result = await session.execute(query)
+            return set(class_ids) - set(result.scalars().all())
+
     async def get_by_id(self, class_id: UUID) -> AppClass:
         async with self.__helper.session as session:
             query = self._add_options(
@@ -64,34 +90,87 @@ class SQLClassRepository(DomainClassRepository, AppClassRepository):
         filter_by_source_ids: list[UUID] | None = None,
         filter_by_tool_ids: list[UUID] | None = None,
         filter_by_weapon_ids: list[UUID] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppClass]:
         async with self.__helper.session as session:
-            query = self._add_options(select(CharacterClassModel))
-            if search_by_name is not None:
-                query = query.where(
-                    or_(
-                        CharacterClassModel.name.ilike(f"%{search_by_name}%"),
-                        CharacterClassModel.name_in_english.ilike(
-                            f"%{search_by_name}%"
-                        ),
-                    )
-                )
-            if filter_by_source_ids is not None:
-                query = query.where(
-                    CharacterClassModel.source_id.in_(filter_by_source_ids)
-                )
-            if filter_by_tool_ids is not None:
-                query = query.where(
-                    CharacterClassModel.tools.any(ToolModel.id.in_(filter_by_tool_ids))
+            query = self._add_options(select(CharacterClassModel)).where(
+                *self._conditions(
+                    search_by_name=search_by_name,
+                    filter_by_source_ids=filter_by_source_ids,
+                    filter_by_tool_ids=filter_by_tool_ids,
+                    filter_by_weapon_ids=filter_by_weapon_ids,
                 )
-            if filter_by_weapon_ids is not None:
-                query = query.where(
-                    CharacterClassModel.weapons.any(
-                        WeaponModel.id.in_(filter_by_weapon_ids)
+            )
+            query = paginate(
+                query,
+                CharacterClassModel.name,
+                CharacterClassModel.id,
+                limit,
+                cursor,
+                rank=search_rank(
+                    search_by_name,
+                    CharacterClassModel.name,
+                    CharacterClassModel.name_in_english,
+                ),
+            )
+            result = await session.execute(query)
+            return [item.to_app() for item in result.scalars().all()]
+
+    async def filter_summaries(
+        self,
+        search_by_name: str | None = None,
+        filter_by_source_ids: list[UUID] | None = None,
+        filter_by_tool_ids: list[UUID] | None = None,
+        filter_by_weapon_ids: list[UUID] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
+    ) -> list[AppClassSummary]:
+        async with self.__helper.session as session:
+            # только колонки сводки: без описания и без связей
+            query = (
+                select(CharacterClassModel)
+                .options(load_only(*self.summary_columns))
+                .where(
+                    *self._conditions(
+                        search_by_name=search_by_name,
+                        filter_by_source_ids=filter_by_source_ids,
+                        filter_by_tool_ids=filter_by_tool_ids,
+                        filter_by_weapon_ids=filter_by_weapon_ids,
                     )
                 )
+            )
+            query = paginate(
+                query,
+                CharacterClassModel.name,
+                CharacterClassModel.id,
+                limit,
+                cursor,
+                rank=search_rank(
+                    search_by_name,
+                    CharacterClassModel.name,
+                    CharacterClassModel.name_in_english,
+                ),
+            )
             result = await session.execute(query)
-            return [item.to_app() for item in result.scalars().all()]
+            return [item.to_summary() for item in result.scalars().all()]
+
+    async def references(
+        self,
+        filter_by_source_ids: list[UUID] | None = None,
+        filter_by_tool_ids: list[UUID] | None = None,
+        filter_by_weapon_ids: list[UUID] | None = None,
+        limit: int = 5,
+    ) -> AppReferences:
+        async with self.__helper.session as session:
+            query = select_references(CharacterClassModel.name, limit).where(
+                *self._conditions(
+                    filter_by_source_ids=filter_by_source_ids,
+                    filter_by_tool_ids=filter_by_tool_ids,
+                    filter_by_weapon_ids=filter_by_weapon_ids,
+                )
+            )
+            return await fetch_references(session, query, limit)
 
     async def save(self, character_class: AppClass) -> None:
         if await self.id_exists(character_class.class_id):
@@ -218,6 +297,7 @@ class SQLClassRepository(DomainClassRepository, AppClassRepository):
             result = await session.execute(stmt)
             if result.rowcount == 0:
                 raise DomainError.not_found(f"класса с id {class_id} не существует")
+            await remove_from_spell_read(session, SpellReadModel.class_ids, class_id)
             await session.commit()
 
     def _add_options(
@@ -232,3 +312,33 @@ class SQLClassRepository(DomainClassRepository, AppClassRepository):
             selectinload(CharacterClassModel.tools),
             joinedload(CharacterClassModel.source),
         )
+
+    def _conditions(
+        self,
+        search_by_name: str | None = None,
+        filter_by_source_ids: list[UUID] | None = None,
+        filter_by_tool_ids: list[UUID] | None = None,
+        filter_by_weapon_ids: list[UUID] | None = None,
+    ) -> list[ColumnElement[bool]]:
+        conditions = list()
+        if search_by_name is not None:
+            conditions.append(
+                name_matches(
+                    search_by_name,
+                    CharacterClassModel.name,
+                    CharacterClassModel.name_in_english,
+                )
+            )
+        if filter_by_source_ids is not None:
+            conditions.append(CharacterClassModel.source_id.in_(filter_by_source_ids))
+        if filter_by_tool_ids is not None:
+            conditions.append(
+                CharacterClassModel.tools.any(ToolModel.id.in_(filter_by_tool_ids))
+            )
+        if filter_by_weapon_ids is not None:
+            conditions.append(
+                CharacterClassModel.weapons.any(
+                    WeaponModel.id.in_(filter_by_weapon_ids)
+                )
+            )
+        return conditions
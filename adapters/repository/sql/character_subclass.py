@@ -1,8 +1,16 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
 from adapters.repository.sql.database import DBHelper
-from adapters.repository.sql.models import CharacterClassModel, CharacterSubclassModel
+from adapters.repository.sql.models import (
+    CharacterClassModel,
+    CharacterSubclassModel,
+    SpellReadModel,
+)
+from adapters.repository.sql.page import paginate
+from adapters.repository.sql.spell_read import remove_from_spell_read
 from application.dto.model.character_subclass import AppSubclass
+from application.dto.model.page import AppCursor
 from application.repository import SubclassRepository as AppSubclassRepository
 from domain.character_subclass import SubclassRepository as DomainSubclassRepository
 from domain.error import DomainError
@@ -31,6 +39,16 @@ class SQLSubclassRepository(DomainSubclassRepository, AppSubclassRepository):
             result = result.scalar()
             return result if result is not None else False
 
+    async def missing_ids(self, subclass_ids: Sequence[UUID]) -> set[UUID]:
+        if len(subclass_ids) == 0:
+            return set()
+        async with self.__helper.session as session:
+            query = select(CharacterSubclassModel.id).where(
+                CharacterSubclassModel.id.in_(subclass_ids)
+            )
+            result = await session.execute(query)
+            return set(subclass_ids) - set(result.scalars().all())
+
     async def get_by_id(self, subclass_id: UUID) -> AppSubclass:
         async with self.__helper.session as session:
             query = (
@@ -55,7 +73,12 @@ class SQLSubclassRepository(DomainSubclassRepository, AppSubclassRepository):
             result = result.scalars().all()
             return [subclass.to_app() for subclass in result]
 
-    async def filter(self, filter_by_class_id: UUID | None = None) -> list[AppSubclass]:
+    async def filter(
+        self,
+        filter_by_class_id: UUID | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
+    ) -> list[AppSubclass]:
         async with self.__helper.session as session:
             query = select(CharacterSubclassModel).options(
                 selectinload(CharacterSubclassModel.character_class)
@@ -64,6 +87,13 @@ class SQLSubclassRepository(DomainSubclassRepository, AppSubclassRepository):
                 query = query.where(
                     CharacterSubclassModel.character_class_id == filter_by_class_id
                 )
+            query = paginate(
+                query,
+                CharacterSubclassModel.name,
+                CharacterSubclassModel.id,
+                limit,
+                cursor,
+            )
             result = await session.execute(query)
             result = result.scalars().all()
             return [subclass.to_app() for subclass in result]
@@ -112,4 +142,7 @@ class SQLSubclassRepository(DomainSubclassRepository, AppSubclassRepository):
                 raise DomainError.not_found(
                     f"подкласс с id {subclass_id} не существует"
                 )
+            await remove_from_spell_read(
+                session, SpellReadModel.subclass_ids, subclass_id
+            )
             await session.commit()
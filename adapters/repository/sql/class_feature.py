@@ -1,8 +1,11 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
 from adapters.repository.sql.database import DBHelper
 from adapters.repository.sql.models import CharacterClassModel, ClassFeatureModel
+from adapters.repository.sql.page import paginate
 from application.dto.model.class_feature import AppClassFeature
+from application.dto.model.page import AppCursor
 from application.repository import ClassFeatureRepository as AppClassFeatureRepository
 from domain.class_feature import ClassFeatureRepository as DomainClassFeatureRepository
 from domain.error import DomainError
@@ -37,6 +40,16 @@ class SQLClassFeatureRepository(
             result = result.scalar()
             return result if result is not None else False
 
+    async def missing_ids(self, feature_ids: Sequence[UUID]) -> set[UUID]:
+        if len(feature_ids) == 0:
+            return set()
+        async with self.__db_helper.session as session:
+            query = select(ClassFeatureModel.id).where(
+                ClassFeatureModel.id.in_(feature_ids)
+            )
+            result = await session.execute(query)
+            return set(feature_ids) - set(result.scalars().all())
+
     async def get_by_id(self, feature_id: UUID) -> AppClassFeature:
         async with self.__db_helper.session as session:
             query = select(ClassFeatureModel).where(ClassFeatureModel.id == feature_id)
@@ -54,7 +67,10 @@ class SQLClassFeatureRepository(
             return [feature.to_app() for feature in result]
 
     async def filter(
-        self, filter_by_class_id: UUID | None = None
+        self,
+        filter_by_class_id: UUID | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppClassFeature]:
         async with self.__db_helper.session as session:
             query = select(ClassFeatureModel)
@@ -62,6 +78,9 @@ class SQLClassFeatureRepository(
                 query = query.where(
                     ClassFeatureModel.character_class_id == filter_by_class_id
                 )
+            query = paginate(
+                query, ClassFeatureModel.level, ClassFeatureModel.id, limit, cursor
+            )
             result = await session.execute(query)
             result = result.scalars().all()
             return [feature.to_app() for feature in result]
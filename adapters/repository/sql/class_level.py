@@ -1,3 +1,4 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
 from adapters.repository.sql.database import DBHelper
@@ -6,7 +7,9 @@ from adapters.repository.sql.models import (
     ClassLevelModel,
     ClassLevelSpellSlotModel,
 )
+from adapters.repository.sql.page import paginate
 from application.dto.model.class_level import AppClassLevel
+from application.dto.model.page import AppCursor
 from application.repository import ClassLevelRepository as AppClassLevelRepository
 from domain.class_level import ClassLevelRepository as DomainClassLevelRepository
 from domain.error import DomainError
@@ -40,6 +43,14 @@ class SQLClassLevelRepository(DomainClassLevelRepository, AppClassLevelRepositor
             result = result.scalar()
             return result if result is not None else False
 
+    async def missing_ids(self, level_ids: Sequence[UUID]) -> set[UUID]:
+        if len(level_ids) == 0:
+            return set()
+        async with self.__helper.session as session:
+            query = select(ClassLevelModel.id).where(ClassLevelModel.id.in_(level_ids))
+            result = await session.execute(query)
+            return set(level_ids) - set(result.scalars().all())
+
     async def get_by_id(self, level_id: UUID) -> AppClassLevel:
         async with self.__helper.session as session:
             query = self._add_options(
@@ -59,7 +70,10 @@ class SQLClassLevelRepository(DomainClassLevelRepository, AppClassLevelRepositor
             return [level.to_app() for level in result]
 
     async def filter(
-        self, filter_by_class_id: UUID | None = None
+        self,
+        filter_by_class_id: UUID | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppClassLevel]:
         async with self.__helper.session as session:
             query = select(ClassLevelModel)
@@ -68,6 +82,9 @@ class SQLClassLevelRepository(DomainClassLevelRepository, AppClassLevelRepositor
                     ClassLevelModel.character_class_id == filter_by_class_id
                 )
             query = self._add_options(query)
+            query = paginate(
+                query, ClassLevelModel.level, ClassLevelModel.id, limit, cursor
+            )
             result = await session.execute(query)
             result = result.scalars().all()
             return [level.to_app() for level in result]
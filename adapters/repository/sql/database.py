@@ -1,22 +1,132 @@
-from typing import TYPE_CHECKING
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable, cast
 
+from adapters.repository.sql.instrumentation import instrument
+from adapters.repository.sql.pool import MeteredPool, PoolMetrics, PoolSettings
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
+WRITTEN_TABLES = "written_tables"
+
+
+class SharedSession:
+    # сессия единицы работы: репозитории открывают и "коммитят" её как обычно,
+    # но фиксирует транзакцию только сама единица работы; AsyncSession не
+    # допускает одновременных операций, запросы внутри единицы работы идут
+    # по очереди
+    def __init__(self, session: "AsyncSession") -> None:
+        self._session = session
+
+    async def __aenter__(self) -> "SharedSession":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+    async def commit(self) -> None:
+        await self._session.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
 
 class DBHelper:
-    def __init__(self, db_url: str, echo: bool = False) -> None:
-        self._engine = create_async_engine(url=db_url, echo=echo)
+    def __init__(
+        self,
+        db_url: str,
+        echo: bool = False,
+        pool: PoolSettings | None = None,
+        slow_query_ms: float | None = None,
+    ) -> None:
+        pool_kwargs: dict[str, Any] = {}
+        if pool is not None:
+            pool_kwargs = dict(asdict(pool), poolclass=MeteredPool)
+        self._engine = create_async_engine(url=db_url, echo=echo, **pool_kwargs)
+        instrument(self._engine.sync_engine, slow_query_ms)
+        # собственный класс сессии, чтобы события не ловили чужие движки
+        session_class = type("DBHelperSession", (Session,), {})
+        event.listen(session_class, "after_begin", self._share_written)
+        event.listen(self._engine.sync_engine, "after_execute", self._record_written)
+        event.listen(session_class, "after_commit", self._after_commit)
+        event.listen(session_class, "after_rollback", self._forget_written)
+        self._commit_callbacks: list[
+            tuple[Callable[[], None], frozenset[str] | None]
+        ] = []
         self._session_factory = async_sessionmaker(
-            bind=self._engine, autoflush=False, expire_on_commit=False
+            bind=self._engine,
+            autoflush=False,
+            expire_on_commit=False,
+            sync_session_class=session_class,
+        )
+        self._current: ContextVar[SharedSession | None] = ContextVar(
+            f"db_session_{id(self)}", default=None
         )
 
     @property
     def engine(self) -> "AsyncEngine":
         return self._engine
 
+    def pool_metrics(self) -> PoolMetrics:
+        pool = self._engine.pool
+        if isinstance(pool, MeteredPool):
+            return pool.snapshot()
+        return PoolMetrics()
+
+    @property
+    def in_unit_of_work(self) -> bool:
+        return self._current.get() is not None
+
+    def on_commit(
+        self, callback: Callable[[], None], tables: Iterable[str] | None = None
+    ) -> None:
+        # tables - вызывать только после коммита, записавшего в эти таблицы
+        self._commit_callbacks.append(
+            (callback, frozenset(tables) if tables is not None else None)
+        )
+
+    def _share_written(
+        self, session: Session, transaction: Any, connection: Any
+    ) -> None:
+        # соединение пишет в набор таблиц сессии, в том числе при flush
+        connection.info[WRITTEN_TABLES] = session.info.setdefault(WRITTEN_TABLES, set())
+
+    def _record_written(self, connection: Any, statement: Any, *args: Any) -> None:
+        written = connection.info.get(WRITTEN_TABLES)
+        if written is not None and isinstance(statement, UpdateBase):
+            written.add(statement.table.name)
+
+    def _forget_written(self, session: Session) -> None:
+        session.info.pop(WRITTEN_TABLES, None)
+
+    def _after_commit(self, session: Session) -> None:
+        written = session.info.pop(WRITTEN_TABLES, set())
+        for callback, tables in self._commit_callbacks:
+            if tables is None or not tables.isdisjoint(written):
+                callback()
+
     @property
     def session(self) -> "AsyncSession":
+        current = self._current.get()
+        if current is not None:
+            return cast("AsyncSession", current)
         return self._session_factory()
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[None]:
+        if self._current.get() is not None:
+            yield
+            return
+        async with self._session_factory() as session:
+            token = self._current.set(SharedSession(session))
+            try:
+                async with session.begin():
+                    yield
+            finally:
+                self._current.reset(token)
@@ -0,0 +1,109 @@
+from datetime import datetime
+from typing import Any, AsyncIterator
+
+from adapters.repository.sql.database import DBHelper
+from adapters.repository.sql.models import (
+    ArmorModel,
+    Base,
+    CharacterClassModel,
+    CharacterSubclassModel,
+    ClassFeatureModel,
+    ClassLevelModel,
+    FeatModel,
+    MaterialComponentModel,
+    MaterialModel,
+    RaceModel,
+    SourceModel,
+    SpellModel,
+    SubclassFeatureModel,
+    SubraceModel,
+    ToolModel,
+    WeaponKindModel,
+    WeaponModel,
+    WeaponPropertyModel,
+)
+from application.dto.model.export import AppExportItem
+from application.repository import ExportRepository as AppExportRepository
+from sqlalchemy import select
+from sqlalchemy.orm import InstrumentedAttribute, selectinload
+
+
+class SQLExportRepository(AppExportRepository):
+    # связи, которые читает to_app каждой модели
+    entities: list[tuple[str, type[Base], list[InstrumentedAttribute[Any]]]] = [
+        ("source", SourceModel, []),
+        ("material", MaterialModel, []),
+        ("material_component", MaterialComponentModel, []),
+        ("weapon_kind", WeaponKindModel, []),
+        ("weapon_property", WeaponPropertyModel, []),
+        ("weapon", WeaponModel, [WeaponModel.properties]),
+        ("armor", ArmorModel, []),
+        ("tool", ToolModel, [ToolModel.utilizes]),
+        (
+            "class",
+            CharacterClassModel,
+            [
+                CharacterClassModel.primary_modifiers,
+                CharacterClassModel.armor_types,
+                CharacterClassModel.saving_throws,
+                CharacterClassModel.skills,
+                CharacterClassModel.weapons,
+                CharacterClassModel.tools,
+            ],
+        ),
+        ("subclass", CharacterSubclassModel, []),
+        ("class_feature", ClassFeatureModel, []),
+        ("class_level", ClassLevelModel, [ClassLevelModel.class_level_spell_slot]),
+        ("subclass_feature", SubclassFeatureModel, []),
+        ("race", RaceModel, [RaceModel.features, RaceModel.increase_modifiers]),
+        (
+            "subrace",
+            SubraceModel,
+            [SubraceModel.features, SubraceModel.increase_modifiers],
+        ),
+        (
+            "feat",
+            FeatModel,
+            [
+                FeatModel.increase_modifiers,
+                FeatModel.required_armor_types,
+                FeatModel.required_modifiers,
+            ],
+        ),
+        (
+            "spell",
+            SpellModel,
+            [
+                SpellModel.saving_throws,
+                SpellModel.character_classes,
+                SpellModel.character_subclasses,
+                SpellModel.materials,
+            ],
+        ),
+    ]
+    batch_size = 500
+
+    def __init__(self, db_helper: DBHelper) -> None:
+        self.__db_helper = db_helper
+
+    async def export(
+        self, since: datetime | None = None
+    ) -> AsyncIterator[AppExportItem]:
+        async with self.__db_helper.session as session:
+            for entity_type, model, relations in self.entities:
+                # серверный курсор: в памяти держится только текущая пачка
+                query = (
+                    select(model)
+                    .options(*[selectinload(relation) for relation in relations])
+                    .order_by(model.id)
+                    .execution_options(yield_per=self.batch_size)
+                )
+                if since is not None:
+                    query = query.where(model.updated_at > since)
+                result = await session.stream_scalars(query)
+                async for item in result:
+                    yield AppExportItem(
+                        entity_type=entity_type,
+                        updated_at=item.updated_at,
+                        entity=item.to_app(),
+                    )
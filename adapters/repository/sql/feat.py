@@ -1,3 +1,4 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
 from adapters.repository.sql.database import DBHelper
@@ -7,7 +8,10 @@ from adapters.repository.sql.models import (
     FeatRequiredArmorTypeModel,
     FeatRequiredModifierModel,
 )
+from adapters.repository.sql.page import paginate
+from adapters.repository.sql.search import name_matches, search_rank
 from application.dto.model.feat import AppFeat
+from application.dto.model.page import AppCursor
 from application.repository import FeatRepository as AppFeatRepository
 from domain.error import DomainError
 from domain.feat import FeatRepository as DomainFeatRepository
@@ -36,6 +40,14 @@ class SQLFeatRepository(DomainFeatRepository, AppFeatRepository):
             result = result.scalar()
             return result if result is not None else False
 
+    async def missing_ids(self, feat_ids: Sequence[UUID]) -> set[UUID]:
+        if len(feat_ids) == 0:
+            return set()
+        async with self.__helper.session as session:
+            query = select(FeatModel.id).where(FeatModel.id.in_(feat_ids))
+            result = await session.execute(query)
+            return set(feat_ids) - set(result.scalars().all())
+
     async def get_by_id(self, feat_id: UUID) -> AppFeat:
         async with self.__helper.session as session:
             query = self._add_options(select(FeatModel).where(FeatModel.id == feat_id))
@@ -59,12 +71,14 @@ class SQLFeatRepository(DomainFeatRepository, AppFeatRepository):
         filter_by_required_armor_types: list[str] | None = None,
         filter_by_required_modifiers: list[str] | None = None,
         filter_by_increase_modifiers: list[str] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppFeat]:
         async with self.__helper.session as session:
             query = self._add_options(select(FeatModel))
             conditions = list()
             if search_by_name is not None:
-                conditions.append(FeatModel.name.ilike(f"%{search_by_name}%"))
+                conditions.append(name_matches(search_by_name, FeatModel.name))
             if filter_by_caster is not None:
                 conditions.append(FeatModel.caster == filter_by_caster)
             if filter_by_required_armor_types is not None:
@@ -89,6 +103,14 @@ class SQLFeatRepository(DomainFeatRepository, AppFeatRepository):
                 )
             if len(conditions) > 0:
                 query = query.where(*conditions)
+            query = paginate(
+                query,
+                FeatModel.name,
+                FeatModel.id,
+                limit,
+                cursor,
+                rank=search_rank(search_by_name, FeatModel.name),
+            )
             result = await session.execute(query)
             result = result.scalars().all()
             return [item.to_app() for item in result]
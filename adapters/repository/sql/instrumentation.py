@@ -0,0 +1,80 @@
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Iterator
+
+from sqlalchemy import Engine, event
+
+__all__ = ["QueryStats", "instrument", "track_queries"]
+
+logger = logging.getLogger("dnd_guide.sql")
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    total_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest_statement: str | None = None
+
+    def add(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_statement = statement
+
+
+_stats: ContextVar[QueryStats | None] = ContextVar("sql_query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    # всё, что выполнится в этом контексте (в том числе внутри greenlet
+    # асинхронного движка), попадёт в возвращённую статистику
+    stats = QueryStats()
+    token = _stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _stats.reset(token)
+
+
+def instrument(engine: Engine, slow_query_ms: float | None = None) -> None:
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn: Any, *args: Any) -> None:
+        conn.info.setdefault("query_start", []).append(perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        elapsed_ms = (perf_counter() - conn.info["query_start"].pop()) * 1000
+        stats = _stats.get()
+        if stats is not None:
+            stats.add(statement, elapsed_ms)
+        if slow_query_ms is not None and elapsed_ms >= slow_query_ms:
+            logger.warning(
+                "slow query %.1f ms: %s",
+                elapsed_ms,
+                statement,
+                extra={
+                    "duration_ms": round(elapsed_ms, 3),
+                    "statement": statement,
+                    "executemany": executemany,
+                },
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(context: Any) -> None:
+        # упавший запрос не доходит до after_cursor_execute
+        connection = context.connection
+        if connection is not None and connection.info.get("query_start"):
+            connection.info["query_start"].pop()
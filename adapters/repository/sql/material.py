@@ -1,8 +1,12 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
 from adapters.repository.sql.database import DBHelper
 from adapters.repository.sql.models.material import MaterialModel
+from adapters.repository.sql.page import paginate
+from adapters.repository.sql.search import name_matches, search_rank
 from application.dto.model.material import AppMaterial
+from application.dto.model.page import AppCursor
 from application.repository import MaterialRepository as AppMaterialRepository
 from domain.error import DomainError
 from domain.material import MaterialRepository as DomainMaterialRepository
@@ -30,6 +34,14 @@ class SQLMaterialRepository(DomainMaterialRepository, AppMaterialRepository):
             result = result.scalar()
             return result if result is not None else False
 
+    async def missing_ids(self, material_ids: Sequence[UUID]) -> set[UUID]:
+        if len(material_ids) == 0:
+            return set()
+        async with self.__helper.session as session:
+            query = select(MaterialModel.id).where(MaterialModel.id.in_(material_ids))
+            result = await session.execute(query)
+            return set(material_ids) - set(result.scalars().all())
+
     async def get_by_id(self, material_id: UUID) -> AppMaterial:
         async with self.__helper.session as session:
             query = select(MaterialModel).where(MaterialModel.id == material_id)
@@ -47,11 +59,24 @@ class SQLMaterialRepository(DomainMaterialRepository, AppMaterialRepository):
             result = await session.execute(query)
             return [model.to_app() for model in result.scalars().all()]
 
-    async def filter(self, search_by_name: str | None = None) -> list[AppMaterial]:
+    async def filter(
+        self,
+        search_by_name: str | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
+    ) -> list[AppMaterial]:
         async with self.__helper.session as session:
             query = select(MaterialModel)
             if search_by_name is not None:
-                query = query.where(MaterialModel.name.ilike(f"%{search_by_name}%"))
+                query = query.where(name_matches(search_by_name, MaterialModel.name))
+            query = paginate(
+                query,
+                MaterialModel.name,
+                MaterialModel.id,
+                limit,
+                cursor,
+                rank=search_rank(search_by_name, MaterialModel.name),
+            )
             result = await session.execute(query)
             return [model.to_app() for model in result.scalars().all()]
 
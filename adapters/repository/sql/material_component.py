@@ -1,8 +1,12 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
 from adapters.repository.sql.database import DBHelper
-from adapters.repository.sql.models import MaterialComponentModel
+from adapters.repository.sql.models import MaterialComponentModel, SpellReadModel
+from adapters.repository.sql.page import paginate
+from adapters.repository.sql.spell_read import remove_from_spell_read
 from application.dto.model.material_component import AppMaterialComponent
+from application.dto.model.page import AppCursor
 from application.repository import (
     MaterialComponentRepository as AppMaterialComponentRepository,
 )
@@ -40,6 +44,16 @@ class SQLMaterialComponentRepository(
             result = result.scalar()
             return result if result is not None else False
 
+    async def missing_ids(self, material_ids: Sequence[UUID]) -> set[UUID]:
+        if len(material_ids) == 0:
+            return set()
+        async with self.__db_helper.session as session:
+            query = select(MaterialComponentModel.id).where(
+                MaterialComponentModel.id.in_(material_ids)
+            )
+            result = await session.execute(query)
+            return set(material_ids) - set(result.scalars().all())
+
     async def get_by_id(self, material_id: UUID) -> AppMaterialComponent:
         async with self.__db_helper.session as session:
             query = select(MaterialComponentModel).where(
@@ -61,7 +75,10 @@ class SQLMaterialComponentRepository(
             return [item.to_app() for item in result]
 
     async def filter(
-        self, search_by_name: str | None = None
+        self,
+        search_by_name: str | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppMaterialComponent]:
         async with self.__db_helper.session as session:
             query = select(MaterialComponentModel)
@@ -69,6 +86,13 @@ class SQLMaterialComponentRepository(
                 query = query.where(
                     MaterialComponentModel.name.ilike(f"%{search_by_name}%")
                 )
+            query = paginate(
+                query,
+                MaterialComponentModel.name,
+                MaterialComponentModel.id,
+                limit,
+                cursor,
+            )
             result = await session.execute(query)
             return [item.to_app() for item in result.scalars().all()]
 
@@ -87,4 +111,7 @@ class SQLMaterialComponentRepository(
                 raise DomainError.not_found(
                     f"материала с id {material_id} не существует"
                 )
+            await remove_from_spell_read(
+                session, SpellReadModel.material_ids, material_id
+            )
             await session.commit()
@@ -27,6 +27,7 @@ from .spell import (
     RelSpellCharacterSubclassModel,
     RelSpellMaterialModel,
     SpellModel,
+    SpellReadModel,
     SpellSavingThrowModel,
 )
 from .subclass_feature import SubclassFeatureModel
@@ -68,6 +69,7 @@ __all__ = [
     "RelSpellCharacterSubclassModel",
     "RelSpellMaterialModel",
     "SpellModel",
+    "SpellReadModel",
     "SpellSavingThrowModel",
     "SubclassFeatureModel",
     "SubraceFeatureModel",
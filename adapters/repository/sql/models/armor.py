@@ -5,7 +5,7 @@ from adapters.repository.sql.models.base import Base
 from application.dto.model.armor import AppArmor, AppArmorClass
 from application.dto.model.coin import AppCoins
 from application.dto.model.weight import AppWeight
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -14,10 +14,24 @@ if TYPE_CHECKING:
 
 class ArmorModel(Base):
     __tablename__ = "armor"
+    __table_args__ = (
+        Index(
+            "ix_armor_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_armor_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     name: Mapped[str] = mapped_column(String(50), unique=True)
     description: Mapped[str]
-    armor_type: Mapped[str]
+    armor_type: Mapped[str] = mapped_column(index=True)
     strength: Mapped[int]
     stealth: Mapped[bool]
     weight: Mapped[float]
@@ -25,7 +39,7 @@ class ArmorModel(Base):
     base_class: Mapped[int]
     modifier: Mapped[str | None] = mapped_column(String(50))
     max_modifier_bonus: Mapped[int | None]
-    material_id: Mapped[UUID] = mapped_column(ForeignKey("material.id"))
+    material_id: Mapped[UUID] = mapped_column(ForeignKey("material.id"), index=True)
 
     material: Mapped["MaterialModel"] = relationship(back_populates="armors")
 
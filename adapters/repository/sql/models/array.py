@@ -0,0 +1,92 @@
+from typing import Any, Sequence
+from uuid import UUID
+
+from sqlalchemy import JSON, ColumnElement, Uuid, cast, false, func, literal
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Dialect
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import Boolean, TypeDecorator, TypeEngine
+
+__all__ = ["ArrayOf", "array_overlap", "array_remove"]
+
+
+class ArrayOf(TypeDecorator[list[Any]]):
+    # массив в Postgres (с GIN индексом), JSON список в остальных СУБД
+    impl = JSON
+    cache_ok = True
+
+    def __init__(self, item: TypeEngine[Any]) -> None:
+        super().__init__()
+        self.item = item
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.ARRAY(self.item))
+        return dialect.type_descriptor(JSON())
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        if value is None or dialect.name == "postgresql":
+            return value
+        return [str(item) if isinstance(item, UUID) else item for item in value]
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Any:
+        if value is None or dialect.name == "postgresql":
+            return value
+        if isinstance(self.item, Uuid):
+            return [UUID(item) for item in value]
+        return value
+
+
+class _array_overlap(FunctionElement[bool]):
+    type = Boolean()
+    inherit_cache = True
+
+
+def array_overlap(column: Any, values: Sequence[Any]) -> ColumnElement[bool]:
+    if len(values) == 0:
+        return false()
+    return _array_overlap(column, *[literal(str(value)) for value in values])
+
+
+@compiles(_array_overlap, "postgresql")
+def _array_overlap_postgresql(element: _array_overlap, compiler: Any, **kw: Any) -> str:
+    column, *values = element.clauses
+    item = column.type.item
+    overlap = column.op("&&")(postgresql.array([cast(v, item) for v in values]))
+    return compiler.process(overlap, **kw)
+
+
+@compiles(_array_overlap)
+def _array_overlap_default(element: _array_overlap, compiler: Any, **kw: Any) -> str:
+    column, *values = element.clauses
+    return (
+        f"EXISTS (SELECT 1 FROM json_each({compiler.process(column, **kw)}) "
+        f"WHERE json_each.value IN "
+        f"({', '.join(compiler.process(v, **kw) for v in values)}))"
+    )
+
+
+class _array_remove(FunctionElement[list[Any]]):
+    inherit_cache = True
+
+
+def array_remove(column: Any, value: Any) -> ColumnElement[list[Any]]:
+    return _array_remove(column, literal(str(value)))
+
+
+@compiles(_array_remove, "postgresql")
+def _array_remove_postgresql(element: _array_remove, compiler: Any, **kw: Any) -> str:
+    column, value = element.clauses
+    removed = func.array_remove(column, cast(value, column.type.item))
+    return compiler.process(removed, **kw)
+
+
+@compiles(_array_remove)
+def _array_remove_default(element: _array_remove, compiler: Any, **kw: Any) -> str:
+    column, value = element.clauses
+    return (
+        f"(SELECT json_group_array(json_each.value) "
+        f"FROM json_each({compiler.process(column, **kw)}) "
+        f"WHERE json_each.value != {compiler.process(value, **kw)})"
+    )
@@ -1,8 +1,9 @@
 from datetime import datetime, timezone
+from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import text
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy import event, text
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
 
 
 def utcnow() -> datetime:
@@ -20,3 +21,12 @@ class Base(DeclarativeBase):
         default=utcnow,
         onupdate=utcnow,
     )
+
+
+@event.listens_for(Session, "before_flush")
+def touch_updated_at(session: Session, flush_context: Any, instances: Any) -> None:
+    # onupdate срабатывает только при изменении колонок строки, а замена
+    # связей (классы заклинания и т.п.) тоже должна менять версию для ETag
+    for instance in session.dirty:
+        if isinstance(instance, Base) and session.is_modified(instance):
+            instance.updated_at = utcnow()
@@ -6,9 +6,10 @@ from application.dto.model.character_class import (
     AppClass,
     AppClassHits,
     AppClassProficiencies,
+    AppClassSummary,
 )
 from application.dto.model.dice import AppDice
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -23,6 +24,26 @@ if TYPE_CHECKING:
 
 class CharacterClassModel(Base):
     __tablename__ = "character_class"
+    __table_args__ = (
+        Index(
+            "ix_character_class_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_character_class_name_in_english_trgm",
+            "name_in_english",
+            postgresql_using="gin",
+            postgresql_ops={"name_in_english": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_character_class_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     name: Mapped[str] = mapped_column(String(50), unique=True)
     description: Mapped[str]
@@ -34,7 +55,7 @@ class CharacterClassModel(Base):
     next_level_hits: Mapped[int]
     number_skills: Mapped[int]
     number_tools: Mapped[int]
-    source_id: Mapped[UUID] = mapped_column(ForeignKey("source.id"))
+    source_id: Mapped[UUID] = mapped_column(ForeignKey("source.id"), index=True)
 
     primary_modifiers: Mapped[list["ClassPrimaryModifierModel"]] = relationship(
         back_populates="character_class", cascade="all, delete-orphan"
@@ -95,6 +116,15 @@ class CharacterClassModel(Base):
             source_id=self.source_id,
         )
 
+    def to_summary(self) -> AppClassSummary:
+        return AppClassSummary(
+            class_id=self.id,
+            name=self.name,
+            hit_dice=AppDice(count=self.hit_dice_count, dice_type=self.hit_dice_name),
+            name_in_english=self.name_in_english,
+            source_id=self.source_id,
+        )
+
     @staticmethod
     def from_app(app_class: AppClass) -> "CharacterClassModel":
         return CharacterClassModel(
@@ -118,7 +148,7 @@ class ClassPrimaryModifierModel(Base):
 
     name: Mapped[str] = mapped_column(String(50))
     class_id: Mapped[UUID] = mapped_column(
-        ForeignKey("character_class.id", ondelete="CASCADE")
+        ForeignKey("character_class.id", ondelete="CASCADE"), index=True
     )
 
     character_class: Mapped["CharacterClassModel"] = relationship(
@@ -141,7 +171,7 @@ class ClassArmorTypeModel(Base):
 
     name: Mapped[str] = mapped_column(String(50))
     class_id: Mapped[UUID] = mapped_column(
-        ForeignKey("character_class.id", ondelete="CASCADE")
+        ForeignKey("character_class.id", ondelete="CASCADE"), index=True
     )
 
     character_class: Mapped["CharacterClassModel"] = relationship(
@@ -164,7 +194,7 @@ class ClassSavingThrowModel(Base):
 
     name: Mapped[str] = mapped_column(String(50))
     class_id: Mapped[UUID] = mapped_column(
-        ForeignKey("character_class.id", ondelete="CASCADE")
+        ForeignKey("character_class.id", ondelete="CASCADE"), index=True
     )
 
     character_class: Mapped["CharacterClassModel"] = relationship(
@@ -187,7 +217,7 @@ class ClassSkillModel(Base):
 
     name: Mapped[str] = mapped_column(String(50))
     class_id: Mapped[UUID] = mapped_column(
-        ForeignKey("character_class.id", ondelete="CASCADE")
+        ForeignKey("character_class.id", ondelete="CASCADE"), index=True
     )
 
     character_class: Mapped["CharacterClassModel"] = relationship(
@@ -207,8 +237,13 @@ class ClassSkillModel(Base):
 
 class RelClassToolModel(Base):
     __tablename__ = "rel_class_tool"
+    __table_args__ = (
+        Index("ix_rel_class_tool_class_id_tool_id", "class_id", "tool_id"),
+    )
 
-    tool_id: Mapped[UUID] = mapped_column(ForeignKey("tool.id", ondelete="CASCADE"))
+    tool_id: Mapped[UUID] = mapped_column(
+        ForeignKey("tool.id", ondelete="CASCADE"), index=True
+    )
     class_id: Mapped[UUID] = mapped_column(
         ForeignKey("character_class.id", ondelete="CASCADE")
     )
@@ -216,8 +251,13 @@ class RelClassToolModel(Base):
 
 class RelClassWeaponModel(Base):
     __tablename__ = "rel_class_weapon"
+    __table_args__ = (
+        Index("ix_rel_class_weapon_class_id_weapon_id", "class_id", "weapon_id"),
+    )
 
-    weapon_id: Mapped[UUID] = mapped_column(ForeignKey("weapon.id", ondelete="CASCADE"))
+    weapon_id: Mapped[UUID] = mapped_column(
+        ForeignKey("weapon.id", ondelete="CASCADE"), index=True
+    )
     class_id: Mapped[UUID] = mapped_column(
         ForeignKey("character_class.id", ondelete="CASCADE")
     )
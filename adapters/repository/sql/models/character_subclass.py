@@ -3,7 +3,7 @@ from uuid import UUID
 
 from adapters.repository.sql.models.base import Base
 from application.dto.model.character_subclass import AppSubclass
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -14,11 +14,33 @@ if TYPE_CHECKING:
 
 class CharacterSubclassModel(Base):
     __tablename__ = "character_subclass"
+    __table_args__ = (
+        Index(
+            "ix_character_subclass_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_character_subclass_name_in_english_trgm",
+            "name_in_english",
+            postgresql_using="gin",
+            postgresql_ops={"name_in_english": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_character_subclass_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     name: Mapped[str] = mapped_column(String(50), unique=True)
     description: Mapped[str]
     name_in_english: Mapped[str] = mapped_column(String(50))
-    character_class_id: Mapped[UUID] = mapped_column(ForeignKey("character_class.id"))
+    character_class_id: Mapped[UUID] = mapped_column(
+        ForeignKey("character_class.id"), index=True
+    )
 
     character_class: Mapped["CharacterClassModel"] = relationship(
         back_populates="character_subclasses"
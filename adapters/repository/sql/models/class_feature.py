@@ -3,7 +3,7 @@ from uuid import UUID
 
 from adapters.repository.sql.models.base import Base
 from application.dto.model.class_feature import AppClassFeature
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -12,6 +12,11 @@ if TYPE_CHECKING:
 
 class ClassFeatureModel(Base):
     __tablename__ = "class_feature"
+    __table_args__ = (
+        Index(
+            "ix_class_feature_character_class_id_level", "character_class_id", "level"
+        ),
+    )
 
     name: Mapped[str] = mapped_column(String(50), unique=True)
     description: Mapped[str]
@@ -11,7 +11,7 @@ from application.dto.model.class_level import (
 )
 from application.dto.model.dice import AppDice
 from application.dto.model.length import AppLength
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -20,6 +20,9 @@ if TYPE_CHECKING:
 
 class ClassLevelModel(Base):
     __tablename__ = "class_level"
+    __table_args__ = (
+        Index("ix_class_level_character_class_id_level", "character_class_id", "level"),
+    )
 
     level: Mapped[int]
     dice_name: Mapped[str | None]
@@ -133,7 +136,7 @@ class ClassLevelSpellSlotModel(Base):
     level_8: Mapped[int]
     level_9: Mapped[int]
     class_level_id: Mapped[UUID] = mapped_column(
-        ForeignKey("class_level.id", ondelete="CASCADE")
+        ForeignKey("class_level.id", ondelete="CASCADE"), index=True
     )
 
     class_level: Mapped["ClassLevelModel"] = relationship(
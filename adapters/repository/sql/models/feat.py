@@ -2,16 +2,30 @@ from uuid import UUID
 
 from adapters.repository.sql.models.base import Base
 from application.dto.model.feat import AppFeat, AppFeatRequiredModifier
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
 class FeatModel(Base):
     __tablename__ = "feat"
+    __table_args__ = (
+        Index(
+            "ix_feat_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_feat_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     name: Mapped[str] = mapped_column(String(50), unique=True)
     description: Mapped[str]
-    caster: Mapped[bool]
+    caster: Mapped[bool] = mapped_column(index=True)
 
     increase_modifiers: Mapped[list["FeatIncreaseModifierModel"]] = relationship(
         back_populates="feat", cascade="all, delete-orphan"
@@ -48,7 +62,9 @@ class FeatIncreaseModifierModel(Base):
     __tablename__ = "feat_increase_modifier"
 
     name: Mapped[str] = mapped_column(String(50))
-    feat_id: Mapped[UUID] = mapped_column(ForeignKey("feat.id", ondelete="CASCADE"))
+    feat_id: Mapped[UUID] = mapped_column(
+        ForeignKey("feat.id", ondelete="CASCADE"), index=True
+    )
 
     feat: Mapped["FeatModel"] = relationship(back_populates="increase_modifiers")
 
@@ -65,7 +81,9 @@ class FeatRequiredModifierModel(Base):
 
     name: Mapped[str] = mapped_column(String(50))
     min_value: Mapped[int]
-    feat_id: Mapped[UUID] = mapped_column(ForeignKey("feat.id", ondelete="CASCADE"))
+    feat_id: Mapped[UUID] = mapped_column(
+        ForeignKey("feat.id", ondelete="CASCADE"), index=True
+    )
 
     feat: Mapped["FeatModel"] = relationship(back_populates="required_modifiers")
 
@@ -85,7 +103,9 @@ class FeatRequiredArmorTypeModel(Base):
     __tablename__ = "feat_required_armor_type"
 
     name: Mapped[str] = mapped_column(String(50))
-    feat_id: Mapped[UUID] = mapped_column(ForeignKey("feat.id", ondelete="CASCADE"))
+    feat_id: Mapped[UUID] = mapped_column(
+        ForeignKey("feat.id", ondelete="CASCADE"), index=True
+    )
 
     feat: Mapped["FeatModel"] = relationship(back_populates="required_armor_types")
 
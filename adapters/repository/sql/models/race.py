@@ -10,7 +10,7 @@ from application.dto.model.race import (
     AppRaceIncreaseModifier,
     AppRaceSpeed,
 )
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -20,6 +20,26 @@ if TYPE_CHECKING:
 
 class RaceModel(Base):
     __tablename__ = "race"
+    __table_args__ = (
+        Index(
+            "ix_race_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_race_name_in_english_trgm",
+            "name_in_english",
+            postgresql_using="gin",
+            postgresql_ops={"name_in_english": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_race_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     name: Mapped[str] = mapped_column(String(50), unique=True)
     description: Mapped[str]
@@ -30,7 +50,7 @@ class RaceModel(Base):
     age_description: Mapped[str]
     creature_type: Mapped[str] = mapped_column(String(50))
     creature_size: Mapped[str] = mapped_column(String(50))
-    source_id: Mapped[UUID] = mapped_column(ForeignKey("source.id"))
+    source_id: Mapped[UUID] = mapped_column(ForeignKey("source.id"), index=True)
 
     increase_modifiers: Mapped[list["RaceIncreaseModifierModel"]] = relationship(
         back_populates="race", cascade="all, delete-orphan"
@@ -78,7 +98,9 @@ class RaceIncreaseModifierModel(Base):
 
     name: Mapped[str] = mapped_column(String(50))
     bonus: Mapped[int]
-    race_id: Mapped[UUID] = mapped_column(ForeignKey("race.id", ondelete="CASCADE"))
+    race_id: Mapped[UUID] = mapped_column(
+        ForeignKey("race.id", ondelete="CASCADE"), index=True
+    )
 
     race: Mapped["RaceModel"] = relationship(back_populates="increase_modifiers")
 
@@ -104,7 +126,9 @@ class RaceFeatureModel(Base):
 
     name: Mapped[str] = mapped_column(String(50))
     description: Mapped[str]
-    race_id: Mapped[UUID] = mapped_column(ForeignKey("race.id", ondelete="CASCADE"))
+    race_id: Mapped[UUID] = mapped_column(
+        ForeignKey("race.id", ondelete="CASCADE"), index=True
+    )
 
     race: Mapped["RaceModel"] = relationship(back_populates="features")
 
@@ -1,11 +1,12 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
+from adapters.repository.sql.models.array import ArrayOf
 from adapters.repository.sql.models.base import Base
 from application.dto.model.game_time import AppGameTime
 from application.dto.model.length import AppLength
-from application.dto.model.spell import AppSpell, AppSpellComponents
-from sqlalchemy import ForeignKey, String
+from application.dto.model.spell import AppSpell, AppSpellComponents, AppSpellSummary
+from sqlalchemy import ForeignKey, Index, String, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -17,26 +18,46 @@ if TYPE_CHECKING:
 
 class SpellModel(Base):
     __tablename__ = "spell"
+    __table_args__ = (
+        Index(
+            "ix_spell_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_spell_name_in_english_trgm",
+            "name_in_english",
+            postgresql_using="gin",
+            postgresql_ops={"name_in_english": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_spell_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     name: Mapped[str] = mapped_column(String(50), unique=True)
     description: Mapped[str]
     name_in_english: Mapped[str] = mapped_column(String(50))
     next_level_description: Mapped[str]
     level: Mapped[int]
-    school: Mapped[str]
-    damage_type: Mapped[str | None]
+    school: Mapped[str] = mapped_column(index=True)
+    damage_type: Mapped[str | None] = mapped_column(index=True)
     spell_range: Mapped[float]
     splash: Mapped[float | None]
-    duration_unit: Mapped[str | None]
+    duration_unit: Mapped[str | None] = mapped_column(index=True)
     duration_count: Mapped[int | None]
-    casting_time_unit: Mapped[str]
+    casting_time_unit: Mapped[str] = mapped_column(index=True)
     casting_time_count: Mapped[int]
-    concentration: Mapped[bool]
-    ritual: Mapped[bool]
+    concentration: Mapped[bool] = mapped_column(index=True)
+    ritual: Mapped[bool] = mapped_column(index=True)
     verbal_component: Mapped[bool]
     symbolic_component: Mapped[bool]
     material_component: Mapped[bool]
-    source_id: Mapped[UUID] = mapped_column(ForeignKey("source.id"))
+    source_id: Mapped[UUID] = mapped_column(ForeignKey("source.id"), index=True)
 
     source: Mapped["SourceModel"] = relationship(back_populates="spells")
     materials: Mapped[list["MaterialComponentModel"]] = relationship(
@@ -53,38 +74,69 @@ class SpellModel(Base):
     )
 
     def to_app(self) -> AppSpell:
+        return SpellModel.row_to_app(
+            self,
+            class_ids=[c.id for c in self.character_classes],
+            subclass_ids=[c.id for c in self.character_subclasses],
+            material_ids=[m.id for m in self.materials],
+            saving_throws=[m.to_app() for m in self.saving_throws],
+        )
+
+    @staticmethod
+    def row_to_app(
+        row: Any,
+        class_ids: list[UUID],
+        subclass_ids: list[UUID],
+        material_ids: list[UUID],
+        saving_throws: list[str],
+    ) -> AppSpell:
+        # row - модель или строка select по колонкам таблицы spell
         duration = None
         splash = None
-        if self.duration_count is not None and self.duration_unit is not None:
+        if row.duration_count is not None and row.duration_unit is not None:
             duration = AppGameTime(
-                count=self.duration_count,
-                unit=self.duration_unit,
+                count=row.duration_count,
+                unit=row.duration_unit,
             )
-        if self.splash is not None:
-            splash = AppLength(count=self.splash)
+        if row.splash is not None:
+            splash = AppLength(count=row.splash)
         return AppSpell(
+            spell_id=row.id,
+            class_ids=class_ids,
+            subclass_ids=subclass_ids,
+            name=row.name,
+            description=row.description,
+            next_level_description=row.next_level_description,
+            level=row.level,
+            school=row.school,
+            damage_type=row.damage_type,
+            duration=duration,
+            casting_time=AppGameTime(row.casting_time_count, row.casting_time_unit),
+            spell_range=AppLength(count=row.spell_range),
+            splash=splash,
+            components=AppSpellComponents(
+                row.verbal_component,
+                row.symbolic_component,
+                row.material_component,
+                material_ids,
+            ),
+            concentration=row.concentration,
+            ritual=row.ritual,
+            saving_throws=saving_throws,
+            name_in_english=row.name_in_english,
+            source_id=row.source_id,
+        )
+
+    def to_summary(self) -> AppSpellSummary:
+        return AppSpellSummary(
             spell_id=self.id,
-            class_ids=[c.id for c in self.character_classes],
-            subclass_ids=[c.id for c in self.character_subclasses],
             name=self.name,
-            description=self.description,
-            next_level_description=self.next_level_description,
             level=self.level,
             school=self.school,
             damage_type=self.damage_type,
-            duration=duration,
             casting_time=AppGameTime(self.casting_time_count, self.casting_time_unit),
-            spell_range=AppLength(count=self.spell_range),
-            splash=splash,
-            components=AppSpellComponents(
-                self.verbal_component,
-                self.symbolic_component,
-                self.material_component,
-                [m.id for m in self.materials],
-            ),
             concentration=self.concentration,
             ritual=self.ritual,
-            saving_throws=[m.to_app() for m in self.saving_throws],
             name_in_english=self.name_in_english,
             source_id=self.source_id,
         )
@@ -117,11 +169,50 @@ class SpellModel(Base):
         )
 
 
+class SpellReadModel(Base):
+    # проекция для чтения: связи заклинания собраны в массивы, чтобы список
+    # и фильтры читали одну строку на заклинание вместо пяти таблиц
+    __tablename__ = "spell_read"
+    __table_args__ = (
+        Index("ix_spell_read_class_ids", "class_ids", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+        Index(
+            "ix_spell_read_subclass_ids", "subclass_ids", postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_spell_read_material_ids", "material_ids", postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    id: Mapped[UUID] = mapped_column(
+        ForeignKey("spell.id", ondelete="CASCADE"), primary_key=True
+    )
+    class_ids: Mapped[list[UUID]] = mapped_column(ArrayOf(Uuid()))
+    subclass_ids: Mapped[list[UUID]] = mapped_column(ArrayOf(Uuid()))
+    material_ids: Mapped[list[UUID]] = mapped_column(ArrayOf(Uuid()))
+    saving_throws: Mapped[list[str]] = mapped_column(ArrayOf(String()))
+
+    @staticmethod
+    def values_from_app(spell: AppSpell) -> dict[str, Any]:
+        # порядок связей в таблицах не задан; в проекции он фиксированный,
+        # чтобы ответ не зависел от порядка записи
+        return {
+            "id": spell.spell_id,
+            "class_ids": sorted(spell.class_ids),
+            "subclass_ids": sorted(spell.subclass_ids),
+            "material_ids": sorted(spell.components.materials),
+            "saving_throws": list(spell.saving_throws),
+        }
+
+
 class SpellSavingThrowModel(Base):
     __tablename__ = "spell_saving_throw"
 
     name: Mapped[str]
-    spell_id: Mapped[UUID] = mapped_column(ForeignKey("spell.id", ondelete="CASCADE"))
+    spell_id: Mapped[UUID] = mapped_column(
+        ForeignKey("spell.id", ondelete="CASCADE"), index=True
+    )
 
     spell: Mapped["SpellModel"] = relationship(back_populates="saving_throws")
 
@@ -135,26 +226,43 @@ class SpellSavingThrowModel(Base):
 
 class RelSpellCharacterClassModel(Base):
     __tablename__ = "rel_spell_character_class"
+    __table_args__ = (
+        Index(
+            "ix_rel_spell_character_class_spell_id_character_class_id",
+            "spell_id",
+            "character_class_id",
+        ),
+    )
 
     character_class_id: Mapped[UUID] = mapped_column(
-        ForeignKey("character_class.id", ondelete="CASCADE")
+        ForeignKey("character_class.id", ondelete="CASCADE"), index=True
     )
     spell_id: Mapped[UUID] = mapped_column(ForeignKey("spell.id", ondelete="CASCADE"))
 
 
 class RelSpellCharacterSubclassModel(Base):
     __tablename__ = "rel_spell_character_subclass"
+    __table_args__ = (
+        Index(
+            "ix_rel_spell_character_subclass_spell_id_character_subclass_id",
+            "spell_id",
+            "character_subclass_id",
+        ),
+    )
 
     character_subclass_id: Mapped[UUID] = mapped_column(
-        ForeignKey("character_subclass.id", ondelete="CASCADE")
+        ForeignKey("character_subclass.id", ondelete="CASCADE"), index=True
     )
     spell_id: Mapped[UUID] = mapped_column(ForeignKey("spell.id", ondelete="CASCADE"))
 
 
 class RelSpellMaterialModel(Base):
     __tablename__ = "rel_spell_material"
+    __table_args__ = (
+        Index("ix_rel_spell_material_spell_id_material_id", "spell_id", "material_id"),
+    )
 
     material_id: Mapped[UUID] = mapped_column(
-        ForeignKey("material_component.id", ondelete="CASCADE")
+        ForeignKey("material_component.id", ondelete="CASCADE"), index=True
     )
     spell_id: Mapped[UUID] = mapped_column(ForeignKey("spell.id", ondelete="CASCADE"))
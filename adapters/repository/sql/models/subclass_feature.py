@@ -4,7 +4,7 @@ from uuid import UUID
 from adapters.repository.sql.models.base import Base
 from application.dto.model.subclass_feature import AppSubclassFeature
 from domain.subclass_feature import SubclassFeature
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -13,6 +13,13 @@ if TYPE_CHECKING:
 
 class SubclassFeatureModel(Base):
     __tablename__ = "subclass_feature"
+    __table_args__ = (
+        Index(
+            "ix_subclass_feature_character_subclass_id_level",
+            "character_subclass_id",
+            "level",
+        ),
+    )
 
     name: Mapped[str] = mapped_column(String(50), unique=True)
     description: Mapped[str]
@@ -7,7 +7,7 @@ from application.dto.model.subrace import (
     AppSubraceFeature,
     AppSubraceIncreaseModifier,
 )
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -16,11 +16,31 @@ if TYPE_CHECKING:
 
 class SubraceModel(Base):
     __tablename__ = "subrace"
+    __table_args__ = (
+        Index(
+            "ix_subrace_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_subrace_name_in_english_trgm",
+            "name_in_english",
+            postgresql_using="gin",
+            postgresql_ops={"name_in_english": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_subrace_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     name: Mapped[str] = mapped_column(String(50), unique=True)
     description: Mapped[str]
     name_in_english: Mapped[str] = mapped_column(String(50))
-    race_id: Mapped[UUID] = mapped_column(ForeignKey("race.id"))
+    race_id: Mapped[UUID] = mapped_column(ForeignKey("race.id"), index=True)
 
     race: Mapped["RaceModel"] = relationship(back_populates="subraces")
     increase_modifiers: Mapped[list["SubraceIncreaseModifierModel"]] = relationship(
@@ -58,7 +78,7 @@ class SubraceIncreaseModifierModel(Base):
     name: Mapped[str] = mapped_column(String(50))
     bonus: Mapped[int]
     subrace_id: Mapped[UUID] = mapped_column(
-        ForeignKey("subrace.id", ondelete="CASCADE")
+        ForeignKey("subrace.id", ondelete="CASCADE"), index=True
     )
 
     subrace: Mapped["SubraceModel"] = relationship(back_populates="increase_modifiers")
@@ -81,7 +101,7 @@ class SubraceFeatureModel(Base):
     name: Mapped[str] = mapped_column(String(50))
     description: Mapped[str]
     subrace_id: Mapped[UUID] = mapped_column(
-        ForeignKey("subrace.id", ondelete="CASCADE")
+        ForeignKey("subrace.id", ondelete="CASCADE"), index=True
     )
 
     subrace: Mapped["SubraceModel"] = relationship(back_populates="features")
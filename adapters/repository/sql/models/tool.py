@@ -5,7 +5,7 @@ from adapters.repository.sql.models.base import Base
 from application.dto.model.coin import AppCoins
 from application.dto.model.tool import AppTool, AppToolUtilizes
 from application.dto.model.weight import AppWeight
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -14,6 +14,20 @@ if TYPE_CHECKING:
 
 class ToolModel(Base):
     __tablename__ = "tool"
+    __table_args__ = (
+        Index(
+            "ix_tool_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_tool_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     name: Mapped[str] = mapped_column(String(50), unique=True)
     description: Mapped[str]
@@ -56,7 +70,9 @@ class ToolUtilizeModel(Base):
 
     action: Mapped[str]
     complexity: Mapped[int]
-    tool_id: Mapped[UUID] = mapped_column(ForeignKey("tool.id", ondelete="cascade"))
+    tool_id: Mapped[UUID] = mapped_column(
+        ForeignKey("tool.id", ondelete="cascade"), index=True
+    )
 
     tool: Mapped["ToolModel"] = relationship(back_populates="utilizes")
 
@@ -9,7 +9,7 @@ from application.dto.model.weapon import AppWeapon, AppWeaponDamage
 from application.dto.model.weapon_kind import AppWeaponKind
 from application.dto.model.weapon_property import AppWeaponProperty
 from application.dto.model.weight import AppWeight
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -19,17 +19,31 @@ if TYPE_CHECKING:
 
 class WeaponModel(Base):
     __tablename__ = "weapon"
+    __table_args__ = (
+        Index(
+            "ix_weapon_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_weapon_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     name: Mapped[str] = mapped_column(String(50), unique=True)
     description: Mapped[str]
     cost: Mapped[int]
     damage_dice_name: Mapped[str]
     damage_dice_count: Mapped[int]
-    damage_type: Mapped[str]
+    damage_type: Mapped[str] = mapped_column(index=True)
     bonus_damage: Mapped[int]
     weight: Mapped[float]
-    material_id: Mapped[UUID] = mapped_column(ForeignKey("material.id"))
-    kind_id: Mapped[UUID] = mapped_column(ForeignKey("weapon_kind.id"))
+    material_id: Mapped[UUID] = mapped_column(ForeignKey("material.id"), index=True)
+    kind_id: Mapped[UUID] = mapped_column(ForeignKey("weapon_kind.id"), index=True)
 
     material: Mapped["MaterialModel"] = relationship(back_populates="weapons")
     kind: Mapped["WeaponKindModel"] = relationship(back_populates="weapons")
@@ -137,7 +151,7 @@ class WeaponKindModel(Base):
 
     name: Mapped[str] = mapped_column(String(50), unique=True)
     description: Mapped[str]
-    weapon_type: Mapped[str] = mapped_column(String(50))
+    weapon_type: Mapped[str] = mapped_column(String(50), index=True)
 
     weapons: Mapped[list["WeaponModel"]] = relationship(back_populates="kind")
 
@@ -166,5 +180,5 @@ class RelWeaponPropertyModel(Base):
         ForeignKey("weapon.id", ondelete="CASCADE"), unique=True
     )
     weapon_property_id: Mapped[UUID] = mapped_column(
-        ForeignKey("weapon_property.id", ondelete="CASCADE")
+        ForeignKey("weapon_property.id", ondelete="CASCADE"), index=True
     )
@@ -0,0 +1,44 @@
+from typing import Any, TypeVar
+
+from application.dto.model.page import AppCursor
+from sqlalchemy import ColumnElement, Select, and_, or_, select
+from sqlalchemy.orm import InstrumentedAttribute
+
+T = TypeVar("T", bound=tuple[Any, ...])
+
+
+def paginate(
+    query: Select[T],
+    key: InstrumentedAttribute[Any],
+    entity_id: InstrumentedAttribute[Any],
+    limit: int | None = None,
+    cursor: AppCursor | None = None,
+    rank: ColumnElement[Any] | None = None,
+) -> Select[T]:
+    after = None
+    if cursor is not None:
+        after = or_(
+            key > cursor.key,
+            and_(key == cursor.key, entity_id > cursor.entity_id),
+        )
+    if rank is None:
+        if after is not None:
+            query = query.where(after)
+        query = query.order_by(key, entity_id)
+    else:
+        # сначала лучшие совпадения; курсор хранит только имя и id, ранг его
+        # строки БД пересчитывает сама (удалённая строка - пустая страница)
+        if after is not None:
+            cursor_rank = (
+                select(rank)
+                .where(entity_id == cursor.entity_id)
+                .correlate(None)
+                .scalar_subquery()
+            )
+            query = query.where(
+                or_(rank < cursor_rank, and_(rank == cursor_rank, after))
+            )
+        query = query.order_by(rank.desc(), key, entity_id)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
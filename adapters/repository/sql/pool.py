@@ -0,0 +1,67 @@
+from dataclasses import dataclass, replace
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+__all__ = ["PoolSettings", "PoolMetrics", "MeteredPool"]
+
+
+@dataclass
+class PoolSettings:
+    pool_size: int
+    max_overflow: int
+    pool_timeout: float
+    pool_recycle: int
+    pool_pre_ping: bool
+    query_cache_size: int
+
+
+@dataclass
+class PoolMetrics:
+    size: int = 0
+    checked_out: int = 0
+    overflow: int = 0
+    checked_out_max: int = 0
+    checkouts: int = 0
+    timeouts: int = 0
+    checkout_wait_total: float = 0.0
+    checkout_wait_max: float = 0.0
+
+
+class MeteredPool(AsyncAdaptedQueuePool):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self) -> PoolProxiedConnection:
+        start = perf_counter()
+        try:
+            connection = super().connect()
+        except TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            wait = perf_counter() - start
+            self.metrics.checkout_wait_total += wait
+            self.metrics.checkout_wait_max = max(self.metrics.checkout_wait_max, wait)
+        self.metrics.checkouts += 1
+        self.metrics.checked_out_max = max(
+            self.metrics.checked_out_max, self.checkedout()
+        )
+        return connection
+
+    def recreate(self) -> "MeteredPool":
+        # dispose() пересоздаёт пул, накопленные метрики переносим в новый
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool  # type: ignore[return-value]
+
+    def snapshot(self) -> PoolMetrics:
+        return replace(
+            self.metrics,
+            size=self.size(),
+            checked_out=self.checkedout(),
+            overflow=max(self.overflow(), 0),
+        )
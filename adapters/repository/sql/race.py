@@ -1,3 +1,4 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
 from adapters.repository.sql.database import DBHelper
@@ -7,11 +8,16 @@ from adapters.repository.sql.models import (
     RaceModel,
     SourceModel,
 )
+from adapters.repository.sql.page import paginate
+from adapters.repository.sql.reference import fetch_references, select_references
+from adapters.repository.sql.search import name_matches, search_rank
+from application.dto.model.page import AppCursor
 from application.dto.model.race import AppRace
+from application.dto.model.reference import AppReferences
 from application.repository import RaceRepository as AppRaceRepository
 from domain.error import DomainError
 from domain.race import RaceRepository as DomainRaceRepository
-from sqlalchemy import Select, delete, exists, or_, select
+from sqlalchemy import Select, delete, exists, select
 from sqlalchemy.orm import selectinload
 
 
@@ -36,6 +42,14 @@ class SQLRaceRepository(DomainRaceRepository, AppRaceRepository):
             result = result.scalar()
             return result if result is not None else False
 
+    async def missing_ids(self, race_ids: Sequence[UUID]) -> set[UUID]:
+        if len(race_ids) == 0:
+            return set()
+        async with self.__db_helper.session as session:
+            query = select(RaceModel.id).where(RaceModel.id.in_(race_ids))
+            result = await session.execute(query)
+            return set(race_ids) - set(result.scalars().all())
+
     async def get_by_id(self, race_id: UUID) -> AppRace:
         async with self.__db_helper.session as session:
             query = self._add_options(select(RaceModel).where(RaceModel.id == race_id))
@@ -56,22 +70,44 @@ class SQLRaceRepository(DomainRaceRepository, AppRaceRepository):
         self,
         search_by_name: str | None = None,
         filter_by_source_ids: list[UUID] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppRace]:
         async with self.__db_helper.session as session:
             query = self._add_options(select(RaceModel))
             if search_by_name is not None:
                 query = query.where(
-                    or_(
-                        RaceModel.name.ilike(f"%{search_by_name}%"),
-                        RaceModel.name_in_english.ilike(f"%{search_by_name}%"),
+                    name_matches(
+                        search_by_name, RaceModel.name, RaceModel.name_in_english
                     )
                 )
             if filter_by_source_ids is not None:
                 query = query.where(RaceModel.source_id.in_(filter_by_source_ids))
+            query = paginate(
+                query,
+                RaceModel.name,
+                RaceModel.id,
+                limit,
+                cursor,
+                rank=search_rank(
+                    search_by_name, RaceModel.name, RaceModel.name_in_english
+                ),
+            )
             result = await session.execute(query)
             result = result.scalars().all()
             return [item.to_app() for item in result]
 
+    async def references(
+        self,
+        filter_by_source_ids: list[UUID] | None = None,
+        limit: int = 5,
+    ) -> AppReferences:
+        async with self.__db_helper.session as session:
+            query = select_references(RaceModel.name, limit)
+            if filter_by_source_ids is not None:
+                query = query.where(RaceModel.source_id.in_(filter_by_source_ids))
+            return await fetch_references(session, query, limit)
+
     async def save(self, race: AppRace) -> None:
         if await self.id_exists(race.race_id):
             await self.update(race)
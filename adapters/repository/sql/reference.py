@@ -0,0 +1,21 @@
+from typing import Any
+
+from application.dto.model.reference import AppReferences
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+def select_references(name: InstrumentedAttribute[str], limit: int) -> Select[Any]:
+    # оконная функция считает все совпадения до LIMIT, поэтому количество
+    # и первые имена приходят одним запросом без загрузки сущностей
+    return select(name, func.count().over()).order_by(name).limit(max(limit, 1))
+
+
+async def fetch_references(
+    session: AsyncSession, query: Select[Any], limit: int
+) -> AppReferences:
+    rows = (await session.execute(query)).all()
+    if len(rows) == 0:
+        return AppReferences()
+    return AppReferences(count=rows[0][1], names=[row[0] for row in rows[:limit]])
@@ -0,0 +1,130 @@
+from typing import Any
+
+from adapters.repository.sql.database import DBHelper
+from adapters.repository.sql.models import (
+    ArmorModel,
+    Base,
+    CharacterClassModel,
+    CharacterSubclassModel,
+    FeatModel,
+    MaterialModel,
+    RaceModel,
+    SpellModel,
+    SubraceModel,
+    ToolModel,
+    WeaponModel,
+)
+from application.dto.model.search import AppSearchHit
+from application.repository import SearchRepository as AppSearchRepository
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Select,
+    String,
+    case,
+    func,
+    literal,
+    null,
+    or_,
+    select,
+    union_all,
+)
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.functions import FunctionElement
+
+__all__ = ["SQLSearchRepository", "name_matches", "name_rank", "search_rank"]
+
+
+def name_matches(
+    term: str, *columns: InstrumentedAttribute[Any]
+) -> ColumnElement[bool]:
+    return or_(*[column.ilike(f"%{term}%") for column in columns])
+
+
+def search_rank(
+    term: str | None, *columns: InstrumentedAttribute[Any]
+) -> ColumnElement[float] | None:
+    # ранжированный режим списков: при поиске по имени лучшие совпадения первыми
+    return None if term is None else name_rank(term, *columns)
+
+
+class name_rank(FunctionElement[float]):
+    type = Float()
+    inherit_cache = True
+
+
+# В Postgres ранжируем по pg_trgm, его же GIN индексы обслуживают ilike
+@compiles(name_rank, "postgresql")
+def _name_rank_postgresql(element: name_rank, compiler: Any, **kw: Any) -> str:
+    term, *columns = element.clauses
+    ranks = [func.word_similarity(term, column) for column in columns]
+    rank = ranks[0] if len(ranks) == 1 else func.greatest(*ranks)
+    return compiler.process(rank, **kw)
+
+
+# Без pg_trgm: точное совпадение, затем префикс, затем вхождение
+@compiles(name_rank)
+def _name_rank_default(element: name_rank, compiler: Any, **kw: Any) -> str:
+    term, *columns = element.clauses
+    ranks = [
+        case(
+            (func.lower(column) == func.lower(term), 1.0),
+            (column.istartswith(term), 0.75),
+            (column.icontains(term), 0.5),
+            else_=0.0,
+        )
+        for column in columns
+    ]
+    rank = ranks[0] if len(ranks) == 1 else func.max(*ranks)
+    return compiler.process(rank, **kw)
+
+
+class SQLSearchRepository(AppSearchRepository):
+    entities: list[tuple[str, type[Base]]] = [
+        ("spell", SpellModel),
+        ("class", CharacterClassModel),
+        ("subclass", CharacterSubclassModel),
+        ("race", RaceModel),
+        ("subrace", SubraceModel),
+        ("feat", FeatModel),
+        ("armor", ArmorModel),
+        ("weapon", WeaponModel),
+        ("tool", ToolModel),
+        ("material", MaterialModel),
+    ]
+
+    def __init__(self, db_helper: DBHelper) -> None:
+        self.__db_helper = db_helper
+
+    async def search(self, term: str, limit: int) -> list[AppSearchHit]:
+        async with self.__db_helper.session as session:
+            hits = union_all(
+                *[
+                    self._entity_query(entity_type, model, term)
+                    for entity_type, model in self.entities
+                ]
+            ).subquery()
+            query = (
+                select(hits)
+                .order_by(hits.c.rank.desc(), hits.c.name, hits.c.entity_id)
+                .limit(limit)
+            )
+            result = await session.execute(query)
+            return [AppSearchHit(**row._asdict()) for row in result.all()]
+
+    def _entity_query(
+        self, entity_type: str, model: Any, term: str
+    ) -> Select[tuple[str, Any, str, str | None, float]]:
+        names = [model.name]
+        name_in_english: ColumnElement[str | None] = null().cast(String)
+        if hasattr(model, "name_in_english"):
+            names.append(model.name_in_english)
+            name_in_english = model.name_in_english
+        return select(
+            literal(entity_type).label("entity_type"),
+            model.id.label("entity_id"),
+            model.name.label("name"),
+            name_in_english.label("name_in_english"),
+            name_rank(term, *names).label("rank"),
+        ).where(or_(name_matches(term, *names), model.description.ilike(f"%{term}%")))
@@ -1,7 +1,10 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
 from adapters.repository.sql.database import DBHelper
 from adapters.repository.sql.models import SourceModel
+from adapters.repository.sql.page import paginate
+from application.dto.model.page import AppCursor
 from application.dto.model.source import AppSource
 from application.repository import SourceRepository as AppSourceRepository
 from domain.error import DomainError
@@ -30,6 +33,14 @@ class SQLSourceRepository(DomainSourceRepository, AppSourceRepository):
             result = result.scalar()
             return result if result is not None else False
 
+    async def missing_ids(self, source_ids: Sequence[UUID]) -> set[UUID]:
+        if len(source_ids) == 0:
+            return set()
+        async with self.__db_helper.session as session:
+            query = select(SourceModel.id).where(SourceModel.id.in_(source_ids))
+            result = await session.execute(query)
+            return set(source_ids) - set(result.scalars().all())
+
     async def get_by_id(self, source_id: UUID) -> AppSource:
         async with self.__db_helper.session as session:
             query = select(SourceModel).where(SourceModel.id == source_id)
@@ -39,7 +50,12 @@ class SQLSourceRepository(DomainSourceRepository, AppSourceRepository):
                 raise DomainError.not_found(f"источника с id {source_id} не существует")
             return result.to_app()
 
-    async def filter(self, search_by_name: str | None = None) -> list[AppSource]:
+    async def filter(
+        self,
+        search_by_name: str | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
+    ) -> list[AppSource]:
         async with self.__db_helper.session as session:
             query = select(SourceModel)
             if search_by_name:
@@ -49,6 +65,7 @@ class SQLSourceRepository(DomainSourceRepository, AppSourceRepository):
                         SourceModel.name_in_english.ilike(f"%{search_by_name}%"),
                     )
                 )
+            query = paginate(query, SourceModel.name, SourceModel.id, limit, cursor)
             result = await session.execute(query)
             result = result.scalars().all()
             return [source.to_app() for source in result]
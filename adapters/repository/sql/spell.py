@@ -1,3 +1,4 @@
+from typing import Any, Sequence
 from uuid import UUID, uuid4
 
 from adapters.repository.sql.database import DBHelper
@@ -5,19 +6,47 @@ from adapters.repository.sql.models import (
     CharacterClassModel,
     CharacterSubclassModel,
     MaterialComponentModel,
+    RelSpellCharacterClassModel,
+    RelSpellCharacterSubclassModel,
+    RelSpellMaterialModel,
     SourceModel,
     SpellModel,
+    SpellReadModel,
     SpellSavingThrowModel,
 )
-from application.dto.model.spell import AppSpell
+from adapters.repository.sql.models.array import array_overlap
+from adapters.repository.sql.models.base import utcnow
+from adapters.repository.sql.page import paginate
+from adapters.repository.sql.reference import fetch_references, select_references
+from adapters.repository.sql.search import name_matches, search_rank
+from adapters.repository.sql.spell_read import write_spell_read
+from application.dto.model.page import AppCursor
+from application.dto.model.reference import AppReferences
+from application.dto.model.spell import AppSpell, AppSpellSummary
 from application.repository import SpellRepository as AppSpellRepository
 from domain.error import DomainError
 from domain.spell import SpellRepository as DomainSpellRepository
-from sqlalchemy import Select, delete, exists, or_, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import ColumnElement, Select, delete, exists, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, selectinload
 
 
 class SQLSpellRepository(DomainSpellRepository, AppSpellRepository):
+    summary_columns = [
+        SpellModel.name,
+        SpellModel.level,
+        SpellModel.school,
+        SpellModel.damage_type,
+        SpellModel.casting_time_count,
+        SpellModel.casting_time_unit,
+        SpellModel.concentration,
+        SpellModel.ritual,
+        SpellModel.name_in_english,
+        SpellModel.source_id,
+    ]
+    # строк заклинаний на один executemany в create_many
+    create_batch_size = 500
+
     def __init__(self, db_helper: DBHelper) -> None:
         self.__db_helper = db_helper
 
@@ -28,6 +57,14 @@ class SQLSpellRepository(DomainSpellRepository, AppSpellRepository):
             result = result.scalar()
             return result if result is not None else False
 
+    async def existing_names(self, names: Sequence[str]) -> set[str]:
+        if len(names) == 0:
+            return set()
+        async with self.__db_helper.session as session:
+            query = select(SpellModel.name).where(SpellModel.name.in_(names))
+            result = await session.execute(query)
+            return set(result.scalars().all())
+
     async def next_id(self) -> UUID:
         return uuid4()
 
@@ -38,23 +75,25 @@ class SQLSpellRepository(DomainSpellRepository, AppSpellRepository):
             result = result.scalar()
             return result if result is not None else False
 
-    async def get_by_id(self, spell_id: UUID) -> AppSpell:
+    async def missing_ids(self, spell_ids: Sequence[UUID]) -> set[UUID]:
+        if len(spell_ids) == 0:
+            return set()
         async with self.__db_helper.session as session:
-            query = self._add_options(
-                select(SpellModel).where(SpellModel.id == spell_id)
-            )
+            query = select(SpellModel.id).where(SpellModel.id.in_(spell_ids))
             result = await session.execute(query)
-            result = result.scalar()
-            if result is None:
+            return set(spell_ids) - set(result.scalars().all())
+
+    async def get_by_id(self, spell_id: UUID) -> AppSpell:
+        async with self.__db_helper.session as session:
+            query = self._select().where(SpellModel.id == spell_id)
+            result = await self._load(session, query)
+            if len(result) == 0:
                 raise DomainError.not_found(f"заклинание с id {spell_id} не существует")
-            return result.to_app()
+            return result[0]
 
     async def get_all(self) -> list[AppSpell]:
         async with self.__db_helper.session as session:
-            query = self._add_options(select(SpellModel))
-            result = await session.execute(query)
-            result = result.scalars().all()
-            return [item.to_app() for item in result]
+            return await self._load(session, self._select())
 
     async def filter(
         self,
@@ -72,68 +111,115 @@ class SQLSpellRepository(DomainSpellRepository, AppSpellRepository):
         filter_by_concentration: bool | None = None,
         filter_by_ritual: bool | None = None,
         filter_by_source_ids: list[UUID] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppSpell]:
         async with self.__db_helper.session as session:
-            query = self._add_options(select(SpellModel))
-            conditions = list()
-            if search_by_name is not None:
-                conditions.append(
-                    or_(
-                        SpellModel.name.ilike(f"%{search_by_name}%"),
-                        SpellModel.name_in_english.ilike(f"%{search_by_name}%"),
-                    )
+            query = self._select().where(
+                *self._conditions(
+                    search_by_name=search_by_name,
+                    filter_by_class_ids=filter_by_class_ids,
+                    filter_by_subclass_ids=filter_by_subclass_ids,
+                    filter_by_schools=filter_by_schools,
+                    filter_by_damage_types=filter_by_damage_types,
+                    filter_by_durations=filter_by_durations,
+                    filter_by_casting_times=filter_by_casting_times,
+                    filter_by_verbal_component=filter_by_verbal_component,
+                    filter_by_symbolic_component=filter_by_symbolic_component,
+                    filter_by_material_component=filter_by_material_component,
+                    filter_by_material_ids=filter_by_material_ids,
+                    filter_by_concentration=filter_by_concentration,
+                    filter_by_ritual=filter_by_ritual,
+                    filter_by_source_ids=filter_by_source_ids,
                 )
-            if filter_by_class_ids is not None:
-                conditions.append(
-                    SpellModel.character_classes.any(
-                        CharacterClassModel.id.in_(filter_by_class_ids)
-                    )
-                )
-            if filter_by_subclass_ids is not None:
-                conditions.append(
-                    SpellModel.character_subclasses.any(
-                        CharacterSubclassModel.id.in_(filter_by_subclass_ids)
+            )
+            query = paginate(
+                query,
+                SpellModel.name,
+                SpellModel.id,
+                limit,
+                cursor,
+                rank=search_rank(
+                    search_by_name, SpellModel.name, SpellModel.name_in_english
+                ),
+            )
+            return await self._load(session, query)
+
+    async def filter_summaries(
+        self,
+        search_by_name: str | None = None,
+        filter_by_class_ids: list[UUID] | None = None,
+        filter_by_subclass_ids: list[UUID] | None = None,
+        filter_by_schools: list[str] | None = None,
+        filter_by_damage_types: list[str] | None = None,
+        filter_by_durations: list[str] | None = None,
+        filter_by_casting_times: list[str] | None = None,
+        filter_by_verbal_component: bool | None = None,
+        filter_by_symbolic_component: bool | None = None,
+        filter_by_material_component: bool | None = None,
+        filter_by_material_ids: list[UUID] | None = None,
+        filter_by_concentration: bool | None = None,
+        filter_by_ritual: bool | None = None,
+        filter_by_source_ids: list[UUID] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
+    ) -> list[AppSpellSummary]:
+        async with self.__db_helper.session as session:
+            # только колонки сводки: без текстов описаний и без связей
+            query = (
+                select(SpellModel)
+                .join(SpellReadModel, SpellReadModel.id == SpellModel.id)
+                .options(load_only(*self.summary_columns))
+                .where(
+                    *self._conditions(
+                        search_by_name=search_by_name,
+                        filter_by_class_ids=filter_by_class_ids,
+                        filter_by_subclass_ids=filter_by_subclass_ids,
+                        filter_by_schools=filter_by_schools,
+                        filter_by_damage_types=filter_by_damage_types,
+                        filter_by_durations=filter_by_durations,
+                        filter_by_casting_times=filter_by_casting_times,
+                        filter_by_verbal_component=filter_by_verbal_component,
+                        filter_by_symbolic_component=filter_by_symbolic_component,
+                        filter_by_material_component=filter_by_material_component,
+                        filter_by_material_ids=filter_by_material_ids,
+                        filter_by_concentration=filter_by_concentration,
+                        filter_by_ritual=filter_by_ritual,
+                        filter_by_source_ids=filter_by_source_ids,
                     )
                 )
-            if filter_by_schools is not None:
-                conditions.append(SpellModel.school.in_(filter_by_schools))
-            if filter_by_damage_types is not None:
-                conditions.append(SpellModel.damage_type.in_(filter_by_damage_types))
-            if filter_by_durations is not None:
-                conditions.append(SpellModel.duration_unit.in_(filter_by_durations))
-            if filter_by_casting_times is not None:
-                conditions.append(
-                    SpellModel.casting_time_unit.in_(filter_by_casting_times)
-                )
-            if filter_by_verbal_component is not None:
-                conditions.append(
-                    SpellModel.verbal_component == filter_by_verbal_component
-                )
-            if filter_by_symbolic_component is not None:
-                conditions.append(
-                    SpellModel.symbolic_component == filter_by_symbolic_component
-                )
-            if filter_by_material_component is not None:
-                conditions.append(
-                    SpellModel.material_component == filter_by_material_component
-                )
-            if filter_by_material_ids is not None:
-                conditions.append(
-                    SpellModel.materials.any(
-                        MaterialComponentModel.id.in_(filter_by_material_ids)
+            )
+            query = paginate(
+                query,
+                SpellModel.name,
+                SpellModel.id,
+                limit,
+                cursor,
+                rank=search_rank(
+                    search_by_name, SpellModel.name, SpellModel.name_in_english
+                ),
+            )
+            result = await session.execute(query)
+            return [item.to_summary() for item in result.scalars().all()]
+
+    async def references(
+        self,
+        filter_by_source_ids: list[UUID] | None = None,
+        filter_by_material_ids: list[UUID] | None = None,
+        limit: int = 5,
+    ) -> AppReferences:
+        async with self.__db_helper.session as session:
+            query = (
+                select_references(SpellModel.name, limit)
+                .join(SpellReadModel, SpellReadModel.id == SpellModel.id)
+                .where(
+                    *self._conditions(
+                        filter_by_source_ids=filter_by_source_ids,
+                        filter_by_material_ids=filter_by_material_ids,
                     )
                 )
-            if filter_by_concentration is not None:
-                conditions.append(SpellModel.concentration == filter_by_concentration)
-            if filter_by_ritual:
-                conditions.append(SpellModel.ritual == filter_by_ritual)
-            if filter_by_source_ids is not None:
-                conditions.append(SpellModel.source_id.in_(filter_by_source_ids))
-            if len(conditions) > 0:
-                query = query.where(*conditions)
-            result = await session.execute(query)
-            result = result.scalars().all()
-            return [item.to_app() for item in result]
+            )
+            return await fetch_references(session, query, limit)
 
     async def save(self, spell: AppSpell) -> None:
         if await self.id_exists(spell.spell_id):
@@ -174,8 +260,71 @@ class SQLSpellRepository(DomainSpellRepository, AppSpellRepository):
                     ]
                 )
             session.add(model)
+            await write_spell_read(session, [spell], replace=False)
+            await session.commit()
+
+    async def create_many(self, spells: Sequence[AppSpell]) -> None:
+        if len(spells) == 0:
+            return
+        # executemany по каждой таблице вместо построчного create через ORM;
+        # пачками, чтобы размер одного запроса не рос с размером импорта
+        async with self.__db_helper.session as session:
+            for start in range(0, len(spells), self.create_batch_size):
+                await self._insert_batch(
+                    session, spells[start : start + self.create_batch_size]
+                )
             await session.commit()
 
+    async def _insert_batch(
+        self, session: AsyncSession, spells: Sequence[AppSpell]
+    ) -> None:
+        now = utcnow()
+        columns = SpellModel.__table__.columns
+        rows = []
+        for spell in spells:
+            model = SpellModel.from_app(spell)
+            model.created_at = model.updated_at = now
+            rows.append({column.key: getattr(model, column.key) for column in columns})
+        relations: list[tuple[type[Any], list[dict[str, Any]]]] = [
+            (
+                RelSpellCharacterClassModel,
+                [
+                    {"spell_id": spell.spell_id, "character_class_id": class_id}
+                    for spell in spells
+                    for class_id in spell.class_ids
+                ],
+            ),
+            (
+                RelSpellCharacterSubclassModel,
+                [
+                    {"spell_id": spell.spell_id, "character_subclass_id": subclass_id}
+                    for spell in spells
+                    for subclass_id in spell.subclass_ids
+                ],
+            ),
+            (
+                RelSpellMaterialModel,
+                [
+                    {"spell_id": spell.spell_id, "material_id": material_id}
+                    for spell in spells
+                    for material_id in spell.components.materials
+                ],
+            ),
+            (
+                SpellSavingThrowModel,
+                [
+                    {"spell_id": spell.spell_id, "name": name}
+                    for spell in spells
+                    for name in spell.saving_throws
+                ],
+            ),
+        ]
+        await session.execute(insert(SpellModel), rows)
+        for model, values in relations:
+            if len(values) > 0:
+                await session.execute(insert(model), values)
+        await write_spell_read(session, spells, replace=False)
+
     async def update(self, spell: AppSpell) -> None:
         async with self.__db_helper.session as session:
             model_query = self._add_options(
@@ -254,6 +403,7 @@ class SQLSpellRepository(DomainSpellRepository, AppSpellRepository):
                         for item in spell.saving_throws
                     ]
                 )
+            await write_spell_read(session, [spell])
             await session.commit()
 
     async def delete(self, spell_id: UUID) -> None:
@@ -273,3 +423,89 @@ class SQLSpellRepository(DomainSpellRepository, AppSpellRepository):
             selectinload(SpellModel.character_subclasses),
             selectinload(SpellModel.materials),
         )
+
+    def _conditions(
+        self,
+        search_by_name: str | None = None,
+        filter_by_class_ids: list[UUID] | None = None,
+        filter_by_subclass_ids: list[UUID] | None = None,
+        filter_by_schools: list[str] | None = None,
+        filter_by_damage_types: list[str] | None = None,
+        filter_by_durations: list[str] | None = None,
+        filter_by_casting_times: list[str] | None = None,
+        filter_by_verbal_component: bool | None = None,
+        filter_by_symbolic_component: bool | None = None,
+        filter_by_material_component: bool | None = None,
+        filter_by_material_ids: list[UUID] | None = None,
+        filter_by_concentration: bool | None = None,
+        filter_by_ritual: bool | None = None,
+        filter_by_source_ids: list[UUID] | None = None,
+    ) -> list[ColumnElement[bool]]:
+        conditions = list()
+        if search_by_name is not None:
+            conditions.append(
+                name_matches(
+                    search_by_name, SpellModel.name, SpellModel.name_in_english
+                )
+            )
+        if filter_by_class_ids is not None:
+            conditions.append(
+                array_overlap(SpellReadModel.class_ids, filter_by_class_ids)
+            )
+        if filter_by_subclass_ids is not None:
+            conditions.append(
+                array_overlap(SpellReadModel.subclass_ids, filter_by_subclass_ids)
+            )
+        if filter_by_schools is not None:
+            conditions.append(SpellModel.school.in_(filter_by_schools))
+        if filter_by_damage_types is not None:
+            conditions.append(SpellModel.damage_type.in_(filter_by_damage_types))
+        if filter_by_durations is not None:
+            conditions.append(SpellModel.duration_unit.in_(filter_by_durations))
+        if filter_by_casting_times is not None:
+            conditions.append(SpellModel.casting_time_unit.in_(filter_by_casting_times))
+        if filter_by_verbal_component is not None:
+            conditions.append(SpellModel.verbal_component == filter_by_verbal_component)
+        if filter_by_symbolic_component is not None:
+            conditions.append(
+                SpellModel.symbolic_component == filter_by_symbolic_component
+            )
+        if filter_by_material_component is not None:
+            conditions.append(
+                SpellModel.material_component == filter_by_material_component
+            )
+        if filter_by_material_ids is not None:
+            conditions.append(
+                array_overlap(SpellReadModel.material_ids, filter_by_material_ids)
+            )
+        if filter_by_concentration is not None:
+            conditions.append(SpellModel.concentration == filter_by_concentration)
+        if filter_by_ritual:
+            conditions.append(SpellModel.ritual == filter_by_ritual)
+        if filter_by_source_ids is not None:
+            conditions.append(SpellModel.source_id.in_(filter_by_source_ids))
+        return conditions
+
+    def _select(self) -> Select[Any]:
+        return select(
+            SpellModel.__table__,
+            SpellReadModel.class_ids,
+            SpellReadModel.subclass_ids,
+            SpellReadModel.material_ids,
+            SpellReadModel.saving_throws,
+        ).join(SpellReadModel, SpellReadModel.id == SpellModel.id)
+
+    async def _load(self, session: AsyncSession, query: Select[Any]) -> list[AppSpell]:
+        # чтение без ORM: строки spell вместе с массивами связей из проекции
+        # spell_read собираются в AppSpell одним запросом; строку проекции
+        # пишет каждая запись заклинания, без неё заклинание не читается
+        return [
+            SpellModel.row_to_app(
+                row,
+                class_ids=row.class_ids,
+                subclass_ids=row.subclass_ids,
+                material_ids=row.material_ids,
+                saving_throws=row.saving_throws,
+            )
+            for row in (await session.execute(query)).all()
+        ]
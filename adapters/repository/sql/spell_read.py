@@ -0,0 +1,48 @@
+from typing import Any, Sequence
+from uuid import UUID
+
+from adapters.repository.sql.models import SpellModel, SpellReadModel
+from adapters.repository.sql.models.array import array_overlap, array_remove
+from adapters.repository.sql.models.base import utcnow
+from application.dto.model.spell import AppSpell
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+__all__ = ["remove_from_spell_read", "write_spell_read"]
+
+
+async def write_spell_read(
+    session: AsyncSession, spells: Sequence[AppSpell], replace: bool = True
+) -> None:
+    # строки spell должны попасть в БД раньше проекции из-за внешнего ключа
+    await session.flush()
+    if replace:
+        spell_ids = [spell.spell_id for spell in spells]
+        await session.execute(
+            delete(SpellReadModel).where(SpellReadModel.id.in_(spell_ids))
+        )
+    await session.execute(
+        insert(SpellReadModel),
+        [SpellReadModel.values_from_app(spell) for spell in spells],
+    )
+
+
+async def remove_from_spell_read(
+    session: AsyncSession, column: InstrumentedAttribute[Any], entity_id: UUID
+) -> None:
+    # удаление класса, подкласса или материала каскадом чистит таблицы связей,
+    # а массивы проекции приходится поправить отдельно; два запроса на любое
+    # число затронутых заклинаний
+    affected = select(SpellReadModel.id).where(array_overlap(column, [entity_id]))
+    # связи заклинаний изменились, их версия (ETag, снимок) тоже
+    await session.execute(
+        update(SpellModel)
+        .where(SpellModel.id.in_(affected))
+        .values(updated_at=utcnow())
+    )
+    await session.execute(
+        update(SpellReadModel)
+        .where(array_overlap(column, [entity_id]))
+        .values({column.key: array_remove(column, entity_id)})
+    )
@@ -1,7 +1,10 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
 from adapters.repository.sql.database import DBHelper
 from adapters.repository.sql.models import CharacterSubclassModel, SubclassFeatureModel
+from adapters.repository.sql.page import paginate
+from application.dto.model.page import AppCursor
 from application.dto.model.subclass_feature import AppSubclassFeature
 from application.repository import (
     SubclassFeatureRepository as AppSubclassFeatureRepository,
@@ -42,6 +45,16 @@ class SQLSubclassFeatureRepository(
             result = result.scalar()
             return result if result is not None else False
 
+    async def missing_ids(self, feature_ids: Sequence[UUID]) -> set[UUID]:
+        if len(feature_ids) == 0:
+            return set()
+        async with self.__db_helper.session as session:
+            query = select(SubclassFeatureModel.id).where(
+                SubclassFeatureModel.id.in_(feature_ids)
+            )
+            result = await session.execute(query)
+            return set(feature_ids) - set(result.scalars().all())
+
     async def get_by_id(self, feature_id: UUID) -> AppSubclassFeature:
         async with self.__db_helper.session as session:
             query = (
@@ -65,7 +78,10 @@ class SQLSubclassFeatureRepository(
             return [model.to_app() for model in result]
 
     async def filter(
-        self, filter_by_subclass_id: UUID | None = None
+        self,
+        filter_by_subclass_id: UUID | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppSubclassFeature]:
         async with self.__db_helper.session as session:
             query = select(SubclassFeatureModel).options(
@@ -75,6 +91,13 @@ class SQLSubclassFeatureRepository(
                 query = query.where(
                     SubclassFeatureModel.character_subclass_id == filter_by_subclass_id
                 )
+            query = paginate(
+                query,
+                SubclassFeatureModel.level,
+                SubclassFeatureModel.id,
+                limit,
+                cursor,
+            )
             result = await session.execute(query)
             result = result.scalars().all()
             return [model.to_app() for model in result]
@@ -1,3 +1,4 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
 from adapters.repository.sql.database import DBHelper
@@ -7,11 +8,14 @@ from adapters.repository.sql.models import (
     SubraceIncreaseModifierModel,
     SubraceModel,
 )
+from adapters.repository.sql.page import paginate
+from adapters.repository.sql.search import name_matches, search_rank
+from application.dto.model.page import AppCursor
 from application.dto.model.subrace import AppSubrace
 from application.repository import SubraceRepository as AppSubraceRepository
 from domain.error import DomainError
 from domain.subrace import SubraceRepository as DomainSubraceRepository
-from sqlalchemy import Select, delete, exists, or_, select
+from sqlalchemy import Select, delete, exists, select
 from sqlalchemy.orm import selectinload
 
 
@@ -36,6 +40,14 @@ class SQLSubraceRepository(DomainSubraceRepository, AppSubraceRepository):
             result = result.scalar()
             return result if result is not None else False
 
+    async def missing_ids(self, subrace_ids: Sequence[UUID]) -> set[UUID]:
+        if len(subrace_ids) == 0:
+            return set()
+        async with self.__db_helper.session as session:
+            query = select(SubraceModel.id).where(SubraceModel.id.in_(subrace_ids))
+            result = await session.execute(query)
+            return set(subrace_ids) - set(result.scalars().all())
+
     async def get_by_id(self, subrace_id: UUID) -> AppSubrace:
         async with self.__db_helper.session as session:
             query = self._add_options(
@@ -54,16 +66,30 @@ class SQLSubraceRepository(DomainSubraceRepository, AppSubraceRepository):
             result = result.scalars().all()
             return [r.to_app() for r in result]
 
-    async def filter(self, search_by_name: str | None = None) -> list[AppSubrace]:
+    async def filter(
+        self,
+        search_by_name: str | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
+    ) -> list[AppSubrace]:
         async with self.__db_helper.session as session:
             query = self._add_options(select(SubraceModel))
             if search_by_name is not None:
                 query = query.where(
-                    or_(
-                        SubraceModel.name.ilike(f"%{search_by_name}%"),
-                        SubraceModel.name_in_english.ilike(f"%{search_by_name}%"),
+                    name_matches(
+                        search_by_name, SubraceModel.name, SubraceModel.name_in_english
                     )
                 )
+            query = paginate(
+                query,
+                SubraceModel.name,
+                SubraceModel.id,
+                limit,
+                cursor,
+                rank=search_rank(
+                    search_by_name, SubraceModel.name, SubraceModel.name_in_english
+                ),
+            )
             result = await session.execute(query)
             result = result.scalars().all()
             return [r.to_app() for r in result]
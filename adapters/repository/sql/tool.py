@@ -1,7 +1,11 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
 from adapters.repository.sql.database import DBHelper
 from adapters.repository.sql.models import ToolModel, ToolUtilizeModel
+from adapters.repository.sql.page import paginate
+from adapters.repository.sql.search import name_matches, search_rank
+from application.dto.model.page import AppCursor
 from application.dto.model.tool import AppTool
 from application.repository import ToolRepository as AppToolRepository
 from domain.error import DomainError
@@ -31,6 +35,14 @@ class SQLToolRepository(DomainToolRepository, AppToolRepository):
             result = result.scalar()
             return result if result is not None else False
 
+    async def missing_ids(self, tool_ids: Sequence[UUID]) -> set[UUID]:
+        if len(tool_ids) == 0:
+            return set()
+        async with self.__helper.session as session:
+            query = select(ToolModel.id).where(ToolModel.id.in_(tool_ids))
+            result = await session.execute(query)
+            return set(tool_ids) - set(result.scalars().all())
+
     async def get_by_id(self, tool_id: UUID) -> AppTool:
         async with self.__helper.session as session:
             query = (
@@ -50,11 +62,24 @@ class SQLToolRepository(DomainToolRepository, AppToolRepository):
             result = await session.execute(stmt)
             return [tool_model.to_app() for tool_model in result.scalars().all()]
 
-    async def filter(self, search_by_name: str | None = None) -> list[AppTool]:
+    async def filter(
+        self,
+        search_by_name: str | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
+    ) -> list[AppTool]:
         async with self.__helper.session as session:
             query = select(ToolModel).options(selectinload(ToolModel.utilizes))
             if search_by_name is not None:
-                query = query.where(ToolModel.name.ilike(f"%{search_by_name}%"))
+                query = query.where(name_matches(search_by_name, ToolModel.name))
+            query = paginate(
+                query,
+                ToolModel.name,
+                ToolModel.id,
+                limit,
+                cursor,
+                rank=search_rank(search_by_name, ToolModel.name),
+            )
             result = await session.execute(query)
             return [tool_model.to_app() for tool_model in result.scalars().all()]
 
@@ -0,0 +1,44 @@
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from adapters.repository.sql.database import DBHelper
+
+if TYPE_CHECKING:
+    from adapters.invalidation import InvalidationBus
+
+T = TypeVar("T")
+
+
+class AtomicUseCase:
+    def __init__(
+        self,
+        use_case: Any,
+        db_helper: DBHelper,
+        bus: "InvalidationBus | None" = None,
+    ) -> None:
+        self._use_case = use_case
+        self._db_helper = db_helper
+        self._bus = bus
+
+    async def execute(self, *args: Any, **kwargs: Any) -> Any:
+        # вложенная единица работы коммитит вместе с внешней, она и сообщит
+        outermost = not self._db_helper.in_unit_of_work
+        async with self._db_helper.unit_of_work():
+            result = await self._use_case.execute(*args, **kwargs)
+            # сигнал в той же транзакции: без записи нет и сигнала, и наоборот
+            if outermost and self._bus is not None:
+                await self._bus.publish(self._db_helper.session)
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._use_case, name)
+
+
+class UnitOfWork:
+    def __init__(
+        self, db_helper: DBHelper, bus: "InvalidationBus | None" = None
+    ) -> None:
+        self._db_helper = db_helper
+        self._bus = bus
+
+    def __call__(self, use_case: T) -> T:
+        return cast(T, AtomicUseCase(use_case, self._db_helper, self._bus))
@@ -1,3 +1,4 @@
+from typing import Sequence
 from uuid import UUID
 
 from adapters.repository.sql.database import DBHelper
@@ -18,6 +19,14 @@ class SQLUserRepository(UserRepository):
             result = result.scalar()
             return result if result is not None else False
 
+    async def missing_ids(self, user_ids: Sequence[UUID]) -> set[UUID]:
+        if len(user_ids) == 0:
+            return set()
+        async with self.__helper.session as session:
+            query = select(UserModel.id).where(UserModel.id.in_(user_ids))
+            result = await session.execute(query)
+            return set(user_ids) - set(result.scalars().all())
+
     async def get_all(self) -> list[AppUser]:
         async with self.__helper.session as session:
             query = select(UserModel)
@@ -0,0 +1,84 @@
+from uuid import UUID
+
+from adapters.repository.sql.database import DBHelper
+from adapters.repository.sql.models import (
+    ArmorModel,
+    Base,
+    CharacterClassModel,
+    CharacterSubclassModel,
+    ClassFeatureModel,
+    ClassLevelModel,
+    FeatModel,
+    MaterialComponentModel,
+    MaterialModel,
+    RaceModel,
+    SourceModel,
+    SpellModel,
+    SubclassFeatureModel,
+    SubraceModel,
+    ToolModel,
+    WeaponKindModel,
+    WeaponModel,
+    WeaponPropertyModel,
+)
+from application.dto.model.version import AppVersion
+from application.repository import VersionRepository as AppVersionRepository
+from domain.error import DomainError
+from sqlalchemy import func, select, union_all
+
+
+class SQLVersionRepository(AppVersionRepository):
+    entities: dict[str, type[Base]] = {
+        "armor": ArmorModel,
+        "class": CharacterClassModel,
+        "subclass": CharacterSubclassModel,
+        "class_feature": ClassFeatureModel,
+        "class_level": ClassLevelModel,
+        "feat": FeatModel,
+        "material": MaterialModel,
+        "material_component": MaterialComponentModel,
+        "race": RaceModel,
+        "source": SourceModel,
+        "spell": SpellModel,
+        "subclass_feature": SubclassFeatureModel,
+        "subrace": SubraceModel,
+        "tool": ToolModel,
+        "weapon": WeaponModel,
+        "weapon_kind": WeaponKindModel,
+        "weapon_property": WeaponPropertyModel,
+    }
+
+    def __init__(self, db_helper: DBHelper) -> None:
+        self.__db_helper = db_helper
+
+    async def version(
+        self, entity_type: str, entity_id: UUID | None = None
+    ) -> AppVersion:
+        model = self.entities.get(entity_type)
+        if model is None:
+            raise DomainError.invalid_data(f"неизвестный тип сущности {entity_type}")
+        async with self.__db_helper.session as session:
+            query = select(func.max(model.updated_at), func.count(model.id))
+            if entity_id is not None:
+                query = query.where(model.id == entity_id)
+            result = await session.execute(query)
+            updated_at, count = result.one()
+            return AppVersion(updated_at=updated_at, count=count)
+
+    async def catalogue_version(self) -> AppVersion:
+        # одна строка на таблицу справочника; удаление меняет count,
+        # создание и изменение - updated_at
+        tables = union_all(
+            *[
+                select(
+                    func.max(model.updated_at).label("updated_at"),
+                    func.count(model.id).label("count"),
+                )
+                for model in self.entities.values()
+            ]
+        ).subquery()
+        async with self.__db_helper.session as session:
+            query = select(func.max(tables.c.updated_at), func.sum(tables.c.count))
+            result = await session.execute(query)
+            updated_at, count = result.one()
+            return AppVersion(updated_at=updated_at, count=count or 0)
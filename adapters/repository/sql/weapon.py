@@ -1,3 +1,4 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
 from adapters.repository.sql.database import DBHelper
@@ -8,6 +9,11 @@ from adapters.repository.sql.models import (
     WeaponModel,
     WeaponPropertyModel,
 )
+from adapters.repository.sql.page import paginate
+from adapters.repository.sql.reference import fetch_references, select_references
+from adapters.repository.sql.search import name_matches, search_rank
+from application.dto.model.page import AppCursor
+from application.dto.model.reference import AppReferences
 from application.dto.model.weapon import AppWeapon
 from application.repository import WeaponRepository as AppWeaponRepository
 from domain.error import DomainError
@@ -37,6 +43,14 @@ class SQLWeaponRepository(DomainWeaponRepository, AppWeaponRepository):
             result = result.scalar()
             return result if result is not None else False
 
+    async def missing_ids(self, weapon_ids: Sequence[UUID]) -> set[UUID]:
+        if len(weapon_ids) == 0:
+            return set()
+        async with self.__helper.session as session:
+            query = select(WeaponModel.id).where(WeaponModel.id.in_(weapon_ids))
+            result = await session.execute(query)
+            return set(weapon_ids) - set(result.scalars().all())
+
     async def get_by_id(self, weapon_id: UUID) -> AppWeapon:
         async with self.__helper.session as session:
             weapon_query = (
@@ -66,12 +80,14 @@ class SQLWeaponRepository(DomainWeaponRepository, AppWeaponRepository):
         filter_by_damage_types: list[str] | None = None,
         filter_by_property_ids: list[UUID] | None = None,
         filter_by_material_ids: list[UUID] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppWeapon]:
         async with self.__helper.session as session:
             query = select(WeaponModel).options(selectinload(WeaponModel.properties))
             conditions = list()
             if search_by_name is not None:
-                conditions.append(WeaponModel.name.ilike(f"%{search_by_name}%"))
+                conditions.append(name_matches(search_by_name, WeaponModel.name))
             if filter_by_kind_ids is not None:
                 conditions.append(WeaponModel.kind_id.in_(filter_by_kind_ids))
             if filter_by_damage_types is not None:
@@ -88,10 +104,41 @@ class SQLWeaponRepository(DomainWeaponRepository, AppWeaponRepository):
                 conditions.append(WeaponModel.material_id.in_(filter_by_material_ids))
             if len(conditions) > 0:
                 query = query.where(or_(*conditions))
+            query = paginate(
+                query,
+                WeaponModel.name,
+                WeaponModel.id,
+                limit,
+                cursor,
+                rank=search_rank(search_by_name, WeaponModel.name),
+            )
             weapons = await session.execute(query)
             weapons = weapons.scalars().all()
             return [w.to_app() for w in weapons]
 
+    async def references(
+        self,
+        filter_by_kind_ids: list[UUID] | None = None,
+        filter_by_property_ids: list[UUID] | None = None,
+        filter_by_material_ids: list[UUID] | None = None,
+        limit: int = 5,
+    ) -> AppReferences:
+        async with self.__helper.session as session:
+            query = select_references(WeaponModel.name, limit)
+            if filter_by_kind_ids is not None:
+                query = query.where(WeaponModel.kind_id.in_(filter_by_kind_ids))
+            if filter_by_property_ids is not None:
+                query = query.where(
+                    WeaponModel.properties.any(
+                        RelWeaponPropertyModel.weapon_property_id.in_(
+                            filter_by_property_ids
+                        )
+                    )
+                )
+            if filter_by_material_ids is not None:
+                query = query.where(WeaponModel.material_id.in_(filter_by_material_ids))
+            return await fetch_references(session, query, limit)
+
     async def save(self, weapon: AppWeapon) -> None:
         if await self.id_exists(weapon.weapon_id):
             await self.update(weapon)
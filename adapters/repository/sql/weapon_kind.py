@@ -1,7 +1,10 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
 from adapters.repository.sql.database import DBHelper
 from adapters.repository.sql.models import WeaponKindModel
+from adapters.repository.sql.page import paginate
+from application.dto.model.page import AppCursor
 from application.dto.model.weapon_kind import AppWeaponKind
 from application.repository import WeaponKindRepository as AppWeaponKindRepository
 from domain.error import DomainError
@@ -32,6 +35,16 @@ class SQLWeaponKindRepository(DomainWeaponKindRepository, AppWeaponKindRepositor
             result = result.scalar()
             return result if result is not None else False
 
+    async def missing_ids(self, weapon_kind_ids: Sequence[UUID]) -> set[UUID]:
+        if len(weapon_kind_ids) == 0:
+            return set()
+        async with self.__helper.session as session:
+            query = select(WeaponKindModel.id).where(
+                WeaponKindModel.id.in_(weapon_kind_ids)
+            )
+            result = await session.execute(query)
+            return set(weapon_kind_ids) - set(result.scalars().all())
+
     async def get_by_id(self, weapon_kind_id: UUID) -> AppWeaponKind:
         async with self.__helper.session as session:
             query = select(WeaponKindModel).where(WeaponKindModel.id == weapon_kind_id)
@@ -54,6 +67,8 @@ class SQLWeaponKindRepository(DomainWeaponKindRepository, AppWeaponKindRepositor
         self,
         search_by_name: str | None = None,
         filter_by_types: list[str] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppWeaponKind]:
         async with self.__helper.session as session:
             query = select(WeaponKindModel)
@@ -64,6 +79,9 @@ class SQLWeaponKindRepository(DomainWeaponKindRepository, AppWeaponKindRepositor
                 conditions.append(WeaponKindModel.weapon_type.in_(filter_by_types))
             if len(conditions) > 0:
                 query = query.where(*conditions)
+            query = paginate(
+                query, WeaponKindModel.name, WeaponKindModel.id, limit, cursor
+            )
             result = await session.execute(query)
             result = result.scalars().all()
             return [item.to_app() for item in result]
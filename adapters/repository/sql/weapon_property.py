@@ -1,7 +1,10 @@
+from typing import Sequence
 from uuid import UUID, uuid4
 
 from adapters.repository.sql.database import DBHelper
 from adapters.repository.sql.models import WeaponPropertyModel
+from adapters.repository.sql.page import paginate
+from application.dto.model.page import AppCursor
 from application.dto.model.weapon_property import AppWeaponProperty
 from application.repository import (
     WeaponPropertyRepository as AppWeaponPropertyRepository,
@@ -40,6 +43,16 @@ class SQLWeaponPropertyRepository(
             result = result.scalar()
             return result if result is not None else False
 
+    async def missing_ids(self, weapon_property_ids: Sequence[UUID]) -> set[UUID]:
+        if len(weapon_property_ids) == 0:
+            return set()
+        async with self.__helper.session as session:
+            query = select(WeaponPropertyModel.id).where(
+                WeaponPropertyModel.id.in_(weapon_property_ids)
+            )
+            result = await session.execute(query)
+            return set(weapon_property_ids) - set(result.scalars().all())
+
     async def get_by_id(self, weapon_property_id: UUID) -> AppWeaponProperty:
         async with self.__helper.session as session:
             query = select(WeaponPropertyModel).where(
@@ -61,7 +74,10 @@ class SQLWeaponPropertyRepository(
             return [item.to_app() for item in result]
 
     async def filter(
-        self, search_by_name: str | None = None
+        self,
+        search_by_name: str | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppWeaponProperty]:
         async with self.__helper.session as session:
             query = select(WeaponPropertyModel)
@@ -69,6 +85,9 @@ class SQLWeaponPropertyRepository(
                 query = query.where(
                     WeaponPropertyModel.name.ilike(f"%{search_by_name}%")
                 )
+            query = paginate(
+                query, WeaponPropertyModel.name, WeaponPropertyModel.id, limit, cursor
+            )
             result = await session.execute(query)
             result = result.scalars().all()
             return [item.to_app() for item in result]
@@ -0,0 +1,209 @@
+"""add name trigram indexes
+
+Revision ID: d982f9c38c16
+Revises: 9efc72d2c3e0
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d982f9c38c16"
+down_revision: Union[str, Sequence[str], None] = "9efc72d2c3e0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_armor_name_trgm",
+        "armor",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_character_class_name_trgm",
+        "character_class",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_character_class_name_in_english_trgm",
+        "character_class",
+        ["name_in_english"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name_in_english": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_feat_name_trgm",
+        "feat",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_material_name_trgm",
+        "material",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_race_name_trgm",
+        "race",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_race_name_in_english_trgm",
+        "race",
+        ["name_in_english"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name_in_english": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_spell_name_trgm",
+        "spell",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_spell_name_in_english_trgm",
+        "spell",
+        ["name_in_english"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name_in_english": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_subrace_name_trgm",
+        "subrace",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_subrace_name_in_english_trgm",
+        "subrace",
+        ["name_in_english"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name_in_english": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_tool_name_trgm",
+        "tool",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_weapon_name_trgm",
+        "weapon",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_weapon_name_trgm",
+        table_name="weapon",
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_tool_name_trgm",
+        table_name="tool",
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_subrace_name_in_english_trgm",
+        table_name="subrace",
+        postgresql_using="gin",
+        postgresql_ops={"name_in_english": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_subrace_name_trgm",
+        table_name="subrace",
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_spell_name_in_english_trgm",
+        table_name="spell",
+        postgresql_using="gin",
+        postgresql_ops={"name_in_english": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_spell_name_trgm",
+        table_name="spell",
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_race_name_in_english_trgm",
+        table_name="race",
+        postgresql_using="gin",
+        postgresql_ops={"name_in_english": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_race_name_trgm",
+        table_name="race",
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_material_name_trgm",
+        table_name="material",
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_feat_name_trgm",
+        table_name="feat",
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_character_class_name_in_english_trgm",
+        table_name="character_class",
+        postgresql_using="gin",
+        postgresql_ops={"name_in_english": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_character_class_name_trgm",
+        table_name="character_class",
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_armor_name_trgm",
+        table_name="armor",
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
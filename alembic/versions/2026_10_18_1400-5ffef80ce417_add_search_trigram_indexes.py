@@ -0,0 +1,194 @@
+"""add search trigram indexes
+
+Revision ID: 5ffef80ce417
+Revises: d982f9c38c16
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5ffef80ce417"
+down_revision: Union[str, Sequence[str], None] = "d982f9c38c16"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_armor_description_trgm",
+        "armor",
+        ["description"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_character_class_description_trgm",
+        "character_class",
+        ["description"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_character_subclass_name_trgm",
+        "character_subclass",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_character_subclass_name_in_english_trgm",
+        "character_subclass",
+        ["name_in_english"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name_in_english": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_character_subclass_description_trgm",
+        "character_subclass",
+        ["description"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_feat_description_trgm",
+        "feat",
+        ["description"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_material_description_trgm",
+        "material",
+        ["description"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_race_description_trgm",
+        "race",
+        ["description"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_spell_description_trgm",
+        "spell",
+        ["description"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_subrace_description_trgm",
+        "subrace",
+        ["description"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_tool_description_trgm",
+        "tool",
+        ["description"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_weapon_description_trgm",
+        "weapon",
+        ["description"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_weapon_description_trgm",
+        table_name="weapon",
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_tool_description_trgm",
+        table_name="tool",
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_subrace_description_trgm",
+        table_name="subrace",
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_spell_description_trgm",
+        table_name="spell",
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_race_description_trgm",
+        table_name="race",
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_material_description_trgm",
+        table_name="material",
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_feat_description_trgm",
+        table_name="feat",
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_character_subclass_description_trgm",
+        table_name="character_subclass",
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_character_subclass_name_in_english_trgm",
+        table_name="character_subclass",
+        postgresql_using="gin",
+        postgresql_ops={"name_in_english": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_character_subclass_name_trgm",
+        table_name="character_subclass",
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_character_class_description_trgm",
+        table_name="character_class",
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.drop_index(
+        "ix_armor_description_trgm",
+        table_name="armor",
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
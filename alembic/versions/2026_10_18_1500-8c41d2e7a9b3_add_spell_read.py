@@ -0,0 +1,115 @@
+"""add spell read
+
+Revision ID: 8c41d2e7a9b3
+Revises: 5ffef80ce417
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "8c41d2e7a9b3"
+down_revision: Union[str, Sequence[str], None] = "5ffef80ce417"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "spell_read",
+        sa.Column("class_ids", postgresql.ARRAY(sa.Uuid()), nullable=False),
+        sa.Column("subclass_ids", postgresql.ARRAY(sa.Uuid()), nullable=False),
+        sa.Column("material_ids", postgresql.ARRAY(sa.Uuid()), nullable=False),
+        sa.Column("saving_throws", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["id"], ["spell.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_spell_read_class_ids",
+        "spell_read",
+        ["class_ids"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_spell_read_subclass_ids",
+        "spell_read",
+        ["subclass_ids"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_spell_read_material_ids",
+        "spell_read",
+        ["material_ids"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.execute("""
+        INSERT INTO spell_read (
+            id,
+            class_ids,
+            subclass_ids,
+            material_ids,
+            saving_throws,
+            created_at,
+            updated_at
+        )
+        SELECT
+            s.id,
+            ARRAY(
+                SELECT r.character_class_id
+                FROM rel_spell_character_class r
+                WHERE r.spell_id = s.id
+                ORDER BY r.character_class_id
+            ),
+            ARRAY(
+                SELECT r.character_subclass_id
+                FROM rel_spell_character_subclass r
+                WHERE r.spell_id = s.id
+                ORDER BY r.character_subclass_id
+            ),
+            ARRAY(
+                SELECT r.material_id
+                FROM rel_spell_material r
+                WHERE r.spell_id = s.id
+                ORDER BY r.material_id
+            ),
+            ARRAY(
+                SELECT t.name
+                FROM spell_saving_throw t
+                WHERE t.spell_id = s.id
+            ),
+            TIMEZONE('utc', now()),
+            TIMEZONE('utc', now())
+        FROM spell s
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_spell_read_material_ids",
+        table_name="spell_read",
+        postgresql_using="gin",
+    )
+    op.drop_index(
+        "ix_spell_read_subclass_ids",
+        table_name="spell_read",
+        postgresql_using="gin",
+    )
+    op.drop_index(
+        "ix_spell_read_class_ids",
+        table_name="spell_read",
+        postgresql_using="gin",
+    )
+    op.drop_table("spell_read")
@@ -12,6 +12,7 @@ __all__ = [
     "SpellDamageTypeCommand",
     "SplashCommand",
     "CreateSpellCommand",
+    "ImportSpellsCommand",
     "UpdateSpellCommand",
     "DeleteSpellCommand",
 ]
@@ -63,6 +64,12 @@ class CreateSpellCommand:
     source_id: UUID
 
 
+@dataclass
+class ImportSpellsCommand:
+    user_id: UUID
+    spells: Sequence[CreateSpellCommand]
+
+
 @dataclass
 class UpdateSpellCommand:
     user_id: UUID
@@ -9,7 +9,7 @@ from domain.skill import Skill
 
 from .dice import AppDice
 
-__all__ = ["AppClass", "AppClassHits", "AppClassProficiencies"]
+__all__ = ["AppClass", "AppClassHits", "AppClassProficiencies", "AppClassSummary"]
 
 
 @dataclass
@@ -110,3 +110,22 @@ class AppClass:
             name_in_english=self.name_in_english,
             source_id=self.source_id,
         )
+
+
+@dataclass
+class AppClassSummary:
+    class_id: UUID
+    name: str
+    hit_dice: AppDice
+    name_in_english: str
+    source_id: UUID
+
+    @staticmethod
+    def from_app(character_class: AppClass) -> "AppClassSummary":
+        return AppClassSummary(
+            class_id=character_class.class_id,
+            name=character_class.name,
+            hit_dice=character_class.hits.hit_dice,
+            name_in_english=character_class.name_in_english,
+            source_id=character_class.source_id,
+        )
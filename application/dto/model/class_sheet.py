@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+from .character_class import AppClass
+from .character_subclass import AppSubclass
+from .class_feature import AppClassFeature
+from .class_level import AppClassLevel
+from .spell import AppSpellSummary
+
+__all__ = ["AppClassSheet"]
+
+
+@dataclass
+class AppClassSheet:
+    character_class: AppClass
+    levels: list[AppClassLevel]
+    features: list[AppClassFeature]
+    subclasses: list[AppSubclass]
+    spells: list[AppSpellSummary]
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+__all__ = ["AppExportItem"]
+
+
+@dataclass
+class AppExportItem:
+    entity_type: str
+    updated_at: datetime
+    entity: Any
@@ -0,0 +1,38 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from dataclasses import dataclass
+from typing import Generic, Sequence, TypeVar
+from uuid import UUID
+
+from domain.error import DomainError
+
+__all__ = ["AppCursor", "AppPage"]
+
+T = TypeVar("T")
+
+
+@dataclass
+class AppCursor:
+    key: str | int
+    entity_id: UUID
+
+    def encode(self) -> str:
+        raw = json.dumps([self.key, str(self.entity_id)], ensure_ascii=False)
+        return urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode(cursor: str, key_type: type[str | int] = str) -> "AppCursor":
+        # ключ сравнивается с колонкой сортировки, тип должен совпадать
+        try:
+            key, entity_id = json.loads(urlsafe_b64decode(cursor.encode()))
+            if type(key) is not key_type:
+                raise ValueError(key)
+            return AppCursor(key=key, entity_id=UUID(entity_id))
+        except (ValueError, TypeError):
+            raise DomainError.invalid_data(f"курсор {cursor} некорректен")
+
+
+@dataclass
+class AppPage(Generic[T]):
+    items: Sequence[T]
+    next_cursor: str | None
@@ -0,0 +1,9 @@
+from dataclasses import dataclass, field
+
+__all__ = ["AppReferences"]
+
+
+@dataclass
+class AppReferences:
+    count: int = 0
+    names: list[str] = field(default_factory=list)
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+__all__ = ["AppSearchHit"]
+
+
+@dataclass
+class AppSearchHit:
+    entity_type: str
+    entity_id: UUID
+    name: str
+    name_in_english: str | None
+    rank: float
@@ -13,6 +13,7 @@ __all__ = [
     "AppSpell",
     "AppSpellComponents",
     "AppSpellSchool",
+    "AppSpellSummary",
 ]
 
 
@@ -136,3 +137,32 @@ class AppSpell:
             name_in_english=self.name_in_english,
             source_id=self.source_id,
         )
+
+
+@dataclass
+class AppSpellSummary:
+    spell_id: UUID
+    name: str
+    level: int
+    school: str
+    damage_type: str | None
+    casting_time: AppGameTime
+    concentration: bool
+    ritual: bool
+    name_in_english: str
+    source_id: UUID
+
+    @staticmethod
+    def from_app(spell: AppSpell) -> "AppSpellSummary":
+        return AppSpellSummary(
+            spell_id=spell.spell_id,
+            name=spell.name,
+            level=spell.level,
+            school=spell.school,
+            damage_type=spell.damage_type,
+            casting_time=spell.casting_time,
+            concentration=spell.concentration,
+            ritual=spell.ritual,
+            name_in_english=spell.name_in_english,
+            source_id=spell.source_id,
+        )
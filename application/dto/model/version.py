@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+__all__ = ["AppVersion"]
+
+
+@dataclass
+class AppVersion:
+    updated_at: datetime | None
+    count: int
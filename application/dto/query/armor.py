@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from uuid import UUID
 
+from application.dto.query.page import PageQuery
+
 __all__ = ["ArmorsQuery", "ArmorQuery"]
 
 
@@ -14,3 +16,4 @@ class ArmorsQuery:
     search_by_name: str | None = None
     filter_by_armor_types: list[str] | None = None
     filter_by_material_ids: list[UUID] | None = None
+    page: PageQuery = field(default_factory=PageQuery)
@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from uuid import UUID
 
+from application.dto.query.page import PageQuery
+
 __all__ = ["ClassQuery", "ClassesQuery"]
 
 
@@ -12,3 +14,4 @@ class ClassQuery:
 @dataclass
 class ClassesQuery:
     search_by_name: str | None = None
+    page: PageQuery = field(default_factory=PageQuery)
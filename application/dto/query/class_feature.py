@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from uuid import UUID
 
+from application.dto.query.page import PageQuery
+
 __all__ = ["ClassFeatureQuery", "ClassFeaturesQuery"]
 
 
@@ -12,3 +14,4 @@ class ClassFeatureQuery:
 @dataclass
 class ClassFeaturesQuery:
     filter_by_class_id: UUID | None = None
+    page: PageQuery = field(default_factory=PageQuery)
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+__all__ = ["ExportQuery"]
+
+
+@dataclass
+class ExportQuery:
+    since: datetime | None = None
@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from uuid import UUID
 
+from application.dto.query.page import PageQuery
+
 __all__ = ["FeatQuery", "FeatsQuery"]
 
 
@@ -16,3 +18,4 @@ class FeatsQuery:
     filter_by_required_armor_types: list[str] | None = None
     filter_by_required_modifiers: list[str] | None = None
     filter_by_increase_modifiers: list[str] | None = None
+    page: PageQuery = field(default_factory=PageQuery)
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+__all__ = ["DEFAULT_PAGE_LIMIT", "MAX_PAGE_LIMIT", "PageQuery"]
+
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 100
+
+
+@dataclass
+class PageQuery:
+    limit: int = DEFAULT_PAGE_LIMIT
+    cursor: str | None = None
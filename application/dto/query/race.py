@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from uuid import UUID
 
+from application.dto.query.page import PageQuery
+
 __all__ = ["RaceQuery", "RacesQuery"]
 
 
@@ -12,3 +14,4 @@ class RaceQuery:
 @dataclass
 class RacesQuery:
     search_by_name: str | None = None
+    page: PageQuery = field(default_factory=PageQuery)
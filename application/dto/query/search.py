@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+__all__ = ["DEFAULT_SEARCH_LIMIT", "SearchQuery"]
+
+DEFAULT_SEARCH_LIMIT = 20
+
+
+@dataclass
+class SearchQuery:
+    search: str
+    limit: int = DEFAULT_SEARCH_LIMIT
@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from uuid import UUID
 
+from application.dto.query.page import PageQuery
+
 __all__ = ["SpellQuery", "SpellsQuery"]
 
 
@@ -24,3 +26,4 @@ class SpellsQuery:
     filter_by_concentration: bool | None = None
     filter_by_ritual: bool | None = None
     filter_by_source_ids: list[UUID] | None = None
+    page: PageQuery = field(default_factory=PageQuery)
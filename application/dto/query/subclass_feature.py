@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from uuid import UUID
 
+from application.dto.query.page import PageQuery
+
 __all__ = ["SubclassFeatureQuery", "SubclassFeaturesQuery"]
 
 
@@ -12,3 +14,4 @@ class SubclassFeatureQuery:
 @dataclass
 class SubclassFeaturesQuery:
     filter_by_subclass_id: UUID | None = None
+    page: PageQuery = field(default_factory=PageQuery)
@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from uuid import UUID
 
+from application.dto.query.page import PageQuery
+
 __all__ = ["SubraceQuery", "SubracesQuery"]
 
 
@@ -12,3 +14,4 @@ class SubraceQuery:
 @dataclass
 class SubracesQuery:
     search_by_name: str | None = None
+    page: PageQuery = field(default_factory=PageQuery)
@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from uuid import UUID
 
+from application.dto.query.page import PageQuery
+
 __all__ = ["ToolQuery", "ToolsQuery"]
 
 
@@ -12,3 +14,4 @@ class ToolQuery:
 @dataclass
 class ToolsQuery:
     search_by_name: str | None = None
+    page: PageQuery = field(default_factory=PageQuery)
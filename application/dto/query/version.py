@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+__all__ = ["VersionQuery"]
+
+
+@dataclass
+class VersionQuery:
+    entity_type: str
+    entity_id: UUID | None = None
@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from uuid import UUID
 
+from application.dto.query.page import PageQuery
+
 __all__ = ["WeaponQuery", "WeaponsQuery"]
 
 
@@ -16,3 +18,4 @@ class WeaponsQuery:
     filter_by_damage_types: list[str] | None = None
     filter_by_property_ids: list[UUID] | None = None
     filter_by_material_ids: list[UUID] | None = None
+    page: PageQuery = field(default_factory=PageQuery)
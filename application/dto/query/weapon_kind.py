@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from uuid import UUID
 
+from application.dto.query.page import PageQuery
+
 __all__ = ["WeaponKindQuery", "WeaponKindsQuery"]
 
 
@@ -13,3 +15,4 @@ class WeaponKindQuery:
 class WeaponKindsQuery:
     search_by_name: str | None = None
     filter_by_types: list[str] | None = None
+    page: PageQuery = field(default_factory=PageQuery)
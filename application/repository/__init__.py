@@ -3,16 +3,19 @@ from .character_class import ClassRepository
 from .character_subclass import SubclassRepository
 from .class_feature import ClassFeatureRepository
 from .class_level import ClassLevelRepository
+from .export import ExportRepository
 from .feat import FeatRepository
 from .material import MaterialRepository
 from .material_component import MaterialComponentRepository
 from .race import RaceRepository
+from .search import SearchRepository
 from .source import SourceRepository
 from .spell import SpellRepository
 from .subclass_feature import SubclassFeatureRepository
 from .subrace import SubraceRepository
 from .tool import ToolRepository
 from .user import UserRepository
+from .version import VersionRepository
 from .weapon import WeaponRepository
 from .weapon_kind import WeaponKindRepository
 from .weapon_property import WeaponPropertyRepository
@@ -23,16 +26,19 @@ __all__ = [
     "SubclassRepository",
     "ClassFeatureRepository",
     "ClassLevelRepository",
+    "ExportRepository",
     "FeatRepository",
     "MaterialRepository",
     "MaterialComponentRepository",
     "RaceRepository",
+    "SearchRepository",
     "SourceRepository",
     "SpellRepository",
     "SubclassFeatureRepository",
     "SubraceRepository",
     "ToolRepository",
     "UserRepository",
+    "VersionRepository",
     "WeaponRepository",
     "WeaponKindRepository",
     "WeaponPropertyRepository",
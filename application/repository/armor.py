@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 from uuid import UUID
 
 from application.dto.model.armor import AppArmor
+from application.dto.model.page import AppCursor
+from application.dto.model.reference import AppReferences
 
 
 class ArmorRepository(ABC):
@@ -13,6 +16,10 @@ class ArmorRepository(ABC):
     async def id_exists(self, armor_id: UUID) -> bool:
         raise NotImplemented
 
+    @abstractmethod
+    async def missing_ids(self, armor_ids: Sequence[UUID]) -> set[UUID]:
+        raise NotImplemented
+
     @abstractmethod
     async def get_by_id(self, armor_id: UUID) -> AppArmor:
         raise NotImplemented
@@ -27,9 +34,19 @@ class ArmorRepository(ABC):
         search_by_name: str | None = None,
         filter_by_armor_types: list[str] | None = None,
         filter_by_material_ids: list[UUID] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppArmor]:
         raise NotImplemented
 
+    @abstractmethod
+    async def references(
+        self,
+        filter_by_material_ids: list[UUID] | None = None,
+        limit: int = 5,
+    ) -> AppReferences:
+        raise NotImplemented
+
     @abstractmethod
     async def save(self, armor: AppArmor) -> None:
         raise NotImplemented
@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 from uuid import UUID
 
-from application.dto.model.character_class import AppClass
+from application.dto.model.character_class import AppClass, AppClassSummary
+from application.dto.model.page import AppCursor
+from application.dto.model.reference import AppReferences
 
 
 class ClassRepository(ABC):
@@ -13,6 +16,10 @@ class ClassRepository(ABC):
     async def id_exists(self, class_id: UUID) -> bool:
         raise NotImplemented
 
+    @abstractmethod
+    async def missing_ids(self, class_ids: Sequence[UUID]) -> set[UUID]:
+        raise NotImplemented
+
     @abstractmethod
     async def get_by_id(self, class_id: UUID) -> AppClass:
         raise NotImplemented
@@ -28,9 +35,33 @@ class ClassRepository(ABC):
         filter_by_source_ids: list[UUID] | None = None,
         filter_by_tool_ids: list[UUID] | None = None,
         filter_by_weapon_ids: list[UUID] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppClass]:
         raise NotImplemented
 
+    @abstractmethod
+    async def filter_summaries(
+        self,
+        search_by_name: str | None = None,
+        filter_by_source_ids: list[UUID] | None = None,
+        filter_by_tool_ids: list[UUID] | None = None,
+        filter_by_weapon_ids: list[UUID] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
+    ) -> list[AppClassSummary]:
+        raise NotImplemented
+
+    @abstractmethod
+    async def references(
+        self,
+        filter_by_source_ids: list[UUID] | None = None,
+        filter_by_tool_ids: list[UUID] | None = None,
+        filter_by_weapon_ids: list[UUID] | None = None,
+        limit: int = 5,
+    ) -> AppReferences:
+        raise NotImplemented
+
     @abstractmethod
     async def save(self, character_class: AppClass) -> None:
         raise NotImplemented
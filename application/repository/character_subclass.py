@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 from uuid import UUID
 
 from application.dto.model.character_subclass import AppSubclass
+from application.dto.model.page import AppCursor
 
 
 class SubclassRepository(ABC):
@@ -13,6 +15,10 @@ class SubclassRepository(ABC):
     async def id_exists(self, subclass_id: UUID) -> bool:
         raise NotImplemented
 
+    @abstractmethod
+    async def missing_ids(self, subclass_ids: Sequence[UUID]) -> set[UUID]:
+        raise NotImplemented
+
     @abstractmethod
     async def get_by_id(self, subclass_id: UUID) -> AppSubclass:
         raise NotImplemented
@@ -22,7 +28,12 @@ class SubclassRepository(ABC):
         raise NotImplemented
 
     @abstractmethod
-    async def filter(self, filter_by_class_id: UUID | None = None) -> list[AppSubclass]:
+    async def filter(
+        self,
+        filter_by_class_id: UUID | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
+    ) -> list[AppSubclass]:
         raise NotImplemented
 
     @abstractmethod
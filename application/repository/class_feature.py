@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 from uuid import UUID
 
 from application.dto.model.class_feature import AppClassFeature
+from application.dto.model.page import AppCursor
 
 
 class ClassFeatureRepository(ABC):
@@ -13,6 +15,10 @@ class ClassFeatureRepository(ABC):
     async def id_exists(self, feature_id: UUID) -> bool:
         raise NotImplemented
 
+    @abstractmethod
+    async def missing_ids(self, feature_ids: Sequence[UUID]) -> set[UUID]:
+        raise NotImplemented
+
     @abstractmethod
     async def get_by_id(self, feature_id: UUID) -> AppClassFeature:
         raise NotImplemented
@@ -23,7 +29,10 @@ class ClassFeatureRepository(ABC):
 
     @abstractmethod
     async def filter(
-        self, filter_by_class_id: UUID | None = None
+        self,
+        filter_by_class_id: UUID | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppClassFeature]:
         raise NotImplemented
 
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator
+
+from application.dto.model.export import AppExportItem
+
+
+class ExportRepository(ABC):
+    @abstractmethod
+    def export(self, since: datetime | None = None) -> AsyncIterator[AppExportItem]:
+        raise NotImplemented
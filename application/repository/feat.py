@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 from uuid import UUID
 
 from application.dto.model.feat import AppFeat
+from application.dto.model.page import AppCursor
 
 
 class FeatRepository(ABC):
@@ -13,6 +15,10 @@ class FeatRepository(ABC):
     async def id_exists(self, feat_id: UUID) -> bool:
         raise NotImplemented
 
+    @abstractmethod
+    async def missing_ids(self, feat_ids: Sequence[UUID]) -> set[UUID]:
+        raise NotImplemented
+
     @abstractmethod
     async def get_by_id(self, feat_id: UUID) -> AppFeat:
         raise NotImplemented
@@ -29,6 +35,8 @@ class FeatRepository(ABC):
         filter_by_required_armor_types: list[str] | None = None,
         filter_by_required_modifiers: list[str] | None = None,
         filter_by_increase_modifiers: list[str] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppFeat]:
         raise NotImplemented
 
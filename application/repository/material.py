@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 from uuid import UUID
 
 from application.dto.model.material import AppMaterial
+from application.dto.model.page import AppCursor
 
 
 class MaterialRepository(ABC):
@@ -13,6 +15,10 @@ class MaterialRepository(ABC):
     async def id_exists(self, material_id: UUID) -> bool:
         raise NotImplemented
 
+    @abstractmethod
+    async def missing_ids(self, material_ids: Sequence[UUID]) -> set[UUID]:
+        raise NotImplemented
+
     @abstractmethod
     async def get_by_id(self, material_id: UUID) -> AppMaterial:
         raise NotImplemented
@@ -22,7 +28,12 @@ class MaterialRepository(ABC):
         raise NotImplemented
 
     @abstractmethod
-    async def filter(self, search_by_name: str | None = None) -> list[AppMaterial]:
+    async def filter(
+        self,
+        search_by_name: str | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
+    ) -> list[AppMaterial]:
         raise NotImplemented
 
     @abstractmethod
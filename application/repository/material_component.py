@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 from uuid import UUID
 
 from application.dto.model.material_component import AppMaterialComponent
+from application.dto.model.page import AppCursor
 
 
 class MaterialComponentRepository(ABC):
@@ -13,6 +15,10 @@ class MaterialComponentRepository(ABC):
     async def id_exists(self, material_id: UUID) -> bool:
         raise NotImplemented
 
+    @abstractmethod
+    async def missing_ids(self, material_ids: Sequence[UUID]) -> set[UUID]:
+        raise NotImplemented
+
     @abstractmethod
     async def get_by_id(self, material_id: UUID) -> AppMaterialComponent:
         raise NotImplemented
@@ -23,7 +29,10 @@ class MaterialComponentRepository(ABC):
 
     @abstractmethod
     async def filter(
-        self, search_by_name: str | None = None
+        self,
+        search_by_name: str | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppMaterialComponent]:
         raise NotImplemented
 
@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 from uuid import UUID
 
+from application.dto.model.page import AppCursor
 from application.dto.model.race import AppRace
+from application.dto.model.reference import AppReferences
 
 
 class RaceRepository(ABC):
@@ -13,6 +16,10 @@ class RaceRepository(ABC):
     async def id_exists(self, race_id: UUID) -> bool:
         raise NotImplemented
 
+    @abstractmethod
+    async def missing_ids(self, race_ids: Sequence[UUID]) -> set[UUID]:
+        raise NotImplemented
+
     @abstractmethod
     async def get_by_id(self, race_id: UUID) -> AppRace:
         raise NotImplemented
@@ -26,9 +33,19 @@ class RaceRepository(ABC):
         self,
         search_by_name: str | None = None,
         filter_by_source_ids: list[UUID] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppRace]:
         raise NotImplemented
 
+    @abstractmethod
+    async def references(
+        self,
+        filter_by_source_ids: list[UUID] | None = None,
+        limit: int = 5,
+    ) -> AppReferences:
+        raise NotImplemented
+
     @abstractmethod
     async def save(self, race: AppRace) -> None:
         raise NotImplemented
@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+
+from application.dto.model.search import AppSearchHit
+
+
+class SearchRepository(ABC):
+    @abstractmethod
+    async def search(self, term: str, limit: int) -> list[AppSearchHit]:
+        raise NotImplemented
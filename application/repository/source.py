@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 from uuid import UUID
 
+from application.dto.model.page import AppCursor
 from application.dto.model.source import AppSource
 
 
@@ -13,6 +15,10 @@ class SourceRepository(ABC):
     async def id_exists(self, source_id: UUID) -> bool:
         raise NotImplemented
 
+    @abstractmethod
+    async def missing_ids(self, source_ids: Sequence[UUID]) -> set[UUID]:
+        raise NotImplemented
+
     @abstractmethod
     async def get_by_id(self, source_id: UUID) -> AppSource:
         raise NotImplemented
@@ -22,7 +28,12 @@ class SourceRepository(ABC):
         raise NotImplemented
 
     @abstractmethod
-    async def filter(self, search_by_name: str | None = None) -> list[AppSource]:
+    async def filter(
+        self,
+        search_by_name: str | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
+    ) -> list[AppSource]:
         raise NotImplemented
 
     @abstractmethod
@@ -1,10 +1,17 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 from uuid import UUID
 
-from application.dto.model.spell import AppSpell
+from application.dto.model.page import AppCursor
+from application.dto.model.reference import AppReferences
+from application.dto.model.spell import AppSpell, AppSpellSummary
 
 
 class SpellRepository(ABC):
+    @abstractmethod
+    async def existing_names(self, names: Sequence[str]) -> set[str]:
+        raise NotImplemented
+
     @abstractmethod
     async def next_id(self) -> UUID:
         raise NotImplemented
@@ -13,6 +20,10 @@ class SpellRepository(ABC):
     async def id_exists(self, spell_id: UUID) -> bool:
         raise NotImplemented
 
+    @abstractmethod
+    async def missing_ids(self, spell_ids: Sequence[UUID]) -> set[UUID]:
+        raise NotImplemented
+
     @abstractmethod
     async def get_by_id(self, spell_id: UUID) -> AppSpell:
         raise NotImplemented
@@ -38,13 +49,50 @@ class SpellRepository(ABC):
         filter_by_concentration: bool | None = None,
         filter_by_ritual: bool | None = None,
         filter_by_source_ids: list[UUID] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppSpell]:
         raise NotImplemented
 
+    @abstractmethod
+    async def filter_summaries(
+        self,
+        search_by_name: str | None = None,
+        filter_by_class_ids: list[UUID] | None = None,
+        filter_by_subclass_ids: list[UUID] | None = None,
+        filter_by_schools: list[str] | None = None,
+        filter_by_damage_types: list[str] | None = None,
+        filter_by_durations: list[str] | None = None,
+        filter_by_casting_times: list[str] | None = None,
+        filter_by_verbal_component: bool | None = None,
+        filter_by_symbolic_component: bool | None = None,
+        filter_by_material_component: bool | None = None,
+        filter_by_material_ids: list[UUID] | None = None,
+        filter_by_concentration: bool | None = None,
+        filter_by_ritual: bool | None = None,
+        filter_by_source_ids: list[UUID] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
+    ) -> list[AppSpellSummary]:
+        raise NotImplemented
+
+    @abstractmethod
+    async def references(
+        self,
+        filter_by_source_ids: list[UUID] | None = None,
+        filter_by_material_ids: list[UUID] | None = None,
+        limit: int = 5,
+    ) -> AppReferences:
+        raise NotImplemented
+
     @abstractmethod
     async def save(self, spell: AppSpell) -> None:
         raise NotImplemented
 
+    @abstractmethod
+    async def create_many(self, spells: Sequence[AppSpell]) -> None:
+        raise NotImplemented
+
     @abstractmethod
     async def delete(self, spell_id: UUID) -> None:
         raise NotImplemented
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 from uuid import UUID
 
+from application.dto.model.page import AppCursor
 from application.dto.model.subclass_feature import AppSubclassFeature
 
 
@@ -13,6 +15,10 @@ class SubclassFeatureRepository(ABC):
     async def id_exists(self, feature_id: UUID) -> bool:
         raise NotImplemented
 
+    @abstractmethod
+    async def missing_ids(self, feature_ids: Sequence[UUID]) -> set[UUID]:
+        raise NotImplemented
+
     @abstractmethod
     async def get_by_id(self, feature_id: UUID) -> AppSubclassFeature:
         raise NotImplemented
@@ -23,7 +29,10 @@ class SubclassFeatureRepository(ABC):
 
     @abstractmethod
     async def filter(
-        self, filter_by_subclass_id: UUID | None = None
+        self,
+        filter_by_subclass_id: UUID | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppSubclassFeature]:
         raise NotImplemented
 
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 from uuid import UUID
 
+from application.dto.model.page import AppCursor
 from application.dto.model.subrace import AppSubrace
 
 
@@ -13,6 +15,10 @@ class SubraceRepository(ABC):
     async def id_exists(self, subrace_id: UUID) -> bool:
         raise NotImplemented
 
+    @abstractmethod
+    async def missing_ids(self, subrace_ids: Sequence[UUID]) -> set[UUID]:
+        raise NotImplemented
+
     @abstractmethod
     async def get_by_id(self, subrace_id: UUID) -> AppSubrace:
         raise NotImplemented
@@ -22,7 +28,12 @@ class SubraceRepository(ABC):
         raise NotImplemented
 
     @abstractmethod
-    async def filter(self, search_by_name: str | None = None) -> list[AppSubrace]:
+    async def filter(
+        self,
+        search_by_name: str | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
+    ) -> list[AppSubrace]:
         raise NotImplemented
 
     @abstractmethod
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 from uuid import UUID
 
+from application.dto.model.page import AppCursor
 from application.dto.model.tool import AppTool
 
 
@@ -13,6 +15,10 @@ class ToolRepository(ABC):
     async def id_exists(self, tool_id: UUID) -> bool:
         raise NotImplemented
 
+    @abstractmethod
+    async def missing_ids(self, tool_ids: Sequence[UUID]) -> set[UUID]:
+        raise NotImplemented
+
     @abstractmethod
     async def get_by_id(self, tool_id: UUID) -> AppTool:
         raise NotImplemented
@@ -22,7 +28,12 @@ class ToolRepository(ABC):
         raise NotImplemented
 
     @abstractmethod
-    async def filter(self, search_by_name: str | None = None) -> list[AppTool]:
+    async def filter(
+        self,
+        search_by_name: str | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
+    ) -> list[AppTool]:
         raise NotImplemented
 
     @abstractmethod
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 from uuid import UUID
 
 from application.dto.model.user import AppUser
@@ -9,6 +10,10 @@ class UserRepository(ABC):
     async def id_exists(self, user_id: UUID) -> bool:
         raise NotImplementedError()
 
+    @abstractmethod
+    async def missing_ids(self, user_ids: Sequence[UUID]) -> set[UUID]:
+        raise NotImplemented
+
     @abstractmethod
     async def get_all(self) -> list[AppUser]:
         raise NotImplemented
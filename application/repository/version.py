@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from application.dto.model.version import AppVersion
+
+
+class VersionRepository(ABC):
+    @abstractmethod
+    async def version(
+        self, entity_type: str, entity_id: UUID | None = None
+    ) -> AppVersion:
+        raise NotImplemented
+
+    @abstractmethod
+    async def catalogue_version(self) -> AppVersion:
+        raise NotImplemented
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 from uuid import UUID
 
+from application.dto.model.page import AppCursor
+from application.dto.model.reference import AppReferences
 from application.dto.model.weapon import AppWeapon
 
 
@@ -13,6 +16,10 @@ class WeaponRepository(ABC):
     async def id_exists(self, weapon_id: UUID) -> bool:
         raise NotImplemented
 
+    @abstractmethod
+    async def missing_ids(self, weapon_ids: Sequence[UUID]) -> set[UUID]:
+        raise NotImplemented
+
     @abstractmethod
     async def get_by_id(self, weapon_id: UUID) -> AppWeapon:
         raise NotImplemented
@@ -29,9 +36,21 @@ class WeaponRepository(ABC):
         filter_by_damage_types: list[str] | None = None,
         filter_by_property_ids: list[UUID] | None = None,
         filter_by_material_ids: list[UUID] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppWeapon]:
         raise NotImplemented
 
+    @abstractmethod
+    async def references(
+        self,
+        filter_by_kind_ids: list[UUID] | None = None,
+        filter_by_property_ids: list[UUID] | None = None,
+        filter_by_material_ids: list[UUID] | None = None,
+        limit: int = 5,
+    ) -> AppReferences:
+        raise NotImplemented
+
     @abstractmethod
     async def save(self, weapon: AppWeapon) -> None:
         raise NotImplemented
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 from uuid import UUID
 
+from application.dto.model.page import AppCursor
 from application.dto.model.weapon_kind import AppWeaponKind
 
 
@@ -13,6 +15,10 @@ class WeaponKindRepository(ABC):
     async def id_exists(self, weapon_kind_id: UUID) -> bool:
         raise NotImplemented
 
+    @abstractmethod
+    async def missing_ids(self, weapon_kind_ids: Sequence[UUID]) -> set[UUID]:
+        raise NotImplemented
+
     @abstractmethod
     async def get_by_id(self, weapon_kind_id: UUID) -> AppWeaponKind:
         raise NotImplemented
@@ -26,6 +32,8 @@ class WeaponKindRepository(ABC):
         self,
         search_by_name: str | None = None,
         filter_by_types: list[str] | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppWeaponKind]:
         raise NotImplemented
 
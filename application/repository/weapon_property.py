@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 from uuid import UUID
 
+from application.dto.model.page import AppCursor
 from application.dto.model.weapon_property import AppWeaponProperty
 
 
@@ -13,6 +15,10 @@ class WeaponPropertyRepository(ABC):
     async def id_exists(self, weapon_property_id: UUID) -> bool:
         raise NotImplemented
 
+    @abstractmethod
+    async def missing_ids(self, weapon_property_ids: Sequence[UUID]) -> set[UUID]:
+        raise NotImplemented
+
     @abstractmethod
     async def get_by_id(self, weapon_property_id: UUID) -> AppWeaponProperty:
         raise NotImplemented
@@ -23,7 +29,10 @@ class WeaponPropertyRepository(ABC):
 
     @abstractmethod
     async def filter(
-        self, search_by_name: str | None = None
+        self,
+        search_by_name: str | None = None,
+        limit: int | None = None,
+        cursor: AppCursor | None = None,
     ) -> list[AppWeaponProperty]:
         raise NotImplemented
 
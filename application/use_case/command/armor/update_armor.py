@@ -24,10 +24,6 @@ class UpdateArmorUseCase(UserCheck):
 
     async def execute(self, command: UpdateArmorCommand) -> None:
         await self._user_check(command.user_id)
-        if not await self._armor_repository.id_exists(command.armor_id):
-            raise DomainError.not_found(
-                f"доспехов с id {command.armor_id} не существует"
-            )
         app_armor = await self._armor_repository.get_by_id(command.armor_id)
         armor = app_armor.to_domain()
         if command.armor_type is not None:
@@ -46,11 +46,17 @@ class CreateClassUseCase(UserCheck):
             raise DomainError.invalid_data(
                 f"класс с названием {command.name} уже существует"
             )
+        missing_weapon_ids = await self._weapon_repository.missing_ids(
+            command.proficiencies.weapons
+        )
         for weapon_id in command.proficiencies.weapons:
-            if not await self._weapon_repository.id_exists(weapon_id):
+            if weapon_id in missing_weapon_ids:
                 raise DomainError.invalid_data(f"оружия с id {weapon_id} не существует")
+        missing_tool_ids = await self._tool_repository.missing_ids(
+            command.proficiencies.tools
+        )
         for tool_id in command.proficiencies.tools:
-            if not await self._tool_repository.id_exists(tool_id):
+            if tool_id in missing_tool_ids:
                 raise DomainError.invalid_data(
                     f"инструментов с id {tool_id} не существует"
                 )
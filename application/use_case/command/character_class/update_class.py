@@ -35,8 +35,6 @@ class UpdateClassUseCase(UserCheck):
 
     async def execute(self, command: UpdateClassCommand) -> None:
         await self._user_check(command.user_id)
-        if not await self._class_repository.id_exists(command.class_id):
-            raise DomainError.not_found(f"класса с id {command.class_id} не существует")
         app_changing_class = await self._class_repository.get_by_id(command.class_id)
         changing_class = app_changing_class.to_domain()
         if command.name is not None:
@@ -64,13 +62,19 @@ class UpdateClassUseCase(UserCheck):
                 )
             )
         if command.proficiencies is not None:
+            missing_weapon_ids = await self._weapon_repository.missing_ids(
+                command.proficiencies.weapons
+            )
             for weapon_id in command.proficiencies.weapons:
-                if not await self._weapon_repository.id_exists(weapon_id):
+                if weapon_id in missing_weapon_ids:
                     raise DomainError.invalid_data(
                         f"оружия с id {weapon_id} не существует"
                     )
+            missing_tool_ids = await self._tool_repository.missing_ids(
+                command.proficiencies.tools
+            )
             for tool_id in command.proficiencies.tools:
-                if not await self._tool_repository.id_exists(tool_id):
+                if tool_id in missing_tool_ids:
                     raise DomainError.invalid_data(
                         f"инструментов с id {tool_id} не существует"
                     )
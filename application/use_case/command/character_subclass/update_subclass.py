@@ -21,10 +21,6 @@ class UpdateSubclassUseCase(UserCheck):
 
     async def execute(self, command: UpdateSubclassCommand) -> None:
         await self._user_check(command.user_id)
-        if not await self._subclass_repository.id_exists(command.subclass_id):
-            raise DomainError.not_found(
-                f"подкласс с id {command.subclass_id} не существует"
-            )
         app_changing_class = await self._subclass_repository.get_by_id(
             command.subclass_id
         )
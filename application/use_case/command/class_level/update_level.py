@@ -30,10 +30,6 @@ class UpdateClassLevelUseCase(UserCheck):
 
     async def execute(self, command: UpdateClassLevelCommand) -> None:
         await self._user_check(command.user_id)
-        if not await self._class_level_repository.id_exists(command.class_level_id):
-            raise DomainError.not_found(
-                f"уровень с id {command.class_level_id} не существует"
-            )
         app_class_level = await self._class_level_repository.get_by_id(
             command.class_level_id
         )
@@ -21,8 +21,6 @@ class UpdateFeatUseCase(UserCheck):
 
     async def execute(self, command: UpdateFeatCommand) -> None:
         await self._user_check(command.user_id)
-        if not await self._feat_repository.id_exists(command.feat_id):
-            raise DomainError.not_found(f"черты с id {command.feat_id} не существует")
         app_feat = await self._feat_repository.get_by_id(command.feat_id)
         feat = app_feat.to_domain()
         if command.name is not None:
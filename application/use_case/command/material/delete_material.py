@@ -5,6 +5,7 @@ from application.repository import (
     UserRepository,
     WeaponRepository,
 )
+from application.use_case.command.reference_check import ensure_unused
 from application.use_case.command.user_check import UserCheck
 from domain.error import DomainError
 
@@ -28,20 +29,19 @@ class DeleteMaterialUseCase(UserCheck):
             raise DomainError.not_found(
                 f"материала с id {command.material_id} не существует"
             )
-        exists_armors = await self._armor_repository.filter(
-            filter_by_material_ids=[command.material_id]
+        material_ids = [command.material_id]
+        await ensure_unused(
+            (
+                "материал используется в доспехах",
+                lambda: self._armor_repository.references(
+                    filter_by_material_ids=material_ids
+                ),
+            ),
+            (
+                "материал используется в оружии",
+                lambda: self._weapon_repository.references(
+                    filter_by_material_ids=material_ids
+                ),
+            ),
         )
-        if len(exists_armors) > 0:
-            raise DomainError.invalid_data(
-                "материал используется в доспехах: "
-                f"{", ".join([a.name for a in exists_armors])}"
-            )
-        exists_weapons = await self._weapon_repository.filter(
-            filter_by_material_ids=[command.material_id]
-        )
-        if len(exists_weapons) > 0:
-            raise DomainError.invalid_data(
-                "материал используется в оружии: "
-                f"{", ".join([w.name for w in exists_weapons])}"
-            )
         await self._material_repository.delete(command.material_id)
@@ -4,6 +4,7 @@ from application.repository import (
     SpellRepository,
     UserRepository,
 )
+from application.use_case.command.reference_check import ensure_unused
 from application.use_case.command.user_check import UserCheck
 from domain.error import DomainError
 
@@ -25,12 +26,12 @@ class DeleteMaterialComponentUseCase(UserCheck):
             raise DomainError.not_found(
                 f"материала с id {command.material_id} не существует"
             )
-        exists_spells = await self._spell_repository.filter(
-            filter_by_material_ids=[command.material_id]
+        await ensure_unused(
+            (
+                "материал используется в заклинаниях",
+                lambda: self._spell_repository.references(
+                    filter_by_material_ids=[command.material_id]
+                ),
+            ),
         )
-        if len(exists_spells) > 0:
-            raise DomainError.invalid_data(
-                "материал  используется в заклинаниях: "
-                f"{[spell.name for spell in exists_spells]}"
-            )
         await self._material_repository.delete(command.material_id)
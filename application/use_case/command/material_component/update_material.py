@@ -19,10 +19,6 @@ class UpdateMaterialComponentUseCase(UserCheck):
 
     async def execute(self, command: UpdateMaterialComponentCommand) -> None:
         await self._user_check(command.user_id)
-        if not await self._material_repository.id_exists(command.material_id):
-            raise DomainError.not_found(
-                f"материала с id {command.material_id} не существует"
-            )
         app_material = await self._material_repository.get_by_id(command.material_id)
         material = app_material.to_domain()
         if command.name is not None:
@@ -31,8 +31,6 @@ class UpdateRaceUseCase(UserCheck):
 
     async def execute(self, command: UpdateRaceCommand) -> None:
         await self._user_check(command.user_id)
-        if not await self._race_repository.id_exists(command.race_id):
-            raise DomainError.not_found(f"расы с id {command.race_id} не существует")
         app_race = await self._race_repository.get_by_id(command.race_id)
         race = app_race.to_domain()
         if command.name is not None:
@@ -0,0 +1,21 @@
+from typing import Awaitable, Callable
+
+from application.dto.model.reference import AppReferences
+from domain.error import DomainError
+
+
+def describe(references: AppReferences) -> str:
+    names = ", ".join(references.names)
+    rest = references.count - len(references.names)
+    return f"{names} и ещё {rest}" if rest > 0 else names
+
+
+async def ensure_unused(
+    *checks: tuple[str, Callable[[], Awaitable[AppReferences]]],
+) -> None:
+    # удаление выполняется в единице работы, где у всех репозиториев одна
+    # сессия, поэтому проверки идут по очереди и до первой найденной ссылки
+    for message, references in checks:
+        found = await references()
+        if found.count > 0:
+            raise DomainError.invalid_data(f"{message}: {describe(found)}")
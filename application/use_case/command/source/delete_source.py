@@ -6,6 +6,7 @@ from application.repository import (
     SpellRepository,
     UserRepository,
 )
+from application.use_case.command.reference_check import ensure_unused
 from application.use_case.command.user_check import UserCheck
 from domain.error import DomainError
 
@@ -31,28 +32,25 @@ class DeleteSourceUseCase(UserCheck):
             raise DomainError.not_found(
                 f"источника с id {command.source_id} не существует"
             )
-        exists_classes = await self._class_repository.filter(
-            filter_by_source_ids=[command.source_id]
+        source_ids = [command.source_id]
+        await ensure_unused(
+            (
+                "этот источник используют классы",
+                lambda: self._class_repository.references(
+                    filter_by_source_ids=source_ids
+                ),
+            ),
+            (
+                "этот источник используют расы",
+                lambda: self._race_repository.references(
+                    filter_by_source_ids=source_ids
+                ),
+            ),
+            (
+                "этот источник используют заклинания",
+                lambda: self._spell_repository.references(
+                    filter_by_source_ids=source_ids
+                ),
+            ),
         )
-        if len(exists_classes) > 0:
-            raise DomainError.invalid_data(
-                "этот источник используют классы: "
-                f"{", ".join(c.name for c in exists_classes)}"
-            )
-        exists_races = await self._race_repository.filter(
-            filter_by_source_ids=[command.source_id]
-        )
-        if len(exists_races) > 0:
-            raise DomainError.invalid_data(
-                "этот источник используют расы: "
-                f"{", ".join(c.name for c in exists_races)}"
-            )
-        exists_spells = await self._spell_repository.filter(
-            filter_by_source_ids=[command.source_id]
-        )
-        if len(exists_spells) > 0:
-            raise DomainError.invalid_data(
-                "этот источник используют заклинания: "
-                f"{", ".join(c.name for c in exists_spells)}"
-            )
         await self._source_repository.delete(command.source_id)
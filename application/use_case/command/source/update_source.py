@@ -19,10 +19,6 @@ class UpdateSourceUseCase(UserCheck):
 
     async def execute(self, command: UpdateSourceCommand) -> None:
         await self._user_check(command.user_id)
-        if not await self._source_repository.id_exists(command.source_id):
-            raise DomainError.not_found(
-                f"источника с id {command.source_id} не существует"
-            )
         app_source = await self._source_repository.get_by_id(command.source_id)
         source = app_source.to_domain()
         if command.name is not None:
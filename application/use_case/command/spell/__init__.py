@@ -1,5 +1,11 @@
 from .create_spell import CreateSpellUseCase
 from .delete_spell import DeleteSpellUseCase
+from .import_spells import ImportSpellsUseCase
 from .update_spell import UpdateSpellUseCase
 
-__all__ = ["CreateSpellUseCase", "DeleteSpellUseCase", "UpdateSpellUseCase"]
+__all__ = [
+    "CreateSpellUseCase",
+    "DeleteSpellUseCase",
+    "ImportSpellsUseCase",
+    "UpdateSpellUseCase",
+]
@@ -19,6 +19,60 @@ from domain.modifier import Modifier
 from domain.spell import Spell, SpellComponents, SpellSchool, SpellService
 
 
+def spell_from_command(spell_id: UUID, command: CreateSpellCommand) -> Spell:
+    return Spell(
+        spell_id=spell_id,
+        class_ids=command.class_ids,
+        subclass_ids=command.subclass_ids,
+        name=command.name,
+        description=command.description,
+        next_level_description=command.next_level_description,
+        level=command.level,
+        school=SpellSchool.from_str(command.school),
+        damage_type=(
+            DamageType.from_str(command.damage_type.name)
+            if command.damage_type.name is not None
+            else None
+        ),
+        duration=(
+            GameTime(
+                command.duration.game_time.count,
+                GameTimeUnit.from_str(command.duration.game_time.unit),
+            )
+            if command.duration.game_time is not None
+            else None
+        ),
+        casting_time=GameTime(
+            command.casting_time.count,
+            GameTimeUnit.from_str(command.casting_time.unit),
+        ),
+        spell_range=Length(
+            command.spell_range.count, LengthUnit.from_str(command.spell_range.unit)
+        ),
+        splash=(
+            Length(
+                command.splash.splash.count,
+                LengthUnit.from_str(command.splash.splash.unit),
+            )
+            if command.splash.splash is not None
+            else None
+        ),
+        components=SpellComponents(
+            command.components.verbal,
+            command.components.symbolic,
+            command.components.material,
+            command.components.materials,
+        ),
+        concentration=command.concentration,
+        ritual=command.ritual,
+        saving_throws=[
+            Modifier.from_str(modifier) for modifier in command.saving_throws
+        ],
+        name_in_english=command.name_in_english,
+        source_id=command.source_id,
+    )
+
+
 class CreateSpellUseCase(UserCheck):
     def __init__(
         self,
@@ -44,11 +98,15 @@ class CreateSpellUseCase(UserCheck):
             raise DomainError.invalid_data(
                 f"заклинание с именем {command.name} не возможно создать"
             )
+        missing_class_ids = await self._class_repository.missing_ids(command.class_ids)
         for class_id in command.class_ids:
-            if not await self._class_repository.id_exists(class_id):
+            if class_id in missing_class_ids:
                 raise DomainError.invalid_data(f"класс с id {class_id} не существует")
+        missing_subclass_ids = await self._subclass_repository.missing_ids(
+            command.subclass_ids
+        )
         for subclass_id in command.subclass_ids:
-            if not await self._subclass_repository.id_exists(subclass_id):
+            if subclass_id in missing_subclass_ids:
                 raise DomainError.invalid_data(
                     f"подкласс с id {subclass_id} не существует"
                 )
@@ -56,61 +114,14 @@ class CreateSpellUseCase(UserCheck):
             raise DomainError.invalid_data(
                 f"источник с id {command.source_id} не существует"
             )
+        missing_material_ids = await self._material_repository.missing_ids(
+            command.components.materials
+        )
         for material_id in command.components.materials:
-            if not await self._material_repository.id_exists(material_id):
+            if material_id in missing_material_ids:
                 raise DomainError.invalid_data(
                     f"материал с id {material_id} не существует"
                 )
-        spell = Spell(
-            spell_id=await self._spell_repository.next_id(),
-            class_ids=command.class_ids,
-            subclass_ids=command.subclass_ids,
-            name=command.name,
-            description=command.description,
-            next_level_description=command.next_level_description,
-            level=command.level,
-            school=SpellSchool.from_str(command.school),
-            damage_type=(
-                DamageType.from_str(command.damage_type.name)
-                if command.damage_type.name is not None
-                else None
-            ),
-            duration=(
-                GameTime(
-                    command.duration.game_time.count,
-                    GameTimeUnit.from_str(command.duration.game_time.unit),
-                )
-                if command.duration.game_time is not None
-                else None
-            ),
-            casting_time=GameTime(
-                command.casting_time.count,
-                GameTimeUnit.from_str(command.casting_time.unit),
-            ),
-            spell_range=Length(
-                command.spell_range.count, LengthUnit.from_str(command.spell_range.unit)
-            ),
-            splash=(
-                Length(
-                    command.splash.splash.count,
-                    LengthUnit.from_str(command.splash.splash.unit),
-                )
-                if command.splash.splash is not None
-                else None
-            ),
-            components=SpellComponents(
-                command.components.verbal,
-                command.components.symbolic,
-                command.components.material,
-                command.components.materials,
-            ),
-            concentration=command.concentration,
-            ritual=command.ritual,
-            saving_throws=[
-                Modifier.from_str(modifier) for modifier in command.saving_throws
-            ],
-            name_in_english=command.name_in_english,
-            source_id=command.source_id,
-        )
+        spell = spell_from_command(await self._spell_repository.next_id(), command)
         await self._spell_repository.save(AppSpell.from_domain(spell))
         return spell.spell_id()
@@ -0,0 +1,75 @@
+from collections import Counter
+from uuid import UUID
+
+from application.dto.command.spell import ImportSpellsCommand
+from application.dto.model.spell import AppSpell
+from application.repository import (
+    ClassRepository,
+    MaterialComponentRepository,
+    SourceRepository,
+    SpellRepository,
+    SubclassRepository,
+    UserRepository,
+)
+from application.use_case.command.user_check import UserCheck
+from domain.error import DomainError
+
+from .create_spell import spell_from_command
+
+
+class ImportSpellsUseCase(UserCheck):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        spell_repository: SpellRepository,
+        class_repository: ClassRepository,
+        subclass_repository: SubclassRepository,
+        material_component_repository: MaterialComponentRepository,
+        source_repository: SourceRepository,
+    ) -> None:
+        UserCheck.__init__(self, user_repository)
+        self._spell_repository = spell_repository
+        self._class_repository = class_repository
+        self._subclass_repository = subclass_repository
+        self._material_repository = material_component_repository
+        self._source_repository = source_repository
+
+    async def execute(self, command: ImportSpellsCommand) -> list[UUID]:
+        await self._user_check(command.user_id)
+        # вся пачка проверяется одним запросом на каждый вид ссылок
+        names = Counter(spell.name for spell in command.spells)
+        for name, count in names.items():
+            if count > 1:
+                raise DomainError.invalid_data(
+                    f"заклинание с именем {name} повторяется в импорте"
+                )
+        for name in await self._spell_repository.existing_names(list(names)):
+            raise DomainError.invalid_data(
+                f"заклинание с именем {name} не возможно создать"
+            )
+        class_ids = {i for spell in command.spells for i in spell.class_ids}
+        for class_id in await self._class_repository.missing_ids(list(class_ids)):
+            raise DomainError.invalid_data(f"класс с id {class_id} не существует")
+        subclass_ids = {i for spell in command.spells for i in spell.subclass_ids}
+        for subclass_id in await self._subclass_repository.missing_ids(
+            list(subclass_ids)
+        ):
+            raise DomainError.invalid_data(f"подкласс с id {subclass_id} не существует")
+        source_ids = {spell.source_id for spell in command.spells}
+        for source_id in await self._source_repository.missing_ids(list(source_ids)):
+            raise DomainError.invalid_data(f"источник с id {source_id} не существует")
+        material_ids = {
+            i for spell in command.spells for i in spell.components.materials
+        }
+        for material_id in await self._material_repository.missing_ids(
+            list(material_ids)
+        ):
+            raise DomainError.invalid_data(f"материал с id {material_id} не существует")
+        spells = [
+            spell_from_command(await self._spell_repository.next_id(), spell)
+            for spell in command.spells
+        ]
+        await self._spell_repository.create_many(
+            [AppSpell.from_domain(spell) for spell in spells]
+        )
+        return [spell.spell_id() for spell in spells]
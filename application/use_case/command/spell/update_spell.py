@@ -38,22 +38,24 @@ class UpdateSpellUseCase(UserCheck):
 
     async def execute(self, command: UpdateSpellCommand) -> None:
         await self._user_check(command.user_id)
-        if not await self._spell_repository.id_exists(command.spell_id):
-            raise DomainError.not_found(
-                f"заклинание с id {command.spell_id} не существует"
-            )
         app_spell = await self._spell_repository.get_by_id(command.spell_id)
         spell = app_spell.to_domain()
         if command.class_ids is not None:
+            missing_class_ids = await self._class_repository.missing_ids(
+                command.class_ids
+            )
             for class_id in command.class_ids:
-                if not await self._class_repository.id_exists(class_id):
+                if class_id in missing_class_ids:
                     raise DomainError.invalid_data(
                         f"класс с id {class_id} не существует"
                     )
             spell.new_class_ids(command.class_ids)
         if command.subclass_ids is not None:
+            missing_subclass_ids = await self._subclass_repository.missing_ids(
+                command.subclass_ids
+            )
             for subclass_id in command.subclass_ids:
-                if not await self._subclass_repository.id_exists(subclass_id):
+                if subclass_id in missing_subclass_ids:
                     raise DomainError.invalid_data(
                         f"подкласс с id {subclass_id} не существует"
                     )
@@ -113,8 +115,11 @@ class UpdateSpellUseCase(UserCheck):
                 else None
             )
         if command.components is not None:
+            missing_material_ids = await self._material_repository.missing_ids(
+                command.components.materials
+            )
             for material_id in command.components.materials:
-                if not await self._material_repository.id_exists(material_id):
+                if material_id in missing_material_ids:
                     raise DomainError.invalid_data(
                         f"материал с id {material_id} не существует"
                     )
@@ -25,10 +25,6 @@ class UpdateSubclassFeatureUseCase(UserCheck):
 
     async def execute(self, command: UpdateSubclassFeatureCommand) -> None:
         await self._user_check(command.user_id)
-        if not await self._feature_repository.id_exists(command.feature_id):
-            raise DomainError.not_found(
-                f"умения подкласса с id {command.feature_id} не существует"
-            )
         app_feature = await self._feature_repository.get_by_id(command.feature_id)
         feature = app_feature.to_domain()
         if command.name is not None and command.subclass_id is not None:
@@ -22,8 +22,6 @@ class UpdateSubraceUseCase(UserCheck):
 
     async def execute(self, command: UpdateSubraceCommand) -> None:
         await self._user_check(command.user_id)
-        if not await self._subrace_repository.id_exists(command.subrace_id):
-            raise DomainError.not_found(f"подрасы с id {command.race_id} не существует")
         app_subrace = await self._subrace_repository.get_by_id(command.subrace_id)
         subrace = app_subrace.to_domain()
         if command.race_id is not None:
@@ -1,5 +1,6 @@
 from application.dto.command.tool import DeleteToolCommand
 from application.repository import ClassRepository, ToolRepository, UserRepository
+from application.use_case.command.reference_check import ensure_unused
 from application.use_case.command.user_check import UserCheck
 from domain.error import DomainError
 
@@ -21,12 +22,12 @@ class DeleteToolUseCase(UserCheck):
             raise DomainError.not_found(
                 f"инструмент с id {command.tool_id} не существует"
             )
-        exists_classes = await self._class_repository.filter(
-            filter_by_tool_ids=[command.tool_id]
+        await ensure_unused(
+            (
+                "инструменты используются для классов",
+                lambda: self._class_repository.references(
+                    filter_by_tool_ids=[command.tool_id]
+                ),
+            ),
         )
-        if len(exists_classes) > 0:
-            raise DomainError.invalid_data(
-                "инструменты используются для классов: "
-                f"{", ".join(c.name for c in exists_classes)}"
-            )
         await self._tool_repository.delete(command.tool_id)
@@ -21,10 +21,6 @@ class UpdateToolUseCase(UserCheck):
 
     async def execute(self, command: UpdateToolCommand) -> None:
         await self._user_check(command.user_id)
-        if not await self._tool_repository.id_exists(command.tool_id):
-            raise DomainError.not_found(
-                f"инструмент с id {command.tool_id} не существует"
-            )
         app_tool = await self._tool_repository.get_by_id(command.tool_id)
         tool = app_tool.to_domain()
         if command.tool_type is not None:
@@ -45,8 +45,11 @@ class CreateWeaponUseCase(UserCheck):
             raise DomainError.invalid_data(
                 f"тип оружия с id {command.weapon_kind_id} не существует"
             )
+        missing_property_ids = await self._property_repository.missing_ids(
+            command.weapon_property_ids
+        )
         for property_id in command.weapon_property_ids:
-            if not await self._property_repository.id_exists(property_id):
+            if property_id in missing_property_ids:
                 raise DomainError.invalid_data(
                     f"свойство оружия с id {property_id} не существует"
                 )
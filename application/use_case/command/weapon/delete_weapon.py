@@ -1,5 +1,6 @@
 from application.dto.command.weapon import DeleteWeaponCommand
 from application.repository import ClassRepository, UserRepository, WeaponRepository
+from application.use_case.command.reference_check import ensure_unused
 from application.use_case.command.user_check import UserCheck
 from domain.error import DomainError
 
@@ -21,12 +22,12 @@ class DeleteWeaponUseCase(UserCheck):
             raise DomainError.not_found(
                 f"оружие с id {command.weapon_id} не существует"
             )
-        exists_classes = await self._class_repository.filter(
-            filter_by_weapon_ids=[command.weapon_id]
+        await ensure_unused(
+            (
+                "оружие используется для классов",
+                lambda: self._class_repository.references(
+                    filter_by_weapon_ids=[command.weapon_id]
+                ),
+            ),
         )
-        if len(exists_classes) > 0:
-            raise DomainError.invalid_data(
-                "оружие используется для классов: "
-                f"{', '.join(c.name for c in exists_classes)}"
-            )
         await self._weapon_repository.delete(command.weapon_id)
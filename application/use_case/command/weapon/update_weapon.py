@@ -35,10 +35,6 @@ class UpdateWeaponUseCase(UserCheck):
 
     async def execute(self, command: UpdateWeaponCommand) -> None:
         await self._user_check(command.user_id)
-        if not await self._weapon_repository.id_exists(command.weapon_id):
-            raise DomainError.not_found(
-                f"оружие с id {command.weapon_id} не существует"
-            )
         app_weapon = await self._weapon_repository.get_by_id(command.weapon_id)
         weapon = app_weapon.to_domain()
         if command.weapon_kind_id is not None:
@@ -75,8 +71,11 @@ class UpdateWeaponUseCase(UserCheck):
                 Weight(command.weight.count, WeightUnit.from_str(command.weight.unit))
             )
         if command.weapon_property_ids is not None:
+            missing_property_ids = await self._property_repository.missing_ids(
+                command.weapon_property_ids
+            )
             for property_id in command.weapon_property_ids:
-                if not await self._property_repository.id_exists(property_id):
+                if property_id in missing_property_ids:
                     raise DomainError.invalid_data(
                         f"свойство оружия с id {property_id} не существует"
                     )
@@ -4,6 +4,7 @@ from application.repository import (
     WeaponKindRepository,
     WeaponRepository,
 )
+from application.use_case.command.reference_check import ensure_unused
 from application.use_case.command.user_check import UserCheck
 from domain.error import DomainError
 
@@ -25,12 +26,12 @@ class DeleteWeaponKindUseCase(UserCheck):
             raise DomainError.not_found(
                 f"вид оружия с id {command.weapon_kind_id} не существует"
             )
-        exists_weapons = await self._weapon_repository.filter(
-            filter_by_kind_ids=[command.weapon_kind_id]
+        await ensure_unused(
+            (
+                "вид оружия используется в оружии",
+                lambda: self._weapon_repository.references(
+                    filter_by_kind_ids=[command.weapon_kind_id]
+                ),
+            ),
         )
-        if len(exists_weapons) > 0:
-            raise DomainError.invalid_data(
-                "вид оружия используется в оружии: "
-                f"{", ".join([w.name for w in exists_weapons])}"
-            )
         await self._kind_repository.delete(command.weapon_kind_id)
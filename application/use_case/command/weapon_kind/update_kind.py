@@ -19,10 +19,6 @@ class UpdateWeaponKindUseCase(UserCheck):
 
     async def execute(self, command: UpdateWeaponKindCommand) -> None:
         await self._user_check(command.user_id)
-        if not await self._kind_repository.id_exists(command.weapon_kind_id):
-            raise DomainError.not_found(
-                f"вид оружия с id {command.weapon_kind_id} не существует"
-            )
         app_kind = await self._kind_repository.get_by_id(command.weapon_kind_id)
         kind = app_kind.to_domain()
         if command.weapon_type is not None:
@@ -4,6 +4,7 @@ from application.repository import (
     WeaponPropertyRepository,
     WeaponRepository,
 )
+from application.use_case.command.reference_check import ensure_unused
 from application.use_case.command.user_check import UserCheck
 from domain.error import DomainError
 
@@ -25,12 +26,12 @@ class DeleteWeaponPropertyUseCase(UserCheck):
             raise DomainError.not_found(
                 f"свойство с id {command.weapon_property_id} не существует"
             )
-        exists_weapons = await self._weapon_repository.filter(
-            filter_by_property_ids=[command.weapon_property_id]
+        await ensure_unused(
+            (
+                "свойство используется в оружии",
+                lambda: self._weapon_repository.references(
+                    filter_by_property_ids=[command.weapon_property_id]
+                ),
+            ),
         )
-        if len(exists_weapons) > 0:
-            raise DomainError.invalid_data(
-                "свойство используется в оружии: "
-                f"{", ".join([w.name for w in exists_weapons])}"
-            )
         await self._property_repository.delete(command.weapon_property_id)
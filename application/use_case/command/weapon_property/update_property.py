@@ -21,10 +21,6 @@ class UpdateWeaponPropertyUseCase(UserCheck):
 
     async def execute(self, command: UpdateWeaponPropertyCommand) -> None:
         await self._user_check(command.user_id)
-        if not await self._property_repository.id_exists(command.weapon_property_id):
-            raise DomainError.not_found(
-                f"свойство с id {command.weapon_property_id} не существует"
-            )
         app_weapon_property = await self._property_repository.get_by_id(
             command.weapon_property_id
         )
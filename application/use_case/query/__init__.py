@@ -4,15 +4,18 @@ from . import (
     character_subclass,
     class_feature,
     class_level,
+    export,
     feat,
     material,
     material_component,
     race,
+    search,
     source,
     spell,
     subclass_feature,
     subrace,
     tool,
+    version,
     weapon,
     weapon_kind,
     weapon_property,
@@ -24,15 +27,18 @@ __all__ = [
     "character_subclass",
     "class_feature",
     "class_level",
+    "export",
     "feat",
     "material",
     "material_component",
     "race",
+    "search",
     "source",
     "spell",
     "subclass_feature",
     "subrace",
     "tool",
+    "version",
     "weapon",
     "weapon_kind",
     "weapon_property",
@@ -1,15 +1,23 @@
 from application.dto.model.armor import AppArmor
+from application.dto.model.page import AppCursor, AppPage
 from application.dto.query.armor import ArmorsQuery
 from application.repository import ArmorRepository
+from application.use_case.query.page import make_page, page_cursor
 
 
 class GetArmorsUseCase:
     def __init__(self, armor_repository: ArmorRepository):
         self._repository = armor_repository
 
-    async def execute(self, query: ArmorsQuery) -> list[AppArmor]:
-        return await self._repository.filter(
+    async def execute(self, query: ArmorsQuery) -> AppPage[AppArmor]:
+        cursor = page_cursor(query.page)
+        armors = await self._repository.filter(
             search_by_name=query.search_by_name,
             filter_by_armor_types=query.filter_by_armor_types,
             filter_by_material_ids=query.filter_by_material_ids,
+            limit=query.page.limit + 1,
+            cursor=cursor,
+        )
+        return make_page(
+            armors, query.page, lambda armor: AppCursor(armor.name, armor.armor_id)
         )
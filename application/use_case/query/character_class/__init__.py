@@ -1,4 +1,11 @@
 from .get_class import GetClassUseCase
+from .get_class_sheet import GetClassSheetUseCase
+from .get_class_summaries import GetClassSummariesUseCase
 from .get_classes import GetClassesUseCase
 
-__all__ = ["GetClassUseCase", "GetClassesUseCase"]
+__all__ = [
+    "GetClassUseCase",
+    "GetClassesUseCase",
+    "GetClassSheetUseCase",
+    "GetClassSummariesUseCase",
+]
@@ -0,0 +1,61 @@
+import asyncio
+
+from application.dto.model.class_sheet import AppClassSheet
+from application.dto.query.character_class import ClassQuery
+from application.repository import (
+    ClassFeatureRepository,
+    ClassLevelRepository,
+    ClassRepository,
+    SpellRepository,
+    SubclassRepository,
+)
+
+
+class GetClassSheetUseCase:
+    def __init__(
+        self,
+        class_repository: ClassRepository,
+        class_level_repository: ClassLevelRepository,
+        class_feature_repository: ClassFeatureRepository,
+        subclass_repository: SubclassRepository,
+        spell_repository: SpellRepository,
+    ):
+        self._class_repository = class_repository
+        self._level_repository = class_level_repository
+        self._feature_repository = class_feature_repository
+        self._subclass_repository = subclass_repository
+        self._spell_repository = spell_repository
+
+    async def execute(self, query: ClassQuery) -> AppClassSheet:
+        # части страницы класса независимы: вне единицы работы каждый
+        # репозиторий берёт своё соединение, и запросы идут параллельно;
+        # TaskGroup при ошибке одного запроса отменяет остальные
+        try:
+            async with asyncio.TaskGroup() as group:
+                character_class = group.create_task(
+                    self._class_repository.get_by_id(query.class_id)
+                )
+                levels = group.create_task(
+                    self._level_repository.filter(filter_by_class_id=query.class_id)
+                )
+                features = group.create_task(
+                    self._feature_repository.filter(filter_by_class_id=query.class_id)
+                )
+                subclasses = group.create_task(
+                    self._subclass_repository.filter(filter_by_class_id=query.class_id)
+                )
+                spells = group.create_task(
+                    self._spell_repository.filter_summaries(
+                        filter_by_class_ids=[query.class_id]
+                    )
+                )
+        except ExceptionGroup as errors:
+            # обработчики ошибок ждут DomainError (404), а не группу
+            raise errors.exceptions[0]
+        return AppClassSheet(
+            character_class=character_class.result(),
+            levels=levels.result(),
+            features=features.result(),
+            subclasses=subclasses.result(),
+            spells=spells.result(),
+        )
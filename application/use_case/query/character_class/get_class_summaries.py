@@ -0,0 +1,25 @@
+from application.dto.model.character_class import AppClassSummary
+from application.dto.model.page import AppCursor, AppPage
+from application.dto.query.character_class import ClassesQuery
+from application.repository import ClassRepository
+from application.use_case.query.page import make_page, page_cursor
+
+
+class GetClassSummariesUseCase:
+    def __init__(self, class_repository: ClassRepository):
+        self._repository = class_repository
+
+    async def execute(self, query: ClassesQuery) -> AppPage[AppClassSummary]:
+        cursor = page_cursor(query.page)
+        classes = await self._repository.filter_summaries(
+            search_by_name=query.search_by_name,
+            limit=query.page.limit + 1,
+            cursor=cursor,
+        )
+        return make_page(
+            classes,
+            query.page,
+            lambda character_class: AppCursor(
+                character_class.name, character_class.class_id
+            ),
+        )
@@ -1,11 +1,25 @@
 from application.dto.model.character_class import AppClass
+from application.dto.model.page import AppCursor, AppPage
 from application.dto.query.character_class import ClassesQuery
 from application.repository import ClassRepository
+from application.use_case.query.page import make_page, page_cursor
 
 
 class GetClassesUseCase:
     def __init__(self, class_repository: ClassRepository):
         self._repository = class_repository
 
-    async def execute(self, query: ClassesQuery) -> list[AppClass]:
-        return await self._repository.filter(search_by_name=query.search_by_name)
+    async def execute(self, query: ClassesQuery) -> AppPage[AppClass]:
+        cursor = page_cursor(query.page)
+        classes = await self._repository.filter(
+            search_by_name=query.search_by_name,
+            limit=query.page.limit + 1,
+            cursor=cursor,
+        )
+        return make_page(
+            classes,
+            query.page,
+            lambda character_class: AppCursor(
+                character_class.name, character_class.class_id
+            ),
+        )
@@ -1,7 +1,6 @@
 from application.dto.model.character_subclass import AppSubclass
 from application.dto.query.character_subclass import SubclassQuery
 from application.repository import SubclassRepository
-from domain.error import DomainError
 
 
 class GetSubclassUseCase:
@@ -9,8 +8,4 @@ class GetSubclassUseCase:
         self._repository = subclass_repository
 
     async def execute(self, query: SubclassQuery) -> AppSubclass:
-        if not await self._repository.id_exists(query.subclass_id):
-            raise DomainError.not_found(
-                f"подкласс с id {query.subclass_id} не существует"
-            )
         return await self._repository.get_by_id(query.subclass_id)
@@ -1,13 +1,23 @@
 from application.dto.model.character_subclass import AppSubclass
+from application.dto.model.page import AppCursor, AppPage
 from application.dto.query.character_subclass import SubclassesQuery
 from application.repository import SubclassRepository
+from application.use_case.query.page import make_page, page_cursor
 
 
 class GetSubclassesUseCase:
     def __init__(self, subclass_repository: SubclassRepository):
         self._repository = subclass_repository
 
-    async def execute(self, query: SubclassesQuery) -> list[AppSubclass]:
-        return await self._repository.filter(
-            filter_by_class_id=query.filter_by_class_id
+    async def execute(self, query: SubclassesQuery) -> AppPage[AppSubclass]:
+        cursor = page_cursor(query.page)
+        subclasses = await self._repository.filter(
+            filter_by_class_id=query.filter_by_class_id,
+            limit=query.page.limit + 1,
+            cursor=cursor,
+        )
+        return make_page(
+            subclasses,
+            query.page,
+            lambda subclass: AppCursor(subclass.name, subclass.subclass_id),
         )
@@ -1,13 +1,23 @@
 from application.dto.model.class_feature import AppClassFeature
+from application.dto.model.page import AppCursor, AppPage
 from application.dto.query.class_feature import ClassFeaturesQuery
 from application.repository import ClassFeatureRepository
+from application.use_case.query.page import make_page, page_cursor
 
 
 class GetClassFeaturesUseCase:
     def __init__(self, feature_repository: ClassFeatureRepository):
         self._repository = feature_repository
 
-    async def execute(self, query: ClassFeaturesQuery) -> list[AppClassFeature]:
-        return await self._repository.filter(
-            filter_by_class_id=query.filter_by_class_id
+    async def execute(self, query: ClassFeaturesQuery) -> AppPage[AppClassFeature]:
+        cursor = page_cursor(query.page, int)
+        features = await self._repository.filter(
+            filter_by_class_id=query.filter_by_class_id,
+            limit=query.page.limit + 1,
+            cursor=cursor,
+        )
+        return make_page(
+            features,
+            query.page,
+            lambda feature: AppCursor(feature.level, feature.feature_id),
         )
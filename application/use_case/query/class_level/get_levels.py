@@ -1,13 +1,23 @@
 from application.dto.model.class_level import AppClassLevel
+from application.dto.model.page import AppCursor, AppPage
 from application.dto.query.class_level import ClassLevelsQuery
 from application.repository import ClassLevelRepository
+from application.use_case.query.page import make_page, page_cursor
 
 
 class GetClassLevelsUseCase:
     def __init__(self, class_level_repository: ClassLevelRepository):
         self._repository = class_level_repository
 
-    async def execute(self, query: ClassLevelsQuery) -> list[AppClassLevel]:
-        return await self._repository.filter(
-            filter_by_class_id=query.filter_by_class_id
+    async def execute(self, query: ClassLevelsQuery) -> AppPage[AppClassLevel]:
+        cursor = page_cursor(query.page, int)
+        levels = await self._repository.filter(
+            filter_by_class_id=query.filter_by_class_id,
+            limit=query.page.limit + 1,
+            cursor=cursor,
+        )
+        return make_page(
+            levels,
+            query.page,
+            lambda level: AppCursor(level.level, level.class_level_id),
         )
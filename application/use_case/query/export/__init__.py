@@ -0,0 +1,5 @@
+from .export import ExportUseCase
+
+__all__ = [
+    "ExportUseCase",
+]
@@ -0,0 +1,13 @@
+from typing import AsyncIterator
+
+from application.dto.model.export import AppExportItem
+from application.dto.query.export import ExportQuery
+from application.repository import ExportRepository
+
+
+class ExportUseCase:
+    def __init__(self, export_repository: ExportRepository) -> None:
+        self._repository = export_repository
+
+    async def execute(self, query: ExportQuery) -> AsyncIterator[AppExportItem]:
+        return self._repository.export(query.since)
@@ -1,17 +1,25 @@
 from application.dto.model.feat import AppFeat
+from application.dto.model.page import AppCursor, AppPage
 from application.dto.query.feat import FeatsQuery
 from application.repository import FeatRepository
+from application.use_case.query.page import make_page, page_cursor
 
 
 class GetFeatsUseCase:
     def __init__(self, feat_repository: FeatRepository):
         self._repository = feat_repository
 
-    async def execute(self, query: FeatsQuery) -> list[AppFeat]:
-        return await self._repository.filter(
+    async def execute(self, query: FeatsQuery) -> AppPage[AppFeat]:
+        cursor = page_cursor(query.page)
+        feats = await self._repository.filter(
             search_by_name=query.search_by_name,
             filter_by_caster=query.filter_by_caster,
             filter_by_required_armor_types=query.filter_by_required_armor_types,
             filter_by_required_modifiers=query.filter_by_required_modifiers,
             filter_by_increase_modifiers=query.filter_by_increase_modifiers,
+            limit=query.page.limit + 1,
+            cursor=cursor,
+        )
+        return make_page(
+            feats, query.page, lambda feat: AppCursor(feat.name, feat.feat_id)
         )
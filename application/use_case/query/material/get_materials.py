@@ -1,11 +1,23 @@
 from application.dto.model.material import AppMaterial
+from application.dto.model.page import AppCursor, AppPage
 from application.dto.query.material import MaterialsQuery
 from application.repository import MaterialRepository
+from application.use_case.query.page import make_page, page_cursor
 
 
 class GetMaterialsUseCase:
     def __init__(self, material_repository: MaterialRepository) -> None:
         self._repository = material_repository
 
-    async def execute(self, query: MaterialsQuery) -> list[AppMaterial]:
-        return await self._repository.filter(search_by_name=query.search_by_name)
+    async def execute(self, query: MaterialsQuery) -> AppPage[AppMaterial]:
+        cursor = page_cursor(query.page)
+        materials = await self._repository.filter(
+            search_by_name=query.search_by_name,
+            limit=query.page.limit + 1,
+            cursor=cursor,
+        )
+        return make_page(
+            materials,
+            query.page,
+            lambda material: AppCursor(material.name, material.material_id),
+        )
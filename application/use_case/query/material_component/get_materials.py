@@ -1,6 +1,8 @@
 from application.dto.model.material_component import AppMaterialComponent
+from application.dto.model.page import AppCursor, AppPage
 from application.dto.query.material_component import MaterialComponentsQuery
 from application.repository import MaterialComponentRepository
+from application.use_case.query.page import make_page, page_cursor
 
 
 class GetMaterialComponentsUseCase:
@@ -9,5 +11,15 @@ class GetMaterialComponentsUseCase:
 
     async def execute(
         self, query: MaterialComponentsQuery
-    ) -> list[AppMaterialComponent]:
-        return await self._repository.filter(search_by_name=query.search_by_name)
+    ) -> AppPage[AppMaterialComponent]:
+        cursor = page_cursor(query.page)
+        materials = await self._repository.filter(
+            search_by_name=query.search_by_name,
+            limit=query.page.limit + 1,
+            cursor=cursor,
+        )
+        return make_page(
+            materials,
+            query.page,
+            lambda material: AppCursor(material.name, material.material_id),
+        )
@@ -0,0 +1,28 @@
+from typing import Callable, Sequence, TypeVar
+
+from application.dto.model.page import AppCursor, AppPage
+from application.dto.query.page import MAX_PAGE_LIMIT, PageQuery
+from domain.error import DomainError
+
+T = TypeVar("T")
+
+
+def page_cursor(page: PageQuery, key_type: type[str | int] = str) -> AppCursor | None:
+    if not 0 < page.limit <= MAX_PAGE_LIMIT:
+        raise DomainError.invalid_data(
+            f"размер страницы должен быть от 1 до {MAX_PAGE_LIMIT}"
+        )
+    if page.cursor is None:
+        return None
+    return AppCursor.decode(page.cursor, key_type)
+
+
+def make_page(
+    items: Sequence[T], page: PageQuery, cursor_of: Callable[[T], AppCursor]
+) -> AppPage[T]:
+    # выборка запрашивается с лимитом page.limit + 1: лишняя запись
+    # означает, что следующая страница существует
+    if len(items) <= page.limit:
+        return AppPage(items=items, next_cursor=None)
+    items = items[: page.limit]
+    return AppPage(items=items, next_cursor=cursor_of(items[-1]).encode())
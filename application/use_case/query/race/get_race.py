@@ -1,7 +1,6 @@
 from application.dto.model.race import AppRace
 from application.dto.query.race import RaceQuery
 from application.repository import RaceRepository
-from domain.error import DomainError
 
 
 class GetRaceUseCase:
@@ -9,6 +8,4 @@ class GetRaceUseCase:
         self._repository = race_repository
 
     async def execute(self, query: RaceQuery) -> AppRace:
-        if not await self._repository.id_exists(query.race_id):
-            raise DomainError.not_found(f"расы с id {query.race_id} не существует")
         return await self._repository.get_by_id(query.race_id)
@@ -1,11 +1,21 @@
+from application.dto.model.page import AppCursor, AppPage
 from application.dto.model.race import AppRace
 from application.dto.query.race import RacesQuery
 from application.repository import RaceRepository
+from application.use_case.query.page import make_page, page_cursor
 
 
 class GetRacesUseCase:
     def __init__(self, race_repository: RaceRepository):
         self._repository = race_repository
 
-    async def execute(self, query: RacesQuery) -> list[AppRace]:
-        return await self._repository.filter(search_by_name=query.search_by_name)
+    async def execute(self, query: RacesQuery) -> AppPage[AppRace]:
+        cursor = page_cursor(query.page)
+        races = await self._repository.filter(
+            search_by_name=query.search_by_name,
+            limit=query.page.limit + 1,
+            cursor=cursor,
+        )
+        return make_page(
+            races, query.page, lambda race: AppCursor(race.name, race.race_id)
+        )
@@ -0,0 +1,5 @@
+from .search import SearchUseCase
+
+__all__ = [
+    "SearchUseCase",
+]
@@ -0,0 +1,20 @@
+from application.dto.model.search import AppSearchHit
+from application.dto.query.page import MAX_PAGE_LIMIT
+from application.dto.query.search import SearchQuery
+from application.repository import SearchRepository
+from domain.error import DomainError
+
+
+class SearchUseCase:
+    def __init__(self, search_repository: SearchRepository) -> None:
+        self._repository = search_repository
+
+    async def execute(self, query: SearchQuery) -> list[AppSearchHit]:
+        term = query.search.strip()
+        if len(term) == 0:
+            raise DomainError.invalid_data("поисковый запрос не может быть пустым")
+        if not 0 < query.limit <= MAX_PAGE_LIMIT:
+            raise DomainError.invalid_data(
+                f"размер выдачи должен быть от 1 до {MAX_PAGE_LIMIT}"
+            )
+        return await self._repository.search(term, query.limit)
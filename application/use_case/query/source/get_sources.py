@@ -1,11 +1,21 @@
+from application.dto.model.page import AppCursor, AppPage
 from application.dto.model.source import AppSource
 from application.dto.query.source import SourcesQuery
 from application.repository import SourceRepository
+from application.use_case.query.page import make_page, page_cursor
 
 
 class GetSourcesUseCase:
     def __init__(self, source_repository: SourceRepository):
         self._source_repository = source_repository
 
-    async def execute(self, query: SourcesQuery) -> list[AppSource]:
-        return await self._source_repository.filter(search_by_name=query.search_by_name)
+    async def execute(self, query: SourcesQuery) -> AppPage[AppSource]:
+        cursor = page_cursor(query.page)
+        sources = await self._source_repository.filter(
+            search_by_name=query.search_by_name,
+            limit=query.page.limit + 1,
+            cursor=cursor,
+        )
+        return make_page(
+            sources, query.page, lambda source: AppCursor(source.name, source.source_id)
+        )
@@ -1,4 +1,5 @@
 from .get_spell import GetSpellUseCase
+from .get_spell_summaries import GetSpellSummariesUseCase
 from .get_spells import GetSpellsUseCase
 
-__all__ = ["GetSpellUseCase", "GetSpellsUseCase"]
+__all__ = ["GetSpellUseCase", "GetSpellsUseCase", "GetSpellSummariesUseCase"]
@@ -1,7 +1,6 @@
 from application.dto.model.spell import AppSpell
 from application.dto.query.spell import SpellQuery
 from application.repository import SpellRepository
-from domain.error import DomainError
 
 
 class GetSpellUseCase:
@@ -9,8 +8,4 @@ class GetSpellUseCase:
         self._repository = spell_repository
 
     async def execute(self, query: SpellQuery) -> AppSpell:
-        if not await self._repository.id_exists(query.spell_id):
-            raise DomainError.not_found(
-                f"заклинания с id {query.spell_id} не существует"
-            )
         return await self._repository.get_by_id(query.spell_id)
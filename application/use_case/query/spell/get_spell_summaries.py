@@ -0,0 +1,33 @@
+from application.dto.model.page import AppCursor, AppPage
+from application.dto.model.spell import AppSpellSummary
+from application.dto.query.spell import SpellsQuery
+from application.repository import SpellRepository
+from application.use_case.query.page import make_page, page_cursor
+
+
+class GetSpellSummariesUseCase:
+    def __init__(self, spell_repository: SpellRepository):
+        self._repository = spell_repository
+
+    async def execute(self, query: SpellsQuery) -> AppPage[AppSpellSummary]:
+        cursor = page_cursor(query.page)
+        spells = await self._repository.filter_summaries(
+            search_by_name=query.search_by_name,
+            filter_by_class_ids=query.filter_by_class_ids,
+            filter_by_subclass_ids=query.filter_by_subclass_ids,
+            filter_by_schools=query.filter_by_schools,
+            filter_by_damage_types=query.filter_by_damage_types,
+            filter_by_durations=query.filter_by_durations,
+            filter_by_casting_times=query.filter_by_casting_times,
+            filter_by_verbal_component=query.filter_by_verbal_component,
+            filter_by_symbolic_component=query.filter_by_symbolic_component,
+            filter_by_material_component=query.filter_by_material_component,
+            filter_by_concentration=query.filter_by_concentration,
+            filter_by_ritual=query.filter_by_ritual,
+            filter_by_source_ids=query.filter_by_source_ids,
+            limit=query.page.limit + 1,
+            cursor=cursor,
+        )
+        return make_page(
+            spells, query.page, lambda spell: AppCursor(spell.name, spell.spell_id)
+        )
@@ -1,14 +1,17 @@
+from application.dto.model.page import AppCursor, AppPage
 from application.dto.model.spell import AppSpell
 from application.dto.query.spell import SpellsQuery
 from application.repository import SpellRepository
+from application.use_case.query.page import make_page, page_cursor
 
 
 class GetSpellsUseCase:
     def __init__(self, spell_repository: SpellRepository):
         self._repository = spell_repository
 
-    async def execute(self, query: SpellsQuery) -> list[AppSpell]:
-        return await self._repository.filter(
+    async def execute(self, query: SpellsQuery) -> AppPage[AppSpell]:
+        cursor = page_cursor(query.page)
+        spells = await self._repository.filter(
             search_by_name=query.search_by_name,
             filter_by_class_ids=query.filter_by_class_ids,
             filter_by_subclass_ids=query.filter_by_subclass_ids,
@@ -22,4 +25,9 @@ class GetSpellsUseCase:
             filter_by_concentration=query.filter_by_concentration,
             filter_by_ritual=query.filter_by_ritual,
             filter_by_source_ids=query.filter_by_source_ids,
+            limit=query.page.limit + 1,
+            cursor=cursor,
+        )
+        return make_page(
+            spells, query.page, lambda spell: AppCursor(spell.name, spell.spell_id)
         )
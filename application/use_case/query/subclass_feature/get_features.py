@@ -1,13 +1,25 @@
+from application.dto.model.page import AppCursor, AppPage
 from application.dto.model.subclass_feature import AppSubclassFeature
 from application.dto.query.subclass_feature import SubclassFeaturesQuery
 from application.repository import SubclassFeatureRepository
+from application.use_case.query.page import make_page, page_cursor
 
 
 class GetSubclassFeaturesUseCase:
     def __init__(self, feature_repository: SubclassFeatureRepository):
         self._repository = feature_repository
 
-    async def execute(self, query: SubclassFeaturesQuery) -> list[AppSubclassFeature]:
-        return await self._repository.filter(
-            filter_by_subclass_id=query.filter_by_subclass_id
+    async def execute(
+        self, query: SubclassFeaturesQuery
+    ) -> AppPage[AppSubclassFeature]:
+        cursor = page_cursor(query.page, int)
+        features = await self._repository.filter(
+            filter_by_subclass_id=query.filter_by_subclass_id,
+            limit=query.page.limit + 1,
+            cursor=cursor,
+        )
+        return make_page(
+            features,
+            query.page,
+            lambda feature: AppCursor(feature.level, feature.feature_id),
         )
@@ -1,7 +1,6 @@
 from application.dto.model.subrace import AppSubrace
 from application.dto.query.subrace import SubraceQuery
 from application.repository import SubraceRepository
-from domain.error import DomainError
 
 
 class GetSubraceUseCase:
@@ -9,8 +8,4 @@ class GetSubraceUseCase:
         self._subrace_repository = subrace_repository
 
     async def execute(self, query: SubraceQuery) -> AppSubrace:
-        if not await self._subrace_repository.id_exists(query.subrace_id):
-            raise DomainError.not_found(
-                f"подрасы с id {query.subrace_id} не существует"
-            )
         return await self._subrace_repository.get_by_id(query.subrace_id)
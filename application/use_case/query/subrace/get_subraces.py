@@ -1,13 +1,23 @@
+from application.dto.model.page import AppCursor, AppPage
 from application.dto.model.subrace import AppSubrace
 from application.dto.query.subrace import SubracesQuery
 from application.repository import SubraceRepository
+from application.use_case.query.page import make_page, page_cursor
 
 
 class GetSubracesUseCase:
     def __init__(self, subrace_repository: SubraceRepository):
         self._subrace_repository = subrace_repository
 
-    async def execute(self, query: SubracesQuery) -> list[AppSubrace]:
-        return await self._subrace_repository.filter(
-            search_by_name=query.search_by_name
+    async def execute(self, query: SubracesQuery) -> AppPage[AppSubrace]:
+        cursor = page_cursor(query.page)
+        subraces = await self._subrace_repository.filter(
+            search_by_name=query.search_by_name,
+            limit=query.page.limit + 1,
+            cursor=cursor,
+        )
+        return make_page(
+            subraces,
+            query.page,
+            lambda subrace: AppCursor(subrace.name, subrace.subrace_id),
         )
@@ -1,11 +1,21 @@
+from application.dto.model.page import AppCursor, AppPage
 from application.dto.model.tool import AppTool
 from application.dto.query.tool import ToolsQuery
 from application.repository import ToolRepository
+from application.use_case.query.page import make_page, page_cursor
 
 
 class GetToolsUseCase:
     def __init__(self, tool_repository: ToolRepository):
         self._tool_repository = tool_repository
 
-    async def execute(self, query: ToolsQuery) -> list[AppTool]:
-        return await self._tool_repository.filter(search_by_name=query.search_by_name)
+    async def execute(self, query: ToolsQuery) -> AppPage[AppTool]:
+        cursor = page_cursor(query.page)
+        tools = await self._tool_repository.filter(
+            search_by_name=query.search_by_name,
+            limit=query.page.limit + 1,
+            cursor=cursor,
+        )
+        return make_page(
+            tools, query.page, lambda tool: AppCursor(tool.name, tool.tool_id)
+        )
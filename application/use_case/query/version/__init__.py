@@ -0,0 +1,5 @@
+from .get_version import GetVersionUseCase
+
+__all__ = [
+    "GetVersionUseCase",
+]
@@ -0,0 +1,11 @@
+from application.dto.model.version import AppVersion
+from application.dto.query.version import VersionQuery
+from application.repository import VersionRepository
+
+
+class GetVersionUseCase:
+    def __init__(self, version_repository: VersionRepository) -> None:
+        self._repository = version_repository
+
+    async def execute(self, query: VersionQuery) -> AppVersion:
+        return await self._repository.version(query.entity_type, query.entity_id)
@@ -1,17 +1,25 @@
+from application.dto.model.page import AppCursor, AppPage
 from application.dto.model.weapon import AppWeapon
 from application.dto.query.weapon import WeaponsQuery
 from application.repository import WeaponRepository
+from application.use_case.query.page import make_page, page_cursor
 
 
 class GetWeaponsUseCase:
     def __init__(self, weapon_repository: WeaponRepository):
         self._repository = weapon_repository
 
-    async def execute(self, query: WeaponsQuery) -> list[AppWeapon]:
-        return await self._repository.filter(
+    async def execute(self, query: WeaponsQuery) -> AppPage[AppWeapon]:
+        cursor = page_cursor(query.page)
+        weapons = await self._repository.filter(
             search_by_name=query.search_by_name,
             filter_by_kind_ids=query.filter_by_kind_ids,
             filter_by_damage_types=query.filter_by_damage_types,
             filter_by_property_ids=query.filter_by_property_ids,
             filter_by_material_ids=query.filter_by_material_ids,
+            limit=query.page.limit + 1,
+            cursor=cursor,
+        )
+        return make_page(
+            weapons, query.page, lambda weapon: AppCursor(weapon.name, weapon.weapon_id)
         )
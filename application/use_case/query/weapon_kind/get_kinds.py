@@ -1,13 +1,22 @@
+from application.dto.model.page import AppCursor, AppPage
 from application.dto.model.weapon_kind import AppWeaponKind
 from application.dto.query.weapon_kind import WeaponKindsQuery
 from application.repository import WeaponKindRepository
+from application.use_case.query.page import make_page, page_cursor
 
 
 class GetWeaponKindsUseCase:
     def __init__(self, weapon_kind_repository: WeaponKindRepository):
         self._kind_repository = weapon_kind_repository
 
-    async def execute(self, query: WeaponKindsQuery) -> list[AppWeaponKind]:
-        return await self._kind_repository.filter(
-            search_by_name=query.search_by_name, filter_by_types=query.filter_by_types
+    async def execute(self, query: WeaponKindsQuery) -> AppPage[AppWeaponKind]:
+        cursor = page_cursor(query.page)
+        kinds = await self._kind_repository.filter(
+            search_by_name=query.search_by_name,
+            filter_by_types=query.filter_by_types,
+            limit=query.page.limit + 1,
+            cursor=cursor,
+        )
+        return make_page(
+            kinds, query.page, lambda kind: AppCursor(kind.name, kind.weapon_kind_id)
         )
@@ -1,11 +1,25 @@
+from application.dto.model.page import AppCursor, AppPage
 from application.dto.model.weapon_property import AppWeaponProperty
 from application.dto.query.weapon_property import WeaponPropertiesQuery
 from application.repository import WeaponPropertyRepository
+from application.use_case.query.page import make_page, page_cursor
 
 
 class GetWeaponPropertiesUseCase:
     def __init__(self, weapon_property_repository: WeaponPropertyRepository):
         self._repository = weapon_property_repository
 
-    async def execute(self, query: WeaponPropertiesQuery) -> list[AppWeaponProperty]:
-        return await self._repository.filter(search_by_name=query.search_by_name)
+    async def execute(self, query: WeaponPropertiesQuery) -> AppPage[AppWeaponProperty]:
+        cursor = page_cursor(query.page)
+        properties = await self._repository.filter(
+            search_by_name=query.search_by_name,
+            limit=query.page.limit + 1,
+            cursor=cursor,
+        )
+        return make_page(
+            properties,
+            query.page,
+            lambda weapon_property: AppCursor(
+                weapon_property.name, weapon_property.weapon_property_id
+            ),
+        )
@@ -0,0 +1,161 @@
+from dataclasses import dataclass, field
+from random import Random
+from typing import Any
+from uuid import UUID
+
+from adapters.repository import inmemory, sql
+from application.dto.model.character_class import AppClass
+from application.dto.model.class_level import AppClassLevel
+from application.dto.model.material_component import AppMaterialComponent
+from application.dto.model.source import AppSource
+from application.dto.model.spell import AppSpell
+from domain.damage_type import DamageType
+from domain.modifier import Modifier
+from domain.spell import SpellSchool
+from tests.factories import model_factory
+
+__all__ = [
+    "Catalogue",
+    "Repositories",
+    "generate",
+    "load",
+    "memory_repositories",
+    "sql_repositories",
+]
+
+
+@dataclass
+class Catalogue:
+    sources: list[AppSource] = field(default_factory=list)
+    materials: list[AppMaterialComponent] = field(default_factory=list)
+    classes: list[AppClass] = field(default_factory=list)
+    levels: list[AppClassLevel] = field(default_factory=list)
+    spells: list[AppSpell] = field(default_factory=list)
+
+
+@dataclass
+class Repositories:
+    source: Any
+    material_component: Any
+    character_class: Any
+    subclass: Any
+    class_level: Any
+    spell: Any
+    user: Any
+
+
+def generate(
+    spells: int = 10_000,
+    classes: int = 1_000,
+    levels: int = 20,
+    materials: int = 200,
+    sources: int = 5,
+    seed: int = 0,
+) -> Catalogue:
+    # id и распределения зависят только от seed, чтобы прогоны были сравнимы
+    random = Random(seed)
+
+    def uuid() -> UUID:
+        return UUID(int=random.getrandbits(128), version=4)
+
+    catalogue = Catalogue()
+    catalogue.sources = [
+        model_factory.source_model_factory(source_id=uuid(), name=f"source_{i}")
+        for i in range(sources)
+    ]
+    catalogue.materials = [
+        model_factory.material_component_model_factory(
+            material_id=uuid(), name=f"material_{i:04}"
+        )
+        for i in range(materials)
+    ]
+    catalogue.classes = [
+        model_factory.class_model_factory(
+            class_id=uuid(),
+            name=f"class_{i:04}",
+            source_id=random.choice(catalogue.sources).source_id,
+        )
+        for i in range(classes)
+    ]
+    catalogue.levels = [
+        model_factory.class_level_model_factory(
+            class_level_id=uuid(),
+            class_id=character_class.class_id,
+            level=level,
+            spell_slots=[2 + level // 4] * min(9, (level + 1) // 2),
+            number_cantrips_know=2 + level // 5,
+        )
+        for character_class in catalogue.classes
+        for level in range(1, levels + 1)
+    ]
+    schools = [school.name.lower() for school in SpellSchool]
+    damage_types = [damage_type.name.lower() for damage_type in DamageType]
+    modifiers = [modifier.name.lower() for modifier in Modifier]
+    for i in range(spells):
+        spell_materials = (
+            [m.material_id for m in random.sample(catalogue.materials, 2)]
+            if materials > 1 and random.random() < 0.3
+            else []
+        )
+        catalogue.spells.append(
+            model_factory.spell_model_factory(
+                spell_id=uuid(),
+                class_ids=[
+                    c.class_id
+                    for c in random.sample(catalogue.classes, min(3, classes))
+                ],
+                name=f"spell_{i:05}",
+                level=random.randint(0, 9),
+                school=random.choice(schools),
+                damage_type=(
+                    random.choice(damage_types) if random.random() < 0.5 else None
+                ),
+                components=model_factory.spell_component_model_factory(
+                    verbal=random.random() < 0.8,
+                    symbolic=random.random() < 0.6,
+                    material=len(spell_materials) > 0,
+                    materials=spell_materials,
+                ),
+                concentration=random.random() < 0.4,
+                ritual=random.random() < 0.1,
+                saving_throws=random.sample(modifiers, random.randint(0, 2)),
+                source_id=random.choice(catalogue.sources).source_id,
+            )
+        )
+    return catalogue
+
+
+def sql_repositories(helper: sql.DBHelper) -> Repositories:
+    return Repositories(
+        source=sql.SQLSourceRepository(helper),
+        material_component=sql.SQLMaterialComponentRepository(helper),
+        character_class=sql.SQLClassRepository(helper),
+        subclass=sql.SQLSubclassRepository(helper),
+        class_level=sql.SQLClassLevelRepository(helper),
+        spell=sql.SQLSpellRepository(helper),
+        user=sql.SQLUserRepository(helper),
+    )
+
+
+def memory_repositories() -> Repositories:
+    return Repositories(
+        source=inmemory.InMemorySourceRepository(),
+        material_component=inmemory.InMemoryMaterialComponentRepository(),
+        character_class=inmemory.InMemoryClassRepository(),
+        subclass=inmemory.InMemorySubclassRepository(),
+        class_level=inmemory.InMemoryClassLevelRepository(),
+        spell=inmemory.InMemorySpellRepository(),
+        user=inmemory.InMemoryUserRepository(),
+    )
+
+
+async def load(catalogue: Catalogue, repositories: Repositories) -> None:
+    for source in catalogue.sources:
+        await repositories.source.save(source)
+    for material in catalogue.materials:
+        await repositories.material_component.save(material)
+    for character_class in catalogue.classes:
+        await repositories.character_class.save(character_class)
+    for level in catalogue.levels:
+        await repositories.class_level.save(level)
+    await repositories.spell.create_many(catalogue.spells)
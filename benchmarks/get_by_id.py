@@ -0,0 +1,152 @@
+import argparse
+import asyncio
+from dataclasses import fields
+from time import perf_counter
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
+
+from adapters.repository import sql
+from adapters.repository.sql.models import Base
+from tests.factories import model_factory
+
+source_id, material_id, kind_id, class_id, subclass_id, race_id = (
+    uuid4() for _ in range(6)
+)
+
+# порядок важен: репозитории подгружают связанные записи при создании
+ENTITIES: list[tuple[str, type, Any]] = [
+    (
+        "sources",
+        sql.SQLSourceRepository,
+        model_factory.source_model_factory(source_id=source_id),
+    ),
+    (
+        "materials",
+        sql.SQLMaterialRepository,
+        model_factory.material_model_factory(material_id=material_id),
+    ),
+    (
+        "material-components",
+        sql.SQLMaterialComponentRepository,
+        model_factory.material_component_model_factory(material_id=uuid4()),
+    ),
+    (
+        "weapon-kinds",
+        sql.SQLWeaponKindRepository,
+        model_factory.weapon_kind_model_factory(weapon_kind_id=kind_id),
+    ),
+    (
+        "weapon-properties",
+        sql.SQLWeaponPropertyRepository,
+        model_factory.weapon_property_model_factory(weapon_property_id=uuid4()),
+    ),
+    (
+        "classes",
+        sql.SQLClassRepository,
+        model_factory.class_model_factory(class_id=class_id, source_id=source_id),
+    ),
+    (
+        "subclasses",
+        sql.SQLSubclassRepository,
+        model_factory.subclass_model_factory(
+            subclass_id=subclass_id, class_id=class_id
+        ),
+    ),
+    (
+        "class-features",
+        sql.SQLClassFeatureRepository,
+        model_factory.class_feature_model_factory(
+            feature_id=uuid4(), class_id=class_id
+        ),
+    ),
+    (
+        "class-levels",
+        sql.SQLClassLevelRepository,
+        model_factory.class_level_model_factory(
+            class_level_id=uuid4(), class_id=class_id
+        ),
+    ),
+    (
+        "subclass-features",
+        sql.SQLSubclassFeatureRepository,
+        model_factory.subclass_feature_model_factory(
+            feature_id=uuid4(), subclass_id=subclass_id
+        ),
+    ),
+    (
+        "races",
+        sql.SQLRaceRepository,
+        model_factory.race_model_factory(race_id=race_id, source_id=source_id),
+    ),
+    (
+        "subraces",
+        sql.SQLSubraceRepository,
+        model_factory.subrace_model_factory(subrace_id=uuid4(), race_id=race_id),
+    ),
+    ("feats", sql.SQLFeatRepository, model_factory.feat_model_factory(feat_id=uuid4())),
+    (
+        "armors",
+        sql.SQLArmorRepository,
+        model_factory.armor_model_factory(armor_id=uuid4(), material_id=material_id),
+    ),
+    (
+        "weapons",
+        sql.SQLWeaponRepository,
+        model_factory.weapon_model_factory(
+            weapon_id=uuid4(),
+            weapon_kind_id=kind_id,
+            weapon_property_ids=[],
+            material_id=material_id,
+        ),
+    ),
+    ("tools", sql.SQLToolRepository, model_factory.tool_model_factory(tool_id=uuid4())),
+    (
+        "spells",
+        sql.SQLSpellRepository,
+        model_factory.spell_model_factory(spell_id=uuid4(), source_id=source_id),
+    ),
+]
+
+
+async def measure(call: Callable[[], Awaitable[Any]], iterations: int) -> float:
+    await call()
+    start = perf_counter()
+    for _ in range(iterations):
+        await call()
+    return (perf_counter() - start) / iterations * 1000
+
+
+async def main(db_url: str, iterations: int) -> None:
+    helper = sql.DBHelper(db_url)
+    async with helper.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    print(f"{'endpoint':<20} {'exists+get, ms':>15} {'get, ms':>10} {'drop':>7}")
+    for endpoint, repository_type, model in ENTITIES:
+        repository = repository_type(helper)
+        entity_id = getattr(model, fields(model)[0].name)
+        await repository.save(model)
+
+        async def exists_then_get() -> Any:
+            await repository.id_exists(entity_id)
+            return await repository.get_by_id(entity_id)
+
+        async def get() -> Any:
+            return await repository.get_by_id(entity_id)
+
+        before = await measure(exists_then_get, iterations)
+        after = await measure(get, iterations)
+        print(
+            f"{endpoint:<20} {before:>15.3f} {after:>10.3f} "
+            f"{(before - after) / before:>7.1%}"
+        )
+    await helper.engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Задержка чтения по id: id_exists + get_by_id против get_by_id"
+    )
+    parser.add_argument("--db-url", default="sqlite+aiosqlite:///:memory:")
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.db_url, args.iterations))
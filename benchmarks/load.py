@@ -0,0 +1,184 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from itertools import cycle
+from statistics import quantiles
+from time import perf_counter
+
+import httpx
+from benchmarks.use_cases import revision
+
+
+@dataclass
+class Result:
+    workers: int | None
+    requests: int
+    errors: int
+    rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+async def client(
+    url: str, paths: list[str], concurrency: int, duration: float
+) -> tuple[list[float], int]:
+    timings: list[float] = []
+    errors = 0
+    deadline = perf_counter() + duration
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as http:
+
+        async def loop(offset: int) -> None:
+            nonlocal errors
+            targets = cycle(paths[offset % len(paths) :] + paths[: offset % len(paths)])
+            while perf_counter() < deadline:
+                start = perf_counter()
+                try:
+                    response = await http.get(next(targets))
+                    ok = response.status_code < 400
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    timings.append((perf_counter() - start) * 1000)
+                else:
+                    errors += 1
+
+        await asyncio.gather(*(loop(i) for i in range(concurrency)))
+    return timings, errors
+
+
+def run_client(
+    url: str, paths: list[str], concurrency: int, duration: float
+) -> tuple[list[float], int]:
+    return asyncio.run(client(url, paths, concurrency, duration))
+
+
+def load(args: argparse.Namespace, workers: int | None) -> Result:
+    # генератор нагрузки тоже упирается в GIL, поэтому клиенты - отдельные
+    # процессы; они делят ядра с сервером, если запущены на той же машине
+    with ProcessPoolExecutor(args.clients) as pool:
+        futures = [
+            pool.submit(
+                run_client, args.url, args.path, args.concurrency, args.duration
+            )
+            for _ in range(args.clients)
+        ]
+        outcomes = [future.result() for future in futures]
+    timings = [timing for part, _ in outcomes for timing in part]
+    errors = sum(part for _, part in outcomes)
+    cuts = quantiles(timings, n=100) if len(timings) > 1 else [0.0] * 99
+    return Result(
+        workers=workers,
+        requests=len(timings),
+        errors=errors,
+        rps=round(len(timings) / args.duration, 1),
+        p50_ms=round(cuts[49], 3),
+        p95_ms=round(cuts[94], 3),
+        p99_ms=round(cuts[98], 3),
+    )
+
+
+def wait_ready(url: str, path: str, process: subprocess.Popen[bytes]) -> None:
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            sys.exit(f"сервер завершился с кодом {process.returncode}")
+        try:
+            httpx.get(url + path, timeout=1)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    sys.exit("сервер не ответил за 60 секунд")
+
+
+def run_server(args: argparse.Namespace, workers: int) -> Result:
+    port = httpx.URL(args.url).port or 80
+    env = dict(os.environ, WEB_WORKERS=str(workers), WEB_PORT=str(port))
+    process = subprocess.Popen([sys.executable, args.server], env=env)
+    try:
+        wait_ready(args.url, args.path[0], process)
+        # прогрев: кеши, снимок справочника и пулы соединений каждого воркера
+        warm_up = argparse.Namespace(**dict(vars(args), duration=args.warm_up))
+        load(warm_up, workers)
+        return load(args, workers)
+    finally:
+        process.send_signal(signal.SIGTERM)
+        process.wait()
+
+
+def print_table(results: list[Result]) -> None:
+    base = results[0].rps
+    print(
+        f"{'workers':>8} {'rps':>10} {'speedup':>8} {'p50, ms':>9} "
+        f"{'p95, ms':>9} {'p99, ms':>9} {'errors':>7}"
+    )
+    for result in results:
+        speedup = result.rps / base if base else 0.0
+        print(
+            f"{result.workers or '-':>8} {result.rps:>10.1f} {speedup:>8.2f} "
+            f"{result.p50_ms:>9.3f} {result.p95_ms:>9.3f} {result.p99_ms:>9.3f} "
+            f"{result.errors:>7}"
+        )
+
+
+def main(args: argparse.Namespace) -> None:
+    if args.workers:
+        counts = [int(count) for count in args.workers.split(",")]
+        results = [run_server(args, count) for count in counts]
+    else:
+        results = [load(args, None)]
+    print_table(results)
+    if args.output is not None:
+        report = {
+            "revision": revision(),
+            "python": platform.python_version(),
+            "cpu_count": os.process_cpu_count(),
+            "url": args.url,
+            "paths": args.path,
+            "clients": args.clients,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "results": [asdict(result) for result in results],
+        }
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=(
+            "Пропускная способность HTTP API; с --workers запускает serve.py "
+            "с разным числом воркеров и сравнивает их"
+        )
+    )
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument(
+        "--path", action="append", help="по умолчанию /api/v1/spells и /api/v1/classes"
+    )
+    parser.add_argument(
+        "--workers",
+        help=(
+            "например 1,2,4; без него - готовый сервер; больше одного воркера "
+            "требует INVALIDATION_BUS=postgres или REPOSITORY_BACKEND=snapshot"
+        ),
+    )
+    parser.add_argument("--server", default="serve.py")
+    parser.add_argument("--clients", type=int, default=os.process_cpu_count() or 1)
+    parser.add_argument("--concurrency", type=int, default=16, help="на клиента")
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--warm-up", type=float, default=2)
+    parser.add_argument("--output", help="файл для JSON отчёта")
+    args = parser.parse_args()
+    if not args.path:
+        args.path = ["/api/v1/spells", "/api/v1/classes"]
+    main(args)
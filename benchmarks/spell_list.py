@@ -0,0 +1,110 @@
+import argparse
+import asyncio
+from time import perf_counter
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
+
+from adapters.repository import sql
+from adapters.repository.sql.models import Base, SpellModel
+from litestar.serialization import decode_json, encode_json
+from ports.http.web.v1.schemas.spell import ReadSpellSchema
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from tests.factories import model_factory
+
+
+async def seed(helper: sql.DBHelper, count: int) -> None:
+    source = model_factory.source_model_factory(source_id=uuid4())
+    classes = [
+        model_factory.class_model_factory(
+            class_id=uuid4(), name=f"class_{i}", source_id=source.source_id
+        )
+        for i in range(3)
+    ]
+    await sql.SQLSourceRepository(helper).save(source)
+    for character_class in classes:
+        await sql.SQLClassRepository(helper).save(character_class)
+    repository = sql.SQLSpellRepository(helper)
+    for i in range(count):
+        await repository.save(
+            model_factory.spell_model_factory(
+                spell_id=uuid4(),
+                name=f"spell_{i:05}",
+                class_ids=[c.class_id for c in classes[: i % 3 + 1]],
+                saving_throws=["strength", "wisdom"],
+                source_id=source.source_id,
+            )
+        )
+
+
+async def orm_page(helper: sql.DBHelper, limit: int) -> bytes:
+    # прежний путь: объекты моделей с selectinload -> AppSpell -> схема
+    async with helper.session as session:
+        query = (
+            select(SpellModel)
+            .options(
+                selectinload(SpellModel.saving_throws),
+                selectinload(SpellModel.character_classes),
+                selectinload(SpellModel.character_subclasses),
+                selectinload(SpellModel.materials),
+            )
+            .order_by(SpellModel.name, SpellModel.id)
+            .limit(limit)
+        )
+        result = await session.execute(query)
+        spells = [model.to_app() for model in result.scalars().all()]
+    return encode_json([ReadSpellSchema.from_app(spell) for spell in spells])
+
+
+async def fast_page(helper: sql.DBHelper, limit: int) -> bytes:
+    spells = await sql.SQLSpellRepository(helper).filter(limit=limit)
+    return encode_json([ReadSpellSchema.from_app(spell) for spell in spells])
+
+
+def normalised(payload: bytes) -> Any:
+    # ORM отдаёт id связей в порядке БД, проекция - отсортированными
+    spells = decode_json(payload)
+    for spell in spells:
+        spell["class_ids"].sort()
+        spell["subclass_ids"].sort()
+        spell["components"]["materials"].sort()
+    return spells
+
+
+async def measure(call: Callable[[], Awaitable[Any]], iterations: int) -> float:
+    await call()
+    start = perf_counter()
+    for _ in range(iterations):
+        await call()
+    return (perf_counter() - start) / iterations * 1000
+
+
+async def main(db_url: str, count: int, iterations: int) -> None:
+    helper = sql.DBHelper(db_url)
+    try:
+        async with helper.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        await seed(helper, count)
+        assert normalised(await orm_page(helper, count)) == normalised(
+            await fast_page(helper, count)
+        )
+        before = await measure(lambda: orm_page(helper, count), iterations)
+        after = await measure(lambda: fast_page(helper, count), iterations)
+    finally:
+        # иначе поток aiosqlite не даст процессу завершиться
+        await helper.engine.dispose()
+    print(f"{'spells':<8} {'orm, ms':>10} {'core, ms':>10} {'drop':>7}")
+    print(
+        f"{count:<8} {before:>10.3f} {after:>10.3f} {(before - after) / before:>7.1%}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Список заклинаний: ORM + selectinload против чтения строк Core"
+    )
+    parser.add_argument("--db-url", default="sqlite+aiosqlite:///:memory:")
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.db_url, args.count, args.iterations))
@@ -0,0 +1,240 @@
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from itertools import count
+from statistics import mean, quantiles
+from time import perf_counter
+from typing import Any, Awaitable, Callable
+
+from adapters.repository import sql
+from adapters.repository.sql.models import Base
+from application.dto.query.character_class import ClassQuery
+from application.dto.query.class_level import ClassLevelsQuery
+from application.dto.query.page import PageQuery
+from application.dto.query.spell import SpellsQuery
+from application.use_case.command.spell import CreateSpellUseCase
+from application.use_case.query.character_class import GetClassUseCase
+from application.use_case.query.class_level import GetClassLevelsUseCase
+from application.use_case.query.spell import GetSpellsUseCase
+from benchmarks.catalogue import (
+    Catalogue,
+    Repositories,
+    generate,
+    load,
+    memory_repositories,
+    sql_repositories,
+)
+from domain.spell import SpellService
+from tests.factories import command_factory
+
+
+@dataclass
+class Result:
+    backend: str
+    case: str
+    iterations: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    ops_per_s: float
+
+
+async def measure(
+    backend: str, case: str, call: Callable[[], Awaitable[Any]], iterations: int
+) -> Result:
+    await call()
+    timings = []
+    for _ in range(iterations):
+        start = perf_counter()
+        await call()
+        timings.append((perf_counter() - start) * 1000)
+    cuts = quantiles(timings, n=20)
+    return Result(
+        backend=backend,
+        case=case,
+        iterations=iterations,
+        mean_ms=round(mean(timings), 4),
+        p50_ms=round(cuts[9], 4),
+        p95_ms=round(cuts[18], 4),
+        ops_per_s=round(1000 / mean(timings), 1),
+    )
+
+
+def cases(
+    catalogue: Catalogue,
+    repositories: Repositories,
+    wrap: Callable[[Any], Any],
+) -> dict[str, Callable[[], Awaitable[Any]]]:
+    get_spells = GetSpellsUseCase(repositories.spell)
+    create_spell = wrap(
+        CreateSpellUseCase(
+            SpellService(repositories.spell),
+            repositories.user,
+            repositories.spell,
+            repositories.character_class,
+            repositories.subclass,
+            repositories.material_component,
+            repositories.source,
+        )
+    )
+    get_class = GetClassUseCase(repositories.character_class)
+    get_levels = GetClassLevelsUseCase(repositories.class_level)
+    character_class = catalogue.classes[len(catalogue.classes) // 2]
+    material = catalogue.materials[0]
+    names = count()
+
+    async def class_detail() -> Any:
+        return (
+            await get_class.execute(ClassQuery(class_id=character_class.class_id)),
+            await get_levels.execute(
+                ClassLevelsQuery(
+                    filter_by_class_id=character_class.class_id,
+                    page=PageQuery(limit=20),
+                )
+            ),
+        )
+
+    async def create() -> Any:
+        return await create_spell.execute(
+            command_factory.SpellCommandFactory.create(
+                class_ids=[character_class.class_id],
+                name=f"new_spell_{next(names):06}",
+                components=command_factory.spell_components_command_factory(
+                    material=True, materials=[material.material_id]
+                ),
+                source_id=character_class.source_id,
+            )
+        )
+
+    return {
+        "spells.page": lambda: get_spells.execute(SpellsQuery()),
+        "spells.by_class": lambda: get_spells.execute(
+            SpellsQuery(filter_by_class_ids=[character_class.class_id])
+        ),
+        "spells.by_school": lambda: get_spells.execute(
+            SpellsQuery(filter_by_schools=["evocation"])
+        ),
+        "spells.concentration": lambda: get_spells.execute(
+            SpellsQuery(filter_by_concentration=True, filter_by_ritual=False)
+        ),
+        "spells.search": lambda: get_spells.execute(
+            SpellsQuery(search_by_name="spell_01")
+        ),
+        "class.detail": class_detail,
+        "spell.create": create,
+    }
+
+
+async def run_sql(
+    catalogue: Catalogue, db_url: str, iterations: int, selected: list[str]
+) -> list[Result]:
+    helper = sql.DBHelper(db_url)
+    async with helper.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    repositories = sql_repositories(helper)
+    async with helper.unit_of_work():
+        await load(catalogue, repositories)
+    unit_of_work = sql.UnitOfWork(helper)
+    results = [
+        await measure("sql", case, call, iterations)
+        for case, call in cases(catalogue, repositories, unit_of_work).items()
+        if not selected or case in selected
+    ]
+    await helper.engine.dispose()
+    return results
+
+
+async def run_memory(
+    catalogue: Catalogue, iterations: int, selected: list[str]
+) -> list[Result]:
+    repositories = memory_repositories()
+    await load(catalogue, repositories)
+    return [
+        await measure("memory", case, call, iterations)
+        for case, call in cases(catalogue, repositories, lambda u: u).items()
+        if not selected or case in selected
+    ]
+
+
+def revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: list[dict[str, Any]], baseline: list[dict[str, Any]]) -> None:
+    before = {(r["backend"], r["case"]): r["p50_ms"] for r in baseline}
+    print(f"{'backend':<8} {'case':<22} {'before':>10} {'after':>10} {'change':>8}")
+    for result in results:
+        old = before.get((result["backend"], result["case"]))
+        if old is None:
+            continue
+        new = result["p50_ms"]
+        print(
+            f"{result['backend']:<8} {result['case']:<22} "
+            f"{old:>10.3f} {new:>10.3f} {(new - old) / old:>8.1%}"
+        )
+
+
+async def main(args: argparse.Namespace) -> None:
+    catalogue = generate(
+        spells=args.spells, classes=args.classes, levels=args.levels, seed=args.seed
+    )
+    results: list[Result] = []
+    if args.backend in ("memory", "all"):
+        results += await run_memory(catalogue, args.iterations, args.case)
+    if args.backend in ("sql", "all"):
+        results += await run_sql(catalogue, args.db_url, args.iterations, args.case)
+    report = {
+        "revision": revision(),
+        "python": platform.python_version(),
+        "db_url": args.db_url,
+        "catalogue": {
+            "spells": args.spells,
+            "classes": args.classes,
+            "levels": args.levels,
+            "seed": args.seed,
+        },
+        "results": [asdict(result) for result in results],
+    }
+    text = json.dumps(report, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+    if args.compare is not None:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        compare(report["results"], baseline["results"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Задержка горячих сценариев на синтетическом каталоге"
+    )
+    parser.add_argument("--backend", choices=["sql", "memory", "all"], default="all")
+    parser.add_argument("--db-url", default="sqlite+aiosqlite:///:memory:")
+    parser.add_argument("--spells", type=int, default=10_000)
+    parser.add_argument("--classes", type=int, default=1_000)
+    parser.add_argument("--levels", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--case", action="append", default=[])
+    parser.add_argument("--output", default="-", help="файл для JSON отчёта")
+    parser.add_argument("--compare", help="JSON отчёт прошлого прогона")
+    args = parser.parse_args()
+    if args.iterations < 2:
+        sys.exit("--iterations должно быть не меньше 2")
+    asyncio.run(main(args))
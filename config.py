@@ -12,6 +12,40 @@ class Config:
     DB_PASSWORD: str = os.getenv("DB_PASSWORD", "dnd_guide")
     DB_NAME: str = os.getenv("DB_NAME", "dnd_guide")
 
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 10))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 20))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", 30))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", 1800))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    # кеш скомпилированного SQL в SQLAlchemy (query_cache_size); подготовленные
+    # выражения драйвера psycopg он не настраивает
+    DB_QUERY_CACHE_SIZE: int = int(os.getenv("DB_QUERY_CACHE_SIZE", 500))
+    DB_SLOW_QUERY_MS: float = float(os.getenv("DB_SLOW_QUERY_MS", 200))
+
+    CACHE_MAXSIZE: int = int(os.getenv("CACHE_MAXSIZE", 1024))
+    CACHE_TTL: float = float(os.getenv("CACHE_TTL", 60))
+    STATIC_CACHE_MAX_AGE: int = int(os.getenv("STATIC_CACHE_MAX_AGE", 86400))
+
+    # sql - чтение из БД через TTL кеш, snapshot - весь справочник в памяти
+    REPOSITORY_BACKEND: str = os.getenv("REPOSITORY_BACKEND", "sql")
+    SNAPSHOT_POLL_INTERVAL: float = float(os.getenv("SNAPSHOT_POLL_INTERVAL", 5))
+    # local - один процесс, postgres - LISTEN/NOTIFY между воркерами
+    INVALIDATION_BUS: str = os.getenv("INVALIDATION_BUS", "local")
+    INVALIDATION_CHANNEL: str = os.getenv(
+        "INVALIDATION_CHANNEL", "catalogue_invalidation"
+    )
+
+    # serve.py: у каждого воркера свой пул на DB_POOL_SIZE + DB_MAX_OVERFLOW;
+    # больше одного воркера - только с INVALIDATION_BUS=postgres или
+    # REPOSITORY_BACKEND=snapshot, иначе кеши соседей устаревают до TTL
+    WEB_WORKERS: int = int(os.getenv("WEB_WORKERS", 1))
+    WEB_HOST: str = os.getenv("WEB_HOST", "0.0.0.0")
+    WEB_PORT: int = int(os.getenv("WEB_PORT", 8000))
+    WEB_GRACEFUL_TIMEOUT: float = float(os.getenv("WEB_GRACEFUL_TIMEOUT", 30))
+
+    # токен для /metrics/*; пустой - метрики недоступны
+    METRICS_TOKEN: str = os.getenv("METRICS_TOKEN", "")
+
     DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
 
     ALLOWED_HOSTS: list[str] = os.getenv("ALLOWED_HOSTS", "127.0.0.1,localhost").split(
@@ -28,5 +62,12 @@ class Config:
             f"{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
         )
 
+    @property
+    def db_dsn(self) -> str:
+        return (
+            f"postgresql://{self.DB_USER}:{self.DB_PASSWORD}@"
+            f"{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+        )
+
 
 config = Config()
@@ -3,33 +3,44 @@ from .di_use_cases import (
     ClassFeatureUseCases,
     ClassLevelUseCases,
     ClassUseCases,
+    ExportUseCases,
     FeatUseCases,
     MaterialComponentUseCases,
     MaterialUseCases,
     RaceUseCases,
+    SearchUseCases,
     SourceUseCases,
     SpellUseCases,
     SubclassFeatureUseCases,
     SubclassUseCases,
     SubraceUseCases,
     ToolUseCases,
+    VersionUseCases,
     WeaponKindUseCases,
     WeaponPropertyUseCases,
     WeaponUseCases,
+    after_fork,
     armor_use_cases,
     class_feature_use_cases,
     class_level_use_cases,
     class_use_cases,
+    db_helper,
+    dispose,
+    export_use_cases,
     feat_use_cases,
+    invalidation_bus,
     material_component_use_cases,
     material_use_cases,
     race_use_cases,
+    search_use_cases,
     source_use_cases,
     spell_use_cases,
     subclass_feature_use_cases,
     subclass_use_cases,
     subrace_use_cases,
     tool_use_cases,
+    version_use_cases,
+    warm_up,
     weapon_kind_use_cases,
     weapon_property_use_cases,
     weapon_use_cases,
@@ -40,33 +51,44 @@ __all__ = [
     "ClassFeatureUseCases",
     "ClassLevelUseCases",
     "ClassUseCases",
+    "ExportUseCases",
     "FeatUseCases",
     "MaterialComponentUseCases",
     "MaterialUseCases",
     "RaceUseCases",
+    "SearchUseCases",
     "SourceUseCases",
     "SpellUseCases",
     "SubclassFeatureUseCases",
     "SubclassUseCases",
     "SubraceUseCases",
     "ToolUseCases",
+    "VersionUseCases",
     "WeaponKindUseCases",
     "WeaponPropertyUseCases",
     "WeaponUseCases",
+    "after_fork",
     "armor_use_cases",
     "class_feature_use_cases",
     "class_level_use_cases",
     "class_use_cases",
+    "db_helper",
+    "dispose",
+    "export_use_cases",
     "feat_use_cases",
+    "invalidation_bus",
     "material_component_use_cases",
     "material_use_cases",
     "race_use_cases",
+    "search_use_cases",
     "source_use_cases",
     "spell_use_cases",
     "subclass_feature_use_cases",
     "subclass_use_cases",
     "subrace_use_cases",
     "tool_use_cases",
+    "version_use_cases",
+    "warm_up",
     "weapon_kind_use_cases",
     "weapon_property_use_cases",
     "weapon_use_cases",
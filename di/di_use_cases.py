@@ -1,4 +1,18 @@
+from typing import TypeVar
+
+from adapters.invalidation import (
+    InvalidationBus,
+    LocalInvalidationBus,
+    PostgresInvalidationBus,
+)
 from adapters.repository import sql
+from adapters.repository.cache import CachedVersionRepository, TTLCache, cached
+from adapters.repository.snapshot import (
+    SnapshotStore,
+    SnapshotVersionRepository,
+    snapshot,
+)
+from application.repository import VersionRepository
 from application.use_case import command, query
 from config import config
 from domain.armor import ArmorService
@@ -19,29 +33,99 @@ from domain.weapon import WeaponService
 from domain.weapon_kind import WeaponKindService
 from domain.weapon_property import WeaponPropertyService
 
-db_helper = sql.DBHelper(config.db_url)
+db_helper = sql.DBHelper(
+    config.db_url,
+    pool=sql.PoolSettings(
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_timeout=config.DB_POOL_TIMEOUT,
+        pool_recycle=config.DB_POOL_RECYCLE,
+        pool_pre_ping=config.DB_POOL_PRE_PING,
+        query_cache_size=config.DB_QUERY_CACHE_SIZE,
+    ),
+    slow_query_ms=config.DB_SLOW_QUERY_MS,
+)
+invalidation_bus: InvalidationBus = (
+    PostgresInvalidationBus(config.db_dsn, config.INVALIDATION_CHANNEL)
+    if config.INVALIDATION_BUS == "postgres"
+    else LocalInvalidationBus()
+)
+unit_of_work = sql.UnitOfWork(db_helper, invalidation_bus)
+cache = TTLCache(maxsize=config.CACHE_MAXSIZE, ttl=config.CACHE_TTL)
+invalidation_bus.subscribe(cache.clear)
+snapshot_store = (
+    SnapshotStore(db_helper, poll_interval=config.SNAPSHOT_POLL_INTERVAL)
+    if config.REPOSITORY_BACKEND == "snapshot"
+    else None
+)
+if snapshot_store is not None:
+    invalidation_bus.subscribe(snapshot_store.invalidate)
+
+R = TypeVar("R")
+
+
+def catalogue(repository: R, name: str) -> R:
+    if snapshot_store is not None:
+        return snapshot(repository, snapshot_store, name)
+    return cached(repository, cache, db_helper)
+
+
+async def warm_up() -> None:
+    if snapshot_store is not None:
+        await snapshot_store.refresh()
+
+
+def after_fork() -> None:
+    # соединения, открытые до fork, остаются мастеру; воркер начинает с пустым
+    # пулом и не закрывает чужие сокеты
+    db_helper.engine.sync_engine.dispose(close=False)
+
+
+async def dispose() -> None:
+    await db_helper.engine.dispose()
 
 
 # Repositories
 
 user_repo = sql.SQLUserRepository(db_helper=db_helper)
-armor_repo = sql.SQLArmorRepository(db_helper=db_helper)
-character_class_repo = sql.SQLClassRepository(db_helper=db_helper)
-character_subclass_repo = sql.SQLSubclassRepository(db_helper=db_helper)
-class_feature_repo = sql.SQLClassFeatureRepository(db_helper=db_helper)
-class_level_repo = sql.SQLClassLevelRepository(db_helper=db_helper)
-feat_repo = sql.SQLFeatRepository(db_helper=db_helper)
-material_repo = sql.SQLMaterialRepository(db_helper=db_helper)
-material_component_repo = sql.SQLMaterialComponentRepository(db_helper=db_helper)
-race_repo = sql.SQLRaceRepository(db_helper=db_helper)
-source_repo = sql.SQLSourceRepository(db_helper=db_helper)
-spell_repo = sql.SQLSpellRepository(db_helper=db_helper)
-subclass_feature_repo = sql.SQLSubclassFeatureRepository(db_helper=db_helper)
-subrace_repo = sql.SQLSubraceRepository(db_helper=db_helper)
-tool_repo = sql.SQLToolRepository(db_helper=db_helper)
-weapon_repo = sql.SQLWeaponRepository(db_helper=db_helper)
-weapon_kind_repo = sql.SQLWeaponKindRepository(db_helper=db_helper)
-weapon_property_repo = sql.SQLWeaponPropertyRepository(db_helper=db_helper)
+armor_repo = catalogue(sql.SQLArmorRepository(db_helper=db_helper), "armor")
+character_class_repo = catalogue(sql.SQLClassRepository(db_helper=db_helper), "class")
+character_subclass_repo = catalogue(
+    sql.SQLSubclassRepository(db_helper=db_helper), "subclass"
+)
+class_feature_repo = catalogue(
+    sql.SQLClassFeatureRepository(db_helper=db_helper), "class_feature"
+)
+class_level_repo = catalogue(
+    sql.SQLClassLevelRepository(db_helper=db_helper), "class_level"
+)
+feat_repo = catalogue(sql.SQLFeatRepository(db_helper=db_helper), "feat")
+material_repo = catalogue(sql.SQLMaterialRepository(db_helper=db_helper), "material")
+material_component_repo = catalogue(
+    sql.SQLMaterialComponentRepository(db_helper=db_helper), "material_component"
+)
+race_repo = catalogue(sql.SQLRaceRepository(db_helper=db_helper), "race")
+search_repo = sql.SQLSearchRepository(db_helper=db_helper)
+version_repo: VersionRepository = (
+    SnapshotVersionRepository(sql.SQLVersionRepository(db_helper), snapshot_store)
+    if snapshot_store is not None
+    else CachedVersionRepository(sql.SQLVersionRepository(db_helper), cache, db_helper)
+)
+export_repo = sql.SQLExportRepository(db_helper=db_helper)
+source_repo = catalogue(sql.SQLSourceRepository(db_helper=db_helper), "source")
+spell_repo = catalogue(sql.SQLSpellRepository(db_helper=db_helper), "spell")
+subclass_feature_repo = catalogue(
+    sql.SQLSubclassFeatureRepository(db_helper=db_helper), "subclass_feature"
+)
+subrace_repo = catalogue(sql.SQLSubraceRepository(db_helper=db_helper), "subrace")
+tool_repo = catalogue(sql.SQLToolRepository(db_helper=db_helper), "tool")
+weapon_repo = catalogue(sql.SQLWeaponRepository(db_helper=db_helper), "weapon")
+weapon_kind_repo = catalogue(
+    sql.SQLWeaponKindRepository(db_helper=db_helper), "weapon_kind"
+)
+weapon_property_repo = catalogue(
+    sql.SQLWeaponPropertyRepository(db_helper=db_helper), "weapon_property"
+)
 
 
 # Domain services
@@ -67,21 +151,27 @@ weapon_property_domain_service = WeaponPropertyService(weapon_property_repo)
 
 class ArmorUseCases:
     def __init__(self) -> None:
-        self.create = command.armor.CreateArmorUseCase(
-            armor_service=armor_domain_service,
-            user_repository=user_repo,
-            armor_repository=armor_repo,
-            material_repository=material_repo,
-        )
-        self.update = command.armor.UpdateArmorUseCase(
-            armor_service=armor_domain_service,
-            user_repository=user_repo,
-            armor_repository=armor_repo,
-            material_repository=material_repo,
-        )
-        self.delete = command.armor.DeleteArmorUseCase(
-            user_repository=user_repo,
-            armor_repository=armor_repo,
+        self.create = unit_of_work(
+            command.armor.CreateArmorUseCase(
+                armor_service=armor_domain_service,
+                user_repository=user_repo,
+                armor_repository=armor_repo,
+                material_repository=material_repo,
+            )
+        )
+        self.update = unit_of_work(
+            command.armor.UpdateArmorUseCase(
+                armor_service=armor_domain_service,
+                user_repository=user_repo,
+                armor_repository=armor_repo,
+                material_repository=material_repo,
+            )
+        )
+        self.delete = unit_of_work(
+            command.armor.DeleteArmorUseCase(
+                user_repository=user_repo,
+                armor_repository=armor_repo,
+            )
         )
         self.get_one = query.armor.GetArmorUseCase(
             armor_repository=armor_repo,
@@ -93,51 +183,73 @@ class ArmorUseCases:
 
 class ClassUseCases:
     def __init__(self) -> None:
-        self.create = command.character_class.CreateClassUseCase(
-            class_service=character_class_domain_service,
-            user_repository=user_repo,
-            class_repository=character_class_repo,
-            weapon_repository=weapon_repo,
-            tool_repository=tool_repo,
-            source_repository=source_repo,
+        self.create = unit_of_work(
+            command.character_class.CreateClassUseCase(
+                class_service=character_class_domain_service,
+                user_repository=user_repo,
+                class_repository=character_class_repo,
+                weapon_repository=weapon_repo,
+                tool_repository=tool_repo,
+                source_repository=source_repo,
+            )
+        )
+        self.update = unit_of_work(
+            command.character_class.UpdateClassUseCase(
+                class_service=character_class_domain_service,
+                user_repository=user_repo,
+                class_repository=character_class_repo,
+                weapon_repository=weapon_repo,
+                tool_repository=tool_repo,
+                source_repository=source_repo,
+            )
+        )
+        self.delete = unit_of_work(
+            command.character_class.DeleteClassUseCase(
+                user_repository=user_repo,
+                class_repository=character_class_repo,
+            )
         )
-        self.update = command.character_class.UpdateClassUseCase(
-            class_service=character_class_domain_service,
-            user_repository=user_repo,
+        self.get_one = query.character_class.GetClassUseCase(
             class_repository=character_class_repo,
-            weapon_repository=weapon_repo,
-            tool_repository=tool_repo,
-            source_repository=source_repo,
         )
-        self.delete = command.character_class.DeleteClassUseCase(
-            user_repository=user_repo,
+        self.get_all = query.character_class.GetClassesUseCase(
             class_repository=character_class_repo,
         )
-        self.get_one = query.character_class.GetClassUseCase(
+        self.get_summaries = query.character_class.GetClassSummariesUseCase(
             class_repository=character_class_repo,
         )
-        self.get_all = query.character_class.GetClassesUseCase(
+        self.get_sheet = query.character_class.GetClassSheetUseCase(
             class_repository=character_class_repo,
+            class_level_repository=class_level_repo,
+            class_feature_repository=class_feature_repo,
+            subclass_repository=character_subclass_repo,
+            spell_repository=spell_repo,
         )
 
 
 class SubclassUseCases:
     def __init__(self) -> None:
-        self.create = command.character_subclass.CreateSubclassUseCase(
-            subclass_service=character_subclass_domain_service,
-            user_repository=user_repo,
-            class_repository=character_class_repo,
-            subclass_repository=character_subclass_repo,
-        )
-        self.update = command.character_subclass.UpdateSubclassUseCase(
-            subclass_service=character_subclass_domain_service,
-            user_repository=user_repo,
-            class_repository=character_class_repo,
-            subclass_repository=character_subclass_repo,
-        )
-        self.delete = command.character_subclass.DeleteSubclassUseCase(
-            user_repository=user_repo,
-            subclass_repository=character_subclass_repo,
+        self.create = unit_of_work(
+            command.character_subclass.CreateSubclassUseCase(
+                subclass_service=character_subclass_domain_service,
+                user_repository=user_repo,
+                class_repository=character_class_repo,
+                subclass_repository=character_subclass_repo,
+            )
+        )
+        self.update = unit_of_work(
+            command.character_subclass.UpdateSubclassUseCase(
+                subclass_service=character_subclass_domain_service,
+                user_repository=user_repo,
+                class_repository=character_class_repo,
+                subclass_repository=character_subclass_repo,
+            )
+        )
+        self.delete = unit_of_work(
+            command.character_subclass.DeleteSubclassUseCase(
+                user_repository=user_repo,
+                subclass_repository=character_subclass_repo,
+            )
         )
         self.get_one = query.character_subclass.GetSubclassUseCase(
             subclass_repository=character_subclass_repo,
@@ -149,21 +261,27 @@ class SubclassUseCases:
 
 class ClassFeatureUseCases:
     def __init__(self) -> None:
-        self.create = command.class_feature.CreateClassFeatureUseCase(
-            feature_service=class_feature_domain_service,
-            user_repository=user_repo,
-            class_repository=character_class_repo,
-            feature_repository=class_feature_repo,
-        )
-        self.update = command.class_feature.UpdateClassFeatureUseCase(
-            feature_service=class_feature_domain_service,
-            user_repository=user_repo,
-            class_repository=character_class_repo,
-            feature_repository=class_feature_repo,
-        )
-        self.delete = command.class_feature.DeleteClassFeatureUseCase(
-            user_repository=user_repo,
-            feature_repository=class_feature_repo,
+        self.create = unit_of_work(
+            command.class_feature.CreateClassFeatureUseCase(
+                feature_service=class_feature_domain_service,
+                user_repository=user_repo,
+                class_repository=character_class_repo,
+                feature_repository=class_feature_repo,
+            )
+        )
+        self.update = unit_of_work(
+            command.class_feature.UpdateClassFeatureUseCase(
+                feature_service=class_feature_domain_service,
+                user_repository=user_repo,
+                class_repository=character_class_repo,
+                feature_repository=class_feature_repo,
+            )
+        )
+        self.delete = unit_of_work(
+            command.class_feature.DeleteClassFeatureUseCase(
+                user_repository=user_repo,
+                feature_repository=class_feature_repo,
+            )
         )
         self.get_one = query.class_feature.GetClassFeatureUseCase(
             feature_repository=class_feature_repo,
@@ -175,21 +293,27 @@ class ClassFeatureUseCases:
 
 class ClassLevelUseCases:
     def __init__(self) -> None:
-        self.create = command.class_level.CreateClassLevelUseCase(
-            class_level_service=class_level_domain_service,
-            user_repository=user_repo,
-            class_level_repository=class_level_repo,
-            class_repository=character_class_repo,
-        )
-        self.update = command.class_level.UpdateClassLevelUseCase(
-            class_level_service=class_level_domain_service,
-            user_repository=user_repo,
-            class_level_repository=class_level_repo,
-            class_repository=character_class_repo,
-        )
-        self.delete = command.class_level.DeleteClassLevelUseCase(
-            user_repository=user_repo,
-            class_level_repository=class_level_repo,
+        self.create = unit_of_work(
+            command.class_level.CreateClassLevelUseCase(
+                class_level_service=class_level_domain_service,
+                user_repository=user_repo,
+                class_level_repository=class_level_repo,
+                class_repository=character_class_repo,
+            )
+        )
+        self.update = unit_of_work(
+            command.class_level.UpdateClassLevelUseCase(
+                class_level_service=class_level_domain_service,
+                user_repository=user_repo,
+                class_level_repository=class_level_repo,
+                class_repository=character_class_repo,
+            )
+        )
+        self.delete = unit_of_work(
+            command.class_level.DeleteClassLevelUseCase(
+                user_repository=user_repo,
+                class_level_repository=class_level_repo,
+            )
         )
         self.get_one = query.class_level.GetClassLevelUseCase(
             class_level_repository=class_level_repo,
@@ -199,21 +323,34 @@ class ClassLevelUseCases:
         )
 
 
-class FeatUseCases:
+class ExportUseCases:
     def __init__(self) -> None:
-        self.create = command.feat.CreateFeatUseCase(
-            feat_service=feat_domain_service,
-            user_repository=user_repo,
-            feat_repository=feat_repo,
+        self.export = query.export.ExportUseCase(
+            export_repository=export_repo,
         )
-        self.update = command.feat.UpdateFeatUseCase(
-            feat_service=feat_domain_service,
-            user_repository=user_repo,
-            feat_repository=feat_repo,
-        )
-        self.delete = command.feat.DeleteFeatUseCase(
-            user_repository=user_repo,
-            feat_repository=feat_repo,
+
+
+class FeatUseCases:
+    def __init__(self) -> None:
+        self.create = unit_of_work(
+            command.feat.CreateFeatUseCase(
+                feat_service=feat_domain_service,
+                user_repository=user_repo,
+                feat_repository=feat_repo,
+            )
+        )
+        self.update = unit_of_work(
+            command.feat.UpdateFeatUseCase(
+                feat_service=feat_domain_service,
+                user_repository=user_repo,
+                feat_repository=feat_repo,
+            )
+        )
+        self.delete = unit_of_work(
+            command.feat.DeleteFeatUseCase(
+                user_repository=user_repo,
+                feat_repository=feat_repo,
+            )
         )
         self.get_one = query.feat.GetFeatUseCase(
             feat_repository=feat_repo,
@@ -225,21 +362,27 @@ class FeatUseCases:
 
 class MaterialUseCases:
     def __init__(self) -> None:
-        self.create = command.material.CreateMaterialUseCase(
-            material_service=material_domain_service,
-            user_repository=user_repo,
-            material_repository=material_repo,
-        )
-        self.update = command.material.UpdateMaterialUseCase(
-            material_service=material_domain_service,
-            user_repository=user_repo,
-            material_repository=material_repo,
-        )
-        self.delete = command.material.DeleteMaterialUseCase(
-            user_repository=user_repo,
-            material_repository=material_repo,
-            armor_repository=armor_repo,
-            weapon_repository=weapon_repo,
+        self.create = unit_of_work(
+            command.material.CreateMaterialUseCase(
+                material_service=material_domain_service,
+                user_repository=user_repo,
+                material_repository=material_repo,
+            )
+        )
+        self.update = unit_of_work(
+            command.material.UpdateMaterialUseCase(
+                material_service=material_domain_service,
+                user_repository=user_repo,
+                material_repository=material_repo,
+            )
+        )
+        self.delete = unit_of_work(
+            command.material.DeleteMaterialUseCase(
+                user_repository=user_repo,
+                material_repository=material_repo,
+                armor_repository=armor_repo,
+                weapon_repository=weapon_repo,
+            )
         )
         self.get_one = query.material.GetMaterialUseCase(
             material_repository=material_repo,
@@ -251,20 +394,26 @@ class MaterialUseCases:
 
 class MaterialComponentUseCases:
     def __init__(self) -> None:
-        self.create = command.material_component.CreateMaterialComponentUseCase(
-            material_service=material_component_domain_service,
-            user_repository=user_repo,
-            material_repository=material_component_repo,
-        )
-        self.update = command.material_component.UpdateMaterialComponentUseCase(
-            material_service=material_component_domain_service,
-            user_repository=user_repo,
-            material_repository=material_component_repo,
-        )
-        self.delete = command.material_component.DeleteMaterialComponentUseCase(
-            user_repository=user_repo,
-            material_repository=material_component_repo,
-            spell_repository=spell_repo,
+        self.create = unit_of_work(
+            command.material_component.CreateMaterialComponentUseCase(
+                material_service=material_component_domain_service,
+                user_repository=user_repo,
+                material_repository=material_component_repo,
+            )
+        )
+        self.update = unit_of_work(
+            command.material_component.UpdateMaterialComponentUseCase(
+                material_service=material_component_domain_service,
+                user_repository=user_repo,
+                material_repository=material_component_repo,
+            )
+        )
+        self.delete = unit_of_work(
+            command.material_component.DeleteMaterialComponentUseCase(
+                user_repository=user_repo,
+                material_repository=material_component_repo,
+                spell_repository=spell_repo,
+            )
         )
         self.get_one = query.material_component.GetMaterialComponentUseCase(
             material_repository=material_component_repo,
@@ -276,21 +425,27 @@ class MaterialComponentUseCases:
 
 class RaceUseCases:
     def __init__(self) -> None:
-        self.create = command.race.CreateRaceUseCase(
-            race_service=race_domain_service,
-            user_repository=user_repo,
-            race_repository=race_repo,
-            source_repository=source_repo,
-        )
-        self.update = command.race.UpdateRaceUseCase(
-            race_service=race_domain_service,
-            user_repository=user_repo,
-            race_repository=race_repo,
-            source_repository=source_repo,
-        )
-        self.delete = command.race.DeleteRaceUseCase(
-            user_repository=user_repo,
-            race_repository=race_repo,
+        self.create = unit_of_work(
+            command.race.CreateRaceUseCase(
+                race_service=race_domain_service,
+                user_repository=user_repo,
+                race_repository=race_repo,
+                source_repository=source_repo,
+            )
+        )
+        self.update = unit_of_work(
+            command.race.UpdateRaceUseCase(
+                race_service=race_domain_service,
+                user_repository=user_repo,
+                race_repository=race_repo,
+                source_repository=source_repo,
+            )
+        )
+        self.delete = unit_of_work(
+            command.race.DeleteRaceUseCase(
+                user_repository=user_repo,
+                race_repository=race_repo,
+            )
         )
         self.get_one = query.race.GetRaceUseCase(
             race_repository=race_repo,
@@ -300,24 +455,37 @@ class RaceUseCases:
         )
 
 
-class SourceUseCases:
+class SearchUseCases:
     def __init__(self) -> None:
-        self.create = command.source.CreateSourceUseCase(
-            source_service=source_domain_service,
-            user_repository=user_repo,
-            source_repository=source_repo,
-        )
-        self.update = command.source.UpdateSourceUseCase(
-            source_service=source_domain_service,
-            user_repository=user_repo,
-            source_repository=source_repo,
+        self.search = query.search.SearchUseCase(
+            search_repository=search_repo,
         )
-        self.delete = command.source.DeleteSourceUseCase(
-            user_repository=user_repo,
-            source_repository=source_repo,
-            class_repository=character_class_repo,
-            race_repository=race_repo,
-            spell_repository=spell_repo,
+
+
+class SourceUseCases:
+    def __init__(self) -> None:
+        self.create = unit_of_work(
+            command.source.CreateSourceUseCase(
+                source_service=source_domain_service,
+                user_repository=user_repo,
+                source_repository=source_repo,
+            )
+        )
+        self.update = unit_of_work(
+            command.source.UpdateSourceUseCase(
+                source_service=source_domain_service,
+                user_repository=user_repo,
+                source_repository=source_repo,
+            )
+        )
+        self.delete = unit_of_work(
+            command.source.DeleteSourceUseCase(
+                user_repository=user_repo,
+                source_repository=source_repo,
+                class_repository=character_class_repo,
+                race_repository=race_repo,
+                spell_repository=spell_repo,
+            )
         )
         self.get_one = query.source.GetSourceUseCase(
             source_repository=source_repo,
@@ -329,27 +497,43 @@ class SourceUseCases:
 
 class SpellUseCases:
     def __init__(self) -> None:
-        self.create = command.spell.CreateSpellUseCase(
-            spell_service=spell_domain_service,
-            user_repository=user_repo,
-            spell_repository=spell_repo,
-            class_repository=character_class_repo,
-            subclass_repository=character_subclass_repo,
-            source_repository=source_repo,
-            material_component_repository=material_component_repo,
-        )
-        self.update = command.spell.UpdateSpellUseCase(
-            spell_service=spell_domain_service,
-            user_repository=user_repo,
-            spell_repository=spell_repo,
-            class_repository=character_class_repo,
-            subclass_repository=character_subclass_repo,
-            source_repository=source_repo,
-            material_component_repository=material_component_repo,
-        )
-        self.delete = command.spell.DeleteSpellUseCase(
-            user_repository=user_repo,
-            spell_repository=spell_repo,
+        self.create = unit_of_work(
+            command.spell.CreateSpellUseCase(
+                spell_service=spell_domain_service,
+                user_repository=user_repo,
+                spell_repository=spell_repo,
+                class_repository=character_class_repo,
+                subclass_repository=character_subclass_repo,
+                source_repository=source_repo,
+                material_component_repository=material_component_repo,
+            )
+        )
+        self.update = unit_of_work(
+            command.spell.UpdateSpellUseCase(
+                spell_service=spell_domain_service,
+                user_repository=user_repo,
+                spell_repository=spell_repo,
+                class_repository=character_class_repo,
+                subclass_repository=character_subclass_repo,
+                source_repository=source_repo,
+                material_component_repository=material_component_repo,
+            )
+        )
+        self.import_spells = unit_of_work(
+            command.spell.ImportSpellsUseCase(
+                user_repository=user_repo,
+                spell_repository=spell_repo,
+                class_repository=character_class_repo,
+                subclass_repository=character_subclass_repo,
+                source_repository=source_repo,
+                material_component_repository=material_component_repo,
+            )
+        )
+        self.delete = unit_of_work(
+            command.spell.DeleteSpellUseCase(
+                user_repository=user_repo,
+                spell_repository=spell_repo,
+            )
         )
         self.get_one = query.spell.GetSpellUseCase(
             spell_repository=spell_repo,
@@ -357,25 +541,34 @@ class SpellUseCases:
         self.get_all = query.spell.GetSpellsUseCase(
             spell_repository=spell_repo,
         )
+        self.get_summaries = query.spell.GetSpellSummariesUseCase(
+            spell_repository=spell_repo,
+        )
 
 
 class SubclassFeatureUseCases:
     def __init__(self) -> None:
-        self.create = command.subclass_feature.CreateSubclassFeatureUseCase(
-            feature_service=subclass_feature_domain_service,
-            user_repository=user_repo,
-            subclass_repository=character_subclass_repo,
-            feature_repository=subclass_feature_repo,
-        )
-        self.update = command.subclass_feature.UpdateSubclassFeatureUseCase(
-            feature_service=subclass_feature_domain_service,
-            user_repository=user_repo,
-            subclass_repository=character_subclass_repo,
-            feature_repository=subclass_feature_repo,
-        )
-        self.delete = command.subclass_feature.DeleteSubclassFeatureUseCase(
-            user_repository=user_repo,
-            feature_repository=subclass_feature_repo,
+        self.create = unit_of_work(
+            command.subclass_feature.CreateSubclassFeatureUseCase(
+                feature_service=subclass_feature_domain_service,
+                user_repository=user_repo,
+                subclass_repository=character_subclass_repo,
+                feature_repository=subclass_feature_repo,
+            )
+        )
+        self.update = unit_of_work(
+            command.subclass_feature.UpdateSubclassFeatureUseCase(
+                feature_service=subclass_feature_domain_service,
+                user_repository=user_repo,
+                subclass_repository=character_subclass_repo,
+                feature_repository=subclass_feature_repo,
+            )
+        )
+        self.delete = unit_of_work(
+            command.subclass_feature.DeleteSubclassFeatureUseCase(
+                user_repository=user_repo,
+                feature_repository=subclass_feature_repo,
+            )
         )
         self.get_one = query.subclass_feature.GetSubclassFeatureUseCase(
             feature_repository=subclass_feature_repo,
@@ -387,21 +580,27 @@ class SubclassFeatureUseCases:
 
 class SubraceUseCases:
     def __init__(self) -> None:
-        self.create = command.subrace.CreateSubraceUseCase(
-            subrace_service=subrace_domain_service,
-            user_repository=user_repo,
-            subrace_repository=subrace_repo,
-            race_repository=race_repo,
-        )
-        self.update = command.subrace.UpdateSubraceUseCase(
-            subrace_service=subrace_domain_service,
-            user_repository=user_repo,
-            subrace_repository=subrace_repo,
-            race_repository=race_repo,
-        )
-        self.delete = command.subrace.DeleteSubraceUseCase(
-            user_repository=user_repo,
-            subrace_repository=subrace_repo,
+        self.create = unit_of_work(
+            command.subrace.CreateSubraceUseCase(
+                subrace_service=subrace_domain_service,
+                user_repository=user_repo,
+                subrace_repository=subrace_repo,
+                race_repository=race_repo,
+            )
+        )
+        self.update = unit_of_work(
+            command.subrace.UpdateSubraceUseCase(
+                subrace_service=subrace_domain_service,
+                user_repository=user_repo,
+                subrace_repository=subrace_repo,
+                race_repository=race_repo,
+            )
+        )
+        self.delete = unit_of_work(
+            command.subrace.DeleteSubraceUseCase(
+                user_repository=user_repo,
+                subrace_repository=subrace_repo,
+            )
         )
         self.get_one = query.subrace.GetSubraceUseCase(
             subrace_repository=subrace_repo,
@@ -413,20 +612,26 @@ class SubraceUseCases:
 
 class ToolUseCases:
     def __init__(self) -> None:
-        self.create = command.tool.CreateToolUseCase(
-            tool_service=tool_domain_service,
-            user_repository=user_repo,
-            tool_repository=tool_repo,
-        )
-        self.update = command.tool.UpdateToolUseCase(
-            tool_service=tool_domain_service,
-            user_repository=user_repo,
-            tool_repository=tool_repo,
-        )
-        self.delete = command.tool.DeleteToolUseCase(
-            user_repository=user_repo,
-            tool_repository=tool_repo,
-            class_repository=character_class_repo,
+        self.create = unit_of_work(
+            command.tool.CreateToolUseCase(
+                tool_service=tool_domain_service,
+                user_repository=user_repo,
+                tool_repository=tool_repo,
+            )
+        )
+        self.update = unit_of_work(
+            command.tool.UpdateToolUseCase(
+                tool_service=tool_domain_service,
+                user_repository=user_repo,
+                tool_repository=tool_repo,
+            )
+        )
+        self.delete = unit_of_work(
+            command.tool.DeleteToolUseCase(
+                user_repository=user_repo,
+                tool_repository=tool_repo,
+                class_repository=character_class_repo,
+            )
         )
         self.get_one = query.tool.GetToolUseCase(
             tool_repository=tool_repo,
@@ -438,26 +643,32 @@ class ToolUseCases:
 
 class WeaponUseCases:
     def __init__(self) -> None:
-        self.create = command.weapon.CreateWeaponUseCase(
-            weapon_service=weapon_domain_service,
-            user_repository=user_repo,
-            weapon_repository=weapon_repo,
-            kind_repository=weapon_kind_repo,
-            property_repository=weapon_property_repo,
-            material_repository=material_repo,
-        )
-        self.update = command.weapon.UpdateWeaponUseCase(
-            weapon_service=weapon_domain_service,
-            user_repository=user_repo,
-            weapon_repository=weapon_repo,
-            kind_repository=weapon_kind_repo,
-            property_repository=weapon_property_repo,
-            material_repository=material_repo,
-        )
-        self.delete = command.weapon.DeleteWeaponUseCase(
-            user_repository=user_repo,
-            weapon_repository=weapon_repo,
-            class_repository=character_class_repo,
+        self.create = unit_of_work(
+            command.weapon.CreateWeaponUseCase(
+                weapon_service=weapon_domain_service,
+                user_repository=user_repo,
+                weapon_repository=weapon_repo,
+                kind_repository=weapon_kind_repo,
+                property_repository=weapon_property_repo,
+                material_repository=material_repo,
+            )
+        )
+        self.update = unit_of_work(
+            command.weapon.UpdateWeaponUseCase(
+                weapon_service=weapon_domain_service,
+                user_repository=user_repo,
+                weapon_repository=weapon_repo,
+                kind_repository=weapon_kind_repo,
+                property_repository=weapon_property_repo,
+                material_repository=material_repo,
+            )
+        )
+        self.delete = unit_of_work(
+            command.weapon.DeleteWeaponUseCase(
+                user_repository=user_repo,
+                weapon_repository=weapon_repo,
+                class_repository=character_class_repo,
+            )
         )
         self.get_one = query.weapon.GetWeaponUseCase(
             weapon_repository=weapon_repo,
@@ -469,20 +680,26 @@ class WeaponUseCases:
 
 class WeaponKindUseCases:
     def __init__(self) -> None:
-        self.create = command.weapon_kind.CreateWeaponKindUseCase(
-            weapon_kind_service=weapon_kind_domain_service,
-            user_repository=user_repo,
-            weapon_kind_repository=weapon_kind_repo,
-        )
-        self.update = command.weapon_kind.UpdateWeaponKindUseCase(
-            weapon_kind_service=weapon_kind_domain_service,
-            user_repository=user_repo,
-            weapon_kind_repository=weapon_kind_repo,
-        )
-        self.delete = command.weapon_kind.DeleteWeaponKindUseCase(
-            user_repository=user_repo,
-            weapon_kind_repository=weapon_kind_repo,
-            weapon_repository=weapon_repo,
+        self.create = unit_of_work(
+            command.weapon_kind.CreateWeaponKindUseCase(
+                weapon_kind_service=weapon_kind_domain_service,
+                user_repository=user_repo,
+                weapon_kind_repository=weapon_kind_repo,
+            )
+        )
+        self.update = unit_of_work(
+            command.weapon_kind.UpdateWeaponKindUseCase(
+                weapon_kind_service=weapon_kind_domain_service,
+                user_repository=user_repo,
+                weapon_kind_repository=weapon_kind_repo,
+            )
+        )
+        self.delete = unit_of_work(
+            command.weapon_kind.DeleteWeaponKindUseCase(
+                user_repository=user_repo,
+                weapon_kind_repository=weapon_kind_repo,
+                weapon_repository=weapon_repo,
+            )
         )
         self.get_one = query.weapon_kind.GetWeaponKindUseCase(
             weapon_kind_repository=weapon_kind_repo,
@@ -494,20 +711,26 @@ class WeaponKindUseCases:
 
 class WeaponPropertyUseCases:
     def __init__(self) -> None:
-        self.create = command.weapon_property.CreateWeaponPropertyUseCase(
-            weapon_property_service=weapon_property_domain_service,
-            user_repository=user_repo,
-            weapon_property_repository=weapon_property_repo,
-        )
-        self.update = command.weapon_property.UpdateWeaponPropertyUseCase(
-            weapon_property_service=weapon_property_domain_service,
-            user_repository=user_repo,
-            weapon_property_repository=weapon_property_repo,
-        )
-        self.delete = command.weapon_property.DeleteWeaponPropertyUseCase(
-            user_repository=user_repo,
-            weapon_property_repository=weapon_property_repo,
-            weapon_repository=weapon_repo,
+        self.create = unit_of_work(
+            command.weapon_property.CreateWeaponPropertyUseCase(
+                weapon_property_service=weapon_property_domain_service,
+                user_repository=user_repo,
+                weapon_property_repository=weapon_property_repo,
+            )
+        )
+        self.update = unit_of_work(
+            command.weapon_property.UpdateWeaponPropertyUseCase(
+                weapon_property_service=weapon_property_domain_service,
+                user_repository=user_repo,
+                weapon_property_repository=weapon_property_repo,
+            )
+        )
+        self.delete = unit_of_work(
+            command.weapon_property.DeleteWeaponPropertyUseCase(
+                user_repository=user_repo,
+                weapon_property_repository=weapon_property_repo,
+                weapon_repository=weapon_repo,
+            )
         )
         self.get_one = query.weapon_property.GetWeaponPropertyUseCase(
             weapon_property_repository=weapon_property_repo,
@@ -517,15 +740,24 @@ class WeaponPropertyUseCases:
         )
 
 
+class VersionUseCases:
+    def __init__(self) -> None:
+        self.get = query.version.GetVersionUseCase(
+            version_repository=version_repo,
+        )
+
+
 armor_use_cases = ArmorUseCases()
 class_use_cases = ClassUseCases()
 subclass_use_cases = SubclassUseCases()
 class_feature_use_cases = ClassFeatureUseCases()
 class_level_use_cases = ClassLevelUseCases()
+export_use_cases = ExportUseCases()
 feat_use_cases = FeatUseCases()
 material_use_cases = MaterialUseCases()
 material_component_use_cases = MaterialComponentUseCases()
 race_use_cases = RaceUseCases()
+search_use_cases = SearchUseCases()
 source_use_cases = SourceUseCases()
 spell_use_cases = SpellUseCases()
 subclass_feature_use_cases = SubclassFeatureUseCases()
@@ -534,3 +766,4 @@ tool_use_cases = ToolUseCases()
 weapon_use_cases = WeaponUseCases()
 weapon_kind_use_cases = WeaponKindUseCases()
 weapon_property_use_cases = WeaponPropertyUseCases()
+version_use_cases = VersionUseCases()
@@ -1,8 +1,10 @@
+import di
 from config import config
 from domain.error import DomainError
 from litestar import Litestar
 from litestar.config.cors import CORSConfig
 from ports.http.web.exception_handlers import domain_handler
+from ports.http.web.middleware import ETagMiddleware, ServerTimingMiddleware
 from ports.http.web.v1.controllers import router
 
 cors = CORSConfig(allow_origins=config.ALLOWED_ORIGINS)
@@ -10,7 +12,10 @@ cors = CORSConfig(allow_origins=config.ALLOWED_ORIGINS)
 app = Litestar(
     route_handlers=[router],
     exception_handlers={DomainError: domain_handler},
+    middleware=[ServerTimingMiddleware(), ETagMiddleware()],
     allowed_hosts=config.ALLOWED_HOSTS,
     cors_config=cors,
+    on_startup=[di.invalidation_bus.start, di.warm_up],
+    on_shutdown=[di.invalidation_bus.stop, di.dispose],
     debug=config.DEBUG,
 )
@@ -0,0 +1,4 @@
+from .etag import ETagMiddleware
+from .server_timing import ServerTimingMiddleware
+
+__all__ = ["ETagMiddleware", "ServerTimingMiddleware"]
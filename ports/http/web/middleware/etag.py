@@ -0,0 +1,75 @@
+from hashlib import sha1
+from uuid import UUID
+
+from application.dto.model.version import AppVersion
+from application.dto.query.version import VersionQuery
+from litestar.enums import ScopeType
+from litestar.middleware import ASGIMiddleware
+from litestar.types import ASGIApp, Message, Receive, Scope, Send
+from ports.http.web.v1.providers.di_use_cases import di_version_use_cases
+
+ETAG_OPT_KEY = "etag"
+
+
+def make_etag(scope: Scope, version: AppVersion) -> str:
+    # путь и query string различают сущности, фильтры и страницы списка
+    updated_at = version.updated_at.isoformat() if version.updated_at else ""
+    source = (
+        f"{scope['path']}?{scope['query_string'].decode()}"
+        f"|{updated_at}|{version.count}"
+    )
+    return f'"{sha1(source.encode()).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in tags
+
+
+class ETagMiddleware(ASGIMiddleware):
+    # обработчики, помеченные opt={"etag": <тип сущности>}, получают ETag из
+    # id и updated_at, а при совпадении If-None-Match отвечают 304 без тела,
+    # не выполняя основной запрос и сериализацию
+    scopes = (ScopeType.HTTP,)
+
+    async def handle(
+        self, scope: Scope, receive: Receive, send: Send, next_app: ASGIApp
+    ) -> None:
+        entity_type = scope["route_handler"].opt.get(ETAG_OPT_KEY)
+        if entity_type is None or scope["method"] not in ("GET", "HEAD"):
+            await next_app(scope, receive, send)
+            return
+        entity_id = next(
+            (v for v in scope["path_params"].values() if isinstance(v, UUID)), None
+        )
+        version = await di_version_use_cases().get.execute(
+            VersionQuery(entity_type=entity_type, entity_id=entity_id)
+        )
+        if entity_id is not None and version.count == 0:
+            await next_app(scope, receive, send)
+            return
+        etag = make_etag(scope, version)
+        headers = dict(scope["headers"])
+        if_none_match = headers.get(b"if-none-match")
+        if if_none_match is not None and etag_matches(if_none_match.decode(), etag):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [(b"etag", etag.encode())],
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_etag(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"etag", etag.encode()),
+                ]
+            await send(message)
+
+        await next_app(scope, receive, send_with_etag)
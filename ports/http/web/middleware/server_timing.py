@@ -0,0 +1,69 @@
+import logging
+from time import perf_counter
+
+from adapters.repository.sql import QueryStats, track_queries
+from litestar.enums import ScopeType
+from litestar.middleware import ASGIMiddleware
+from litestar.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("dnd_guide.request")
+
+QUERY_STATS_STATE_KEY = "query_stats"
+
+
+def server_timing(stats: QueryStats, total_ms: float) -> str:
+    metrics = [
+        f'db;dur={stats.total_ms:.1f};desc="{stats.count} queries"',
+        f"db-slowest;dur={stats.slowest_ms:.1f}",
+        f"app;dur={total_ms:.1f}",
+    ]
+    return ", ".join(metrics)
+
+
+class ServerTimingMiddleware(ASGIMiddleware):
+    # считает запросы к БД за время обработки HTTP запроса; для потоковых
+    # ответов в заголовок попадает только то, что выполнилось до первого байта
+    scopes = (ScopeType.HTTP,)
+
+    async def handle(
+        self, scope: Scope, receive: Receive, send: Send, next_app: ASGIApp
+    ) -> None:
+        start = perf_counter()
+        status = 500
+        with track_queries() as stats:
+            scope.setdefault("state", {})[QUERY_STATS_STATE_KEY] = stats
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    total_ms = (perf_counter() - start) * 1000
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (b"server-timing", server_timing(stats, total_ms).encode()),
+                    ]
+                await send(message)
+
+            try:
+                await next_app(scope, receive, send_with_timing)
+            finally:
+                total_ms = (perf_counter() - start) * 1000
+                logger.info(
+                    "%s %s %s: %d queries, db %.1f ms, total %.1f ms",
+                    scope["method"],
+                    scope["path"],
+                    status,
+                    stats.count,
+                    stats.total_ms,
+                    total_ms,
+                    extra={
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "status": status,
+                        "query_count": stats.count,
+                        "db_ms": round(stats.total_ms, 3),
+                        "slowest_query_ms": round(stats.slowest_ms, 3),
+                        "slowest_query": stats.slowest_statement,
+                        "total_ms": round(total_ms, 3),
+                    },
+                )
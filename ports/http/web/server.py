@@ -0,0 +1,113 @@
+import logging
+import os
+import signal
+import socket
+import time
+from typing import Any, Callable
+
+import uvicorn
+
+__all__ = ["serve"]
+
+# логгер uvicorn: Config уже настроил для него вывод
+logger = logging.getLogger("uvicorn.error")
+
+RESPAWN_DELAY = 1.0
+KILL_MARGIN = 5.0
+
+
+def serve(
+    app: Any,
+    host: str,
+    port: int,
+    workers: int,
+    graceful_timeout: float,
+    after_fork: Callable[[], None] | None = None,
+) -> None:
+    # приложение импортировано в мастере до fork, воркеры делят его код;
+    # слушающий сокет общий, соединения между воркерами раздаёт ядро
+    config = uvicorn.Config(app, timeout_graceful_shutdown=int(graceful_timeout))
+    sock = socket.create_server((host, port), backlog=config.backlog)
+    sock.set_inheritable(True)
+    children: set[int] = set()
+    stopping = False
+
+    def spawn() -> None:
+        pid = os.fork()
+        if pid != 0:
+            children.add(pid)
+            return
+        code = 0
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            if after_fork is not None:
+                after_fork()
+            uvicorn.Server(config).run(sockets=[sock])
+        except BaseException:
+            logger.exception("worker [%s] crashed", os.getpid())
+            code = 1
+        finally:
+            os._exit(code)
+
+    def stop(signum: int, frame: Any) -> None:
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    logger.info(
+        "Started parent process [%s], %s workers on %s:%s",
+        os.getpid(),
+        workers,
+        host,
+        port,
+    )
+    for _ in range(workers):
+        spawn()
+
+    while not stopping:
+        pid, code = reap(children)
+        if pid == 0:
+            time.sleep(0.2)
+            continue
+        logger.warning("worker [%s] exited with code %s, restarting", pid, code)
+        time.sleep(RESPAWN_DELAY)
+        if not stopping:
+            spawn()
+
+    logger.info("Stopping %s workers", len(children))
+    for pid in children:
+        kill(pid, signal.SIGTERM)
+    # воркер сам ждёт незавершённые запросы graceful_timeout секунд и
+    # закрывает пул в on_shutdown; мастер добивает только зависших
+    deadline = time.monotonic() + graceful_timeout + KILL_MARGIN
+    while children and time.monotonic() < deadline:
+        if reap(children)[0] == 0:
+            time.sleep(0.2)
+    for pid in children:
+        logger.warning("worker [%s] did not stop in time, killing", pid)
+        kill(pid, signal.SIGKILL)
+    while children:
+        reap(children, block=True)
+    sock.close()
+    logger.info("Stopped parent process [%s]", os.getpid())
+
+
+def reap(children: set[int], block: bool = False) -> tuple[int, int]:
+    try:
+        pid, status = os.waitpid(-1, 0 if block else os.WNOHANG)
+    except ChildProcessError:
+        children.clear()
+        return 0, 0
+    if pid == 0:
+        return 0, 0
+    children.discard(pid)
+    return pid, os.waitstatus_to_exitcode(status)
+
+
+def kill(pid: int, signum: int) -> None:
+    try:
+        os.kill(pid, signum)
+    except ProcessLookupError:
+        pass
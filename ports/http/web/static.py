@@ -0,0 +1,31 @@
+from hashlib import sha1
+from typing import Any
+
+from config import config
+from litestar import Request, Response
+from litestar.enums import MediaType
+from litestar.serialization import encode_json
+from litestar.status_codes import HTTP_304_NOT_MODIFIED
+from ports.http.web.middleware.etag import etag_matches
+
+__all__ = ["StaticJSON"]
+
+
+class StaticJSON:
+    # ответ из перечислений домена: сериализуется один раз при импорте,
+    # дальше отдаются готовые байты с долгим Cache-Control и ETag
+    def __init__(self, content: Any) -> None:
+        self.body = encode_json(content)
+        self.etag = f'"{sha1(self.body).hexdigest()}"'
+        self.headers = {
+            "Cache-Control": f"public, max-age={config.STATIC_CACHE_MAX_AGE}",
+            "ETag": self.etag,
+        }
+
+    def response(self, request: Request[Any, Any, Any]) -> Response[bytes]:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None and etag_matches(if_none_match, self.etag):
+            return Response(
+                b"", status_code=HTTP_304_NOT_MODIFIED, headers=self.headers
+            )
+        return Response(self.body, media_type=MediaType.JSON, headers=self.headers)
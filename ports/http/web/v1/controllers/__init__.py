@@ -10,13 +10,16 @@ from .creature_size import get_creature_types
 from .creature_type import get_creature_sizes
 from .damage_type import get_damage_types
 from .dice import get_dice_types
+from .export import export
 from .feat import FeatController
 from .game_time import get_game_time_units
 from .length import get_length_units
 from .material import MaterialController
 from .material_component import MaterialComponentController
+from .metrics import get_db_pool_metrics
 from .modifier import get_modifiers
 from .race import RaceController
+from .search import SearchController
 from .skill import get_skills
 from .source import SourceController
 from .spell import SpellController
@@ -40,6 +43,7 @@ router = Router(
         MaterialController,
         MaterialComponentController,
         RaceController,
+        SearchController,
         SourceController,
         SpellController,
         SubclassFeatureController,
@@ -58,5 +62,7 @@ router = Router(
         get_skills,
         get_creature_types,
         get_creature_sizes,
+        get_db_pool_metrics,
+        export,
     ],
 )
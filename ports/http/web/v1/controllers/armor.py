@@ -2,8 +2,11 @@ from uuid import UUID, uuid4
 
 from application.dto.command.armor import DeleteArmorCommand
 from application.dto.query.armor import ArmorQuery, ArmorsQuery
-from litestar import Controller, delete, get, post, put
+from application.dto.query.page import DEFAULT_PAGE_LIMIT, PageQuery
+from litestar import Controller, Request, Response, delete, get, post, put
 from litestar.di import Provide
+from litestar.openapi import ResponseSpec
+from ports.http.web.static import StaticJSON
 from ports.http.web.v1.providers.di_use_cases import ArmorUseCases, di_armor_use_cases
 from ports.http.web.v1.schemas.armor import (
     CreateArmorSchema,
@@ -11,6 +14,9 @@ from ports.http.web.v1.schemas.armor import (
     ReadArmorTypeSchema,
     UpdateArmorSchema,
 )
+from ports.http.web.v1.schemas.page import ReadPageSchema
+
+ARMOR_TYPES = StaticJSON(ReadArmorTypeSchema.from_app())
 
 
 class ArmorController(Controller):
@@ -19,28 +25,34 @@ class ArmorController(Controller):
 
     dependencies = {"use_cases": Provide(di_armor_use_cases, sync_to_thread=True)}
 
-    @get("/{armor_id:uuid}")
+    @get("/{armor_id:uuid}", opt={"etag": "armor"})
     async def get_armor(
         self, armor_id: UUID, use_cases: ArmorUseCases
     ) -> ReadArmorSchema:
         armor = await use_cases.get_one.execute(ArmorQuery(armor_id=armor_id))
         return ReadArmorSchema.from_app(armor)
 
-    @get()
+    @get(opt={"etag": "armor"})
     async def get_armors(
         self,
         search_by_name: str | None,
         filter_by_armor_types: list[str] | None,
         filter_by_material_ids: list[UUID] | None,
+        cursor: str | None,
         use_cases: ArmorUseCases,
-    ) -> list[ReadArmorSchema]:
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> ReadPageSchema[ReadArmorSchema]:
         query = ArmorsQuery(
             search_by_name=search_by_name,
             filter_by_armor_types=filter_by_armor_types,
             filter_by_material_ids=filter_by_material_ids,
+            page=PageQuery(limit=limit, cursor=cursor),
+        )
+        page = await use_cases.get_all.execute(query)
+        return ReadPageSchema(
+            items=[ReadArmorSchema.from_app(armor) for armor in page.items],
+            next_cursor=page.next_cursor,
         )
-        armors = await use_cases.get_all.execute(query)
-        return [ReadArmorSchema.from_app(armor) for armor in armors]
 
     @post()
     async def create_armor(
@@ -59,6 +71,6 @@ class ArmorController(Controller):
         command = DeleteArmorCommand(user_id=uuid4(), armor_id=armor_id)
         await use_cases.delete.execute(command)
 
-    @get("/types")
-    async def get_armor_types(self) -> ReadArmorTypeSchema:
-        return ReadArmorTypeSchema.from_app()
+    @get("/types", responses={200: ResponseSpec(ReadArmorTypeSchema)})
+    async def get_armor_types(self, request: Request) -> Response[bytes]:
+        return ARMOR_TYPES.response(request)
@@ -1,15 +1,20 @@
+from typing import Literal
 from uuid import UUID, uuid4
 
 from application.dto.command.character_class import DeleteClassCommand
 from application.dto.query.character_class import ClassesQuery, ClassQuery
+from application.dto.query.page import DEFAULT_PAGE_LIMIT, PageQuery
 from litestar import Controller, delete, get, post, put
 from litestar.di import Provide
 from ports.http.web.v1.providers.di_use_cases import ClassUseCases, di_class_use_cases
 from ports.http.web.v1.schemas.character_class import (
     CreateClassSchema,
     ReadClassSchema,
+    ReadClassSheetSchema,
+    ReadClassSummarySchema,
     UpdateClassSchema,
 )
+from ports.http.web.v1.schemas.page import ReadPageSchema
 
 
 class ClassController(Controller):
@@ -18,22 +23,52 @@ class ClassController(Controller):
 
     dependencies = {"use_cases": Provide(di_class_use_cases, sync_to_thread=True)}
 
-    @get("/{class_id:uuid}")
+    @get("/{class_id:uuid}", opt={"etag": "class"})
     async def get_class(
         self, class_id: UUID, use_cases: ClassUseCases
     ) -> ReadClassSchema:
         character_class = await use_cases.get_one.execute(ClassQuery(class_id=class_id))
         return ReadClassSchema.from_app(character_class)
 
-    @get()
+    @get("/{class_id:uuid}/sheet")
+    async def get_class_sheet(
+        self, class_id: UUID, use_cases: ClassUseCases
+    ) -> ReadClassSheetSchema:
+        # страница класса одним запросом: уровни, умения, подклассы и
+        # заклинания; ETag не ставится, документ собран из разных сущностей
+        sheet = await use_cases.get_sheet.execute(ClassQuery(class_id=class_id))
+        return ReadClassSheetSchema.from_app(sheet)
+
+    @get(opt={"etag": "class"})
     async def get_classes(
-        self, search_by_name: str | None, use_cases: ClassUseCases
-    ) -> list[ReadClassSchema]:
-        query = ClassesQuery(search_by_name=search_by_name)
-        classes = await use_cases.get_all.execute(query)
-        return [
-            ReadClassSchema.from_app(character_class) for character_class in classes
-        ]
+        self,
+        search_by_name: str | None,
+        cursor: str | None,
+        fields: Literal["summary"] | None,
+        use_cases: ClassUseCases,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> ReadPageSchema[ReadClassSchema] | ReadPageSchema[ReadClassSummarySchema]:
+        query = ClassesQuery(
+            search_by_name=search_by_name,
+            page=PageQuery(limit=limit, cursor=cursor),
+        )
+        if fields == "summary":
+            summaries = await use_cases.get_summaries.execute(query)
+            return ReadPageSchema(
+                items=[
+                    ReadClassSummarySchema.from_app(character_class)
+                    for character_class in summaries.items
+                ],
+                next_cursor=summaries.next_cursor,
+            )
+        page = await use_cases.get_all.execute(query)
+        return ReadPageSchema(
+            items=[
+                ReadClassSchema.from_app(character_class)
+                for character_class in page.items
+            ],
+            next_cursor=page.next_cursor,
+        )
 
     @post()
     async def create_class(
@@ -2,6 +2,7 @@ from uuid import UUID, uuid4
 
 from application.dto.command.character_subclass import DeleteSubclassCommand
 from application.dto.query.character_subclass import SubclassesQuery, SubclassQuery
+from application.dto.query.page import DEFAULT_PAGE_LIMIT, PageQuery
 from litestar import Controller, delete, get, post, put
 from litestar.di import Provide
 from ports.http.web.v1.providers.di_use_cases import (
@@ -13,6 +14,7 @@ from ports.http.web.v1.schemas.character_subclass import (
     ReadSubclassSchema,
     UpdateSubclassSchema,
 )
+from ports.http.web.v1.schemas.page import ReadPageSchema
 
 
 class SubclassController(Controller):
@@ -21,7 +23,7 @@ class SubclassController(Controller):
 
     dependencies = {"use_cases": Provide(di_subclass_use_cases, sync_to_thread=True)}
 
-    @get("/{subclass_id:uuid}")
+    @get("/{subclass_id:uuid}", opt={"etag": "subclass"})
     async def get_subclass(
         self, subclass_id: UUID, use_cases: SubclassUseCases
     ) -> ReadSubclassSchema:
@@ -30,13 +32,23 @@ class SubclassController(Controller):
         )
         return ReadSubclassSchema.from_app(subclass)
 
-    @get()
+    @get(opt={"etag": "subclass"})
     async def get_subclasses(
-        self, filter_by_class_id: UUID, use_cases: SubclassUseCases
-    ) -> list[ReadSubclassSchema]:
-        query = SubclassesQuery(filter_by_class_id=filter_by_class_id)
-        subclasses = await use_cases.get_all.execute(query)
-        return [ReadSubclassSchema.from_app(subclass) for subclass in subclasses]
+        self,
+        filter_by_class_id: UUID,
+        cursor: str | None,
+        use_cases: SubclassUseCases,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> ReadPageSchema[ReadSubclassSchema]:
+        query = SubclassesQuery(
+            filter_by_class_id=filter_by_class_id,
+            page=PageQuery(limit=limit, cursor=cursor),
+        )
+        page = await use_cases.get_all.execute(query)
+        return ReadPageSchema(
+            items=[ReadSubclassSchema.from_app(subclass) for subclass in page.items],
+            next_cursor=page.next_cursor,
+        )
 
     @post()
     async def create_subclass(
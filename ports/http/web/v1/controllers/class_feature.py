@@ -2,6 +2,7 @@ from uuid import UUID, uuid4
 
 from application.dto.command.class_feature import DeleteClassFeatureCommand
 from application.dto.query.class_feature import ClassFeatureQuery, ClassFeaturesQuery
+from application.dto.query.page import DEFAULT_PAGE_LIMIT, PageQuery
 from litestar import Controller, delete, get, post, put
 from litestar.di import Provide
 from ports.http.web.v1.providers.di_use_cases import (
@@ -13,6 +14,7 @@ from ports.http.web.v1.schemas.class_feature import (
     ReadClassFeatureSchema,
     UpdateClassFeatureSchema,
 )
+from ports.http.web.v1.schemas.page import ReadPageSchema
 
 
 class ClassFeatureController(Controller):
@@ -23,7 +25,7 @@ class ClassFeatureController(Controller):
         "use_cases": Provide(di_class_feature_use_cases, sync_to_thread=True)
     }
 
-    @get("/{feature_id:uuid}")
+    @get("/{feature_id:uuid}", opt={"etag": "class_feature"})
     async def get_feature(
         self, feature_id: UUID, use_cases: ClassFeatureUseCases
     ) -> ReadClassFeatureSchema:
@@ -32,13 +34,23 @@ class ClassFeatureController(Controller):
         )
         return ReadClassFeatureSchema.from_app(feature)
 
-    @get()
+    @get(opt={"etag": "class_feature"})
     async def get_features(
-        self, filter_by_class_id: UUID, use_cases: ClassFeatureUseCases
-    ) -> list[ReadClassFeatureSchema]:
-        query = ClassFeaturesQuery(filter_by_class_id=filter_by_class_id)
-        features = await use_cases.get_all.execute(query)
-        return [ReadClassFeatureSchema.from_app(feature) for feature in features]
+        self,
+        filter_by_class_id: UUID,
+        cursor: str | None,
+        use_cases: ClassFeatureUseCases,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> ReadPageSchema[ReadClassFeatureSchema]:
+        query = ClassFeaturesQuery(
+            filter_by_class_id=filter_by_class_id,
+            page=PageQuery(limit=limit, cursor=cursor),
+        )
+        page = await use_cases.get_all.execute(query)
+        return ReadPageSchema(
+            items=[ReadClassFeatureSchema.from_app(feature) for feature in page.items],
+            next_cursor=page.next_cursor,
+        )
 
     @post()
     async def create_feature(
@@ -2,6 +2,7 @@ from uuid import UUID, uuid4
 
 from application.dto.command.class_level import DeleteClassLevelCommand
 from application.dto.query.class_level import ClassLevelQuery, ClassLevelsQuery
+from application.dto.query.page import DEFAULT_PAGE_LIMIT, PageQuery
 from litestar import Controller, delete, get, post, put
 from litestar.di import Provide
 from ports.http.web.v1.providers.di_use_cases import (
@@ -13,6 +14,7 @@ from ports.http.web.v1.schemas.class_level import (
     ReadClassLevelSchema,
     UpdateClassLevelSchema,
 )
+from ports.http.web.v1.schemas.page import ReadPageSchema
 
 
 class ClassLevelController(Controller):
@@ -21,7 +23,7 @@ class ClassLevelController(Controller):
 
     dependencies = {"use_cases": Provide(di_class_level_use_cases, sync_to_thread=True)}
 
-    @get("/{class_level_id:uuid}")
+    @get("/{class_level_id:uuid}", opt={"etag": "class_level"})
     async def get_class_level(
         self, class_level_id: UUID, use_cases: ClassLevelUseCases
     ) -> ReadClassLevelSchema:
@@ -30,13 +32,23 @@ class ClassLevelController(Controller):
         )
         return ReadClassLevelSchema.from_app(level)
 
-    @get()
+    @get(opt={"etag": "class_level"})
     async def get_class_levels(
-        self, filter_by_class_id: UUID, use_cases: ClassLevelUseCases
-    ) -> list[ReadClassLevelSchema]:
-        query = ClassLevelsQuery(filter_by_class_id=filter_by_class_id)
-        levels = await use_cases.get_all.execute(query)
-        return [ReadClassLevelSchema.from_app(level) for level in levels]
+        self,
+        filter_by_class_id: UUID,
+        cursor: str | None,
+        use_cases: ClassLevelUseCases,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> ReadPageSchema[ReadClassLevelSchema]:
+        query = ClassLevelsQuery(
+            filter_by_class_id=filter_by_class_id,
+            page=PageQuery(limit=limit, cursor=cursor),
+        )
+        page = await use_cases.get_all.execute(query)
+        return ReadPageSchema(
+            items=[ReadClassLevelSchema.from_app(level) for level in page.items],
+            next_cursor=page.next_cursor,
+        )
 
     @post()
     async def create_class_level(
@@ -1,7 +1,15 @@
-from litestar import get
+from litestar import Request, Response, get
+from litestar.openapi import ResponseSpec
+from ports.http.web.static import StaticJSON
 from ports.http.web.v1.schemas.coin import ReadPieceTypeSchema
 
+PIECE_TYPES = StaticJSON(ReadPieceTypeSchema.from_app())
 
-@get("/coins/piece-types", tags=["coin"])
-async def get_piece_types() -> ReadPieceTypeSchema:
-    return ReadPieceTypeSchema.from_app()
+
+@get(
+    "/coins/piece-types",
+    tags=["coin"],
+    responses={200: ResponseSpec(ReadPieceTypeSchema)},
+)
+async def get_piece_types(request: Request) -> Response[bytes]:
+    return PIECE_TYPES.response(request)
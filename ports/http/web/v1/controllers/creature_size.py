@@ -1,7 +1,15 @@
-from litestar import get
+from litestar import Request, Response, get
+from litestar.openapi import ResponseSpec
+from ports.http.web.static import StaticJSON
 from ports.http.web.v1.schemas.creature_type import ReadCreatureTypeSchema
 
+CREATURE_TYPES = StaticJSON(ReadCreatureTypeSchema.from_app())
 
-@get("/creatures/types", tags=["creature"])
-async def get_creature_types() -> ReadCreatureTypeSchema:
-    return ReadCreatureTypeSchema.from_app()
+
+@get(
+    "/creatures/types",
+    tags=["creature"],
+    responses={200: ResponseSpec(ReadCreatureTypeSchema)},
+)
+async def get_creature_types(request: Request) -> Response[bytes]:
+    return CREATURE_TYPES.response(request)
@@ -1,7 +1,15 @@
-from litestar import get
+from litestar import Request, Response, get
+from litestar.openapi import ResponseSpec
+from ports.http.web.static import StaticJSON
 from ports.http.web.v1.schemas.creature_size import ReadCreatureSizeSchema
 
+CREATURE_SIZES = StaticJSON(ReadCreatureSizeSchema.from_app())
 
-@get("/creatures/sizes", tags=["creature"])
-async def get_creature_sizes() -> ReadCreatureSizeSchema:
-    return ReadCreatureSizeSchema.from_app()
+
+@get(
+    "/creatures/sizes",
+    tags=["creature"],
+    responses={200: ResponseSpec(ReadCreatureSizeSchema)},
+)
+async def get_creature_sizes(request: Request) -> Response[bytes]:
+    return CREATURE_SIZES.response(request)
@@ -1,7 +1,15 @@
-from litestar import get
+from litestar import Request, Response, get
+from litestar.openapi import ResponseSpec
+from ports.http.web.static import StaticJSON
 from ports.http.web.v1.schemas.damage_type import ReadDamageTypeSchema
 
+DAMAGE_TYPES = StaticJSON(ReadDamageTypeSchema.from_app())
 
-@get("/damage-types", tags=["damage type"])
-async def get_damage_types() -> ReadDamageTypeSchema:
-    return ReadDamageTypeSchema.from_app()
+
+@get(
+    "/damage-types",
+    tags=["damage type"],
+    responses={200: ResponseSpec(ReadDamageTypeSchema)},
+)
+async def get_damage_types(request: Request) -> Response[bytes]:
+    return DAMAGE_TYPES.response(request)
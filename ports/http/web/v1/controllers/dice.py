@@ -1,7 +1,11 @@
-from litestar import get
+from litestar import Request, Response, get
+from litestar.openapi import ResponseSpec
+from ports.http.web.static import StaticJSON
 from ports.http.web.v1.schemas.dice import ReadDiceTypeSchema
 
+DICE_TYPES = StaticJSON(ReadDiceTypeSchema.from_app())
 
-@get("/dices/types", tags=["dice"])
-async def get_dice_types() -> ReadDiceTypeSchema:
-    return ReadDiceTypeSchema.from_app()
+
+@get("/dices/types", tags=["dice"], responses={200: ResponseSpec(ReadDiceTypeSchema)})
+async def get_dice_types(request: Request) -> Response[bytes]:
+    return DICE_TYPES.response(request)
@@ -0,0 +1,70 @@
+from datetime import datetime
+from typing import Any, AsyncIterator
+
+from application.dto.model.export import AppExportItem
+from application.dto.query.export import ExportQuery
+from litestar import get
+from litestar.di import Provide
+from litestar.response import Stream
+from litestar.serialization import encode_json
+from ports.http.web.v1.providers.di_use_cases import (
+    ExportUseCases,
+    di_export_use_cases,
+)
+from ports.http.web.v1.schemas.armor import ReadArmorSchema
+from ports.http.web.v1.schemas.character_class import ReadClassSchema
+from ports.http.web.v1.schemas.character_subclass import ReadSubclassSchema
+from ports.http.web.v1.schemas.class_feature import ReadClassFeatureSchema
+from ports.http.web.v1.schemas.class_level import ReadClassLevelSchema
+from ports.http.web.v1.schemas.feat import ReadFeatSchema
+from ports.http.web.v1.schemas.material import ReadMaterialSchema
+from ports.http.web.v1.schemas.material_component import ReadMaterialComponentSchema
+from ports.http.web.v1.schemas.race import ReadRaceSchema
+from ports.http.web.v1.schemas.source import ReadSourceSchema
+from ports.http.web.v1.schemas.spell import ReadSpellSchema
+from ports.http.web.v1.schemas.subclass_feature import ReadSubclassFeatureSchema
+from ports.http.web.v1.schemas.subrace import ReadSubraceSchema
+from ports.http.web.v1.schemas.tool import ReadToolSchema
+from ports.http.web.v1.schemas.weapon import ReadWeaponSchema
+from ports.http.web.v1.schemas.weapon_kind import ReadWeaponKindSchema
+from ports.http.web.v1.schemas.weapon_property import ReadWeaponPropertySchema
+
+SCHEMAS: dict[str, Any] = {
+    "armor": ReadArmorSchema,
+    "class": ReadClassSchema,
+    "subclass": ReadSubclassSchema,
+    "class_feature": ReadClassFeatureSchema,
+    "class_level": ReadClassLevelSchema,
+    "feat": ReadFeatSchema,
+    "material": ReadMaterialSchema,
+    "material_component": ReadMaterialComponentSchema,
+    "race": ReadRaceSchema,
+    "source": ReadSourceSchema,
+    "spell": ReadSpellSchema,
+    "subclass_feature": ReadSubclassFeatureSchema,
+    "subrace": ReadSubraceSchema,
+    "tool": ReadToolSchema,
+    "weapon": ReadWeaponSchema,
+    "weapon_kind": ReadWeaponKindSchema,
+    "weapon_property": ReadWeaponPropertySchema,
+}
+
+
+async def ndjson(items: AsyncIterator[AppExportItem]) -> AsyncIterator[bytes]:
+    async for item in items:
+        line = {
+            "entity_type": item.entity_type,
+            "updated_at": item.updated_at,
+            "data": SCHEMAS[item.entity_type].from_app(item.entity),
+        }
+        yield encode_json(line) + b"\n"
+
+
+@get(
+    "/export",
+    tags=["export"],
+    dependencies={"use_cases": Provide(di_export_use_cases, sync_to_thread=True)},
+)
+async def export(since: datetime | None, use_cases: ExportUseCases) -> Stream:
+    items = await use_cases.export.execute(ExportQuery(since=since))
+    return Stream(ndjson(items), media_type="application/x-ndjson")
@@ -2,6 +2,7 @@ from uuid import UUID, uuid4
 
 from application.dto.command.feat import DeleteFeatCommand
 from application.dto.query.feat import FeatQuery, FeatsQuery
+from application.dto.query.page import DEFAULT_PAGE_LIMIT, PageQuery
 from litestar import Controller, delete, get, post, put
 from litestar.di import Provide
 from ports.http.web.v1.providers.di_use_cases import FeatUseCases, di_feat_use_cases
@@ -10,6 +11,7 @@ from ports.http.web.v1.schemas.feat import (
     ReadFeatSchema,
     UpdateFeatSchema,
 )
+from ports.http.web.v1.schemas.page import ReadPageSchema
 
 
 class FeatController(Controller):
@@ -18,12 +20,12 @@ class FeatController(Controller):
 
     dependencies = {"use_cases": Provide(di_feat_use_cases, sync_to_thread=True)}
 
-    @get("/{feat_id:uuid}")
+    @get("/{feat_id:uuid}", opt={"etag": "feat"})
     async def get_feat(self, feat_id: UUID, use_cases: FeatUseCases) -> ReadFeatSchema:
         feat = await use_cases.get_one.execute(FeatQuery(feat_id=feat_id))
         return ReadFeatSchema.from_app(feat)
 
-    @get()
+    @get(opt={"etag": "feat"})
     async def get_feats(
         self,
         search_by_name: str | None,
@@ -31,17 +33,23 @@ class FeatController(Controller):
         filter_by_required_armor_types: list[str] | None,
         filter_by_required_modifiers: list[str] | None,
         filter_by_increase_modifiers: list[str] | None,
+        cursor: str | None,
         use_cases: FeatUseCases,
-    ) -> list[ReadFeatSchema]:
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> ReadPageSchema[ReadFeatSchema]:
         query = FeatsQuery(
             search_by_name=search_by_name,
             filter_by_caster=filter_by_caster,
             filter_by_required_armor_types=filter_by_required_armor_types,
             filter_by_required_modifiers=filter_by_required_modifiers,
             filter_by_increase_modifiers=filter_by_increase_modifiers,
+            page=PageQuery(limit=limit, cursor=cursor),
+        )
+        page = await use_cases.get_all.execute(query)
+        return ReadPageSchema(
+            items=[ReadFeatSchema.from_app(feat) for feat in page.items],
+            next_cursor=page.next_cursor,
         )
-        feats = await use_cases.get_all.execute(query)
-        return [ReadFeatSchema.from_app(feat) for feat in feats]
 
     @post()
     async def create_feat(
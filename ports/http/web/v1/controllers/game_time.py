@@ -1,7 +1,15 @@
-from litestar import get
+from litestar import Request, Response, get
+from litestar.openapi import ResponseSpec
+from ports.http.web.static import StaticJSON
 from ports.http.web.v1.schemas.game_time import ReadGameTimeUnitSchema
 
+GAME_TIME_UNITS = StaticJSON(ReadGameTimeUnitSchema.from_app())
 
-@get("/game-times/units", tags=["game time"])
-async def get_game_time_units() -> ReadGameTimeUnitSchema:
-    return ReadGameTimeUnitSchema.from_app()
+
+@get(
+    "/game-times/units",
+    tags=["game time"],
+    responses={200: ResponseSpec(ReadGameTimeUnitSchema)},
+)
+async def get_game_time_units(request: Request) -> Response[bytes]:
+    return GAME_TIME_UNITS.response(request)
@@ -1,7 +1,15 @@
-from litestar import get
+from litestar import Request, Response, get
+from litestar.openapi import ResponseSpec
+from ports.http.web.static import StaticJSON
 from ports.http.web.v1.schemas.length import ReadLengthUnitSchema
 
+LENGTH_UNITS = StaticJSON(ReadLengthUnitSchema.from_app())
 
-@get("/lengths/units", tags=["length"])
-async def get_length_units() -> ReadLengthUnitSchema:
-    return ReadLengthUnitSchema.from_app()
+
+@get(
+    "/lengths/units",
+    tags=["length"],
+    responses={200: ResponseSpec(ReadLengthUnitSchema)},
+)
+async def get_length_units(request: Request) -> Response[bytes]:
+    return LENGTH_UNITS.response(request)
@@ -2,6 +2,7 @@ from uuid import UUID, uuid4
 
 from application.dto.command.material import DeleteMaterialCommand
 from application.dto.query.material import MaterialQuery, MaterialsQuery
+from application.dto.query.page import DEFAULT_PAGE_LIMIT, PageQuery
 from litestar import Controller, delete, get, post, put
 from litestar.di import Provide
 from ports.http.web.v1.providers.di_use_cases import (
@@ -13,6 +14,7 @@ from ports.http.web.v1.schemas.material import (
     ReadMaterialSchema,
     UpdateMaterialSchema,
 )
+from ports.http.web.v1.schemas.page import ReadPageSchema
 
 
 class MaterialController(Controller):
@@ -21,7 +23,7 @@ class MaterialController(Controller):
 
     dependencies = {"use_cases": Provide(di_material_use_cases, sync_to_thread=True)}
 
-    @get("/{material_id:uuid}")
+    @get("/{material_id:uuid}", opt={"etag": "material"})
     async def get_material(
         self, material_id: UUID, use_cases: MaterialUseCases
     ) -> ReadMaterialSchema:
@@ -30,13 +32,23 @@ class MaterialController(Controller):
         )
         return ReadMaterialSchema.from_app(material)
 
-    @get()
+    @get(opt={"etag": "material"})
     async def get_materials(
-        self, search_by_name: str | None, use_cases: MaterialUseCases
-    ) -> list[ReadMaterialSchema]:
-        query = MaterialsQuery(search_by_name=search_by_name)
-        materials = await use_cases.get_all.execute(query)
-        return [ReadMaterialSchema.from_app(material) for material in materials]
+        self,
+        search_by_name: str | None,
+        cursor: str | None,
+        use_cases: MaterialUseCases,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> ReadPageSchema[ReadMaterialSchema]:
+        query = MaterialsQuery(
+            search_by_name=search_by_name,
+            page=PageQuery(limit=limit, cursor=cursor),
+        )
+        page = await use_cases.get_all.execute(query)
+        return ReadPageSchema(
+            items=[ReadMaterialSchema.from_app(material) for material in page.items],
+            next_cursor=page.next_cursor,
+        )
 
     @post()
     async def create_material(
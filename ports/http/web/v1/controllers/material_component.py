@@ -5,6 +5,7 @@ from application.dto.query.material_component import (
     MaterialComponentQuery,
     MaterialComponentsQuery,
 )
+from application.dto.query.page import DEFAULT_PAGE_LIMIT, PageQuery
 from litestar import Controller, delete, get, post, put
 from litestar.di import Provide
 from ports.http.web.v1.providers.di_use_cases import (
@@ -16,6 +17,7 @@ from ports.http.web.v1.schemas.material_component import (
     ReadMaterialComponentSchema,
     UpdateMaterialComponentSchema,
 )
+from ports.http.web.v1.schemas.page import ReadPageSchema
 
 
 class MaterialComponentController(Controller):
@@ -26,7 +28,7 @@ class MaterialComponentController(Controller):
         "use_cases": Provide(di_material_component_use_cases, sync_to_thread=True)
     }
 
-    @get("/{material_id:uuid}")
+    @get("/{material_id:uuid}", opt={"etag": "material_component"})
     async def get_material(
         self, material_id: UUID, use_cases: MaterialComponentUseCases
     ) -> ReadMaterialComponentSchema:
@@ -35,15 +37,26 @@ class MaterialComponentController(Controller):
         )
         return ReadMaterialComponentSchema.from_app(feature)
 
-    @get()
+    @get(opt={"etag": "material_component"})
     async def get_materials(
-        self, search_by_name: str | None, use_cases: MaterialComponentUseCases
-    ) -> list[ReadMaterialComponentSchema]:
-        query = MaterialComponentsQuery(search_by_name=search_by_name)
-        materials = await use_cases.get_all.execute(query)
-        return [
-            ReadMaterialComponentSchema.from_app(material) for material in materials
-        ]
+        self,
+        search_by_name: str | None,
+        cursor: str | None,
+        use_cases: MaterialComponentUseCases,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> ReadPageSchema[ReadMaterialComponentSchema]:
+        query = MaterialComponentsQuery(
+            search_by_name=search_by_name,
+            page=PageQuery(limit=limit, cursor=cursor),
+        )
+        page = await use_cases.get_all.execute(query)
+        return ReadPageSchema(
+            items=[
+                ReadMaterialComponentSchema.from_app(material)
+                for material in page.items
+            ],
+            next_cursor=page.next_cursor,
+        )
 
     @post()
     async def create_material(
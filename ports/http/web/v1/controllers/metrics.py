@@ -0,0 +1,29 @@
+import os
+from hmac import compare_digest
+
+import di
+from config import config
+from litestar import get
+from litestar.connection import ASGIConnection
+from litestar.exceptions import NotAuthorizedException
+from litestar.handlers.base import BaseRouteHandler
+from ports.http.web.v1.schemas.metrics import ReadPoolMetricsSchema
+
+
+def metrics_token_guard(connection: ASGIConnection, _: BaseRouteHandler) -> None:
+    token = connection.headers.get("Authorization", "").removeprefix("Bearer ")
+    if not config.METRICS_TOKEN or not compare_digest(token, config.METRICS_TOKEN):
+        raise NotAuthorizedException()
+
+
+@get(
+    "/metrics/db-pool",
+    tags=["metrics"],
+    guards=[metrics_token_guard],
+    description=(
+        "Пул соединений процесса, обработавшего запрос; при WEB_WORKERS > 1 "
+        "у каждого воркера свой пул, и ответы разных воркеров не суммируются"
+    ),
+)
+async def get_db_pool_metrics() -> ReadPoolMetricsSchema:
+    return ReadPoolMetricsSchema.from_app(di.db_helper.pool_metrics(), os.getpid())
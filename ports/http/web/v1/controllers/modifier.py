@@ -1,7 +1,11 @@
-from litestar import get
+from litestar import Request, Response, get
+from litestar.openapi import ResponseSpec
+from ports.http.web.static import StaticJSON
 from ports.http.web.v1.schemas.modifier import ReadModifierSchema
 
+MODIFIERS = StaticJSON(ReadModifierSchema.from_app())
 
-@get("/modifiers", tags=["modifier"])
-async def get_modifiers() -> ReadModifierSchema:
-    return ReadModifierSchema.from_app()
+
+@get("/modifiers", tags=["modifier"], responses={200: ResponseSpec(ReadModifierSchema)})
+async def get_modifiers(request: Request) -> Response[bytes]:
+    return MODIFIERS.response(request)
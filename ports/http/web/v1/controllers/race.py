@@ -1,10 +1,12 @@
 from uuid import UUID, uuid4
 
 from application.dto.command.race import DeleteRaceCommand
+from application.dto.query.page import DEFAULT_PAGE_LIMIT, PageQuery
 from application.dto.query.race import RaceQuery, RacesQuery
 from litestar import Controller, delete, get, post, put
 from litestar.di import Provide
 from ports.http.web.v1.providers.di_use_cases import RaceUseCases, di_race_use_cases
+from ports.http.web.v1.schemas.page import ReadPageSchema
 from ports.http.web.v1.schemas.race import (
     CreateRaceSchema,
     ReadRaceSchema,
@@ -18,18 +20,28 @@ class RaceController(Controller):
 
     dependencies = {"use_cases": Provide(di_race_use_cases, sync_to_thread=True)}
 
-    @get("/{race_id:uuid}")
+    @get("/{race_id:uuid}", opt={"etag": "race"})
     async def get_race(self, race_id: UUID, use_cases: RaceUseCases) -> ReadRaceSchema:
         race = await use_cases.get_one.execute(RaceQuery(race_id=race_id))
         return ReadRaceSchema.from_app(race)
 
-    @get()
+    @get(opt={"etag": "race"})
     async def get_races(
-        self, search_by_name: str | None, use_cases: RaceUseCases
-    ) -> list[ReadRaceSchema]:
-        query = RacesQuery(search_by_name=search_by_name)
-        races = await use_cases.get_all.execute(query)
-        return [ReadRaceSchema.from_app(race) for race in races]
+        self,
+        search_by_name: str | None,
+        cursor: str | None,
+        use_cases: RaceUseCases,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> ReadPageSchema[ReadRaceSchema]:
+        query = RacesQuery(
+            search_by_name=search_by_name,
+            page=PageQuery(limit=limit, cursor=cursor),
+        )
+        page = await use_cases.get_all.execute(query)
+        return ReadPageSchema(
+            items=[ReadRaceSchema.from_app(race) for race in page.items],
+            next_cursor=page.next_cursor,
+        )
 
     @post()
     async def create_race(
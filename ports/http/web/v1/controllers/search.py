@@ -0,0 +1,25 @@
+from application.dto.query.search import DEFAULT_SEARCH_LIMIT, SearchQuery
+from litestar import Controller, get
+from litestar.di import Provide
+from ports.http.web.v1.providers.di_use_cases import (
+    SearchUseCases,
+    di_search_use_cases,
+)
+from ports.http.web.v1.schemas.search import ReadSearchHitSchema
+
+
+class SearchController(Controller):
+    path = "/search"
+    tags = ["search"]
+
+    dependencies = {"use_cases": Provide(di_search_use_cases, sync_to_thread=True)}
+
+    @get()
+    async def search(
+        self,
+        search: str,
+        use_cases: SearchUseCases,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+    ) -> list[ReadSearchHitSchema]:
+        hits = await use_cases.search.execute(SearchQuery(search=search, limit=limit))
+        return [ReadSearchHitSchema.from_app(hit) for hit in hits]
@@ -1,7 +1,11 @@
-from litestar import get
+from litestar import Request, Response, get
+from litestar.openapi import ResponseSpec
+from ports.http.web.static import StaticJSON
 from ports.http.web.v1.schemas.skill import ReadSkillSchema
 
+SKILLS = StaticJSON(ReadSkillSchema.from_app())
 
-@get("/skills", tags=["skill"])
-async def get_skills() -> ReadSkillSchema:
-    return ReadSkillSchema.from_app()
+
+@get("/skills", tags=["skill"], responses={200: ResponseSpec(ReadSkillSchema)})
+async def get_skills(request: Request) -> Response[bytes]:
+    return SKILLS.response(request)
@@ -1,10 +1,12 @@
 from uuid import UUID, uuid4
 
 from application.dto.command.source import DeleteSourceCommand
+from application.dto.query.page import DEFAULT_PAGE_LIMIT, PageQuery
 from application.dto.query.source import SourceQuery, SourcesQuery
 from litestar import Controller, delete, get, post, put
 from litestar.di import Provide
 from ports.http.web.v1.providers.di_use_cases import SourceUseCases, di_source_use_cases
+from ports.http.web.v1.schemas.page import ReadPageSchema
 from ports.http.web.v1.schemas.source import (
     CreateSourceSchema,
     ReadSourceSchema,
@@ -18,20 +20,30 @@ class SourceController(Controller):
 
     dependencies = {"use_cases": Provide(di_source_use_cases, sync_to_thread=True)}
 
-    @get("/{source_id:uuid}")
+    @get("/{source_id:uuid}", opt={"etag": "source"})
     async def get_source(
         self, source_id: UUID, use_cases: SourceUseCases
     ) -> ReadSourceSchema:
         source = await use_cases.get_one.execute(SourceQuery(source_id=source_id))
         return ReadSourceSchema.from_app(source)
 
-    @get()
+    @get(opt={"etag": "source"})
     async def get_sources(
-        self, search_by_name: str | None, use_cases: SourceUseCases
-    ) -> list[ReadSourceSchema]:
-        query = SourcesQuery(search_by_name=search_by_name)
-        sources = await use_cases.get_all.execute(query)
-        return [ReadSourceSchema.from_app(source) for source in sources]
+        self,
+        search_by_name: str | None,
+        cursor: str | None,
+        use_cases: SourceUseCases,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> ReadPageSchema[ReadSourceSchema]:
+        query = SourcesQuery(
+            search_by_name=search_by_name,
+            page=PageQuery(limit=limit, cursor=cursor),
+        )
+        page = await use_cases.get_all.execute(query)
+        return ReadPageSchema(
+            items=[ReadSourceSchema.from_app(source) for source in page.items],
+            next_cursor=page.next_cursor,
+        )
 
     @post()
     async def create_source(
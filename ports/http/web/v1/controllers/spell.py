@@ -1,17 +1,25 @@
+from typing import Literal
 from uuid import UUID, uuid4
 
-from application.dto.command.spell import DeleteSpellCommand
+from application.dto.command.spell import DeleteSpellCommand, ImportSpellsCommand
+from application.dto.query.page import DEFAULT_PAGE_LIMIT, PageQuery
 from application.dto.query.spell import SpellQuery, SpellsQuery
-from litestar import Controller, delete, get, post, put
+from litestar import Controller, Request, Response, delete, get, post, put
 from litestar.di import Provide
+from litestar.openapi import ResponseSpec
+from ports.http.web.static import StaticJSON
 from ports.http.web.v1.providers.di_use_cases import SpellUseCases, di_spell_use_cases
+from ports.http.web.v1.schemas.page import ReadPageSchema
 from ports.http.web.v1.schemas.spell import (
     CreateSpellSchema,
     ReadSpellSchema,
     ReadSpellSchoolSchema,
+    ReadSpellSummarySchema,
     UpdateSpellSchema,
 )
 
+SCHOOLS = StaticJSON(ReadSpellSchoolSchema.from_domain())
+
 
 class SpellController(Controller):
     path = "/spells"
@@ -19,14 +27,14 @@ class SpellController(Controller):
 
     dependencies = {"use_cases": Provide(di_spell_use_cases, sync_to_thread=True)}
 
-    @get("/{spell_id:uuid}")
+    @get("/{spell_id:uuid}", opt={"etag": "spell"})
     async def get_spell(
         self, spell_id: UUID, use_cases: SpellUseCases
     ) -> ReadSpellSchema:
         spell = await use_cases.get_one.execute(SpellQuery(spell_id=spell_id))
         return ReadSpellSchema.from_app(spell)
 
-    @get()
+    @get(opt={"etag": "spell"})
     async def get_spells(
         self,
         search_by_name: str | None,
@@ -42,8 +50,11 @@ class SpellController(Controller):
         filter_by_concentration: bool | None,
         filter_by_ritual: bool | None,
         filter_by_source_ids: list[UUID] | None,
+        cursor: str | None,
+        fields: Literal["summary"] | None,
         use_cases: SpellUseCases,
-    ) -> list[ReadSpellSchema]:
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> ReadPageSchema[ReadSpellSchema] | ReadPageSchema[ReadSpellSummarySchema]:
         query = SpellsQuery(
             search_by_name=search_by_name,
             filter_by_class_ids=filter_by_class_ids,
@@ -58,9 +69,21 @@ class SpellController(Controller):
             filter_by_concentration=filter_by_concentration,
             filter_by_ritual=filter_by_ritual,
             filter_by_source_ids=filter_by_source_ids,
+            page=PageQuery(limit=limit, cursor=cursor),
+        )
+        if fields == "summary":
+            summaries = await use_cases.get_summaries.execute(query)
+            return ReadPageSchema(
+                items=[
+                    ReadSpellSummarySchema.from_app(spell) for spell in summaries.items
+                ],
+                next_cursor=summaries.next_cursor,
+            )
+        page = await use_cases.get_all.execute(query)
+        return ReadPageSchema(
+            items=[ReadSpellSchema.from_app(spell) for spell in page.items],
+            next_cursor=page.next_cursor,
         )
-        spells = await use_cases.get_all.execute(query)
-        return [ReadSpellSchema.from_app(spell) for spell in spells]
 
     @post()
     async def create_spell(
@@ -68,6 +91,18 @@ class SpellController(Controller):
     ) -> UUID:
         return await use_cases.create.execute(data.to_command(uuid4()))
 
+    @post("/import")
+    async def import_spells(
+        self, data: list[CreateSpellSchema], use_cases: SpellUseCases
+    ) -> list[UUID]:
+        user_id = uuid4()
+        return await use_cases.import_spells.execute(
+            ImportSpellsCommand(
+                user_id=user_id,
+                spells=[spell.to_command(user_id) for spell in data],
+            )
+        )
+
     @put("/{spell_id:uuid}")
     async def update_spell(
         self,
@@ -82,6 +117,6 @@ class SpellController(Controller):
         command = DeleteSpellCommand(user_id=uuid4(), spell_id=spell_id)
         await use_cases.delete.execute(command)
 
-    @get("/schools")
-    async def get_schools(self) -> ReadSpellSchoolSchema:
-        return ReadSpellSchoolSchema.from_domain()
+    @get("/schools", responses={200: ResponseSpec(ReadSpellSchoolSchema)})
+    async def get_schools(self, request: Request) -> Response[bytes]:
+        return SCHOOLS.response(request)
@@ -1,6 +1,7 @@
 from uuid import UUID, uuid4
 
 from application.dto.command.subclass_feature import DeleteSubclassFeatureCommand
+from application.dto.query.page import DEFAULT_PAGE_LIMIT, PageQuery
 from application.dto.query.subclass_feature import (
     SubclassFeatureQuery,
     SubclassFeaturesQuery,
@@ -11,6 +12,7 @@ from ports.http.web.v1.providers.di_use_cases import (
     SubclassFeatureUseCases,
     di_subclass_feature_use_cases,
 )
+from ports.http.web.v1.schemas.page import ReadPageSchema
 from ports.http.web.v1.schemas.subclass_feature import (
     CreateSubclassFeatureSchema,
     ReadSubclassFeatureSchema,
@@ -26,7 +28,7 @@ class SubclassFeatureController(Controller):
         "use_cases": Provide(di_subclass_feature_use_cases, sync_to_thread=True)
     }
 
-    @get("/{feature_id:uuid}")
+    @get("/{feature_id:uuid}", opt={"etag": "subclass_feature"})
     async def get_feature(
         self, feature_id: UUID, use_cases: SubclassFeatureUseCases
     ) -> ReadSubclassFeatureSchema:
@@ -35,13 +37,25 @@ class SubclassFeatureController(Controller):
         )
         return ReadSubclassFeatureSchema.from_app(feature)
 
-    @get()
+    @get(opt={"etag": "subclass_feature"})
     async def get_features(
-        self, filter_by_subclass_id: UUID, use_cases: SubclassFeatureUseCases
-    ) -> list[ReadSubclassFeatureSchema]:
-        query = SubclassFeaturesQuery(filter_by_subclass_id=filter_by_subclass_id)
-        features = await use_cases.get_all.execute(query)
-        return [ReadSubclassFeatureSchema.from_app(feature) for feature in features]
+        self,
+        filter_by_subclass_id: UUID,
+        cursor: str | None,
+        use_cases: SubclassFeatureUseCases,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> ReadPageSchema[ReadSubclassFeatureSchema]:
+        query = SubclassFeaturesQuery(
+            filter_by_subclass_id=filter_by_subclass_id,
+            page=PageQuery(limit=limit, cursor=cursor),
+        )
+        page = await use_cases.get_all.execute(query)
+        return ReadPageSchema(
+            items=[
+                ReadSubclassFeatureSchema.from_app(feature) for feature in page.items
+            ],
+            next_cursor=page.next_cursor,
+        )
 
     @post()
     async def create_feature(
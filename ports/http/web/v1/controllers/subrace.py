@@ -1,6 +1,7 @@
 from uuid import UUID, uuid4
 
 from application.dto.command.subrace import DeleteSubraceCommand
+from application.dto.query.page import DEFAULT_PAGE_LIMIT, PageQuery
 from application.dto.query.subrace import SubraceQuery, SubracesQuery
 from litestar import Controller, delete, get, post, put
 from litestar.di import Provide
@@ -8,6 +9,7 @@ from ports.http.web.v1.providers.di_use_cases import (
     SubraceUseCases,
     di_subrace_use_cases,
 )
+from ports.http.web.v1.schemas.page import ReadPageSchema
 from ports.http.web.v1.schemas.subrace import (
     CreateSubraceSchema,
     ReadSubraceSchema,
@@ -21,20 +23,30 @@ class SubraceController(Controller):
 
     dependencies = {"use_cases": Provide(di_subrace_use_cases, sync_to_thread=True)}
 
-    @get("/{subrace_id:uuid}")
+    @get("/{subrace_id:uuid}", opt={"etag": "subrace"})
     async def get_subrace(
         self, subrace_id: UUID, use_cases: SubraceUseCases
     ) -> ReadSubraceSchema:
         subrace = await use_cases.get_one.execute(SubraceQuery(subrace_id=subrace_id))
         return ReadSubraceSchema.from_app(subrace)
 
-    @get()
+    @get(opt={"etag": "subrace"})
     async def get_subraces(
-        self, search_by_name: str | None, use_cases: SubraceUseCases
-    ) -> list[ReadSubraceSchema]:
-        query = SubracesQuery(search_by_name=search_by_name)
-        subraces = await use_cases.get_all.execute(query)
-        return [ReadSubraceSchema.from_app(subrace) for subrace in subraces]
+        self,
+        search_by_name: str | None,
+        cursor: str | None,
+        use_cases: SubraceUseCases,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> ReadPageSchema[ReadSubraceSchema]:
+        query = SubracesQuery(
+            search_by_name=search_by_name,
+            page=PageQuery(limit=limit, cursor=cursor),
+        )
+        page = await use_cases.get_all.execute(query)
+        return ReadPageSchema(
+            items=[ReadSubraceSchema.from_app(subrace) for subrace in page.items],
+            next_cursor=page.next_cursor,
+        )
 
     @post()
     async def create_subrace(
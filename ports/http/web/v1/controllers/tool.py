@@ -1,10 +1,14 @@
 from uuid import UUID, uuid4
 
 from application.dto.command.tool import DeleteToolCommand
+from application.dto.query.page import DEFAULT_PAGE_LIMIT, PageQuery
 from application.dto.query.tool import ToolQuery, ToolsQuery
-from litestar import Controller, delete, get, post, put
+from litestar import Controller, Request, Response, delete, get, post, put
 from litestar.di import Provide
+from litestar.openapi import ResponseSpec
+from ports.http.web.static import StaticJSON
 from ports.http.web.v1.providers.di_use_cases import ToolUseCases, di_tool_use_cases
+from ports.http.web.v1.schemas.page import ReadPageSchema
 from ports.http.web.v1.schemas.tool import (
     CreateToolSchema,
     ReadToolSchema,
@@ -12,6 +16,8 @@ from ports.http.web.v1.schemas.tool import (
     UpdateToolSchema,
 )
 
+TOOL_TYPES = StaticJSON(ReadToolTypeSchema.from_domain())
+
 
 class ToolController(Controller):
     path = "/tools"
@@ -19,18 +25,28 @@ class ToolController(Controller):
 
     dependencies = {"use_cases": Provide(di_tool_use_cases, sync_to_thread=True)}
 
-    @get("/{tool_id:uuid}")
+    @get("/{tool_id:uuid}", opt={"etag": "tool"})
     async def get_tool(self, tool_id: UUID, use_cases: ToolUseCases) -> ReadToolSchema:
         tool = await use_cases.get_one.execute(ToolQuery(tool_id=tool_id))
         return ReadToolSchema.from_app(tool)
 
-    @get()
+    @get(opt={"etag": "tool"})
     async def get_tools(
-        self, search_by_name: str | None, use_cases: ToolUseCases
-    ) -> list[ReadToolSchema]:
-        query = ToolsQuery(search_by_name=search_by_name)
-        tools = await use_cases.get_all.execute(query)
-        return [ReadToolSchema.from_app(tool) for tool in tools]
+        self,
+        search_by_name: str | None,
+        cursor: str | None,
+        use_cases: ToolUseCases,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> ReadPageSchema[ReadToolSchema]:
+        query = ToolsQuery(
+            search_by_name=search_by_name,
+            page=PageQuery(limit=limit, cursor=cursor),
+        )
+        page = await use_cases.get_all.execute(query)
+        return ReadPageSchema(
+            items=[ReadToolSchema.from_app(tool) for tool in page.items],
+            next_cursor=page.next_cursor,
+        )
 
     @post()
     async def create_tool(
@@ -52,6 +68,6 @@ class ToolController(Controller):
         command = DeleteToolCommand(user_id=uuid4(), tool_id=tool_id)
         await use_cases.delete.execute(command)
 
-    @get("/types")
-    async def get_tool_types(self) -> ReadToolTypeSchema:
-        return ReadToolTypeSchema.from_domain()
+    @get("/types", responses={200: ResponseSpec(ReadToolTypeSchema)})
+    async def get_tool_types(self, request: Request) -> Response[bytes]:
+        return TOOL_TYPES.response(request)
@@ -1,10 +1,14 @@
 from uuid import UUID, uuid4
 
 from application.dto.command.weapon import DeleteWeaponCommand
+from application.dto.query.page import DEFAULT_PAGE_LIMIT, PageQuery
 from application.dto.query.weapon import WeaponQuery, WeaponsQuery
-from litestar import Controller, delete, get, post, put
+from litestar import Controller, Request, Response, delete, get, post, put
 from litestar.di import Provide
+from litestar.openapi import ResponseSpec
+from ports.http.web.static import StaticJSON
 from ports.http.web.v1.providers.di_use_cases import WeaponUseCases, di_weapon_use_cases
+from ports.http.web.v1.schemas.page import ReadPageSchema
 from ports.http.web.v1.schemas.weapon import (
     CreateWeaponSchema,
     ReadWeaponSchema,
@@ -12,6 +16,8 @@ from ports.http.web.v1.schemas.weapon import (
 )
 from ports.http.web.v1.schemas.weapon_kind import ReadWeaponTypeSchema
 
+WEAPON_TYPES = StaticJSON(ReadWeaponTypeSchema.from_domain())
+
 
 class WeaponController(Controller):
     path = "/weapons"
@@ -19,14 +25,14 @@ class WeaponController(Controller):
 
     dependencies = {"use_cases": Provide(di_weapon_use_cases, sync_to_thread=True)}
 
-    @get("/{weapon_id:uuid}")
+    @get("/{weapon_id:uuid}", opt={"etag": "weapon"})
     async def get_weapon(
         self, weapon_id: UUID, use_cases: WeaponUseCases
     ) -> ReadWeaponSchema:
         weapon = await use_cases.get_one.execute(WeaponQuery(weapon_id=weapon_id))
         return ReadWeaponSchema.from_app(weapon)
 
-    @get()
+    @get(opt={"etag": "weapon"})
     async def get_weapons(
         self,
         search_by_name: str | None,
@@ -34,17 +40,23 @@ class WeaponController(Controller):
         filter_by_damage_types: list[str] | None,
         filter_by_property_ids: list[UUID] | None,
         filter_by_material_ids: list[UUID] | None,
+        cursor: str | None,
         use_cases: WeaponUseCases,
-    ) -> list[ReadWeaponSchema]:
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> ReadPageSchema[ReadWeaponSchema]:
         query = WeaponsQuery(
             search_by_name=search_by_name,
             filter_by_kind_ids=filter_by_kind_ids,
             filter_by_damage_types=filter_by_damage_types,
             filter_by_property_ids=filter_by_property_ids,
             filter_by_material_ids=filter_by_material_ids,
+            page=PageQuery(limit=limit, cursor=cursor),
+        )
+        page = await use_cases.get_all.execute(query)
+        return ReadPageSchema(
+            items=[ReadWeaponSchema.from_app(weapon) for weapon in page.items],
+            next_cursor=page.next_cursor,
         )
-        weapons = await use_cases.get_all.execute(query)
-        return [ReadWeaponSchema.from_app(weapon) for weapon in weapons]
 
     @post()
     async def create_weapon(
@@ -66,6 +78,6 @@ class WeaponController(Controller):
         command = DeleteWeaponCommand(user_id=uuid4(), weapon_id=weapon_id)
         await use_cases.delete.execute(command)
 
-    @get("/types")
-    async def get_weapon_types(self) -> ReadWeaponTypeSchema:
-        return ReadWeaponTypeSchema.from_domain()
+    @get("/types", responses={200: ResponseSpec(ReadWeaponTypeSchema)})
+    async def get_weapon_types(self, request: Request) -> Response[bytes]:
+        return WEAPON_TYPES.response(request)
@@ -1,6 +1,7 @@
 from uuid import UUID, uuid4
 
 from application.dto.command.weapon_kind import DeleteWeaponKindCommand
+from application.dto.query.page import DEFAULT_PAGE_LIMIT, PageQuery
 from application.dto.query.weapon_kind import WeaponKindQuery, WeaponKindsQuery
 from litestar import Controller, delete, get, post, put
 from litestar.di import Provide
@@ -8,6 +9,7 @@ from ports.http.web.v1.providers.di_use_cases import (
     WeaponKindUseCases,
     di_weapon_kind_use_cases,
 )
+from ports.http.web.v1.schemas.page import ReadPageSchema
 from ports.http.web.v1.schemas.weapon_kind import (
     CreateWeaponKindSchema,
     ReadWeaponKindSchema,
@@ -21,7 +23,7 @@ class WeaponKindController(Controller):
 
     dependencies = {"use_cases": Provide(di_weapon_kind_use_cases, sync_to_thread=True)}
 
-    @get("/{weapon_kind_id:uuid}")
+    @get("/{weapon_kind_id:uuid}", opt={"etag": "weapon_kind"})
     async def get_weapon_kind(
         self, weapon_kind_id: UUID, use_cases: WeaponKindUseCases
     ) -> ReadWeaponKindSchema:
@@ -30,20 +32,27 @@ class WeaponKindController(Controller):
         )
         return ReadWeaponKindSchema.from_app(weapon_kind)
 
-    @get()
+    @get(opt={"etag": "weapon_kind"})
     async def get_weapon_kinds(
         self,
         search_by_name: str | None,
         filter_by_types: list[str] | None,
+        cursor: str | None,
         use_cases: WeaponKindUseCases,
-    ) -> list[ReadWeaponKindSchema]:
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> ReadPageSchema[ReadWeaponKindSchema]:
         query = WeaponKindsQuery(
-            search_by_name=search_by_name, filter_by_types=filter_by_types
+            search_by_name=search_by_name,
+            filter_by_types=filter_by_types,
+            page=PageQuery(limit=limit, cursor=cursor),
+        )
+        page = await use_cases.get_all.execute(query)
+        return ReadPageSchema(
+            items=[
+                ReadWeaponKindSchema.from_app(weapon_kind) for weapon_kind in page.items
+            ],
+            next_cursor=page.next_cursor,
         )
-        weapon_kinds = await use_cases.get_all.execute(query)
-        return [
-            ReadWeaponKindSchema.from_app(weapon_kind) for weapon_kind in weapon_kinds
-        ]
 
     @post()
     async def create_weapon_kind(
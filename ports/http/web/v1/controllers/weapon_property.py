@@ -1,16 +1,20 @@
 from uuid import UUID, uuid4
 
 from application.dto.command.weapon_property import DeleteWeaponPropertyCommand
+from application.dto.query.page import DEFAULT_PAGE_LIMIT, PageQuery
 from application.dto.query.weapon_property import (
     WeaponPropertiesQuery,
     WeaponPropertyQuery,
 )
-from litestar import Controller, delete, get, post, put
+from litestar import Controller, Request, Response, delete, get, post, put
 from litestar.di import Provide
+from litestar.openapi import ResponseSpec
+from ports.http.web.static import StaticJSON
 from ports.http.web.v1.providers.di_use_cases import (
     WeaponPropertyUseCases,
     di_weapon_property_use_cases,
 )
+from ports.http.web.v1.schemas.page import ReadPageSchema
 from ports.http.web.v1.schemas.weapon_property import (
     CreateWeaponPropertySchema,
     ReadWeaponPropertyNameSchema,
@@ -18,6 +22,8 @@ from ports.http.web.v1.schemas.weapon_property import (
     UpdateWeaponPropertySchema,
 )
 
+WEAPON_PROPERTY_NAMES = StaticJSON(ReadWeaponPropertyNameSchema.from_domain())
+
 
 class WeaponPropertyController(Controller):
     path = "/weapon-properties"
@@ -27,7 +33,7 @@ class WeaponPropertyController(Controller):
         "use_cases": Provide(di_weapon_property_use_cases, sync_to_thread=True)
     }
 
-    @get("/{weapon_property_id:uuid}")
+    @get("/{weapon_property_id:uuid}", opt={"etag": "weapon_property"})
     async def get_weapon_property(
         self, weapon_property_id: UUID, use_cases: WeaponPropertyUseCases
     ) -> ReadWeaponPropertySchema:
@@ -36,16 +42,26 @@ class WeaponPropertyController(Controller):
         )
         return ReadWeaponPropertySchema.from_app(weapon_property)
 
-    @get()
+    @get(opt={"etag": "weapon_property"})
     async def get_weapon_properties(
-        self, search_by_name: str | None, use_cases: WeaponPropertyUseCases
-    ) -> list[ReadWeaponPropertySchema]:
-        query = WeaponPropertiesQuery(search_by_name=search_by_name)
-        weapon_properties = await use_cases.get_all.execute(query)
-        return [
-            ReadWeaponPropertySchema.from_app(weapon_property)
-            for weapon_property in weapon_properties
-        ]
+        self,
+        search_by_name: str | None,
+        cursor: str | None,
+        use_cases: WeaponPropertyUseCases,
+        limit: int = DEFAULT_PAGE_LIMIT,
+    ) -> ReadPageSchema[ReadWeaponPropertySchema]:
+        query = WeaponPropertiesQuery(
+            search_by_name=search_by_name,
+            page=PageQuery(limit=limit, cursor=cursor),
+        )
+        page = await use_cases.get_all.execute(query)
+        return ReadPageSchema(
+            items=[
+                ReadWeaponPropertySchema.from_app(weapon_property)
+                for weapon_property in page.items
+            ],
+            next_cursor=page.next_cursor,
+        )
 
     @post()
     async def create_weapon_property(
@@ -73,6 +89,6 @@ class WeaponPropertyController(Controller):
         )
         await use_cases.delete.execute(command)
 
-    @get("/names")
-    async def get_weapon_property_names(self) -> ReadWeaponPropertyNameSchema:
-        return ReadWeaponPropertyNameSchema.from_domain()
+    @get("/names", responses={200: ResponseSpec(ReadWeaponPropertyNameSchema)})
+    async def get_weapon_property_names(self, request: Request) -> Response[bytes]:
+        return WEAPON_PROPERTY_NAMES.response(request)
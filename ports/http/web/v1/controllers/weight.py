@@ -1,7 +1,15 @@
-from litestar import get
+from litestar import Request, Response, get
+from litestar.openapi import ResponseSpec
+from ports.http.web.static import StaticJSON
 from ports.http.web.v1.schemas.weight import ReadWeightUnitSchema
 
+WEIGHT_UNITS = StaticJSON(ReadWeightUnitSchema.from_app())
 
-@get("/weights/units", tags=["weight"])
-async def get_weight_units() -> ReadWeightUnitSchema:
-    return ReadWeightUnitSchema.from_app()
+
+@get(
+    "/weights/units",
+    tags=["weight"],
+    responses={200: ResponseSpec(ReadWeightUnitSchema)},
+)
+async def get_weight_units(request: Request) -> Response[bytes]:
+    return WEIGHT_UNITS.response(request)
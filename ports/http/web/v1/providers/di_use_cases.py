@@ -4,16 +4,19 @@ from di import (
     ClassFeatureUseCases,
     ClassLevelUseCases,
     ClassUseCases,
+    ExportUseCases,
     FeatUseCases,
     MaterialComponentUseCases,
     MaterialUseCases,
     RaceUseCases,
+    SearchUseCases,
     SourceUseCases,
     SpellUseCases,
     SubclassFeatureUseCases,
     SubclassUseCases,
     SubraceUseCases,
     ToolUseCases,
+    VersionUseCases,
     WeaponKindUseCases,
     WeaponPropertyUseCases,
     WeaponUseCases,
@@ -24,16 +27,19 @@ __all__ = [
     "ClassFeatureUseCases",
     "ClassLevelUseCases",
     "ClassUseCases",
+    "ExportUseCases",
     "FeatUseCases",
     "MaterialComponentUseCases",
     "MaterialUseCases",
     "RaceUseCases",
+    "SearchUseCases",
     "SourceUseCases",
     "SpellUseCases",
     "SubclassFeatureUseCases",
     "SubclassUseCases",
     "SubraceUseCases",
     "ToolUseCases",
+    "VersionUseCases",
     "WeaponKindUseCases",
     "WeaponPropertyUseCases",
     "WeaponUseCases",
@@ -44,15 +50,18 @@ __all__ = [
     "di_class_level_use_cases",
     "di_creature_size_use_cases",
     "di_creature_type_use_cases",
+    "di_export_use_cases",
     "di_feat_use_cases",
     "di_material_use_cases",
     "di_material_component_use_cases",
     "di_race_use_cases",
+    "di_search_use_cases",
     "di_source_use_cases",
     "di_spell_use_cases",
     "di_subclass_feature_use_cases",
     "di_subrace_use_cases",
     "di_tool_use_cases",
+    "di_version_use_cases",
     "di_weapon_use_cases",
     "di_weapon_kind_use_cases",
     "di_weapon_property_use_cases",
@@ -79,6 +88,10 @@ def di_class_level_use_cases() -> di.ClassLevelUseCases:
     return di.class_level_use_cases
 
 
+def di_export_use_cases() -> di.ExportUseCases:
+    return di.export_use_cases
+
+
 def di_feat_use_cases() -> di.FeatUseCases:
     return di.feat_use_cases
 
@@ -95,6 +108,10 @@ def di_race_use_cases() -> di.RaceUseCases:
     return di.race_use_cases
 
 
+def di_search_use_cases() -> di.SearchUseCases:
+    return di.search_use_cases
+
+
 def di_source_use_cases() -> di.SourceUseCases:
     return di.source_use_cases
 
@@ -115,6 +132,10 @@ def di_tool_use_cases() -> di.ToolUseCases:
     return di.tool_use_cases
 
 
+def di_version_use_cases() -> di.VersionUseCases:
+    return di.version_use_cases
+
+
 def di_weapon_use_cases() -> di.WeaponUseCases:
     return di.weapon_use_cases
 
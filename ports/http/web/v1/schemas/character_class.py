@@ -12,8 +12,14 @@ from application.dto.model.character_class import (
     AppClass,
     AppClassHits,
     AppClassProficiencies,
+    AppClassSummary,
 )
+from application.dto.model.class_sheet import AppClassSheet
+from ports.http.web.v1.schemas.character_subclass import ReadSubclassSchema
+from ports.http.web.v1.schemas.class_feature import ReadClassFeatureSchema
+from ports.http.web.v1.schemas.class_level import ReadClassLevelSchema
 from ports.http.web.v1.schemas.dice import DiceSchema
+from ports.http.web.v1.schemas.spell import ReadSpellSummarySchema
 
 
 @dataclass
@@ -102,6 +108,48 @@ class ReadClassSchema:
         )
 
 
+@dataclass
+class ReadClassSummarySchema:
+    class_id: UUID
+    name: str
+    hit_dice: DiceSchema
+    name_in_english: str
+    source_id: UUID
+
+    @staticmethod
+    def from_app(character_class: AppClassSummary) -> "ReadClassSummarySchema":
+        return ReadClassSummarySchema(
+            class_id=character_class.class_id,
+            name=character_class.name,
+            hit_dice=DiceSchema.from_app(character_class.hit_dice),
+            name_in_english=character_class.name_in_english,
+            source_id=character_class.source_id,
+        )
+
+
+@dataclass
+class ReadClassSheetSchema:
+    character_class: ReadClassSchema
+    levels: Sequence[ReadClassLevelSchema]
+    features: Sequence[ReadClassFeatureSchema]
+    subclasses: Sequence[ReadSubclassSchema]
+    spells: Sequence[ReadSpellSummarySchema]
+
+    @staticmethod
+    def from_app(sheet: AppClassSheet) -> "ReadClassSheetSchema":
+        return ReadClassSheetSchema(
+            character_class=ReadClassSchema.from_app(sheet.character_class),
+            levels=[ReadClassLevelSchema.from_app(level) for level in sheet.levels],
+            features=[
+                ReadClassFeatureSchema.from_app(feature) for feature in sheet.features
+            ],
+            subclasses=[
+                ReadSubclassSchema.from_app(subclass) for subclass in sheet.subclasses
+            ],
+            spells=[ReadSpellSummarySchema.from_app(spell) for spell in sheet.spells],
+        )
+
+
 @dataclass
 class CreateClassSchema:
     name: str
@@ -0,0 +1,20 @@
+from dataclasses import asdict, dataclass
+
+from adapters.repository.sql import PoolMetrics
+
+
+@dataclass
+class ReadPoolMetricsSchema:
+    pid: int
+    size: int
+    checked_out: int
+    overflow: int
+    checked_out_max: int
+    checkouts: int
+    timeouts: int
+    checkout_wait_total: float
+    checkout_wait_max: float
+
+    @staticmethod
+    def from_app(metrics: PoolMetrics, pid: int) -> "ReadPoolMetricsSchema":
+        return ReadPoolMetricsSchema(pid=pid, **asdict(metrics))
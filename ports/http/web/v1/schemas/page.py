@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from typing import Generic, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class ReadPageSchema(Generic[T]):
+    items: Sequence[T]
+    next_cursor: str | None
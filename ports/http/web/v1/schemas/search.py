@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from application.dto.model.search import AppSearchHit
+
+
+@dataclass
+class ReadSearchHitSchema:
+    entity_type: str
+    entity_id: UUID
+    name: str
+    name_in_english: str | None
+    rank: float
+
+    @staticmethod
+    def from_app(hit: AppSearchHit) -> "ReadSearchHitSchema":
+        return ReadSearchHitSchema(
+            entity_type=hit.entity_type,
+            entity_id=hit.entity_id,
+            name=hit.name,
+            name_in_english=hit.name_in_english,
+            rank=hit.rank,
+        )
@@ -10,7 +10,12 @@ from application.dto.command.spell import (
     SplashCommand,
     UpdateSpellCommand,
 )
-from application.dto.model.spell import AppSpell, AppSpellComponents, AppSpellSchool
+from application.dto.model.spell import (
+    AppSpell,
+    AppSpellComponents,
+    AppSpellSchool,
+    AppSpellSummary,
+)
 from ports.http.web.v1.schemas.game_time import GameTimeSchema
 from ports.http.web.v1.schemas.length import LengthSchema
 
@@ -141,6 +146,35 @@ class ReadSpellSchema:
         )
 
 
+@dataclass
+class ReadSpellSummarySchema:
+    spell_id: UUID
+    name: str
+    level: int
+    school: str
+    damage_type: str | None
+    casting_time: GameTimeSchema
+    concentration: bool
+    ritual: bool
+    name_in_english: str
+    source_id: UUID
+
+    @staticmethod
+    def from_app(spell: AppSpellSummary) -> "ReadSpellSummarySchema":
+        return ReadSpellSummarySchema(
+            spell_id=spell.spell_id,
+            name=spell.name,
+            level=spell.level,
+            school=spell.school,
+            damage_type=spell.damage_type,
+            casting_time=GameTimeSchema.from_app(spell.casting_time),
+            concentration=spell.concentration,
+            ritual=spell.ritual,
+            name_in_english=spell.name_in_english,
+            source_id=spell.source_id,
+        )
+
+
 @dataclass
 class CreateSpellSchema:
     class_ids: Sequence[UUID]
@@ -0,0 +1 @@
+docker compose exec -T backend .venv/bin/python -m scripts.import_spells - < "$1"
@@ -0,0 +1,48 @@
+import asyncio
+import json
+import sys
+from typing import Any, TextIO
+from uuid import uuid4
+
+import msgspec
+from application.dto.command.spell import ImportSpellsCommand
+from di import db_helper, spell_use_cases
+from domain.error import DomainError
+from ports.http.web.v1.schemas.spell import CreateSpellSchema
+
+
+def read_items(stream: TextIO) -> list[Any]:
+    # принимаем как JSON массив, так и NDJSON (по объекту на строку)
+    text = stream.read().strip()
+    if text.startswith("["):
+        return json.loads(text)
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+async def main(path: str) -> None:
+    if path == "-":
+        items = read_items(sys.stdin)
+    else:
+        with open(path, encoding="utf-8") as file:
+            items = read_items(file)
+    user_id = uuid4()
+    command = ImportSpellsCommand(
+        user_id=user_id,
+        spells=[
+            msgspec.convert(item, CreateSpellSchema).to_command(user_id)
+            for item in items
+        ],
+    )
+    try:
+        spell_ids = await spell_use_cases.import_spells.execute(command)
+    except DomainError as e:
+        sys.exit(e.msg)
+    finally:
+        await db_helper.engine.dispose()
+    print(f"импортировано заклинаний: {len(spell_ids)}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("usage: python -m scripts.import_spells FILE|-")
+    asyncio.run(main(sys.argv[1]))
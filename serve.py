@@ -0,0 +1,27 @@
+import sys
+
+import di
+from config import config
+from ports.http.web.app import app
+from ports.http.web.server import serve
+
+if __name__ == "__main__":
+    # с local шиной запись в одном воркере не сбрасывает кеши остальных;
+    # снимок справочника соседи догоняют сами, опрашивая версию в БД
+    if (
+        config.WEB_WORKERS > 1
+        and config.INVALIDATION_BUS != "postgres"
+        and config.REPOSITORY_BACKEND != "snapshot"
+    ):
+        sys.exit(
+            "WEB_WORKERS > 1 требует INVALIDATION_BUS=postgres "
+            "или REPOSITORY_BACKEND=snapshot"
+        )
+    serve(
+        app,
+        host=config.WEB_HOST,
+        port=config.WEB_PORT,
+        workers=config.WEB_WORKERS,
+        graceful_timeout=config.WEB_GRACEFUL_TIMEOUT,
+        after_fork=di.after_fork,
+    )
@@ -117,3 +117,19 @@ def weapon_property_repository():
 @pytest.fixture
 def user_repository():
     return repositories["user"]
+
+
+@pytest.fixture
+def search_repository():
+    return inmemory.InMemorySearchRepository(
+        spell_repository=repositories["spell"],
+        class_repository=repositories["class"],
+        subclass_repository=repositories["subclass"],
+        race_repository=repositories["race"],
+        subrace_repository=repositories["subrace"],
+        feat_repository=repositories["feat"],
+        armor_repository=repositories["armor"],
+        weapon_repository=repositories["weapon"],
+        tool_repository=repositories["tool"],
+        material_repository=repositories["material"],
+    )
@@ -19,6 +19,14 @@ from application.dto.query import (
     weapon_kind,
     weapon_property,
 )
+from application.dto.query.page import DEFAULT_PAGE_LIMIT, PageQuery
+from application.dto.query.search import DEFAULT_SEARCH_LIMIT, SearchQuery
+
+
+class PageQueryFactory:
+    @staticmethod
+    def query(limit: int = DEFAULT_PAGE_LIMIT, cursor: str | None = None) -> PageQuery:
+        return PageQuery(limit=limit, cursor=cursor)
 
 
 class ArmorQueryFactory:
@@ -31,11 +39,13 @@ class ArmorQueryFactory:
         search_by_name: str | None = None,
         filter_by_armor_types: list[str] | None = None,
         filter_by_material_ids: list[UUID] | None = None,
+        page: PageQuery = PageQuery(),
     ) -> armor.ArmorsQuery:
         return armor.ArmorsQuery(
             search_by_name=search_by_name,
             filter_by_armor_types=filter_by_armor_types,
             filter_by_material_ids=filter_by_material_ids,
+            page=page,
         )
 
 
@@ -45,8 +55,14 @@ class ClassQueryFactory:
         return character_class.ClassQuery(class_id=class_id)
 
     @staticmethod
-    def queries(search_by_name: str | None = None) -> character_class.ClassesQuery:
-        return character_class.ClassesQuery(search_by_name=search_by_name)
+    def queries(
+        search_by_name: str | None = None,
+        page: PageQuery = PageQuery(),
+    ) -> character_class.ClassesQuery:
+        return character_class.ClassesQuery(
+            search_by_name=search_by_name,
+            page=page,
+        )
 
 
 class SubclassQueryFactory:
@@ -57,8 +73,12 @@ class SubclassQueryFactory:
     @staticmethod
     def queries(
         filter_by_class_id: UUID | None = None,
+        page: PageQuery = PageQuery(),
     ) -> character_subclass.SubclassesQuery:
-        return character_subclass.SubclassesQuery(filter_by_class_id=filter_by_class_id)
+        return character_subclass.SubclassesQuery(
+            filter_by_class_id=filter_by_class_id,
+            page=page,
+        )
 
 
 class ClassFeatureQueryFactory:
@@ -69,8 +89,12 @@ class ClassFeatureQueryFactory:
     @staticmethod
     def queries(
         filter_by_class_id: UUID | None = None,
+        page: PageQuery = PageQuery(),
     ) -> class_feature.ClassFeaturesQuery:
-        return class_feature.ClassFeaturesQuery(filter_by_class_id=filter_by_class_id)
+        return class_feature.ClassFeaturesQuery(
+            filter_by_class_id=filter_by_class_id,
+            page=page,
+        )
 
 
 class ClassLevelQueryFactory:
@@ -79,8 +103,14 @@ class ClassLevelQueryFactory:
         return class_level.ClassLevelQuery(class_level_id=level_id)
 
     @staticmethod
-    def queries(filter_by_class_id: UUID | None = None) -> class_level.ClassLevelsQuery:
-        return class_level.ClassLevelsQuery(filter_by_class_id=filter_by_class_id)
+    def queries(
+        filter_by_class_id: UUID | None = None,
+        page: PageQuery = PageQuery(),
+    ) -> class_level.ClassLevelsQuery:
+        return class_level.ClassLevelsQuery(
+            filter_by_class_id=filter_by_class_id,
+            page=page,
+        )
 
 
 class FeatQueryFactory:
@@ -89,8 +119,14 @@ class FeatQueryFactory:
         return feat.FeatQuery(feat_id=feat_id)
 
     @staticmethod
-    def queries(search_by_name: str | None = None) -> feat.FeatsQuery:
-        return feat.FeatsQuery(search_by_name=search_by_name)
+    def queries(
+        search_by_name: str | None = None,
+        page: PageQuery = PageQuery(),
+    ) -> feat.FeatsQuery:
+        return feat.FeatsQuery(
+            search_by_name=search_by_name,
+            page=page,
+        )
 
 
 class MaterialQueryFactory:
@@ -99,8 +135,14 @@ class MaterialQueryFactory:
         return material.MaterialQuery(material_id=material_id)
 
     @staticmethod
-    def queries(search_by_name: str | None = None) -> material.MaterialsQuery:
-        return material.MaterialsQuery(search_by_name=search_by_name)
+    def queries(
+        search_by_name: str | None = None,
+        page: PageQuery = PageQuery(),
+    ) -> material.MaterialsQuery:
+        return material.MaterialsQuery(
+            search_by_name=search_by_name,
+            page=page,
+        )
 
 
 class MaterialComponentQueryFactory:
@@ -111,8 +153,12 @@ class MaterialComponentQueryFactory:
     @staticmethod
     def queries(
         search_by_name: str | None = None,
+        page: PageQuery = PageQuery(),
     ) -> material_component.MaterialComponentsQuery:
-        return material_component.MaterialComponentsQuery(search_by_name=search_by_name)
+        return material_component.MaterialComponentsQuery(
+            search_by_name=search_by_name,
+            page=page,
+        )
 
 
 class RaceQueryFactory:
@@ -121,8 +167,20 @@ class RaceQueryFactory:
         return race.RaceQuery(race_id=race_id)
 
     @staticmethod
-    def queries(search_by_name: str | None = None) -> race.RacesQuery:
-        return race.RacesQuery(search_by_name=search_by_name)
+    def queries(
+        search_by_name: str | None = None,
+        page: PageQuery = PageQuery(),
+    ) -> race.RacesQuery:
+        return race.RacesQuery(
+            search_by_name=search_by_name,
+            page=page,
+        )
+
+
+class SearchQueryFactory:
+    @staticmethod
+    def query(search: str = "name", limit: int = DEFAULT_SEARCH_LIMIT) -> SearchQuery:
+        return SearchQuery(search=search, limit=limit)
 
 
 class SourceQueryFactory:
@@ -131,8 +189,14 @@ class SourceQueryFactory:
         return source.SourceQuery(source_id=source_id)
 
     @staticmethod
-    def queries(search_by_name: str | None = None) -> source.SourcesQuery:
-        return source.SourcesQuery(search_by_name=search_by_name)
+    def queries(
+        search_by_name: str | None = None,
+        page: PageQuery = PageQuery(),
+    ) -> source.SourcesQuery:
+        return source.SourcesQuery(
+            search_by_name=search_by_name,
+            page=page,
+        )
 
 
 class SpellQueryFactory:
@@ -155,6 +219,7 @@ class SpellQueryFactory:
         filter_by_concentration: bool | None = None,
         filter_by_ritual: bool | None = None,
         filter_by_source_ids: list[UUID] | None = None,
+        page: PageQuery = PageQuery(),
     ) -> spell.SpellsQuery:
         return spell.SpellsQuery(
             search_by_name=search_by_name,
@@ -170,6 +235,7 @@ class SpellQueryFactory:
             filter_by_concentration=filter_by_concentration,
             filter_by_ritual=filter_by_ritual,
             filter_by_source_ids=filter_by_source_ids,
+            page=page,
         )
 
 
@@ -183,9 +249,11 @@ class SubclassFeatureQueryFactory:
     @staticmethod
     def queries(
         filter_by_subclass_id: UUID | None = None,
+        page: PageQuery = PageQuery(),
     ) -> subclass_feature.SubclassFeaturesQuery:
         return subclass_feature.SubclassFeaturesQuery(
-            filter_by_subclass_id=filter_by_subclass_id
+            filter_by_subclass_id=filter_by_subclass_id,
+            page=page,
         )
 
 
@@ -195,8 +263,14 @@ class SubraceQueryFactory:
         return subrace.SubraceQuery(subrace_id=subrace_id)
 
     @staticmethod
-    def queries(search_by_name: str | None = None) -> subrace.SubracesQuery:
-        return subrace.SubracesQuery(search_by_name=search_by_name)
+    def queries(
+        search_by_name: str | None = None,
+        page: PageQuery = PageQuery(),
+    ) -> subrace.SubracesQuery:
+        return subrace.SubracesQuery(
+            search_by_name=search_by_name,
+            page=page,
+        )
 
 
 class ToolQueryFactory:
@@ -205,8 +279,14 @@ class ToolQueryFactory:
         return tool.ToolQuery(tool_id=tool_id)
 
     @staticmethod
-    def queries(search_by_name: str | None = None) -> tool.ToolsQuery:
-        return tool.ToolsQuery(search_by_name=search_by_name)
+    def queries(
+        search_by_name: str | None = None,
+        page: PageQuery = PageQuery(),
+    ) -> tool.ToolsQuery:
+        return tool.ToolsQuery(
+            search_by_name=search_by_name,
+            page=page,
+        )
 
 
 class WeaponQueryFactory:
@@ -223,6 +303,7 @@ class WeaponQueryFactory:
         filter_by_damage_types: list[str] | None = None,
         filter_by_property_ids: list[UUID] | None = None,
         filter_by_material_ids: list[UUID] | None = None,
+        page: PageQuery = PageQuery(),
     ) -> weapon.WeaponsQuery:
         return weapon.WeaponsQuery(
             search_by_name=search_by_name,
@@ -230,6 +311,7 @@ class WeaponQueryFactory:
             filter_by_damage_types=filter_by_damage_types,
             filter_by_property_ids=filter_by_property_ids,
             filter_by_material_ids=filter_by_material_ids,
+            page=page,
         )
 
 
@@ -240,10 +322,14 @@ class WeaponKindQueryFactory:
 
     @staticmethod
     def queries(
-        search_by_name: str | None = None, filter_by_types: list[str] | None = None
+        search_by_name: str | None = None,
+        filter_by_types: list[str] | None = None,
+        page: PageQuery = PageQuery(),
     ) -> weapon_kind.WeaponKindsQuery:
         return weapon_kind.WeaponKindsQuery(
-            search_by_name=search_by_name, filter_by_types=filter_by_types
+            search_by_name=search_by_name,
+            filter_by_types=filter_by_types,
+            page=page,
         )
 
 
@@ -257,5 +343,9 @@ class WeaponPropertyQueryFactory:
     @staticmethod
     def queries(
         search_by_name: str | None = None,
+        page: PageQuery = PageQuery(),
     ) -> weapon_property.WeaponPropertiesQuery:
-        return weapon_property.WeaponPropertiesQuery(search_by_name=search_by_name)
+        return weapon_property.WeaponPropertiesQuery(
+            search_by_name=search_by_name,
+            page=page,
+        )
@@ -0,0 +1,86 @@
+import asyncio
+
+import psycopg
+import pytest
+from adapters.invalidation import PostgresInvalidationBus
+from psycopg import sql
+
+
+class FakeConnection:
+    def __init__(self, notifies: int = 0, lost: bool = False) -> None:
+        self.notifies_count = notifies
+        self.lost = lost
+        self.queries: list[sql.Composable] = []
+        self.closed = False
+
+    async def __aenter__(self) -> "FakeConnection":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.closed = True
+
+    async def execute(self, query: sql.Composable) -> None:
+        self.queries.append(query)
+
+    async def notifies(self):
+        for _ in range(self.notifies_count):
+            yield object()
+        if self.lost:
+            raise psycopg.OperationalError("connection lost")
+        await asyncio.Event().wait()
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict]] = []
+
+    async def execute(self, statement, params) -> None:
+        self.calls.append((str(statement), params))
+
+
+def stub_connect(monkeypatch, outcomes: list) -> None:
+    async def connect(dsn: str, autocommit: bool = False):
+        assert autocommit
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(psycopg.AsyncConnection, "connect", connect)
+
+
+async def wait_calls(calls: list, count: int) -> None:
+    async with asyncio.timeout(5):
+        while len(calls) < count:
+            await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_listener_reconnects_and_resyncs(monkeypatch):
+    lost = FakeConnection(notifies=1, lost=True)
+    restored = FakeConnection()
+    stub_connect(
+        monkeypatch, [lost, psycopg.OperationalError("connection refused"), restored]
+    )
+    bus = PostgresInvalidationBus("postgresql://", "catalogue", reconnect_delay=0)
+    calls: list[None] = []
+    bus.subscribe(lambda: calls.append(None))
+    await bus.start()
+    # сброс при подключении, уведомление, сброс после переподключения
+    await wait_calls(calls, 3)
+    await bus.stop()
+    assert len(calls) == 3
+    assert lost.closed and restored.closed
+    for connection in (lost, restored):
+        (query,) = connection.queries
+        assert sql.Identifier("catalogue") in query
+
+
+@pytest.mark.asyncio
+async def test_publish_notifies_in_session():
+    bus = PostgresInvalidationBus("postgresql://", "catalogue")
+    session = FakeSession()
+    await bus.publish(session)
+    ((statement, params),) = session.calls
+    assert "pg_notify" in statement
+    assert params == {"channel": "catalogue"}
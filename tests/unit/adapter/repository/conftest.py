@@ -1,6 +1,8 @@
+from contextlib import contextmanager
+
 import pytest
 import pytest_asyncio
-from adapters.repository.sql import DBHelper
+from adapters.repository.sql import DBHelper, track_queries
 from adapters.repository.sql.models import Base
 
 
@@ -19,3 +21,19 @@ async def db_helper(create_db_helper):
         for table in reversed(Base.metadata.sorted_tables):
             await conn.execute(table.delete())
     yield create_db_helper
+
+
+@pytest.fixture
+def query_budget():
+    # with query_budget(3, "get_by_id"): ... падает, если внутри блока
+    # выполнено больше SQL запросов, чем записано в бюджете
+    @contextmanager
+    def budget(limit, label=""):
+        with track_queries() as stats:
+            yield stats
+        assert stats.count <= limit, (
+            f"{label}: {stats.count} запросов при бюджете {limit}, "
+            f"самый долгий: {stats.slowest_statement}"
+        )
+
+    return budget
@@ -0,0 +1,123 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+from adapters.repository.cache import TTLCache, cached
+from adapters.repository.sql import SQLMaterialRepository
+from tests.factories import model_factory
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_cached(material_repository):
+    repo = cached(material_repository, TTLCache(maxsize=10, ttl=60))
+    material = model_factory.material_model_factory(material_id=uuid4())
+    await material_repository.save(material)
+    assert (await repo.get_by_id(material.material_id)).name == material.name
+
+    material_repository._store.clear()
+    assert (await repo.get_by_id(material.material_id)).name == material.name
+    assert await repo.id_exists(material.material_id)
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates(material_repository):
+    repo = cached(material_repository, TTLCache(maxsize=10, ttl=60))
+    material = model_factory.material_model_factory(material_id=uuid4())
+    await repo.save(material)
+    await repo.get_by_id(material.material_id)
+
+    renamed = model_factory.material_model_factory(
+        material_id=material.material_id, name="new_name"
+    )
+    await repo.save(renamed)
+    assert (await repo.get_by_id(material.material_id)).name == "new_name"
+
+    await repo.delete(material.material_id)
+    assert not await repo.id_exists(material.material_id)
+
+
+@pytest.mark.asyncio
+async def test_returns_copy(material_repository):
+    repo = cached(material_repository, TTLCache(maxsize=10, ttl=60))
+    material = model_factory.material_model_factory(material_id=uuid4())
+    await material_repository.save(material)
+    (await repo.get_by_id(material.material_id)).name = "changed"
+    assert (await repo.get_by_id(material.material_id)).name == material.name
+
+
+def test_ttl_expires():
+    clock = Clock()
+    cache = TTLCache(maxsize=10, ttl=5, clock=clock)
+    cache.set("key", 1)
+    clock.now = 4
+    assert cache.get("key") == 1
+    clock.now = 5
+    assert cache.get("key") != 1
+    assert len(cache) == 0
+
+
+def test_lru_evicts():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") != 2
+    assert cache.get("c") == 3
+
+
+class SlowReads:
+    def __init__(self, repository) -> None:
+        self.repository = repository
+        self.loaded = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def get_by_id(self, *args):
+        value = await self.repository.get_by_id(*args)
+        self.loaded.set()
+        await self.release.wait()
+        return value
+
+    def __getattr__(self, name):
+        return getattr(self.repository, name)
+
+
+@pytest.mark.asyncio
+async def test_write_during_load_not_cached(material_repository):
+    slow = SlowReads(material_repository)
+    repo = cached(slow, TTLCache(maxsize=10, ttl=60))
+    material = model_factory.material_model_factory(material_id=uuid4())
+    await material_repository.save(material)
+
+    read = asyncio.create_task(repo.get_by_id(material.material_id))
+    await slow.loaded.wait()
+    renamed = model_factory.material_model_factory(
+        material_id=material.material_id, name="new_name"
+    )
+    await repo.save(renamed)
+    slow.release.set()
+    assert (await read).name == material.name
+    assert (await repo.get_by_id(material.material_id)).name == "new_name"
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_reads_not_cached(db_helper):
+    cache = TTLCache(maxsize=10, ttl=60)
+    repo = cached(SQLMaterialRepository(db_helper), cache, db_helper)
+    material = model_factory.material_model_factory(material_id=uuid4())
+    with pytest.raises(RuntimeError):
+        async with db_helper.unit_of_work():
+            await repo.save(material)
+            assert await repo.get_by_id(material.material_id) == material
+            raise RuntimeError
+    assert len(cache) == 0
+    assert not await repo.id_exists(material.material_id)
@@ -11,6 +11,7 @@ from adapters.repository.sql import (
     SQLWeaponRepository,
 )
 from adapters.repository.sql.source import SQLSourceRepository
+from application.dto.model.character_class import AppClassSummary
 from domain import error
 from domain.modifier import Modifier
 from tests.factories import model_factory
@@ -192,3 +193,12 @@ async def test_filter(db_helper, filters, count):
     repo = SQLClassRepository(db_helper)
     result = await repo.filter(**filters)
     assert len(result) == count
+
+
+@pytest.mark.asyncio
+async def test_filter_summaries(db_helper):
+    await save_class(db_helper, st_class)
+    repo = SQLClassRepository(db_helper)
+    result = await repo.filter_summaries(search_by_name=st_class.name)
+    assert result == [AppClassSummary.from_app(st_class)]
+    assert await repo.filter_summaries(search_by_name="random_name") == []
@@ -7,6 +7,7 @@ from adapters.repository.sql import (
     SQLClassRepository,
     SQLSourceRepository,
 )
+from application.dto.model.page import AppCursor
 from domain import error
 from tests.factories import model_factory
 
@@ -165,3 +166,22 @@ async def test_filter(db_helper, filters, count):
     repo = SQLClassLevelRepository(db_helper)
     result = await repo.filter(**filters)
     assert len(result) == count
+
+
+@pytest.mark.asyncio
+async def test_filter_pages(db_helper):
+    await create_level(db_helper, st_level)
+    repo = SQLClassLevelRepository(db_helper)
+    for level in [3, 2]:
+        await repo.save(
+            model_factory.class_level_model_factory(
+                class_level_id=uuid4(), class_id=st_class.class_id, level=level
+            )
+        )
+    first = await repo.filter(filter_by_class_id=st_class.class_id, limit=2)
+    assert [level.level for level in first] == [1, 2]
+    cursor = AppCursor(key=first[-1].level, entity_id=first[-1].class_level_id)
+    second = await repo.filter(
+        filter_by_class_id=st_class.class_id, limit=2, cursor=cursor
+    )
+    assert [level.level for level in second] == [3]
@@ -0,0 +1,48 @@
+from uuid import uuid4
+
+import pytest
+from adapters.repository.sql import (
+    SQLClassRepository,
+    SQLExportRepository,
+    SQLMaterialRepository,
+    SQLSourceRepository,
+    SQLSpellRepository,
+)
+from tests.factories import model_factory
+
+
+@pytest.mark.asyncio
+async def test_export(db_helper):
+    source = model_factory.source_model_factory(source_id=uuid4())
+    character_class = model_factory.class_model_factory(
+        class_id=uuid4(), source_id=source.source_id
+    )
+    spell = model_factory.spell_model_factory(
+        spell_id=uuid4(),
+        class_ids=[character_class.class_id],
+        source_id=source.source_id,
+    )
+    material = model_factory.material_model_factory(material_id=uuid4())
+    await SQLSourceRepository(db_helper).save(source)
+    await SQLClassRepository(db_helper).save(character_class)
+    await SQLSpellRepository(db_helper).save(spell)
+    await SQLMaterialRepository(db_helper).save(material)
+
+    repo = SQLExportRepository(db_helper)
+    items = [item async for item in repo.export()]
+    assert [item.entity_type for item in items] == [
+        "source",
+        "material",
+        "class",
+        "spell",
+    ]
+    assert items[-1].entity == spell
+
+    since = max(item.updated_at for item in items)
+    assert [item async for item in repo.export(since)] == []
+    material.name = "new_name"
+    await SQLMaterialRepository(db_helper).save(material)
+    delta = [item async for item in repo.export(since)]
+    assert [(item.entity_type, item.entity.name) for item in delta] == [
+        ("material", "new_name")
+    ]
@@ -0,0 +1,38 @@
+import logging
+from uuid import uuid4
+
+import pytest
+from adapters.repository.sql import DBHelper, SQLMaterialRepository, track_queries
+from sqlalchemy import text
+from tests.factories import model_factory
+
+
+@pytest.mark.asyncio
+async def test_track_queries(db_helper):
+    repo = SQLMaterialRepository(db_helper)
+    material = model_factory.material_model_factory(material_id=uuid4())
+    await repo.save(material)
+    with track_queries() as stats:
+        await repo.get_by_id(material.material_id)
+        await repo.id_exists(material.material_id)
+    assert stats.count == 2
+    assert stats.total_ms >= stats.slowest_ms > 0
+    assert stats.slowest_statement is not None
+
+    with track_queries() as other:
+        pass
+    await repo.get_all()
+    assert other.count == 0
+    assert stats.count == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_query_log(caplog):
+    helper = DBHelper(db_url="sqlite+aiosqlite:///:memory:", slow_query_ms=0)
+    with caplog.at_level(logging.WARNING, logger="dnd_guide.sql"):
+        async with helper.session as session:
+            await session.execute(text("SELECT 1"))
+    await helper.engine.dispose()
+    records = [r for r in caplog.records if r.name == "dnd_guide.sql"]
+    assert len(records) == 1
+    assert records[0].statement == "SELECT 1"
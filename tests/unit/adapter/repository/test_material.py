@@ -99,3 +99,13 @@ async def test_filter(db_helper, name, count):
 
     filtered_materials = await repo.filter(search_by_name=name)
     assert len(filtered_materials) == count
+
+
+@pytest.mark.asyncio
+async def test_missing_ids(db_helper):
+    repo = SQLMaterialRepository(db_helper)
+    material = model_factory.material_model_factory(material_id=uuid4())
+    await repo.save(material)
+    unknown_id = uuid4()
+    assert await repo.missing_ids([material.material_id, unknown_id]) == {unknown_id}
+    assert await repo.missing_ids([]) == set()
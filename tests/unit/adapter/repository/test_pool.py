@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+from adapters.repository.sql import DBHelper, PoolSettings
+from sqlalchemy import text
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics(tmp_path):
+    helper = DBHelper(
+        db_url=f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        pool=PoolSettings(
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=5,
+            pool_recycle=-1,
+            pool_pre_ping=True,
+            query_cache_size=100,
+        ),
+    )
+
+    async def query() -> None:
+        async with helper.session as session:
+            await session.execute(text("SELECT 1"))
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(query(), query())
+    metrics = helper.pool_metrics()
+    await helper.engine.dispose()
+
+    assert metrics.size == 1
+    assert metrics.checked_out == 0
+    assert metrics.checkouts == 2
+    assert metrics.checked_out_max == 1
+    assert metrics.checkout_wait_max > 0
+    assert helper.pool_metrics().checkouts == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_without_settings(db_helper):
+    assert db_helper.pool_metrics().checkouts == 0
@@ -0,0 +1,299 @@
+from copy import deepcopy
+from uuid import uuid4
+
+import pytest
+from adapters.repository import sql
+from domain.weapon_property.name import WeaponPropertyName
+from tests.factories import model_factory
+
+source_id, material_id, component_id = uuid4(), uuid4(), uuid4()
+kind_id, property_id, tool_id = uuid4(), uuid4(), uuid4()
+class_id, subclass_id, race_id, weapon_id = uuid4(), uuid4(), uuid4(), uuid4()
+
+# справочники, на которые ссылаются проверяемые сущности
+PREREQUISITES = [
+    (sql.SQLSourceRepository, model_factory.source_model_factory(source_id=source_id)),
+    (
+        sql.SQLMaterialRepository,
+        model_factory.material_model_factory(material_id=material_id),
+    ),
+    (
+        sql.SQLMaterialComponentRepository,
+        model_factory.material_component_model_factory(material_id=component_id),
+    ),
+    (
+        sql.SQLWeaponKindRepository,
+        model_factory.weapon_kind_model_factory(weapon_kind_id=kind_id),
+    ),
+    (
+        sql.SQLWeaponPropertyRepository,
+        model_factory.weapon_property_model_factory(weapon_property_id=property_id),
+    ),
+    (
+        sql.SQLWeaponRepository,
+        model_factory.weapon_model_factory(
+            weapon_id=weapon_id,
+            weapon_kind_id=kind_id,
+            weapon_property_ids=[property_id],
+            material_id=material_id,
+        ),
+    ),
+    (sql.SQLToolRepository, model_factory.tool_model_factory(tool_id=tool_id)),
+    (
+        sql.SQLClassRepository,
+        model_factory.class_model_factory(class_id=class_id, source_id=source_id),
+    ),
+    (
+        sql.SQLSubclassRepository,
+        model_factory.subclass_model_factory(
+            subclass_id=subclass_id, class_id=class_id
+        ),
+    ),
+    (
+        sql.SQLRaceRepository,
+        model_factory.race_model_factory(race_id=race_id, source_id=source_id),
+    ),
+]
+
+# бюджеты записаны по фактическому числу запросов; рост числа означает
+# лишний round-trip или N+1, уменьшение - повод обновить таблицу
+ENTITIES = [
+    (
+        "source",
+        sql.SQLSourceRepository,
+        model_factory.source_model_factory(source_id=uuid4(), name="other"),
+        {"save": 2, "get_by_id": 1, "filter": 1, "update": 2, "delete": 1},
+    ),
+    (
+        "material",
+        sql.SQLMaterialRepository,
+        model_factory.material_model_factory(material_id=uuid4(), name="other"),
+        {"save": 2, "get_by_id": 1, "filter": 1, "update": 2, "delete": 1},
+    ),
+    (
+        "material_component",
+        sql.SQLMaterialComponentRepository,
+        model_factory.material_component_model_factory(
+            material_id=uuid4(), name="other"
+        ),
+        {"save": 2, "get_by_id": 1, "filter": 1, "update": 2, "delete": 3},
+    ),
+    (
+        "weapon_kind",
+        sql.SQLWeaponKindRepository,
+        model_factory.weapon_kind_model_factory(weapon_kind_id=uuid4(), name="other"),
+        {"save": 2, "get_by_id": 1, "filter": 1, "update": 3, "delete": 1},
+    ),
+    (
+        "weapon_property",
+        sql.SQLWeaponPropertyRepository,
+        model_factory.weapon_property_model_factory(
+            weapon_property_id=uuid4(), name=WeaponPropertyName.LIGHT.name.lower()
+        ),
+        {"save": 2, "get_by_id": 1, "filter": 1, "update": 3, "delete": 1},
+    ),
+    (
+        "weapon",
+        sql.SQLWeaponRepository,
+        model_factory.weapon_model_factory(
+            weapon_id=uuid4(),
+            name="other",
+            weapon_kind_id=kind_id,
+            weapon_property_ids=[property_id],
+            material_id=material_id,
+        ),
+        {"save": 6, "get_by_id": 2, "filter": 2, "update": 6, "delete": 1},
+    ),
+    (
+        "armor",
+        sql.SQLArmorRepository,
+        model_factory.armor_model_factory(armor_id=uuid4(), material_id=material_id),
+        {"save": 3, "get_by_id": 1, "filter": 1, "update": 3, "delete": 1},
+    ),
+    (
+        "tool",
+        sql.SQLToolRepository,
+        model_factory.tool_model_factory(tool_id=uuid4(), name="other"),
+        {"save": 3, "get_by_id": 2, "filter": 2, "update": 6, "delete": 1},
+    ),
+    (
+        "feat",
+        sql.SQLFeatRepository,
+        model_factory.feat_model_factory(feat_id=uuid4()),
+        {"save": 5, "get_by_id": 4, "filter": 4, "update": 12, "delete": 1},
+    ),
+    (
+        "class",
+        sql.SQLClassRepository,
+        model_factory.class_model_factory(
+            class_id=uuid4(),
+            name="other",
+            proficiencies=model_factory.class_proficiencies_model_factory(
+                weapons=[weapon_id], tools=[tool_id]
+            ),
+            source_id=source_id,
+        ),
+        {"save": 11, "get_by_id": 7, "filter": 7, "update": 19, "delete": 3},
+    ),
+    (
+        "subclass",
+        sql.SQLSubclassRepository,
+        model_factory.subclass_model_factory(
+            subclass_id=uuid4(), name="other", class_id=class_id
+        ),
+        {"save": 3, "get_by_id": 2, "filter": 2, "update": 3, "delete": 3},
+    ),
+    (
+        "class_feature",
+        sql.SQLClassFeatureRepository,
+        model_factory.class_feature_model_factory(
+            feature_id=uuid4(), class_id=class_id
+        ),
+        {"save": 3, "get_by_id": 1, "filter": 1, "update": 3, "delete": 1},
+    ),
+    (
+        "class_level",
+        sql.SQLClassLevelRepository,
+        model_factory.class_level_model_factory(
+            class_level_id=uuid4(), class_id=class_id, spell_slots=[2, 1]
+        ),
+        {"save": 4, "get_by_id": 1, "filter": 1, "update": 5, "delete": 1},
+    ),
+    (
+        "subclass_feature",
+        sql.SQLSubclassFeatureRepository,
+        model_factory.subclass_feature_model_factory(
+            feature_id=uuid4(), subclass_id=subclass_id
+        ),
+        {"save": 2, "get_by_id": 2, "filter": 2, "update": 4, "delete": 1},
+    ),
+    (
+        "race",
+        sql.SQLRaceRepository,
+        model_factory.race_model_factory(
+            race_id=uuid4(), name="other", source_id=source_id
+        ),
+        {"save": 5, "get_by_id": 3, "filter": 3, "update": 9, "delete": 1},
+    ),
+    (
+        "subrace",
+        sql.SQLSubraceRepository,
+        model_factory.subrace_model_factory(subrace_id=uuid4(), race_id=race_id),
+        {"save": 4, "get_by_id": 3, "filter": 3, "update": 9, "delete": 1},
+    ),
+    (
+        "spell",
+        sql.SQLSpellRepository,
+        model_factory.spell_model_factory(
+            spell_id=uuid4(),
+            class_ids=[class_id],
+            subclass_ids=[subclass_id],
+            components=model_factory.spell_component_model_factory(
+                material=True, materials=[component_id]
+            ),
+            saving_throws=["wisdom"],
+            source_id=source_id,
+        ),
+        {"save": 10, "get_by_id": 1, "filter": 1, "update": 13, "delete": 1},
+    ),
+]
+
+
+def changed(name, model):
+    # обновление без изменений - пустой flush; меняем колонку и связи, чтобы
+    # бюджет покрывал настоящий UPDATE и перезапись связанных строк
+    model = deepcopy(model)
+    model.description = "changed_description"
+    if name == "weapon":
+        model.weapon_property_ids = []
+    elif name == "tool":
+        model.utilizes[0].action = "other_action"
+    elif name == "feat":
+        model.increase_modifiers = ["wisdom"]
+        model.required_armor_types = ["light_armor"]
+    elif name == "class":
+        model.primary_modifiers = ["dexterity"]
+        model.proficiencies.weapons = []
+    elif name == "class_level":
+        model.spell_slots = [3, 2]
+    elif name in ("race", "subrace"):
+        model.increase_modifiers[0].bonus = 1
+        model.features[0].name = "other_feature"
+    elif name == "spell":
+        model.class_ids = []
+        model.saving_throws = ["strength"]
+    return model
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "name,repository_type,model,budget",
+    ENTITIES,
+    ids=[entity[0] for entity in ENTITIES],
+)
+async def test_query_budget(
+    db_helper, query_budget, name, repository_type, model, budget
+):
+    for prerequisite_type, prerequisite in PREREQUISITES:
+        await prerequisite_type(db_helper).save(prerequisite)
+    repository = repository_type(db_helper)
+    entity_id = getattr(model, next(iter(vars(model))))
+    with query_budget(budget["save"], "save"):
+        await repository.save(model)
+    with query_budget(budget["get_by_id"], "get_by_id"):
+        await repository.get_by_id(entity_id)
+    with query_budget(budget["filter"], "filter"):
+        await repository.filter()
+    update = changed(name, model)
+    with query_budget(budget["update"], "update") as stats:
+        await repository.save(update)
+    assert stats.count > 0
+    assert await repository.get_by_id(entity_id) == update
+    with query_budget(budget["delete"], "delete"):
+        await repository.delete(entity_id)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "repository_type,filters",
+    [
+        [sql.SQLClassRepository, {"filter_by_source_ids": [source_id]}],
+        [sql.SQLClassRepository, {"filter_by_tool_ids": [tool_id]}],
+        [sql.SQLClassRepository, {"filter_by_weapon_ids": [weapon_id]}],
+        [sql.SQLRaceRepository, {"filter_by_source_ids": [source_id]}],
+        [sql.SQLSpellRepository, {"filter_by_source_ids": [source_id]}],
+        [sql.SQLSpellRepository, {"filter_by_material_ids": [component_id]}],
+        [sql.SQLArmorRepository, {"filter_by_material_ids": [material_id]}],
+        [sql.SQLWeaponRepository, {"filter_by_kind_ids": [kind_id]}],
+        [sql.SQLWeaponRepository, {"filter_by_property_ids": [property_id]}],
+        [sql.SQLWeaponRepository, {"filter_by_material_ids": [material_id]}],
+    ],
+)
+async def test_references_budget(db_helper, query_budget, repository_type, filters):
+    for prerequisite_type, prerequisite in PREREQUISITES:
+        await prerequisite_type(db_helper).save(prerequisite)
+    with query_budget(1, "references"):
+        await repository_type(db_helper).references(**filters)
+
+
+@pytest.mark.asyncio
+async def test_delete_related_budget(db_helper, query_budget):
+    # число запросов удаления не зависит от числа заклинаний со связью
+    for prerequisite_type, prerequisite in PREREQUISITES:
+        await prerequisite_type(db_helper).save(prerequisite)
+    spell_repository = sql.SQLSpellRepository(db_helper)
+    spells = [
+        model_factory.spell_model_factory(
+            spell_id=uuid4(),
+            name=f"spell_{i}",
+            class_ids=[class_id],
+            subclass_ids=[subclass_id],
+            source_id=source_id,
+        )
+        for i in range(5)
+    ]
+    await spell_repository.create_many(spells)
+    with query_budget(3, "delete"):
+        await sql.SQLSubclassRepository(db_helper).delete(subclass_id)
+    for spell in await spell_repository.filter():
+        assert spell.subclass_ids == [] and spell.class_ids == [class_id]
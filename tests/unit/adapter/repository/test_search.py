@@ -0,0 +1,109 @@
+from uuid import uuid4
+
+import pytest
+from adapters.repository.sql import (
+    SQLFeatRepository,
+    SQLMaterialRepository,
+    SQLSearchRepository,
+    SQLSourceRepository,
+    SQLSpellRepository,
+)
+from adapters.repository.sql.models import MaterialModel
+from adapters.repository.sql.search import name_matches, name_rank
+from application.dto.model.page import AppCursor
+from sqlalchemy import select
+from tests.factories import model_factory
+
+st_source = model_factory.source_model_factory()
+
+
+@pytest.mark.asyncio
+async def test_name_rank(db_helper):
+    repo = SQLMaterialRepository(db_helper)
+    for name in ["Steel fire", "Fire", "Fireproof", "Wood"]:
+        await repo.save(
+            model_factory.material_model_factory(material_id=uuid4(), name=name)
+        )
+    async with db_helper.session as session:
+        rank = name_rank("fire", MaterialModel.name)
+        query = (
+            select(MaterialModel.name)
+            .where(name_matches("fire", MaterialModel.name))
+            .order_by(rank.desc(), MaterialModel.name)
+        )
+        result = await session.execute(query)
+        assert list(result.scalars().all()) == ["Fire", "Fireproof", "Steel fire"]
+
+
+@pytest.mark.asyncio
+async def test_filter_ranked_by_name(db_helper):
+    repo = SQLMaterialRepository(db_helper)
+    for name in ["Steel fire", "Fire", "Fireproof", "Ash fire", "Wood"]:
+        await repo.save(
+            model_factory.material_model_factory(material_id=uuid4(), name=name)
+        )
+    result = await repo.filter(search_by_name="fire")
+    names = [material.name for material in result]
+    assert names == ["Fire", "Fireproof", "Ash fire", "Steel fire"]
+
+    # страницы по курсору идут в том же порядке, через границы рангов
+    pages: list[str] = []
+    cursor = None
+    while True:
+        page = await repo.filter(search_by_name="fire", limit=1, cursor=cursor)
+        if not page:
+            break
+        pages.append(page[0].name)
+        cursor = AppCursor(key=page[0].name, entity_id=page[0].material_id)
+    assert pages == names
+
+
+@pytest.mark.asyncio
+async def test_filter_ranked_by_english_name(db_helper):
+    await SQLSourceRepository(db_helper).save(st_source)
+    repo = SQLSpellRepository(db_helper)
+    for name, name_in_english in [
+        ("Огненный шар", "Fireball"),
+        ("Адское возмездие", "Hellish fire"),
+        ("Огонь", "Fire"),
+    ]:
+        await repo.save(
+            model_factory.spell_model_factory(
+                spell_id=uuid4(),
+                name=name,
+                name_in_english=name_in_english,
+                source_id=st_source.source_id,
+            )
+        )
+    result = await repo.filter_summaries(search_by_name="fire")
+    assert [spell.name for spell in result] == [
+        "Огонь",
+        "Огненный шар",
+        "Адское возмездие",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search(db_helper):
+    material_repo = SQLMaterialRepository(db_helper)
+    feat_repo = SQLFeatRepository(db_helper)
+    await material_repo.save(
+        model_factory.material_model_factory(material_id=uuid4(), name="Fireproof")
+    )
+    await feat_repo.save(model_factory.feat_model_factory(feat_id=uuid4(), name="Fire"))
+    await feat_repo.save(
+        model_factory.feat_model_factory(
+            feat_id=uuid4(), name="Ember", description="Burns like fire"
+        )
+    )
+    await feat_repo.save(
+        model_factory.feat_model_factory(feat_id=uuid4(), name="Frost")
+    )
+    repo = SQLSearchRepository(db_helper)
+    result = await repo.search("fire", 10)
+    assert [(hit.entity_type, hit.name) for hit in result] == [
+        ("feat", "Fire"),
+        ("material", "Fireproof"),
+        ("feat", "Ember"),
+    ]
+    assert (await repo.search("fire", 1))[0].name == "Fire"
@@ -0,0 +1,174 @@
+from copy import deepcopy
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from adapters.repository.snapshot import SnapshotStore, snapshot
+from adapters.repository.sql import (
+    SQLMaterialRepository,
+    SQLSpellRepository,
+    SQLUserRepository,
+)
+from adapters.repository.sql.models import MaterialModel
+from domain import error
+from sqlalchemy import update
+from tests.factories import model_factory
+from tests.unit.adapter.repository.test_spell import (
+    save_spell,
+    st_class,
+    st_material,
+    st_source,
+    st_spell,
+    st_subclass,
+)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def make_repository(db_helper, clock=None):
+    store = SnapshotStore(db_helper, poll_interval=60, clock=clock or Clock())
+    repo = snapshot(SQLMaterialRepository(db_helper), store, "material")
+    material = model_factory.material_model_factory(material_id=uuid4())
+    await repo.save(material)
+    await store.refresh()
+    return store, repo, material
+
+
+@pytest.mark.asyncio
+async def test_reads_from_snapshot(db_helper, query_budget):
+    store, repo, material = await make_repository(db_helper)
+    with query_budget(0, "snapshot"):
+        assert await repo.get_by_id(material.material_id) == material
+        assert await repo.get_all() == [material]
+        assert await repo.id_exists(material.material_id)
+
+
+@pytest.mark.asyncio
+async def test_missing_id_reads_database(db_helper, query_budget):
+    store, repo, _ = await make_repository(db_helper)
+    missing = uuid4()
+    with query_budget(2, "snapshot miss") as stats:
+        assert not await repo.id_exists(missing)
+        with pytest.raises(error.DomainError):
+            await repo.get_by_id(missing)
+    assert stats.count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"filter_by_schools": [st_spell.school]},
+        {"filter_by_schools": ["evocation"]},
+        {"filter_by_class_ids": [st_class.class_id]},
+        {"filter_by_subclass_ids": [st_subclass.subclass_id]},
+        {"filter_by_material_ids": [st_material.material_id]},
+        {"filter_by_source_ids": [st_source.source_id]},
+        {"filter_by_material_component": True},
+        {"filter_by_ritual": False},
+        {"filter_by_ritual": True},
+        {"limit": 1},
+    ],
+)
+async def test_filters_match_database(db_helper, kwargs):
+    spell = deepcopy(st_spell)
+    spell.class_ids = [st_class.class_id]
+    spell.subclass_ids = [st_subclass.subclass_id]
+    await save_spell(db_helper, spell)
+    store = SnapshotStore(db_helper, poll_interval=60, clock=Clock())
+    sql_repo = SQLSpellRepository(db_helper)
+    repo = snapshot(sql_repo, store, "spell")
+    await store.refresh()
+    assert await repo.filter(**kwargs) == await sql_repo.filter(**kwargs)
+    assert await repo.filter_summaries(**kwargs) == await sql_repo.filter_summaries(
+        **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_snapshot(db_helper, query_budget):
+    store, repo, material = await make_repository(db_helper)
+    material.name = "new_name"
+    await repo.save(material)
+    # пока снимок перестраивается, чтение идёт в БД
+    assert (await repo.get_by_id(material.material_id)).name == "new_name"
+    await store.wait()
+    with query_budget(0, "snapshot"):
+        assert (await repo.get_by_id(material.material_id)).name == "new_name"
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_reads_database(db_helper, query_budget):
+    store, repo, _ = await make_repository(db_helper)
+    other = model_factory.material_model_factory(material_id=uuid4(), name="other")
+    async with db_helper.unit_of_work():
+        await repo.save(other)
+        assert await repo.get_by_id(other.material_id) == other
+    # коммит сбросил снимок, перестройка видит новую запись
+    assert store.current() is None
+    await store.wait()
+    with query_budget(0, "snapshot"):
+        assert await repo.get_by_id(other.material_id) == other
+
+
+@pytest.mark.asyncio
+async def test_commit_outside_snapshot_invalidates(db_helper):
+    store, _, material = await make_repository(db_helper)
+    material.name = "direct"
+    await SQLMaterialRepository(db_helper).save(material)
+    assert store.current() is None
+    await store.wait()
+
+
+@pytest.mark.asyncio
+async def test_user_commit_keeps_snapshot(db_helper):
+    store, _, _ = await make_repository(db_helper)
+    await SQLUserRepository(db_helper).save(
+        model_factory.user_model_factory(user_id=uuid4())
+    )
+    assert store.current() is not None
+    await store.wait()
+
+
+@pytest.mark.asyncio
+async def test_read_returns_copy(db_helper, query_budget):
+    store, repo, material = await make_repository(db_helper)
+    with query_budget(0, "snapshot"):
+        (read,) = await repo.get_all()
+        read.name = "mutated"
+        assert (await repo.get_by_id(material.material_id)).name == material.name
+
+
+@pytest.mark.asyncio
+async def test_poll_picks_external_change(db_helper):
+    clock = Clock()
+    store, repo, material = await make_repository(db_helper, clock)
+    # запись мимо сессий приложения, как из другого процесса
+    async with db_helper.engine.begin() as conn:
+        await conn.execute(
+            update(MaterialModel)
+            .where(MaterialModel.id == material.material_id)
+            .values(
+                name="external",
+                updated_at=datetime.now(timezone.utc) + timedelta(seconds=1),
+            )
+        )
+    assert (await repo.get_by_id(material.material_id)).name == material.name
+    clock.now += 60
+    await repo.get_by_id(material.material_id)
+    await store.wait()
+    assert (await repo.get_by_id(material.material_id)).name == "external"
+
+
+@pytest.mark.asyncio
+async def test_search_by_name_reads_database(db_helper):
+    store, repo, material = await make_repository(db_helper)
+    result = await repo.filter(search_by_name=material.name.upper())
+    assert result == [material]
@@ -9,6 +9,8 @@ from adapters.repository.sql import (
     SQLSpellRepository,
     SQLSubclassRepository,
 )
+from application.dto.model.page import AppCursor
+from application.dto.model.spell import AppSpellSummary
 from domain import error
 from domain.damage_type import DamageType
 from domain.modifier import Modifier
@@ -172,6 +174,39 @@ async def test_name_exists(db_helper, name, expected):
     assert await repo.name_exists(name) == expected
 
 
+@pytest.mark.asyncio
+async def test_existing_names(db_helper):
+    await save_spell(db_helper, st_spell)
+    repo = SQLSpellRepository(db_helper)
+    assert await repo.existing_names([st_spell.name, "random_name"]) == {st_spell.name}
+    assert await repo.existing_names([]) == set()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_size", [500, 2], ids=["one_batch", "batches"])
+async def test_create_many(db_helper, batch_size):
+    await save_spell(db_helper, st_spell)
+    repo = SQLSpellRepository(db_helper)
+    repo.create_batch_size = batch_size
+    spells = [
+        model_factory.spell_model_factory(
+            spell_id=uuid4(),
+            name=name,
+            class_ids=[st_class.class_id],
+            subclass_ids=[st_subclass.subclass_id],
+            components=model_factory.spell_component_model_factory(
+                material=True, materials=[st_material.material_id]
+            ),
+            saving_throws=[Modifier.WISDOM.name.lower()],
+            source_id=st_source.source_id,
+        )
+        for name in ["first", "second", "third", "fourth", "fifth"]
+    ]
+    await repo.create_many(spells)
+    for spell in spells:
+        assert await repo.get_by_id(spell.spell_id) == spell
+
+
 @pytest.mark.asyncio
 async def test_get_by_id(db_helper):
     await save_spell(db_helper, st_spell)
@@ -262,3 +297,67 @@ async def test_filter(db_helper, filters, count):
     repo = SQLSpellRepository(db_helper)
     result = await repo.filter(**filters)
     assert len(result) == count
+
+
+@pytest.mark.asyncio
+async def test_filter_pages(db_helper):
+    await SQLSourceRepository(db_helper).save(st_source)
+    repo = SQLSpellRepository(db_helper)
+    for name in ["c", "a", "e", "b", "d"]:
+        await repo.save(
+            model_factory.spell_model_factory(
+                spell_id=uuid4(), name=name, source_id=st_source.source_id
+            )
+        )
+    first = await repo.filter(limit=2)
+    assert [spell.name for spell in first] == ["a", "b"]
+    cursor = AppCursor(key=first[-1].name, entity_id=first[-1].spell_id)
+    second = await repo.filter(limit=2, cursor=cursor)
+    assert [spell.name for spell in second] == ["c", "d"]
+
+
+@pytest.mark.asyncio
+async def test_filter_sorts_relation_ids(db_helper):
+    await SQLSourceRepository(db_helper).save(st_source)
+    classes = [
+        model_factory.class_model_factory(
+            class_id=uuid4(), name=f"class_{i}", source_id=st_source.source_id
+        )
+        for i in range(3)
+    ]
+    for character_class in classes:
+        await SQLClassRepository(db_helper).save(character_class)
+    class_ids = sorted(c.class_id for c in classes)
+    spell = deepcopy(st_spell)
+    spell.class_ids = list(reversed(class_ids))
+    repo = SQLSpellRepository(db_helper)
+    await repo.save(spell)
+    (result,) = await repo.filter()
+    assert result.class_ids == class_ids
+
+
+@pytest.mark.asyncio
+async def test_filter_summaries(db_helper):
+    spell = deepcopy(st_spell)
+    spell.class_ids = [st_class.class_id]
+    await save_spell(db_helper, spell)
+    repo = SQLSpellRepository(db_helper)
+    result = await repo.filter_summaries(filter_by_class_ids=[st_class.class_id])
+    assert result == [AppSpellSummary.from_app(spell)]
+    assert await repo.filter_summaries(filter_by_class_ids=[uuid4()]) == []
+
+
+@pytest.mark.asyncio
+async def test_delete_related_updates_read_model(db_helper):
+    spell = deepcopy(st_spell)
+    spell.class_ids = [st_class.class_id]
+    spell.subclass_ids = [st_subclass.subclass_id]
+    await save_spell(db_helper, spell)
+    await SQLSubclassRepository(db_helper).delete(st_subclass.subclass_id)
+    await SQLMaterialComponentRepository(db_helper).delete(st_material.material_id)
+    repo = SQLSpellRepository(db_helper)
+    result = await repo.get_by_id(spell.spell_id)
+    assert result.subclass_ids == []
+    assert result.components.materials == []
+    assert result.class_ids == [st_class.class_id]
+    assert await repo.filter(filter_by_material_ids=[st_material.material_id]) == []
@@ -0,0 +1,142 @@
+from uuid import uuid4
+
+import pytest
+from adapters.invalidation import LocalInvalidationBus
+from adapters.repository.sql import SQLMaterialRepository, UnitOfWork
+from tests.factories import model_factory
+
+
+class SaveTwice:
+    def __init__(self, repo: SQLMaterialRepository, fail: bool) -> None:
+        self.repo = repo
+        self.fail = fail
+
+    async def execute(self, first, second) -> None:
+        await self.repo.save(first)
+        await self.repo.save(second)
+        if self.fail:
+            raise RuntimeError
+
+
+class Nested:
+    def __init__(self, inner) -> None:
+        self.inner = inner
+
+    async def execute(self, first, second) -> None:
+        await self.inner.execute(first, second)
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_commits(db_helper):
+    repo = SQLMaterialRepository(db_helper)
+    first = model_factory.material_model_factory(material_id=uuid4())
+    second = model_factory.material_model_factory(material_id=uuid4(), name="second")
+    await UnitOfWork(db_helper)(SaveTwice(repo, fail=False)).execute(first, second)
+    assert await repo.id_exists(first.material_id)
+    assert await repo.id_exists(second.material_id)
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_rolls_back(db_helper):
+    repo = SQLMaterialRepository(db_helper)
+    first = model_factory.material_model_factory(material_id=uuid4())
+    second = model_factory.material_model_factory(material_id=uuid4(), name="second")
+    with pytest.raises(RuntimeError):
+        await UnitOfWork(db_helper)(SaveTwice(repo, fail=True)).execute(first, second)
+    assert not await repo.id_exists(first.material_id)
+    assert not await repo.id_exists(second.material_id)
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_shares_session(db_helper):
+    repo = SQLMaterialRepository(db_helper)
+    material = model_factory.material_model_factory(material_id=uuid4())
+    async with db_helper.unit_of_work():
+        async with db_helper.session as first, db_helper.session as second:
+            assert first.sync_session is second.sync_session
+        await repo.save(material)
+        async with db_helper.unit_of_work():
+            assert await repo.id_exists(material.material_id)
+
+
+def materials():
+    first = model_factory.material_model_factory(material_id=uuid4())
+    second = model_factory.material_model_factory(material_id=uuid4(), name="second")
+    return first, second
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self) -> None:
+        self.calls += 1
+
+
+def counted_bus() -> tuple[LocalInvalidationBus, Counter]:
+    bus = LocalInvalidationBus()
+    counter = Counter()
+    bus.subscribe(counter)
+    return bus, counter
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_publishes_after_commit(db_helper):
+    bus, counter = counted_bus()
+    repo = SQLMaterialRepository(db_helper)
+    await UnitOfWork(db_helper, bus)(SaveTwice(repo, fail=False)).execute(*materials())
+    assert counter.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_rollback_does_not_publish(db_helper):
+    bus, counter = counted_bus()
+    repo = SQLMaterialRepository(db_helper)
+    with pytest.raises(RuntimeError):
+        await UnitOfWork(db_helper, bus)(SaveTwice(repo, fail=True)).execute(
+            *materials()
+        )
+    assert counter.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_local_bus_delivers_on_commit(db_helper):
+    bus, counter = counted_bus()
+    async with db_helper.unit_of_work():
+        await bus.publish(db_helper.session)
+        assert counter.calls == 0
+    assert counter.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_local_bus_drops_signal_on_rollback(db_helper):
+    bus, counter = counted_bus()
+    with pytest.raises(RuntimeError):
+        async with db_helper.unit_of_work():
+            await bus.publish(db_helper.session)
+            raise RuntimeError
+    assert counter.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_nested_unit_of_work_publishes_once(db_helper):
+    bus, counter = counted_bus()
+    unit_of_work = UnitOfWork(db_helper, bus)
+    inner = unit_of_work(SaveTwice(SQLMaterialRepository(db_helper), fail=False))
+    await unit_of_work(Nested(inner)).execute(*materials())
+    assert counter.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_failing_subscriber_does_not_block_others(db_helper):
+    bus = LocalInvalidationBus()
+    counter = Counter()
+
+    def fail() -> None:
+        raise RuntimeError
+
+    bus.subscribe(fail)
+    bus.subscribe(counter)
+    repo = SQLMaterialRepository(db_helper)
+    await UnitOfWork(db_helper, bus)(SaveTwice(repo, fail=False)).execute(*materials())
+    assert counter.calls == 1
@@ -0,0 +1,161 @@
+from copy import deepcopy
+from uuid import uuid4
+
+import pytest
+from adapters.repository.cache import CachedVersionRepository, TTLCache, cached
+from adapters.repository.snapshot import (
+    SnapshotStore,
+    SnapshotVersionRepository,
+    snapshot,
+)
+from adapters.repository.sql import (
+    SQLClassRepository,
+    SQLMaterialRepository,
+    SQLSourceRepository,
+    SQLSpellRepository,
+    SQLVersionRepository,
+)
+from domain import error
+from ports.http.web.middleware.etag import make_etag
+from tests.factories import model_factory
+
+
+@pytest.mark.asyncio
+async def test_version(db_helper):
+    repo = SQLVersionRepository(db_helper)
+    material_repo = SQLMaterialRepository(db_helper)
+    empty = await repo.version("material")
+    assert empty.count == 0 and empty.updated_at is None
+
+    material = model_factory.material_model_factory(material_id=uuid4())
+    await material_repo.save(material)
+    table = await repo.version("material")
+    entity = await repo.version("material", material.material_id)
+    assert table.count == 1
+    assert entity.count == 1 and entity.updated_at == table.updated_at
+    assert (await repo.version("material", uuid4())).count == 0
+
+    material.name = "new_name"
+    await material_repo.save(material)
+    assert (await repo.version("material")).updated_at > table.updated_at
+
+
+@pytest.mark.asyncio
+async def test_version_relation_change(db_helper):
+    source = model_factory.source_model_factory()
+    character_class = model_factory.class_model_factory(source_id=source.source_id)
+    spell = model_factory.spell_model_factory(source_id=source.source_id)
+    await SQLSourceRepository(db_helper).save(source)
+    await SQLClassRepository(db_helper).save(character_class)
+    await SQLSpellRepository(db_helper).save(spell)
+    repo = SQLVersionRepository(db_helper)
+    before = await repo.version("spell", spell.spell_id)
+
+    updated = deepcopy(spell)
+    updated.class_ids = [character_class.class_id]
+    await SQLSpellRepository(db_helper).save(updated)
+    after = await repo.version("spell", spell.spell_id)
+    assert after.updated_at > before.updated_at
+
+
+@pytest.mark.asyncio
+async def test_version_related_delete(db_helper):
+    source = model_factory.source_model_factory()
+    character_class = model_factory.class_model_factory(source_id=source.source_id)
+    spell = model_factory.spell_model_factory(
+        source_id=source.source_id, class_ids=[character_class.class_id]
+    )
+    await SQLSourceRepository(db_helper).save(source)
+    await SQLClassRepository(db_helper).save(character_class)
+    await SQLSpellRepository(db_helper).save(spell)
+    repo = SQLVersionRepository(db_helper)
+    scope = {"path": f"/api/v1/spells/{spell.spell_id}", "query_string": b""}
+    before = await repo.version("spell", spell.spell_id)
+
+    # каскад меняет только таблицы связей, но ETag заклинания должен смениться
+    await SQLClassRepository(db_helper).delete(character_class.class_id)
+    after = await repo.version("spell", spell.spell_id)
+    assert after.updated_at > before.updated_at
+    assert make_etag(scope, after) != make_etag(scope, before)
+    assert (await repo.version("spell")).updated_at == after.updated_at
+
+
+@pytest.mark.asyncio
+async def test_version_unknown_type(db_helper):
+    try:
+        await SQLVersionRepository(db_helper).version("random_type")
+    except error.DomainError as e:
+        assert e.status == error.DomainErrorStatus.INVALID_DATA
+        return
+    pytest.fail("not raised exception")
+
+
+@pytest.mark.asyncio
+async def test_catalogue_version(db_helper):
+    repo = SQLVersionRepository(db_helper)
+    empty = await repo.catalogue_version()
+    assert empty.count == 0 and empty.updated_at is None
+
+    source = model_factory.source_model_factory()
+    material = model_factory.material_model_factory(material_id=uuid4())
+    await SQLSourceRepository(db_helper).save(source)
+    await SQLMaterialRepository(db_helper).save(material)
+    version = await repo.catalogue_version()
+    assert version.count == 2
+
+    await SQLMaterialRepository(db_helper).delete(material.material_id)
+    assert (await repo.catalogue_version()).count == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_version(db_helper, query_budget):
+    cache = TTLCache(maxsize=10, ttl=60)
+    repo = CachedVersionRepository(SQLVersionRepository(db_helper), cache, db_helper)
+    material_repo = cached(SQLMaterialRepository(db_helper), cache, db_helper)
+    material = model_factory.material_model_factory(material_id=uuid4())
+    await material_repo.save(material)
+    before = await repo.version("material", material.material_id)
+    with query_budget(0, "cached version"):
+        assert await repo.version("material", material.material_id) == before
+
+    # запись сбрасывает кеш, и версия снова читается из БД
+    material.name = "new_name"
+    await material_repo.save(material)
+    after = await repo.version("material", material.material_id)
+    assert after.updated_at > before.updated_at
+
+
+@pytest.mark.asyncio
+async def test_cached_version_bypassed_in_unit_of_work(db_helper, query_budget):
+    repo = CachedVersionRepository(
+        SQLVersionRepository(db_helper), TTLCache(maxsize=10, ttl=60), db_helper
+    )
+    await repo.version("material")
+    async with db_helper.unit_of_work():
+        with query_budget(1, "version in unit of work") as stats:
+            await repo.version("material")
+    assert stats.count == 1
+
+
+@pytest.mark.asyncio
+async def test_snapshot_version(db_helper, query_budget):
+    store = SnapshotStore(db_helper, poll_interval=60)
+    material_repo = snapshot(SQLMaterialRepository(db_helper), store, "material")
+    repo = SnapshotVersionRepository(SQLVersionRepository(db_helper), store)
+    material = model_factory.material_model_factory(material_id=uuid4())
+    await material_repo.save(material)
+    await store.refresh()
+    catalogue = await SQLVersionRepository(db_helper).catalogue_version()
+    with query_budget(0, "snapshot version"):
+        assert await repo.version("material") == catalogue
+        assert await repo.version("material", material.material_id) == catalogue
+        assert await repo.catalogue_version() == catalogue
+
+    # сущности нет в снимке: версию (и count == 0 для 404) даёт БД
+    assert (await repo.version("material", uuid4())).count == 0
+
+    material.name = "new_name"
+    await material_repo.save(material)
+    after = await repo.version("material", material.material_id)
+    assert after.updated_at > catalogue.updated_at
+    await store.wait()
@@ -172,3 +172,37 @@ async def test_filter(db_helper, filters, count):
     await create_weapon(db_helper, st_weapon)
     result = await SQLWeaponRepository(db_helper).filter(**filters)
     assert len(result) == count
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "filters,count",
+    [
+        [{"filter_by_kind_ids": [st_kind.weapon_kind_id]}, 3],
+        [{"filter_by_kind_ids": [st_kind2.weapon_kind_id]}, 0],
+        [{"filter_by_property_ids": [st_prop.weapon_property_id]}, 3],
+        [{"filter_by_property_ids": [st_prop2.weapon_property_id]}, 0],
+        [{"filter_by_material_ids": [st_material.material_id]}, 3],
+        [{"filter_by_material_ids": [st_material2.material_id]}, 0],
+    ],
+    ids=[
+        "by_kind_id",
+        "not_exists_by_kind_id",
+        "by_property_id",
+        "not_exists_by_property_id",
+        "by_material_id",
+        "not_exists_by_material_id",
+    ],
+)
+async def test_references(db_helper, filters, count):
+    await create_weapon(db_helper, st_weapon)
+    repo = SQLWeaponRepository(db_helper)
+    for name in ["b_weapon", "a_weapon"]:
+        weapon = deepcopy(st_weapon)
+        weapon.weapon_id = uuid4()
+        weapon.name = name
+        await repo.save(weapon)
+    result = await repo.references(**filters, limit=2)
+    assert result.count == count
+    names = sorted([st_weapon.name, "a_weapon", "b_weapon"])
+    assert result.names == names[: min(count, 2)]
@@ -433,4 +433,4 @@ async def test_get_armors_ok(armor_repository, material_repository):
         query_factory.ArmorQueryFactory.queries(search_by_name=armor2.name)
     )
     assert result is not None
-    assert result[0].armor_id == armor.armor_id
+    assert result.items[0].armor_id == armor.armor_id
@@ -1,6 +1,8 @@
+import asyncio
 from uuid import uuid4
 
 import pytest
+from application.dto.model.spell import AppSpellSummary
 from application.use_case.command.character_class import (
     CreateClassUseCase,
     DeleteClassUseCase,
@@ -8,6 +10,8 @@ from application.use_case.command.character_class import (
 )
 from application.use_case.query.character_class import (
     GetClassesUseCase,
+    GetClassSheetUseCase,
+    GetClassSummariesUseCase,
     GetClassUseCase,
 )
 from domain import error
@@ -462,6 +466,97 @@ async def test_get_class_fail(
     pytest.fail("not raised exception")
 
 
+@pytest.mark.asyncio
+async def test_get_class_sheet_ok(
+    class_repository,
+    class_level_repository,
+    class_feature_repository,
+    subclass_repository,
+    spell_repository,
+):
+    await save_class(class_repository, st_class)
+    level = model_factory.class_level_model_factory(class_id=st_class.class_id)
+    feature = model_factory.class_feature_model_factory(class_id=st_class.class_id)
+    subclass = model_factory.subclass_model_factory(class_id=st_class.class_id)
+    spell = model_factory.spell_model_factory(class_ids=[st_class.class_id])
+    other_spell = model_factory.spell_model_factory(spell_id=uuid4(), class_ids=[])
+    await class_level_repository.save(level)
+    await class_feature_repository.save(feature)
+    await subclass_repository.save(subclass)
+    await spell_repository.save(spell)
+    await spell_repository.save(other_spell)
+    use_case = GetClassSheetUseCase(
+        class_repository,
+        class_level_repository,
+        class_feature_repository,
+        subclass_repository,
+        spell_repository,
+    )
+    result = await use_case.execute(
+        query_factory.ClassQueryFactory.query(class_id=st_class.class_id)
+    )
+    assert result.character_class == st_class
+    assert result.levels == [level]
+    assert result.features == [feature]
+    assert result.subclasses == [subclass]
+    assert result.spells == [AppSpellSummary.from_app(spell)]
+
+
+@pytest.mark.asyncio
+async def test_get_class_sheet_not_exists(
+    class_repository,
+    class_level_repository,
+    class_feature_repository,
+    subclass_repository,
+    spell_repository,
+):
+    use_case = GetClassSheetUseCase(
+        class_repository,
+        class_level_repository,
+        class_feature_repository,
+        subclass_repository,
+        spell_repository,
+    )
+    with pytest.raises(error.DomainError) as e:
+        await use_case.execute(query_factory.ClassQueryFactory.query(class_id=uuid4()))
+    assert e.value.status == error.DomainErrorStatus.NOT_FOUND
+
+
+class SlowSpells:
+    def __init__(self, repository) -> None:
+        self.repository = repository
+        self.cancelled = False
+
+    async def filter_summaries(self, **kwargs):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return await self.repository.filter_summaries(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_get_class_sheet_not_exists_cancels_queries(
+    class_repository,
+    class_level_repository,
+    class_feature_repository,
+    subclass_repository,
+    spell_repository,
+):
+    spells = SlowSpells(spell_repository)
+    use_case = GetClassSheetUseCase(
+        class_repository,
+        class_level_repository,
+        class_feature_repository,
+        subclass_repository,
+        spells,
+    )
+    with pytest.raises(error.DomainError):
+        await use_case.execute(query_factory.ClassQueryFactory.query(class_id=uuid4()))
+    assert spells.cancelled
+
+
 @pytest.mark.asyncio
 async def test_get_classes_ok(
     user_repository,
@@ -477,8 +572,17 @@ async def test_get_classes_ok(
     await save_class(class_repository, st_class)
     use_case = GetClassesUseCase(class_repository)
     result = await use_case.execute(query_factory.ClassQueryFactory.queries())
-    assert len(result) > 0
+    assert len(result.items) > 0
     result = await use_case.execute(
         query_factory.ClassQueryFactory.queries(search_by_name="random_symbols")
     )
-    assert len(result) == 0
+    assert len(result.items) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_class_summaries_ok(class_repository):
+    await save_class(class_repository, st_class)
+    use_case = GetClassSummariesUseCase(class_repository)
+    result = await use_case.execute(query_factory.ClassQueryFactory.queries())
+    assert [c.class_id for c in result.items] == [st_class.class_id]
+    assert result.items[0].hit_dice == st_class.hits.hit_dice
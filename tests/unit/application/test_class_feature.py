@@ -244,4 +244,4 @@ async def test_get_features_ok(
     feature_query = query_factory.ClassFeatureQueryFactory.queries(**filter)
     use_case = GetClassFeaturesUseCase(class_feature_repository)
     result = await use_case.execute(feature_query)
-    assert len(result) == count
+    assert len(result.items) == count
@@ -1,6 +1,7 @@
 from uuid import uuid4
 
 import pytest
+from application.dto.model.page import AppCursor
 from application.use_case.command.class_level import (
     CreateClassLevelUseCase,
     DeleteClassLevelUseCase,
@@ -411,4 +412,21 @@ async def test_get_levels_ok(
     result = await use_case.execute(
         query_factory.ClassLevelQueryFactory.queries(**filter)
     )
-    assert len(result) == count
+    assert len(result.items) == count
+
+
+@pytest.mark.asyncio
+async def test_get_levels_cursor_key_type(class_level_repository):
+    # уровни сортируются по числу, строковый ключ курсора - ошибка клиента
+    cursor = AppCursor(key="5", entity_id=uuid4()).encode()
+    use_case = GetClassLevelsUseCase(class_level_repository)
+    try:
+        await use_case.execute(
+            query_factory.ClassLevelQueryFactory.queries(
+                page=query_factory.PageQueryFactory.query(cursor=cursor)
+            )
+        )
+    except error.DomainError as e:
+        assert e.status == error.DomainErrorStatus.INVALID_DATA
+        return
+    pytest.fail("not raised exception")
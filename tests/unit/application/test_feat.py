@@ -223,4 +223,4 @@ async def test_get_feats_ok(user_repository, feat_repository, filter, count):
     await save_feat(feat_repository, st_feat)
     use_case = GetFeatsUseCase(feat_repository)
     result = await use_case.execute(query_factory.FeatQueryFactory.queries(**filter))
-    assert len(result) == count
+    assert len(result.items) == count
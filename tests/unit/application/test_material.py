@@ -260,4 +260,27 @@ async def test_get_materials_ok(user_repository, material_repository, filters, c
     result = await use_case.execute(
         query_factory.MaterialQueryFactory.queries(**filters)
     )
-    assert len(result) == count
+    assert len(result.items) == count
+
+
+@pytest.mark.asyncio
+async def test_get_materials_pages(material_repository):
+    for name in ["c", "a", "b"]:
+        await save_material(
+            material_repository,
+            model_factory.material_model_factory(material_id=uuid4(), name=name),
+        )
+    use_case = GetMaterialsUseCase(material_repository)
+    first = await use_case.execute(
+        query_factory.MaterialQueryFactory.queries(
+            page=query_factory.PageQueryFactory.query(limit=2)
+        )
+    )
+    assert [material.name for material in first.items] == ["a", "b"]
+    second = await use_case.execute(
+        query_factory.MaterialQueryFactory.queries(
+            page=query_factory.PageQueryFactory.query(limit=2, cursor=first.next_cursor)
+        )
+    )
+    assert [material.name for material in second.items] == ["c"]
+    assert second.next_cursor is None
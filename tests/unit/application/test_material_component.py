@@ -262,4 +262,4 @@ async def test_get_materials_ok(
     result = await use_case.execute(
         query_factory.MaterialComponentQueryFactory.queries(**filters)
     )
-    assert len(result) == count
+    assert len(result.items) == count
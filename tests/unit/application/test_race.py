@@ -447,4 +447,4 @@ async def test_get_races_ok(race_repository, filters, count):
     await save_race(race_repository, st_race)
     use_case = GetRacesUseCase(race_repository)
     result = await use_case.execute(query_factory.RaceQueryFactory.queries(**filters))
-    assert len(result) == count
+    assert len(result.items) == count
@@ -0,0 +1,48 @@
+from uuid import uuid4
+
+import pytest
+from application.use_case.query.search import SearchUseCase
+from domain import error
+from tests.factories import model_factory, query_factory
+
+
+@pytest.mark.asyncio
+async def test_search(search_repository, material_repository, feat_repository):
+    await material_repository.save(
+        model_factory.material_model_factory(material_id=uuid4(), name="Fireproof")
+    )
+    await feat_repository.save(
+        model_factory.feat_model_factory(feat_id=uuid4(), name="Fire")
+    )
+    await feat_repository.save(
+        model_factory.feat_model_factory(
+            feat_id=uuid4(), name="Ember", description="Burns like fire"
+        )
+    )
+    await feat_repository.save(
+        model_factory.feat_model_factory(feat_id=uuid4(), name="Frost")
+    )
+    use_case = SearchUseCase(search_repository)
+    result = await use_case.execute(query_factory.SearchQueryFactory.query("fire"))
+    assert [(hit.entity_type, hit.name) for hit in result] == [
+        ("feat", "Fire"),
+        ("material", "Fireproof"),
+        ("feat", "Ember"),
+    ]
+
+    result = await use_case.execute(
+        query_factory.SearchQueryFactory.query("fire", limit=1)
+    )
+    assert [hit.name for hit in result] == ["Fire"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("search, limit", [("  ", 10), ("fire", 0), ("fire", 1000)])
+async def test_search_invalid(search_repository, search, limit):
+    use_case = SearchUseCase(search_repository)
+    try:
+        await use_case.execute(query_factory.SearchQueryFactory.query(search, limit))
+    except error.DomainError as e:
+        assert e.status == error.DomainErrorStatus.INVALID_DATA
+        return
+    pytest.fail("not raised exception")
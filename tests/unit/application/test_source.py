@@ -242,6 +242,92 @@ async def test_delete_with_spell(
     pytest.fail("not raised exception")
 
 
+@pytest.mark.asyncio
+async def test_delete_lists_first_references(
+    user_repository,
+    source_repository,
+    spell_repository,
+    class_repository,
+    race_repository,
+):
+    await save_user(user_repository, st_user)
+    await save_source(source_repository, st_source)
+    for i in range(7):
+        await save_class(
+            class_repository,
+            model_factory.class_model_factory(
+                class_id=uuid4(), name=f"class_{i}", source_id=st_source.source_id
+            ),
+        )
+    use_case = DeleteSourceUseCase(
+        user_repository,
+        source_repository,
+        class_repository,
+        race_repository,
+        spell_repository,
+    )
+    with pytest.raises(error.DomainError) as e:
+        await use_case.execute(
+            command_factory.SourceCommandFactory.delete(
+                user_id=st_user.user_id, source_id=st_source.source_id
+            )
+        )
+    assert e.value.msg == (
+        "этот источник используют классы: "
+        "class_0, class_1, class_2, class_3, class_4 и ещё 2"
+    )
+
+
+class FailingReferences:
+    def __init__(self, repository) -> None:
+        self.repository = repository
+
+    def __getattr__(self, name):
+        return getattr(self.repository, name)
+
+    async def references(self, **kwargs):
+        raise RuntimeError
+
+
+class CountingReferences(FailingReferences):
+    calls = 0
+
+    async def references(self, **kwargs):
+        self.calls += 1
+        return await self.repository.references(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_delete_stops_at_failed_check(
+    user_repository,
+    source_repository,
+    spell_repository,
+    class_repository,
+    race_repository,
+):
+    await save_user(user_repository, st_user)
+    await save_source(source_repository, st_source)
+    race = CountingReferences(race_repository)
+    spell = CountingReferences(spell_repository)
+    use_case = DeleteSourceUseCase(
+        user_repository,
+        source_repository,
+        FailingReferences(class_repository),
+        race,
+        spell,
+    )
+    with pytest.raises(RuntimeError):
+        await use_case.execute(
+            command_factory.SourceCommandFactory.delete(
+                user_id=st_user.user_id, source_id=st_source.source_id
+            )
+        )
+    # следующие проверки не начаты: их корутины даже не созданы
+    assert race.calls == 0
+    assert spell.calls == 0
+    assert await source_repository.id_exists(st_source.source_id)
+
+
 @pytest.mark.asyncio
 async def test_get_source_ok(source_repository):
     await save_source(source_repository, st_source)
@@ -280,4 +366,4 @@ async def test_get_sources_ok(source_repository, filters, count):
     await save_source(source_repository, st_source)
     use_case = GetSourcesUseCase(source_repository)
     result = await use_case.execute(query_factory.SourceQueryFactory.queries(**filters))
-    assert len(result) == count
+    assert len(result.items) == count
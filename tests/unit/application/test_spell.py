@@ -2,12 +2,18 @@ from os import name
 from uuid import uuid4
 
 import pytest
+from application.dto.command.spell import ImportSpellsCommand
 from application.use_case.command.spell import (
     CreateSpellUseCase,
     DeleteSpellUseCase,
+    ImportSpellsUseCase,
     UpdateSpellUseCase,
 )
-from application.use_case.query.spell import GetSpellsUseCase, GetSpellUseCase
+from application.use_case.query.spell import (
+    GetSpellSummariesUseCase,
+    GetSpellsUseCase,
+    GetSpellUseCase,
+)
 from domain import error
 from domain.damage_type import DamageType
 from domain.modifier import Modifier
@@ -275,6 +281,123 @@ async def test_create_not_exists(
     pytest.fail("did not raised exception")
 
 
+def import_use_case(
+    spell_repository,
+    user_repository,
+    class_repository,
+    subclass_repository,
+    source_repository,
+    material_component_repository,
+):
+    return ImportSpellsUseCase(
+        user_repository,
+        spell_repository,
+        class_repository,
+        subclass_repository,
+        material_component_repository,
+        source_repository,
+    )
+
+
+def import_command(*names):
+    return ImportSpellsCommand(
+        user_id=st_user.user_id,
+        spells=[
+            command_factory.SpellCommandFactory.create(
+                user_id=st_user.user_id,
+                class_ids=[st_class.class_id],
+                subclass_ids=[st_subclass.subclass_id],
+                source_id=st_source.source_id,
+                components=command_factory.spell_components_command_factory(
+                    material=True, materials=[st_m_component.material_id]
+                ),
+                name=name,
+            )
+            for name in names
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_import_ok(
+    spell_repository,
+    user_repository,
+    class_repository,
+    subclass_repository,
+    source_repository,
+    material_component_repository,
+):
+    await save_user(user_repository, st_user)
+    await save_class(class_repository, st_class)
+    await save_subclass(subclass_repository, st_subclass)
+    await save_source(source_repository, st_source)
+    await save_material_component(material_component_repository, st_m_component)
+    use_case = import_use_case(
+        spell_repository,
+        user_repository,
+        class_repository,
+        subclass_repository,
+        source_repository,
+        material_component_repository,
+    )
+    result = await use_case.execute(import_command("first", "second"))
+    assert len(result) == 2
+    spells = [await spell_repository.get_by_id(spell_id) for spell_id in result]
+    assert [spell.name for spell in spells] == ["first", "second"]
+    assert spells[0].class_ids == [st_class.class_id]
+    assert spells[1].components.materials == [st_m_component.material_id]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "names,not_exists",
+    [
+        [["first", "first"], None],
+        [[st_spell.name, "second"], None],
+        [["first"], "class"],
+        [["first"], "subclass"],
+        [["first"], "source"],
+        [["first"], "material"],
+    ],
+    ids=["duplicate", "name_exists", "class", "subclass", "source", "material"],
+)
+async def test_import_invalid(
+    spell_repository,
+    user_repository,
+    class_repository,
+    subclass_repository,
+    source_repository,
+    material_component_repository,
+    names,
+    not_exists,
+):
+    await save_user(user_repository, st_user)
+    await save_spell(spell_repository, st_spell)
+    if not_exists != "class":
+        await save_class(class_repository, st_class)
+    if not_exists != "subclass":
+        await save_subclass(subclass_repository, st_subclass)
+    if not_exists != "source":
+        await save_source(source_repository, st_source)
+    if not_exists != "material":
+        await save_material_component(material_component_repository, st_m_component)
+    use_case = import_use_case(
+        spell_repository,
+        user_repository,
+        class_repository,
+        subclass_repository,
+        source_repository,
+        material_component_repository,
+    )
+    try:
+        await use_case.execute(import_command(*names))
+    except error.DomainError as e:
+        assert e.status == error.DomainErrorStatus.INVALID_DATA
+        assert len(await spell_repository.get_all()) == 1
+        return
+    pytest.fail("did not raised exception")
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "update_field,checked",
@@ -648,4 +771,66 @@ async def test_get_spells_ok(
     await save_spell(spell_repository, st_spell)
     use_case = GetSpellsUseCase(spell_repository)
     result = await use_case.execute(query_factory.SpellQueryFactory.queries(**filter))
-    assert len(result) == count
+    assert len(result.items) == count
+
+
+@pytest.mark.asyncio
+async def test_get_spells_pages(spell_repository):
+    spells = [
+        model_factory.spell_model_factory(spell_id=uuid4(), name=name)
+        for name in ["c", "a", "e", "b", "d"]
+    ]
+    for spell in spells:
+        await save_spell(spell_repository, spell)
+    use_case = GetSpellsUseCase(spell_repository)
+    names = list()
+    cursor = None
+    while True:
+        result = await use_case.execute(
+            query_factory.SpellQueryFactory.queries(
+                page=query_factory.PageQueryFactory.query(limit=2, cursor=cursor)
+            )
+        )
+        names.extend(spell.name for spell in result.items)
+        cursor = result.next_cursor
+        if cursor is None:
+            break
+    assert names == ["a", "b", "c", "d", "e"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "limit,cursor",
+    [[0, None], [101, None], [10, "random_cursor"]],
+    ids=["zero_limit", "big_limit", "bad_cursor"],
+)
+async def test_get_spells_invalid_page(spell_repository, limit, cursor):
+    use_case = GetSpellsUseCase(spell_repository)
+    try:
+        await use_case.execute(
+            query_factory.SpellQueryFactory.queries(
+                page=query_factory.PageQueryFactory.query(limit=limit, cursor=cursor)
+            )
+        )
+    except error.DomainError as e:
+        assert e.status == error.DomainErrorStatus.INVALID_DATA
+        return
+    pytest.fail("not raised exception")
+
+
+@pytest.mark.asyncio
+async def test_get_spell_summaries_pages(spell_repository):
+    spells = [
+        model_factory.spell_model_factory(spell_id=uuid4(), name=name)
+        for name in ["c", "a", "b"]
+    ]
+    for spell in spells:
+        await save_spell(spell_repository, spell)
+    use_case = GetSpellSummariesUseCase(spell_repository)
+    result = await use_case.execute(
+        query_factory.SpellQueryFactory.queries(
+            page=query_factory.PageQueryFactory.query(limit=2)
+        )
+    )
+    assert [spell.name for spell in result.items] == ["a", "b"]
+    assert result.next_cursor is not None
@@ -297,4 +297,4 @@ async def test_get_subclasses_ok(
     result = await use_case.execute(
         query_factory.SubclassQueryFactory.queries(**filter)
     )
-    assert len(result) == count
+    assert len(result.items) == count
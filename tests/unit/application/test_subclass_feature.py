@@ -266,4 +266,4 @@ async def test_get_subclass_features_ok(
     result = await use_case.execute(
         query_factory.SubclassFeatureQueryFactory.queries(**filters)
     )
-    assert len(result) == count
+    assert len(result.items) == count
@@ -394,4 +394,4 @@ async def test_get_subraces_ok(
     result = await use_case.execute(
         query_factory.SubraceQueryFactory.queries(**filters)
     )
-    assert len(result) == count
+    assert len(result.items) == count
@@ -298,4 +298,4 @@ async def test_get_tools_ok(tool_repository, filters, count):
     await save_tool(tool_repository, st_tool)
     use_case = GetToolsUseCase(tool_repository)
     result = await use_case.execute(query_factory.ToolQueryFactory.queries(**filters))
-    assert len(result) == count
+    assert len(result.items) == count
@@ -456,4 +456,4 @@ async def test_get_weapons_ok(weapon_repository, filters, count):
     await save_weapon(weapon_repository, st_weapon)
     use_case = GetWeaponsUseCase(weapon_repository)
     result = await use_case.execute(query_factory.WeaponQueryFactory.queries(**filters))
-    assert len(result) == count
+    assert len(result.items) == count
@@ -204,4 +204,4 @@ async def test_get_kinds_ok(weapon_kind_repository, filters, count):
     result = await use_case.execute(
         query_factory.WeaponKindQueryFactory.queries(**filters)
     )
-    assert len(result) == count
+    assert len(result.items) == count
@@ -264,4 +264,4 @@ async def test_get_properties_ok(weapon_property_repository, filters, count):
     result = await use_case.execute(
         query_factory.WeaponPropertyQueryFactory.queries(**filters)
     )
-    assert len(result) == count
+    assert len(result.items) == count
@@ -0,0 +1,73 @@
+from uuid import uuid4
+
+import pytest
+from application.use_case.query.character_class import GetClassSheetUseCase
+from di import ClassUseCases
+from domain.error import DomainError
+from litestar import Litestar
+from litestar.di import Provide
+from litestar.testing import AsyncTestClient
+from ports.http.web.exception_handlers import domain_handler
+from ports.http.web.v1.controllers import ClassController
+from tests.factories import model_factory
+
+
+@pytest.fixture
+def client(
+    class_repository,
+    class_level_repository,
+    class_feature_repository,
+    subclass_repository,
+    spell_repository,
+):
+    # обработчик проверяет тип зависимости; нужен только get_sheet
+    use_cases = ClassUseCases.__new__(ClassUseCases)
+    use_cases.get_sheet = GetClassSheetUseCase(
+        class_repository,
+        class_level_repository,
+        class_feature_repository,
+        subclass_repository,
+        spell_repository,
+    )
+
+    # контроллер как есть, только use cases поверх репозиториев в памяти
+    class Controller(ClassController):
+        dependencies = {"use_cases": Provide(lambda: use_cases, sync_to_thread=False)}
+
+    app = Litestar(
+        route_handlers=[Controller], exception_handlers={DomainError: domain_handler}
+    )
+    return AsyncTestClient(app)
+
+
+@pytest.mark.asyncio
+async def test_get_class_sheet(
+    client, class_repository, class_level_repository, spell_repository
+):
+    character_class = model_factory.class_model_factory(class_id=uuid4())
+    level = model_factory.class_level_model_factory(
+        class_level_id=uuid4(), class_id=character_class.class_id
+    )
+    spell = model_factory.spell_model_factory(
+        spell_id=uuid4(), class_ids=[character_class.class_id]
+    )
+    await class_repository.save(character_class)
+    await class_level_repository.save(level)
+    await spell_repository.save(spell)
+    async with client:
+        response = await client.get(f"/classes/{character_class.class_id}/sheet")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["character_class"]["class_id"] == str(character_class.class_id)
+    assert [item["class_level_id"] for item in body["levels"]] == [
+        str(level.class_level_id)
+    ]
+    assert [item["spell_id"] for item in body["spells"]] == [str(spell.spell_id)]
+    assert body["features"] == [] and body["subclasses"] == []
+
+
+@pytest.mark.asyncio
+async def test_get_class_sheet_not_found(client):
+    async with client:
+        response = await client.get(f"/classes/{uuid4()}/sheet")
+    assert response.status_code == 404
@@ -0,0 +1,95 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+ROOT = Path(__file__).resolve().parents[3]
+
+APP = """
+import os
+import sys
+
+from ports.http.web.server import serve
+
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        while True:
+            message = await receive()
+            await send({"type": message["type"] + ".complete"})
+            if message["type"] == "lifespan.shutdown":
+                return
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": str(os.getpid()).encode()})
+
+
+serve(app, "127.0.0.1", int(sys.argv[1]), workers=2, graceful_timeout=1)
+"""
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def children(pid: int) -> set[int]:
+    path = Path(f"/proc/{pid}/task/{pid}/children")
+    return {int(child) for child in path.read_text().split()}
+
+
+def wait_for(condition, timeout: float = 10) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+
+
+def responds(url: str) -> bool:
+    try:
+        return httpx.get(url, timeout=1).status_code == 200
+    except httpx.HTTPError:
+        return False
+
+
+@pytest.mark.skipif(
+    not Path(f"/proc/{os.getpid()}/task/{os.getpid()}/children").exists(),
+    reason="нужен /proc/<pid>/task/<pid>/children",
+)
+def test_serve_respawns_and_stops_workers(tmp_path):
+    script = tmp_path / "app.py"
+    script.write_text(APP)
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/"
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    master = subprocess.Popen([sys.executable, str(script), str(port)], env=env)
+    try:
+        wait_for(lambda: len(children(master.pid)) == 2 and responds(url))
+        workers = children(master.pid)
+        assert int(httpx.get(url).text) in workers
+
+        # упавший воркер мастер заменяет новым
+        crashed = workers.pop()
+        os.kill(crashed, signal.SIGKILL)
+        wait_for(
+            lambda: crashed not in children(master.pid)
+            and len(children(master.pid)) == 2
+        )
+        assert responds(url)
+
+        workers = children(master.pid)
+        master.send_signal(signal.SIGTERM)
+        assert master.wait(timeout=10) == 0
+        for pid in workers:
+            assert not Path(f"/proc/{pid}").exists()
+        assert not responds(url)
+    finally:
+        if master.poll() is None:
+            master.kill()
+            master.wait()